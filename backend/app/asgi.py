@@ -0,0 +1,43 @@
+"""ASGI entry point, served next to the WSGI one (``app.main:app``).
+
+    uvicorn app.asgi:app --host 0.0.0.0 --port 8090 --workers 4
+
+``app.main`` is not imported: it builds the whole sync stack (database pool,
+Redis, cache warm-up, change listener) at import. The Flask app used for the
+request contexts and the fallback routes is set up without it, and the sync
+dependencies are only started in the background by the first request handed
+to Flask (docs, health checks...).
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app.setup import ApplicationSetup
+from src.infrastructure.dependencie_injection import AsyncApplicationDependencies
+from src.infrastructure.routes.async_routes import AsyncPortfolioApp
+
+
+class LazyFlaskFallback:
+    """Hands requests to Flask, starting its dependencies on the first one."""
+
+    def __init__(self, setup: ApplicationSetup) -> None:
+        self.setup = setup
+        self.flask = WsgiToAsgi(setup.app)
+        self.started = False
+
+    async def __call__(self, scope, receive, send) -> None:
+        if not self.started:
+            # Health checks answer "initializing" until they are ready
+            self.started = True
+            self.setup.start_dependencies_in_background()
+
+        await self.flask(scope, receive, send)
+
+
+setup = ApplicationSetup()
+flask_app = setup.setup(with_dependencies=False)
+
+app = AsyncPortfolioApp(
+    flask_app,
+    AsyncApplicationDependencies().portfolio_data_service,
+    fallback=LazyFlaskFallback(setup),
+)
@@ -0,0 +1,176 @@
+"""Flask application setup shared by the WSGI and ASGI entry points."""
+
+import os
+import threading
+import time
+from functools import cached_property
+
+from flask import Flask
+from flask_cors import CORS
+from flask_restx import Api
+
+from src.infrastructure.cli.cache_commands import cache_cli
+from src.infrastructure.cli.database_commands import db_cli
+from src.infrastructure.routes.education.view import education_ns
+from src.infrastructure.routes.experiences.view import experiences_ns
+
+## Application Dependencies
+from src.infrastructure.routes.health_check.view import health_check_ns
+from src.infrastructure.routes.portfolio.view import portfolio_ns
+from src.infrastructure.routes.projects.view import projects_ns
+from src.infrastructure.routes.social_media.view import social_media_ns
+from src.infrastructure.dependencie_injection import ApplicationDependencies
+from src.infrastructure.services.response_snapshot_store import ResponseSnapshotStore
+from src.infrastructure.utils.app_version import get_application_version
+from src.infrastructure.utils.http_cache import register_conditional_get
+from src.infrastructure.utils.json_codec import JSON_BACKEND, register_json_provider
+from src.infrastructure.utils.logger import get_logger
+from src.infrastructure.utils.tracing import setup_tracing
+
+logger = get_logger(__name__)
+
+class ApplicationSetup:
+    # Serve right after import: dependencies are built in the background
+    FAST_BOOT = os.getenv("FAST_BOOT", "false").lower() == "true"
+    FAST_BOOT_RETRY_INTERVAL = float(os.getenv("FAST_BOOT_RETRY_INTERVAL", "5"))
+
+    def __init__(self):
+        setup_tracing()
+        self.app = Flask(__name__)
+        self.app.url_map.strict_slashes = False
+
+    @cached_property
+    def api(self) -> Api:
+        """flask-restx Api, built by the first setup step that needs it.
+
+        The Swagger spec itself is only generated when it is first requested.
+        """
+        return Api(
+            self.app,
+            version=self.get_application_version(),
+            title="api.ivanildobarauna.dev",
+            description="This is the API documentation for api.ivanildobarauna.dev",
+            terms_url="https://github.com/ivanildobarauna-dev/api.ivanildobarauna.dev/blob/main/README.md",
+            contact="ivanildo.jnr@outlook.com",
+            license="MIT",
+            license_url="https://github.com/ivanildobarauna-dev/api.ivanildobarauna.dev/blob/main/LICENSE",
+            ordered=True,
+            validate=True,
+        )
+
+    def get_application_version(self) -> str:
+        return get_application_version()
+
+    def setup_cors(self):
+        CORS(
+            self.app,
+            resources={
+                r"/*": {
+                    "origins": "*",
+                }
+            },
+        )
+
+    def setup_json(self):
+        register_json_provider(self.app, self.api)
+
+    def setup_conditional_requests(self):
+        register_conditional_get(self.app)
+
+    def setup_cache_invalidation(self):
+        # Snapshots are rebuilt as soon as the data behind them changes
+        snapshot_store = self.app.extensions.setdefault(
+            "response_snapshot_store", ResponseSnapshotStore()
+        )
+        self.app.dps.cache_invalidation_service.add_callback(
+            lambda datasets: snapshot_store.invalidate()
+        )
+
+    def setup_cache_warmup(self):
+        # The worker only starts serving once the caches are warm (or on timeout)
+        warmup = self.app.dps.cache_warmup_service
+        warmup.start()
+        if not warmup.wait():
+            logger.warning(
+                "⚠️  Aquecimento do cache excedeu o tempo limite, "
+                "seguindo em segundo plano"
+            )
+
+    def register_cli(self):
+        self.app.cli.add_command(cache_cli)
+        self.app.cli.add_command(db_cli)
+
+    def register_namespaces(self):
+        # API Namespaces
+        namespaces = [
+            experiences_ns,
+            education_ns,
+            health_check_ns,
+            portfolio_ns,
+            projects_ns,
+            social_media_ns,
+        ]
+
+        for namespace in namespaces:
+            self.api.add_namespace(namespace, path="/api/v1")
+
+    def setup_dependencies(self):
+        logger.info("🔄 Inicializando ApplicationDependencies...")
+        self.app.dps = ApplicationDependencies()
+        logger.info("✅ ApplicationDependencies inicializado")
+
+        self.setup_cache_invalidation()
+        logger.info("✅ Invalidação de cache configurada")
+
+        self.setup_cache_warmup()
+        logger.info(
+            f"✅ Aquecimento do cache: {self.app.dps.cache_warmup_service.status}"
+        )
+
+    def setup_dependencies_in_background(self):
+        # Retries the whole setup, not only the build: invalidation and warm-up
+        # must be wired even if a request built the dependencies meanwhile
+        while True:
+            try:
+                self.setup_dependencies()
+                return
+            except Exception as e:
+                logger.error(
+                    f"❌ Falha ao inicializar dependências, nova tentativa em "
+                    f"{self.FAST_BOOT_RETRY_INTERVAL}s: {str(e)}"
+                )
+                time.sleep(self.FAST_BOOT_RETRY_INTERVAL)
+
+    def start_dependencies_in_background(self):
+        # /ready answers 503 until the dependencies are built and warm
+        threading.Thread(
+            target=self.setup_dependencies_in_background,
+            name="fast-boot",
+            daemon=True,
+        ).start()
+
+    def setup(self, with_dependencies: bool = True):
+        logger.info("🛠️  Iniciando configuração da aplicação...")
+        self.setup_cors()
+        logger.info("✅ CORS configurado")
+
+        self.setup_json()
+        logger.info(f"✅ Codificação JSON configurada ({JSON_BACKEND})")
+
+        self.setup_conditional_requests()
+        logger.info("✅ Requisições condicionais (ETag) configuradas")
+        
+        self.register_namespaces()
+        logger.info("✅ Namespaces registrados")
+
+        self.register_cli()
+
+        # Without them (see app.asgi) the caller starts them when it needs them
+        if with_dependencies and self.FAST_BOOT:
+            self.start_dependencies_in_background()
+            logger.info("⚡ Fast boot: dependências inicializadas em segundo plano")
+        elif with_dependencies:
+            self.setup_dependencies()
+
+        logger.info("🚀 Aplicação configurada com sucesso!")
+        return self.app
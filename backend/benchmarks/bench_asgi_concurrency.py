@@ -0,0 +1,257 @@
+"""Benchmark: concurrent clients on the WSGI (threads) vs. ASGI (asyncio) stacks.
+
+Both stacks serve the real routes with a repository that simulates ``--io-ms``
+of database latency per dataset read. Response snapshots are bypassed so every
+request goes down the data path. The WSGI stack gets ``--threads`` request
+threads, like ``gunicorn --workers=4 --threads=4``; the ASGI stack runs every
+request on one event loop.
+
+For each concurrency level it reports throughput and p50/p99 latency, measured
+from the moment the request is issued (so time queued for a free thread counts).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_asgi_concurrency [--io-ms 20] [--threads 16]
+        [--concurrency 16,64,256] [--rounds 3]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from flask import Flask
+from flask_restx import Api
+
+from src.domain.dto.company_duration import CompanyDuration
+from src.domain.dto.experience import Experience
+from src.domain.dto.project import Project
+from src.infrastructure.routes.async_routes import AsyncPortfolioApp
+from src.infrastructure.routes.portfolio.view import portfolio_ns
+from src.infrastructure.routes.projects.view import projects_ns
+from src.infrastructure.services.async_portfolio_data_service import (
+    AsyncPortfolioDataService,
+)
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+from src.infrastructure.services.response_snapshot_store import ResponseSnapshotStore
+
+ENDPOINTS = ["/api/v1/projects", "/api/v1/portfolio"]
+
+
+def build_datasets() -> dict:
+    return {
+        "get_all_projects": [
+            Project(
+                id=i,
+                title=f"Project {i}",
+                description="Open source library for data engineering. " * 3,
+                url=f"https://github.com/ivanildobarauna-dev/project-{i}",
+                tags=["python", "data-engineering", f"tag{i}"],
+                active=True,
+            )
+            for i in range(30)
+        ],
+        "get_all_experiences": [
+            Experience(
+                position=f"Data Engineer {i}",
+                company=f"Company {i % 8}",
+                location="São Paulo, Brasil",
+                website=f"https://company{i % 8}.example.com",
+                logo=f"https://cdn.example.com/logos/company{i % 8}.png",
+                description="Pipelines de dados em larga escala. " * 4,
+                skills="Python, SQL, Spark, Airflow",
+                duration=f"{i % 6} anos",
+            )
+            for i in range(40)
+        ],
+        "get_company_duration": [
+            CompanyDuration(name=f"Company {i}", duration=f"{i} anos")
+            for i in range(8)
+        ],
+        "get_total_experience": {"total_duration": "10 anos"},
+        "get_all_formations": [],
+        "get_all_certifications": [],
+        "get_all_social_media": [],
+    }
+
+
+class SleepyRepository:
+    """Sync repository whose reads block for ``io_seconds``."""
+
+    def __init__(self, datasets: dict, io_seconds: float) -> None:
+        for name, data in datasets.items():
+            setattr(self, name, self._reader(data, io_seconds))
+
+    @staticmethod
+    def _reader(data, io_seconds):
+        def read():
+            time.sleep(io_seconds)
+            return data
+
+        return read
+
+
+class AsyncSleepyRepository:
+    """Async repository whose reads wait ``io_seconds`` without blocking."""
+
+    def __init__(self, datasets: dict, io_seconds: float) -> None:
+        for name, data in datasets.items():
+            setattr(self, name, self._reader(data, io_seconds))
+
+    @staticmethod
+    def _reader(data, io_seconds):
+        async def read():
+            await asyncio.sleep(io_seconds)
+            return data
+
+        return read
+
+    async def close(self) -> None:
+        pass
+
+
+class PassThroughSnapshotStore(ResponseSnapshotStore):
+    """Always rebuilds, so each request exercises the data path.
+
+    Compression is skipped: it is CPU work shared by both stacks and would hide
+    the I/O wait being compared.
+    """
+
+    RESPONSE_COMPRESSION_MIN_SIZE = sys.maxsize
+
+    def get(self, key):
+        return None
+
+    def get_or_build(self, key, builder):
+        # A fresh store per request: no shared build lock between requests
+        return ResponseSnapshotStore.get_or_build(
+            PassThroughSnapshotStore(), key, builder
+        )
+
+
+def build_app() -> Flask:
+    app = Flask(__name__)
+    api = Api(app)
+    api.add_namespace(projects_ns, path="/api/v1")
+    api.add_namespace(portfolio_ns, path="/api/v1")
+    return app
+
+
+def summarize(samples: list, elapsed: float) -> tuple:
+    samples = sorted(samples)
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return len(samples) / elapsed, statistics.median(samples), p99
+
+
+def run_wsgi(app: Flask, path: str, concurrency: int, threads: int) -> tuple:
+    def request(issued_at: float) -> float:
+        response = app.test_client().get(path)
+        assert response.status_code == 200, response.status_code
+        return (time.perf_counter() - issued_at) * 1000
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        futures = [pool.submit(request, time.perf_counter()) for _ in range(concurrency)]
+        samples = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+
+    return summarize(samples, elapsed)
+
+
+def run_asgi(asgi_app: AsyncPortfolioApp, path: str, concurrency: int) -> tuple:
+    async def request() -> float:
+        issued_at = time.perf_counter()
+        messages = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"",
+            "headers": [],
+            "server": ("bench", 80),
+        }
+        await asgi_app(scope, receive, send)
+        assert messages[0]["status"] == 200, messages[0]["status"]
+        return (time.perf_counter() - issued_at) * 1000
+
+    async def burst() -> tuple:
+        start = time.perf_counter()
+        samples = await asyncio.gather(*(request() for _ in range(concurrency)))
+        return summarize(list(samples), time.perf_counter() - start)
+
+    return asyncio.run(burst())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--io-ms", type=float, default=20.0)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--concurrency", default="16,64,256")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    io_seconds = args.io_ms / 1000
+    datasets = build_datasets()
+    sync_service = PortfolioDataService(SleepyRepository(datasets, io_seconds))
+    async_service = AsyncPortfolioDataService(
+        AsyncSleepyRepository(datasets, io_seconds)
+    )
+    app = build_app()
+    asgi_app = AsyncPortfolioApp(build_app(), async_service)
+    store = PassThroughSnapshotStore()
+
+    patches = [
+        patch(
+            f"src.infrastructure.routes.{module}.get_response_snapshot_store",
+            lambda: store,
+        )
+        for module in ("projects.view", "portfolio.view", "async_routes")
+    ] + [
+        patch(
+            f"src.infrastructure.routes.{module}.view.get_portfolio_data_service",
+            return_value=sync_service,
+        )
+        for module in ("projects", "portfolio")
+    ]
+    for active_patch in patches:
+        active_patch.start()
+
+    try:
+        for path in ENDPOINTS:
+            print(f"\n{path} ({args.io_ms:g} ms per dataset read)")
+            print(
+                f"{'stack':<22}{'clients':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+            )
+            for concurrency in map(int, args.concurrency.split(",")):
+                for name, run in (
+                    (
+                        f"WSGI ({args.threads} threads)",
+                        lambda: run_wsgi(app, path, concurrency, args.threads),
+                    ),
+                    ("ASGI (asyncio)", lambda: run_asgi(asgi_app, path, concurrency)),
+                ):
+                    results = [run() for _ in range(args.rounds)]
+                    throughput, p50, p99 = (
+                        statistics.median(column) for column in zip(*results)
+                    )
+                    print(
+                        f"{name:<22}{concurrency:>8}{throughput:>10.0f}"
+                        f"{p50:>10.1f}{p99:>10.1f}"
+                    )
+    finally:
+        for active_patch in patches:
+            active_patch.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark: JSON envelope vs. the binary cache codec, per Redis key.
+
+Synthetic datasets of ``--rows`` items (as in ``bench_json_encoding``) are
+serialized the way ``RedisAdapter`` stores them and encoded with the JSON
+envelope and the binary codec with a JSON body and, when ``msgpack`` is
+installed, a MessagePack body. For each cache key it reports the stored size
+and the p50 time to decode the value and rebuild the DTOs, which is what a cache
+hit costs.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_cache_codec [--rows 200] [--rounds 200]
+"""
+
+import argparse
+import statistics
+import time
+
+from benchmarks.bench_json_encoding import build_datasets
+from src.infrastructure.adapters.outbound_redis_adapter import RedisAdapter
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+from src.infrastructure.utils.cache_codec import (
+    BinaryCacheCodec,
+    JSONCacheCodec,
+    msgpack,
+)
+from src.infrastructure.utils.json_codec import JSON_BACKEND
+
+
+def p50_ms(function, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    # Only the (de)serialization helpers are used: no connection is opened
+    adapter = RedisAdapter.__new__(RedisAdapter)
+    datasets = build_datasets(args.rows)
+    codecs = {
+        "json": JSONCacheCodec(),
+        "bin+json": BinaryCacheCodec(body_format=BinaryCacheCodec.FORMAT_JSON),
+    }
+    if msgpack is not None:
+        codecs["bin+msgpack"] = BinaryCacheCodec(
+            body_format=BinaryCacheCodec.FORMAT_MSGPACK
+        )
+
+    print(f"{args.rows} rows per key, p50 of {args.rounds} rounds, {JSON_BACKEND}")
+    print(f"{'key':<30}{'codec':<13}{'bytes':>8}{'size':>7}{'decode ms':>11}")
+    for dataset, (key, _, _) in PortfolioDataService.CACHE_BINDINGS.items():
+        value = adapter._serialize(key, datasets[dataset])
+        baseline = None
+        for name, codec in codecs.items():
+            raw = codec.encode(value, soft_expires_at=0.0, delta=0.0)
+            baseline = baseline or len(raw)
+            timing = p50_ms(
+                lambda: adapter._deserialize(key, codec.decode(raw).data),
+                args.rounds,
+            )
+            print(
+                f"{key:<30}{name:<13}{len(raw):>8}{len(raw) / baseline:>7.0%}"
+                f"{timing:>11.3f}"
+            )
+
+if __name__ == "__main__":
+    main()
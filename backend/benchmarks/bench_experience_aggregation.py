@@ -0,0 +1,168 @@
+"""Benchmark: experience aggregation of ``FileStorageAdapter``, before and after.
+
+A synthetic ``experiences.json`` history is generated with ``--entries``
+positions spread over ``--companies`` companies. ``legacy`` is the previous
+algorithm (``strptime`` per date, ``min``/``max`` and duration formatting per
+experience); ``single-pass`` is ``FileStorageAdapter._aggregate``. Both start
+from the parsed JSON and build the experiences, company durations and total
+duration. It reports the p50 time per aggregation and the speedup.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_experience_aggregation [--entries 5000]
+        [--companies 500] [--rounds 10]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime
+
+from dateutil.relativedelta import relativedelta
+
+from src.domain.dto.company_duration import CompanyDuration
+from src.domain.dto.experience import Experience
+from src.infrastructure.adapters.outbound_file_storage_adapter import (
+    FileStorageAdapter,
+)
+
+
+def build_entries(count: int, companies: int) -> list:
+    rng = random.Random(42)
+    entries = []
+    for i in range(count):
+        start_year, start_month = rng.randint(1995, 2023), rng.randint(1, 12)
+        entry = {
+            "position": f"Engineer {i}",
+            "company": f"Company {i % companies}",
+            "location": "São Paulo, Brasil",
+            "description": "Pipelines de dados em larga escala.",
+            "skills": "Python, SQL, Spark",
+            "startDate": f"{start_year}-{start_month:02d}",
+        }
+        if i % 50 == 0:
+            entry["currentJob"] = True
+        else:
+            end_year = min(start_year + rng.randint(0, 3), 2024)
+            entry["endDate"] = f"{end_year}-{rng.randint(start_month, 12):02d}"
+        entries.append(entry)
+
+    return entries
+
+
+def legacy_duration(start_date: str, end_date: str = None) -> str:
+    start = datetime.strptime(start_date, "%Y-%m")
+    end = datetime.strptime(end_date, "%Y-%m") if end_date else datetime.now()
+
+    diff = relativedelta(end, start)
+    anos, meses = diff.years, diff.months
+    if anos == 0:
+        return f"{meses} {'mês' if meses == 1 else 'meses'}"
+    elif meses == 0:
+        return f"{anos} {'ano' if anos == 1 else 'anos'}"
+    return (
+        f"{anos} {'ano' if anos == 1 else 'anos'} e "
+        f"{meses} {'mês' if meses == 1 else 'meses'}"
+    )
+
+
+def legacy_aggregate(json_content: list) -> tuple:
+    """The algorithm replaced by the single pass, kept here as the baseline."""
+    company_experiences = {}
+    for experience in json_content:
+        company = experience["company"]
+        if company not in company_experiences:
+            company_experiences[company] = {
+                "start_dates": [],
+                "end_dates": [],
+                "current_job": False,
+            }
+        company_experiences[company]["start_dates"].append(
+            datetime.strptime(experience["startDate"], "%Y-%m")
+        )
+        if experience.get("currentJob", False):
+            company_experiences[company]["current_job"] = True
+        elif "endDate" in experience:
+            company_experiences[company]["end_dates"].append(
+                datetime.strptime(experience["endDate"], "%Y-%m")
+            )
+
+    experiences = []
+    for experience in json_content:
+        company_data = company_experiences[experience["company"]]
+        earliest_start = min(company_data["start_dates"])
+        latest_end = (
+            None if company_data["current_job"] else max(company_data["end_dates"])
+        )
+        duration = legacy_duration(
+            earliest_start.strftime("%Y-%m"),
+            latest_end.strftime("%Y-%m") if latest_end else None,
+        )
+        experiences.append(Experience(**{**experience, "duration": duration}))
+
+    company_duration = [
+        CompanyDuration(
+            name=company,
+            duration=legacy_duration(
+                min(data["start_dates"]).strftime("%Y-%m"),
+                None
+                if data["current_job"]
+                else max(data["end_dates"]).strftime("%Y-%m"),
+            ),
+        )
+        for company, data in company_experiences.items()
+    ]
+
+    first = min(
+        datetime.strptime(experience["startDate"], "%Y-%m")
+        for experience in json_content
+    )
+    years = relativedelta(datetime.now(), first).years
+    return experiences, company_duration, f"{years} {'ano' if years == 1 else 'anos'}"
+
+
+def p50_ms(function, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--companies", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    entries = build_entries(args.entries, args.companies)
+    current_month = FileStorageAdapter._current_month()
+
+    legacy = legacy_aggregate(entries)
+    single_pass = FileStorageAdapter._aggregate(entries, current_month)
+    assert [e.duration for e in legacy[0]] == [
+        e.duration for e in single_pass.experiences
+    ]
+    assert legacy[1] == single_pass.company_duration
+    assert legacy[2] == single_pass.total_duration
+
+    legacy_ms = p50_ms(lambda: legacy_aggregate(entries), args.rounds)
+    single_pass_ms = p50_ms(
+        lambda: FileStorageAdapter._aggregate(entries, current_month), args.rounds
+    )
+
+    print(
+        f"{args.entries} experiences, {args.companies} companies, "
+        f"p50 of {args.rounds} rounds"
+    )
+    print(f"{'legacy':<14}{legacy_ms:>10.1f} ms")
+    print(f"{'single-pass':<14}{single_pass_ms:>10.1f} ms")
+    print(f"{'speedup':<14}{legacy_ms / single_pass_ms:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Benchmark: stdlib JSON vs. the shared codec for responses and cache payloads.
+
+Synthetic datasets of ``--rows`` items each are rendered with the routes' own
+renderers. Each endpoint payload is encoded with Flask's default provider
+(stdlib ``json``, sorted keys, ASCII escapes) and with ``FastJSONProvider``
+(``json_codec``: orjson when installed). The Redis envelope of every dataset is
+encoded with the previous ``json.dumps(..., default=str)`` and with
+``json_codec.dumps``. For each payload it reports the p50 encode and decode
+times and the encoded size.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_json_encoding [--rows 200] [--rounds 200]
+"""
+
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from src.domain.dto.certification import CertificationRecord
+from src.domain.dto.company_duration import CompanyDuration
+from src.domain.dto.experience import Experience
+from src.domain.dto.formation import FormationRecord
+from src.domain.dto.project import ProjectRecord
+from src.domain.dto.social_media import SocialMediaRecord
+from src.infrastructure.routes.education.view import render_education_response
+from src.infrastructure.routes.experiences.view import (
+    render_companies_duration_response,
+    render_experiences_response,
+)
+from src.infrastructure.routes.portfolio.view import (
+    SECTION_DATASETS,
+    render_portfolio_response,
+)
+from src.infrastructure.routes.projects.view import render_projects_response
+from src.infrastructure.routes.social_media.view import render_social_media_response
+from src.infrastructure.utils import json_codec
+from src.infrastructure.utils.json_codec import JSON_BACKEND, FastJSONProvider
+
+
+def build_datasets(count: int) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "projects": [
+            ProjectRecord(
+                title=f"Project {i}",
+                description="Biblioteca open source para engenharia de dados. " * 3,
+                url=f"https://github.com/ivanildobarauna-dev/project-{i}",
+                tags=["python", "data-engineering", f"tag{i}"],
+                active=True,
+                updated_at=now,
+            )
+            for i in range(count)
+        ],
+        "formations": [
+            FormationRecord(
+                institution=f"Universidade {i}",
+                type="Graduação",
+                course="Sistemas de Informação",
+                period="2010 - 2014",
+                description="Bacharelado com ênfase em dados. " * 3,
+                logo=f"https://cdn.example.com/logos/university{i}.png",
+                active=True,
+            )
+            for i in range(count)
+        ],
+        "certifications": [
+            CertificationRecord(
+                name=f"Certificação {i}",
+                institution="Google Cloud",
+                credential_url=f"https://example.com/credential/{i}",
+                logo="https://cdn.example.com/logos/gcp.png",
+                active=True,
+                updated_at=now,
+            )
+            for i in range(count)
+        ],
+        "experiences": [
+            Experience(
+                position=f"Engenheiro de Dados {i}",
+                company=f"Empresa {i}",
+                location="São Paulo, Brasil",
+                website=f"https://empresa{i}.example.com",
+                logo=f"https://cdn.example.com/logos/empresa{i}.png",
+                description="Pipelines de dados em larga escala. " * 4,
+                skills="Python, SQL, Spark, Airflow",
+                duration="2 anos e 3 meses",
+            )
+            for i in range(count)
+        ],
+        "companies_duration": [
+            CompanyDuration(name=f"Empresa {i}", duration="2 anos e 3 meses")
+            for i in range(count)
+        ],
+        "total_experience": {"total_duration": "12 anos"},
+        "social_media": [
+            SocialMediaRecord(
+                label=f"Rede {i}",
+                url=f"https://social.example.com/{i}",
+                type="link",
+                active=True,
+                updated_at=now,
+            )
+            for i in range(count)
+        ],
+    }
+
+
+def endpoint_payloads(datasets: dict) -> dict:
+    return {
+        "/projects": render_projects_response(datasets).data,
+        "/education": render_education_response(datasets),
+        "/experiences": render_experiences_response(datasets),
+        "/experiences?companies": render_companies_duration_response(datasets),
+        "/social-media-links": render_social_media_response(datasets).data,
+        "/portfolio": render_portfolio_response(list(SECTION_DATASETS), datasets),
+    }
+
+
+def cache_payloads(datasets: dict) -> dict:
+    """Redis envelopes, as ``RedisAdapter._serialize`` builds them."""
+    serializers = {
+        "projects": "to_dict",
+        "formations": "to_dict",
+        "certifications": "to_dict",
+        "experiences": "model_dump",
+        "social_media": "to_dict",
+        "companies_duration": "to_response",
+    }
+    envelopes = {}
+    for name, data in datasets.items():
+        if name in serializers:
+            data = [getattr(item, serializers[name])() for item in data]
+        envelopes[f"cache:{name}"] = {
+            "data": data,
+            "soft_expires_at": time.time(),
+            "delta": 0.0,
+        }
+
+    return envelopes
+
+
+def p50_ms(function, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples)
+
+
+def report(name: str, payload, baseline: tuple, fast: tuple, rounds: int) -> None:
+    rows = []
+    for encode, decode in (baseline, fast):
+        body = encode(payload)
+        rows.append(
+            (
+                p50_ms(lambda: encode(payload), rounds),
+                p50_ms(lambda: decode(body), rounds),
+                len(body),
+            )
+        )
+
+    (old_encode, old_decode, old_size), (new_encode, new_decode, new_size) = rows
+    print(
+        f"{name:<24}{old_encode:>8.3f}{new_encode:>8.3f}"
+        f"{old_encode / new_encode:>7.1f}x{old_decode:>8.3f}{new_decode:>8.3f}"
+        f"{old_decode / new_decode:>7.1f}x{old_size:>9}{new_size:>9}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    default_provider, fast_provider = DefaultJSONProvider(app), FastJSONProvider(app)
+    datasets = build_datasets(args.rows)
+
+    print(
+        f"{args.rows} rows per dataset, p50 of {args.rounds} rounds, {JSON_BACKEND}"
+    )
+    print(
+        f"{'payload':<24}{'enc ms':>8}{'new':>8}{'':>8}{'dec ms':>8}{'new':>8}"
+        f"{'':>8}{'bytes':>9}{'new':>9}"
+    )
+    with app.app_context():
+        for name, payload in endpoint_payloads(datasets).items():
+            report(
+                name,
+                payload,
+                (
+                    lambda data: default_provider.response(data).get_data(),
+                    default_provider.loads,
+                ),
+                (
+                    lambda data: fast_provider.response(data).get_data(),
+                    fast_provider.loads,
+                ),
+                args.rounds,
+            )
+
+    for name, payload in cache_payloads(datasets).items():
+        report(
+            name,
+            payload,
+            (lambda data: json.dumps(data, default=str).encode("utf-8"), json.loads),
+            (json_codec.dumps, json_codec.loads),
+            args.rounds,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark: ORM hydration vs. the lean Core read path of ``PostgresAdapter``.
+
+Each table is filled with ``--rows`` rows in an in-memory SQLite database and
+read back with ``get_all`` in both modes. For each entity it reports rows
+materialized per second and the memory allocated per read (tracemalloc peak).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_lean_reads [--rows 5000] [--rounds 5]
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.pool import StaticPool
+
+from src.domain.dto.certification import Certification
+from src.domain.dto.formation import Formation
+from src.domain.dto.project import Project
+from src.domain.dto.social_media import SocialMedia
+from src.infrastructure.adapters.outbound_postgres_adapter import PostgresAdapter
+
+
+def build_rows(model_class, count: int) -> list:
+    now = datetime.now(timezone.utc)
+    factories = {
+        Project: lambda i: {
+            "title": f"Project {i}",
+            "description": "Open source library for data engineering. " * 3,
+            "url": f"https://github.com/ivanildobarauna-dev/project-{i}",
+            "tags": ["python", "data-engineering", f"tag{i}"],
+            "active": i % 4 != 0,
+            "created_at": now,
+        },
+        Formation: lambda i: {
+            "institution": f"Universidade {i}",
+            "type": "Graduação",
+            "course": "Sistemas de Informação",
+            "period": "2010 - 2014",
+            "description": "Bacharelado com ênfase em dados. " * 3,
+            "logo": f"https://cdn.example.com/logos/university{i}.png",
+            "active": True,
+        },
+        Certification: lambda i: {
+            "name": f"Certification {i}",
+            "institution": "Google Cloud",
+            "credential_url": f"https://example.com/credential/{i}",
+            "logo": "https://cdn.example.com/logos/gcp.png",
+            "active": True,
+            "created_at": now,
+        },
+        SocialMedia: lambda i: {
+            "label": f"Network {i}",
+            "url": f"https://social.example.com/{i}",
+            "type": "link",
+            "active": True,
+            "created_at": now,
+        },
+    }
+    return [factories[model_class](i) for i in range(count)]
+
+
+def build_adapter(rows: int) -> PostgresAdapter:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    with engine.begin() as connection:
+        for model_class in (Project, Formation, Certification, SocialMedia):
+            model_class.metadata.create_all(connection, tables=[model_class.__table__])
+            connection.execute(
+                insert(model_class.__table__), build_rows(model_class, rows)
+            )
+
+    return PostgresAdapter(conn=engine)
+
+
+def measure(adapter: PostgresAdapter, model_class, lean: bool, rounds: int) -> tuple:
+    with patch.object(PostgresAdapter, "POSTGRES_LEAN_READS", lean):
+        adapter.get_all(model_class)  # warm-up (statement compilation)
+
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            rows = adapter.get_all(model_class)
+            timings.append(time.perf_counter() - start)
+            del rows
+
+        tracemalloc.start()
+        rows = adapter.get_all(model_class)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return len(rows) / statistics.median(timings), peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    adapter = build_adapter(args.rows)
+
+    print(f"{args.rows} rows per table, median of {args.rounds} reads")
+    print(f"{'entity':<16}{'mode':<8}{'rows/s':>12}{'peak KiB':>12}")
+    for model_class in (Project, Formation, Certification, SocialMedia):
+        for mode, lean in (("orm", False), ("lean", True)):
+            throughput, peak = measure(adapter, model_class, lean, args.rounds)
+            print(
+                f"{model_class.__name__:<16}{mode:<8}{throughput:>12.0f}"
+                f"{peak / 1024:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
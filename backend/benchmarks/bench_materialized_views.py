@@ -0,0 +1,226 @@
+"""Benchmark: experience views computed on read vs. their materialized copies.
+
+Needs a PostgreSQL server (``POSTGRES_*`` settings or ``--dsn``). A scratch
+schema is seeded with ``--companies`` companies of ``--experiences`` positions
+each, plus views computing durations the way ``VW_EXPERIENCES``,
+``VW_COMPANIES_DURATION`` and ``VW_TOTAL_EXPERIENCE`` do. Their ``MV_*`` copies
+are created as in migration 0003. For each view it reports the p50 read
+latency of both, the speedup, and the cost of ``REFRESH ... CONCURRENTLY``. The
+schema is dropped at the end.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_materialized_views [--companies 200]
+        [--experiences 5] [--rounds 50] [--dsn postgresql://...]
+"""
+
+import argparse
+import statistics
+import time
+
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.adapters.outbound_postgres_adapter import PostgresAdapter
+
+SCHEMA = "bench_materialized_views"
+
+DURATION = """
+    CASE
+        WHEN extract(year FROM {age}) = 0
+            THEN extract(month FROM {age}) || ' meses'
+        ELSE extract(year FROM {age}) || ' anos e '
+            || extract(month FROM {age}) || ' meses'
+    END
+"""
+COMPANY_DURATION = DURATION.format(
+    age="age(max(coalesce(e.end_date, current_date)), min(e.start_date))"
+)
+EXPERIENCE_DURATION = DURATION.format(
+    age="age(max(coalesce(e.end_date, current_date)) OVER w, min(e.start_date) OVER w)"
+)
+TOTAL_DURATION = DURATION.format(age="age(current_date, min(start_date))")
+
+SEED = [
+    f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE",
+    f"CREATE SCHEMA {SCHEMA}",
+    f"SET search_path = {SCHEMA}",
+    """
+    CREATE TABLE companies (
+        id serial PRIMARY KEY,
+        name varchar(100) NOT NULL,
+        location varchar(100) NOT NULL,
+        website varchar(200),
+        logo varchar(200)
+    )
+    """,
+    """
+    CREATE TABLE experiences (
+        id serial PRIMARY KEY,
+        company_id integer NOT NULL REFERENCES companies (id),
+        position varchar(100) NOT NULL,
+        description varchar(500) NOT NULL,
+        skills varchar(300) NOT NULL,
+        start_date date NOT NULL,
+        end_date date
+    )
+    """,
+    """
+    INSERT INTO companies (name, location, website, logo)
+    SELECT 'Company ' || i, 'São Paulo, Brasil',
+           'https://company' || i || '.example.com',
+           'https://cdn.example.com/logos/company' || i || '.png'
+    FROM generate_series(1, :companies) AS i
+    """,
+    """
+    INSERT INTO experiences
+        (company_id, position, description, skills, start_date, end_date)
+    SELECT c.id, 'Data Engineer ' || e,
+           repeat('Pipelines de dados em larga escala. ', 4),
+           'Python, SQL, Spark, Airflow',
+           date '2010-01-01' + (c.id * 30 + e * 90),
+           CASE WHEN c.id = 1 AND e = :experiences THEN NULL
+                ELSE date '2010-01-01' + (c.id * 30 + e * 90 + 80) END
+    FROM companies AS c, generate_series(1, :experiences) AS e
+    """,
+    f"""
+    CREATE VIEW vw_companies_duration AS
+    SELECT c.name, {COMPANY_DURATION} AS duration
+    FROM companies AS c JOIN experiences AS e ON e.company_id = c.id
+    GROUP BY c.id, c.name
+    ORDER BY min(e.start_date) DESC
+    """,
+    f"""
+    CREATE VIEW vw_experiences AS
+    SELECT e.position, c.name AS company, c.location, c.website, c.logo,
+           e.description, e.skills, {EXPERIENCE_DURATION} AS duration
+    FROM experiences AS e JOIN companies AS c ON c.id = e.company_id
+    WINDOW w AS (PARTITION BY e.company_id)
+    ORDER BY e.start_date DESC
+    """,
+    f"""
+    CREATE VIEW vw_total_experience AS
+    SELECT {TOTAL_DURATION} AS total_duration
+    FROM experiences
+    """,
+]
+
+VIEWS = ("experiences", "companies_duration", "total_experience")
+
+# View -> (join bringing its sort key, ORDER BY), as in migration 0003
+VIEW_ORDER = {
+    "experiences": (
+        """
+        LEFT JOIN (
+            SELECT c.name AS company, e.position, max(e.start_date) AS started_on
+            FROM experiences AS e JOIN companies AS c ON c.id = e.company_id
+            GROUP BY c.name, e.position
+        ) AS sort_key USING (company, position)
+        """,
+        "sort_key.started_on DESC NULLS LAST, source.company, source.position, "
+        "source.description",
+    ),
+    "companies_duration": (
+        """
+        LEFT JOIN (
+            SELECT c.name, min(e.start_date) AS started_on
+            FROM companies AS c JOIN experiences AS e ON e.company_id = c.id
+            GROUP BY c.name
+        ) AS sort_key USING (name)
+        """,
+        "sort_key.started_on DESC NULLS LAST, source.name, source.duration",
+    ),
+    "total_experience": ("", ""),
+}
+
+
+def materialize(connection, view: str) -> None:
+    """Same definition as migration 0003."""
+    sort_key_join, order_by = VIEW_ORDER[view]
+    order = f"ORDER BY {order_by}" if order_by else ""
+    connection.execute(
+        text(
+            f"""
+            CREATE MATERIALIZED VIEW mv_{view} AS
+                SELECT source.*,
+                       row_number() OVER ({order}) AS view_order,
+                       current_date AS refreshed_on
+                FROM vw_{view} AS source
+                {sort_key_join}
+            WITH DATA
+            """
+        )
+    )
+    connection.execute(
+        text(f"CREATE UNIQUE INDEX ux_mv_{view}_view_order ON mv_{view} (view_order)")
+    )
+
+
+def p50_ms(connection, statement: str, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = connection.execute(text(statement))
+        if result.returns_rows:
+            result.fetchall()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--companies", type=int, default=200)
+    parser.add_argument("--experiences", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument(
+        "--dsn",
+        default=(
+            f"postgresql://{PostgresAdapter.POSTGRES_USER}:"
+            f"{PostgresAdapter.POSTGRES_PASSWORD}@{PostgresAdapter.POSTGRES_HOST}:"
+            f"{PostgresAdapter.POSTGRES_PORT}/{PostgresAdapter.POSTGRES_DB}"
+        ),
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(args.dsn, isolation_level="AUTOCOMMIT")
+    with engine.connect() as connection:
+        try:
+            for statement in SEED:
+                connection.execute(
+                    text(statement),
+                    {"companies": args.companies, "experiences": args.experiences},
+                )
+            for view in VIEWS:
+                materialize(connection, view)
+            connection.execute(text("ANALYZE"))
+
+            print(
+                f"{args.companies} companies x {args.experiences} experiences, "
+                f"p50 of {args.rounds} reads"
+            )
+            print(
+                f"{'view':<22}{'VW_* ms':>10}{'MV_* ms':>10}{'speedup':>10}"
+                f"{'refresh ms':>12}"
+            )
+            for view in VIEWS:
+                computed = p50_ms(connection, f"SELECT * FROM vw_{view}", args.rounds)
+                materialized = p50_ms(
+                    connection,
+                    f"SELECT * FROM mv_{view} ORDER BY view_order",
+                    args.rounds,
+                )
+                refresh = p50_ms(
+                    connection,
+                    f"REFRESH MATERIALIZED VIEW CONCURRENTLY mv_{view}",
+                    max(1, args.rounds // 10),
+                )
+                print(
+                    f"{view:<22}{computed:>10.2f}{materialized:>10.2f}"
+                    f"{computed / materialized:>9.1f}x{refresh:>12.1f}"
+                )
+        finally:
+            connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
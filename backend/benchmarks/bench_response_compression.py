@@ -0,0 +1,133 @@
+"""Benchmark: pre-compressed response variants vs. identity and per-request gzip.
+
+Reports, for ``/api/v1/experiences`` and ``/api/v1/projects``, the bytes sent per
+encoding, the server-side latency of each strategy and the estimated transfer
+time saved on a given link.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_response_compression [--requests 2000] [--mbps 10]
+"""
+
+import argparse
+import gzip
+import statistics
+import time
+from unittest.mock import MagicMock, patch
+
+from flask import Flask
+from flask_restx import Api
+
+from src.domain.dto.experience import Experience
+from src.domain.dto.project import Project
+from src.infrastructure.routes.experiences.view import experiences_ns
+from src.infrastructure.routes.projects.view import projects_ns
+from src.infrastructure.utils.compression import available_encodings
+
+ENDPOINTS = ["/api/v1/experiences", "/api/v1/projects"]
+
+
+def build_service() -> MagicMock:
+    """Service returning payloads shaped like production data."""
+    service = MagicMock()
+    service.experiences.return_value = [
+        Experience(
+            position=f"Senior Data Engineer {i}",
+            company=f"Company {i % 8}",
+            location="São Paulo, Brasil",
+            website=f"https://company{i % 8}.example.com",
+            logo=f"https://cdn.example.com/logos/company{i % 8}.png",
+            description=(
+                "Desenvolvimento de pipelines de dados em larga escala, "
+                "modelagem dimensional e observabilidade de ponta a ponta. "
+            ) * 3,
+            skills="Python, SQL, Spark, Airflow, GCP, BigQuery, Docker, Kubernetes",
+            duration=f"{i % 6} anos e {i % 12} meses",
+        )
+        for i in range(40)
+    ]
+    service.projects.return_value = [
+        Project(
+            id=i,
+            title=f"Project {i}",
+            description="Open source library for data engineering workflows. " * 4,
+            url=f"https://github.com/ivanildobarauna-dev/project-{i}",
+            tags=["python", "data-engineering", "open-source", f"tag{i}"],
+            active=True,
+        )
+        for i in range(30)
+    ]
+    return service
+
+
+def build_app() -> Flask:
+    app = Flask(__name__)
+    api = Api(app)
+    api.add_namespace(experiences_ns, path="/api/v1")
+    api.add_namespace(projects_ns, path="/api/v1")
+    return app
+
+
+def measure(client, path: str, headers: dict, requests: int, post=None) -> float:
+    """Median latency in microseconds of ``requests`` GETs (plus ``post``)."""
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(path, headers=headers)
+        if post is not None:
+            post(response.data)
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--mbps", type=float, default=10.0)
+    args = parser.parse_args()
+
+    service = build_service()
+    app = build_app()
+    client = app.test_client()
+    bytes_per_second = args.mbps * 1_000_000 / 8
+
+    targets = [
+        "src.infrastructure.routes.experiences.view.get_portfolio_data_service",
+        "src.infrastructure.routes.projects.view.get_portfolio_data_service",
+    ]
+    with patch(targets[0], return_value=service), patch(
+        targets[1], return_value=service
+    ):
+        for path in ENDPOINTS:
+            identity = client.get(path).data
+            print(f"\n{path}")
+            print(f"{'strategy':<28}{'bytes':>10}{'median µs':>12}{'transfer ms':>13}")
+
+            rows = [
+                ("identity (snapshot)", len(identity), {}, None),
+                (
+                    "gzip per request (proxy)",
+                    len(gzip.compress(identity, compresslevel=6)),
+                    {},
+                    lambda body: gzip.compress(body, compresslevel=6),
+                ),
+            ]
+            for encoding in available_encodings():
+                body = client.get(path, headers={"Accept-Encoding": encoding}).data
+                rows.append(
+                    (
+                        f"{encoding} (pre-compressed)",
+                        len(body),
+                        {"Accept-Encoding": encoding},
+                        None,
+                    )
+                )
+
+            for name, size, headers, post in rows:
+                latency = measure(client, path, headers, args.requests, post)
+                transfer = size / bytes_per_second * 1000
+                print(f"{name:<28}{size:>10}{latency:>12.1f}{transfer:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Benchmark: serving the portfolio from JSON files vs. the binary snapshot.
+
+``--rows`` items per list dataset are written both as the JSON files read by
+``FileStorageAdapter`` and as a ``portfolio.snapshot``. It reports the file
+sizes, the time to open the snapshot (header, checksum and directory only) and,
+for a worker keeping every dataset in memory, the load time and the memory it
+allocates (tracemalloc peak) with each format.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_snapshot_boot [--rows 2000] [--rounds 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+from src.domain.dto.certification import CertificationRecord
+from src.domain.dto.formation import FormationRecord
+from src.domain.dto.project import ProjectRecord
+from src.domain.dto.social_media import SocialMediaRecord
+from src.infrastructure.utils.portfolio_snapshot import (
+    PortfolioSnapshot,
+    write_snapshot,
+)
+
+DATASET_CLASSES = {
+    "projects": ProjectRecord,
+    "formations": FormationRecord,
+    "certifications": CertificationRecord,
+    "social_media": SocialMediaRecord,
+}
+
+
+def build_datasets(count: int) -> dict:
+    return {
+        "projects": [
+            {
+                "title": f"Project {i}",
+                "description": "Open source library for data engineering. " * 3,
+                "url": f"https://github.com/ivanildobarauna-dev/project-{i}",
+                "tags": ["python", "data-engineering", f"tag{i}"],
+                "active": True,
+            }
+            for i in range(count)
+        ],
+        "formations": [
+            {
+                "institution": f"Universidade {i}",
+                "type": "Graduação",
+                "course": "Sistemas de Informação",
+                "period": "2010 - 2014",
+                "description": "Bacharelado com ênfase em dados. " * 3,
+                "logo": f"https://cdn.example.com/logos/university{i}.png",
+                "active": True,
+            }
+            for i in range(count)
+        ],
+        "certifications": [
+            {
+                "name": f"Certification {i}",
+                "institution": "Google Cloud",
+                "credential_url": f"https://example.com/credential/{i}",
+                "logo": "https://cdn.example.com/logos/gcp.png",
+                "active": True,
+            }
+            for i in range(count)
+        ],
+        "social_media": [
+            {"label": f"Network {i}", "url": f"https://social.example.com/{i}"}
+            for i in range(count)
+        ],
+    }
+
+
+def write_json(folder: str, datasets: dict) -> int:
+    files = {
+        "projects.json": datasets["projects"],
+        "education.json": {
+            "formations": datasets["formations"],
+            "certifications": datasets["certifications"],
+        },
+        "social_media.json": datasets["social_media"],
+    }
+    for name, content in files.items():
+        with open(os.path.join(folder, name), "w", encoding="utf-8") as file:
+            json.dump(content, file, ensure_ascii=False)
+
+    return sum(os.path.getsize(os.path.join(folder, name)) for name in files)
+
+
+def load_json(folder: str) -> dict:
+    with open(os.path.join(folder, "education.json"), encoding="utf-8") as file:
+        education = json.load(file)
+    with open(os.path.join(folder, "projects.json"), encoding="utf-8") as file:
+        projects = json.load(file)
+    with open(os.path.join(folder, "social_media.json"), encoding="utf-8") as file:
+        social_media = json.load(file)
+
+    raw = {"projects": projects, "social_media": social_media, **education}
+    return {
+        name: [DATASET_CLASSES[name](**item) for item in items]
+        for name, items in raw.items()
+    }
+
+
+def load_snapshot(path: str) -> dict:
+    snapshot = PortfolioSnapshot(path)
+    return {
+        name: [record_class(**item) for item in snapshot.read(name)]
+        for name, record_class in DATASET_CLASSES.items()
+    }
+
+
+def measure(load, rounds: int) -> tuple:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        load()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    data = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del data
+
+    return statistics.median(timings), peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    datasets = build_datasets(args.rows)
+    with tempfile.TemporaryDirectory() as folder:
+        json_bytes = write_json(folder, datasets)
+        snapshot_path = os.path.join(folder, "portfolio.snapshot")
+        snapshot_bytes = write_snapshot(snapshot_path, datasets)["bytes"]
+
+        open_ms, open_kib = measure(
+            lambda: PortfolioSnapshot(snapshot_path), args.rounds
+        )
+        json_ms, json_kib = measure(lambda: load_json(folder), args.rounds)
+        snapshot_ms, snapshot_kib = measure(
+            lambda: load_snapshot(snapshot_path), args.rounds
+        )
+
+    print(f"{args.rows} rows per dataset, p50 of {args.rounds} rounds")
+    print(f"{'':<24}{'file KiB':>10}{'load ms':>10}{'alloc KiB':>11}")
+    print(
+        f"{'JSON files':<24}{json_bytes / 1024:>10.0f}{json_ms:>10.1f}"
+        f"{json_kib:>11.0f}"
+    )
+    print(
+        f"{'snapshot (all records)':<24}{snapshot_bytes / 1024:>10.0f}"
+        f"{snapshot_ms:>10.1f}{snapshot_kib:>11.0f}"
+    )
+    print(f"{'snapshot (open only)':<24}{'':>10}{open_ms:>10.2f}{open_kib:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark: worker boot time, default vs. fast-boot mode.
+
+Each round boots ``app.main`` in a fresh interpreter (snapshot mode, so no
+database or Redis is needed) and measures the time until the application is
+ready to serve, with ``FAST_BOOT=false`` and ``FAST_BOOT=true``. One more boot
+per mode runs under ``python -X importtime`` to break the import time down:
+self time per top-level package and the slowest modules (cumulative time).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.bench_startup [--rounds 5] [--top 15]
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import Counter
+
+BOOT = (
+    "import time; started_at = time.perf_counter(); import app.main; "
+    "print(f'boot_ms={(time.perf_counter() - started_at) * 1000}')"
+)
+MODES = {"default": "false", "fast boot": "true"}
+
+
+def boot(fast_boot: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    env = {
+        **os.environ,
+        "SNAPSHOT_MODE": "true",
+        "CACHE_ENABLED": "false",
+        "FAST_BOOT": fast_boot,
+    }
+    command = [sys.executable] + (["-X", "importtime"] if importtime else [])
+    return subprocess.run(
+        command + ["-c", BOOT], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def boot_ms(stdout: str) -> float:
+    # The application logs to stdout too, possibly after the measurement
+    return float(re.search(r"boot_ms=([0-9.]+)", stdout).group(1))
+
+
+def parse_importtime(stderr: str) -> list:
+    """(module, self us, cumulative us) of every ``-X importtime`` line."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        modules.append((module.strip(), int(self_us), int(cumulative_us)))
+
+    return modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    print(f"boot until app.main is imported, p50 of {args.rounds} rounds")
+    for mode, fast_boot in MODES.items():
+        timings = [boot_ms(boot(fast_boot).stdout) for _ in range(args.rounds)]
+        print(f"{mode:<12}{statistics.median(timings):>10.0f} ms")
+
+    for mode, fast_boot in MODES.items():
+        modules = parse_importtime(boot(fast_boot, importtime=True).stderr)
+        packages = Counter()
+        for module, self_us, _ in modules:
+            packages[module.split(".")[0]] += self_us
+
+        print(f"\n{mode}: import self time per package (ms)")
+        for package, self_us in packages.most_common(args.top):
+            print(f"  {package:<66}{self_us / 1000:>8.1f}")
+
+        print(f"{mode}: slowest modules, cumulative (ms)")
+        slowest = sorted(modules, key=lambda module: module[2], reverse=True)
+        for module, _, cumulative_us in slowest[: args.top]:
+            print(f"  {module:<66}{cumulative_us / 1000:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
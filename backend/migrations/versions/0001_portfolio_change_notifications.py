@@ -0,0 +1,95 @@
+"""Notify portfolio data changes through LISTEN/NOTIFY
+
+Every write to a table behind the API emits ``NOTIFY portfolio_changes`` with a
+JSON payload ``{"table": ..., "operation": ..., "seq": ...}``, consumed by
+``PostgresChangeListener`` to invalidate exactly the affected caches. ``seq``
+comes from ``portfolio_change_seq``: workers use it to tell the same change
+apart from a new one, and the listener to know whether it missed changes
+while disconnected.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHANNEL = "portfolio_changes"
+CHANGE_SEQUENCE = "portfolio_change_seq"
+
+# "companies" and "experiences" back VW_EXPERIENCES, VW_COMPANIES_DURATION and
+# VW_TOTAL_EXPERIENCE. Tables that do not exist are skipped.
+TABLES = (
+    "projects",
+    "formations",
+    "certifications",
+    "social_media",
+    "companies",
+    "experiences",
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(f"CREATE SEQUENCE IF NOT EXISTS {CHANGE_SEQUENCE}")
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION notify_portfolio_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify(
+                '{CHANNEL}',
+                json_build_object(
+                    'table', TG_TABLE_NAME,
+                    'operation', TG_OP,
+                    'seq', nextval('{CHANGE_SEQUENCE}')
+                )::text
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    for table in TABLES:
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF to_regclass('public.{table}') IS NOT NULL THEN
+                    DROP TRIGGER IF EXISTS {table}_notify_change ON {table};
+                    CREATE TRIGGER {table}_notify_change
+                        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                        FOR EACH STATEMENT
+                        EXECUTE FUNCTION notify_portfolio_change();
+                END IF;
+            END
+            $$
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF to_regclass('public.{table}') IS NOT NULL THEN
+                    DROP TRIGGER IF EXISTS {table}_notify_change ON {table};
+                END IF;
+            END
+            $$
+            """
+        )
+
+    op.execute("DROP FUNCTION IF EXISTS notify_portfolio_change()")
+    op.execute(f"DROP SEQUENCE IF EXISTS {CHANGE_SEQUENCE}")
@@ -0,0 +1,91 @@
+"""Display order column and partial indexes on active rows
+
+Adds ``display_order`` (backfilled from ``id``, so the current order is kept)
+and one covering index per table, restricted to ``WHERE active``. The read
+``... WHERE active ORDER BY display_order, id`` becomes an index-only scan whose
+cost does not grow with the number of inactive rows.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Table -> columns read by the lean path (``*Record.__slots__``), carried in the
+# index so the heap is not visited. Tables that do not exist are skipped.
+COVERED_COLUMNS = {
+    "projects": (
+        "title",
+        "description",
+        "url",
+        "tags",
+        "active",
+        "created_at",
+        "updated_at",
+    ),
+    "formations": (
+        "institution",
+        "type",
+        "course",
+        "period",
+        "description",
+        "logo",
+        "active",
+    ),
+    "certifications": (
+        "name",
+        "institution",
+        "credential_url",
+        "logo",
+        "active",
+        "created_at",
+        "updated_at",
+    ),
+    "social_media": ("label", "url", "type", "active", "created_at", "updated_at"),
+}
+
+
+def index_name(table: str) -> str:
+    return f"ix_{table}_active_display_order"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in COVERED_COLUMNS.items():
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF to_regclass('public.{table}') IS NOT NULL THEN
+                    ALTER TABLE {table}
+                        ADD COLUMN IF NOT EXISTS display_order integer
+                        NOT NULL DEFAULT 0;
+                    UPDATE {table} SET display_order = id;
+                    COMMENT ON COLUMN {table}.display_order
+                        IS 'Posição de exibição';
+                    CREATE INDEX IF NOT EXISTS {index_name(table)}
+                        ON {table} (display_order, id)
+                        INCLUDE ({", ".join(columns)})
+                        WHERE active;
+                    ANALYZE {table};
+                END IF;
+            END
+            $$
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in COVERED_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS {index_name(table)}")
+        op.execute(f"ALTER TABLE IF EXISTS {table} DROP COLUMN IF EXISTS display_order")
@@ -0,0 +1,267 @@
+"""Materialize the experience views
+
+``VW_EXPERIENCES``, ``VW_COMPANIES_DURATION`` and ``VW_TOTAL_EXPERIENCE``
+recompute date aggregates on every read. Each one gets a materialized copy
+(``MV_*``) that the API reads instead. Every copy has two extra columns.
+``view_order`` numbers the rows in the order of the view and is the unique key
+needed by ``REFRESH MATERIALIZED VIEW CONCURRENTLY``. The views do not expose
+the start dates they sort by: when ``companies`` and ``experiences`` have the
+columns they are computed from, the numbering sorts by those dates, looked up
+in the tables, then by the view's own columns; otherwise by the view's own
+columns only. Either way it is deterministic. ``refreshed_on`` records the
+date the durations were computed. Views that do not exist are skipped.
+
+``refresh_experience_views()`` refreshes the three copies concurrently, so
+readers are never blocked. Writers never refresh them: statement triggers on
+``companies`` and ``experiences`` only log the change in
+``experience_view_changes``, and ``refresh_experience_views(true)`` refreshes
+the copies when a change is pending or they were not refreshed today. It is
+called by ``pg_cron`` every minute when the extension is installed, by the API
+workers when they are notified of a change to those tables or every
+``MATERIALIZED_VIEW_REFRESH_INTERVAL`` seconds, and by
+``flask db refresh-views``.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 16:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHANNEL = "portfolio_changes"
+CRON_JOB = "refresh-experience-views"
+
+# Materialized copy -> (source view, join bringing its sort key, ORDER BY using
+# it, ORDER BY on the view's columns only)
+VIEWS = {
+    "mv_experiences": (
+        "vw_experiences",
+        """
+        LEFT JOIN (
+            SELECT c.name AS company, e.position, max(e.start_date) AS started_on
+            FROM experiences AS e JOIN companies AS c ON c.id = e.company_id
+            GROUP BY c.name, e.position
+        ) AS sort_key USING (company, position)
+        """,
+        "sort_key.started_on DESC NULLS LAST, source.company, source.position, "
+        "source.description",
+        "source.company, source.position, source.description",
+    ),
+    "mv_companies_duration": (
+        "vw_companies_duration",
+        """
+        LEFT JOIN (
+            SELECT c.name, min(e.start_date) AS started_on
+            FROM companies AS c JOIN experiences AS e ON e.company_id = c.id
+            GROUP BY c.name
+        ) AS sort_key USING (name)
+        """,
+        "sort_key.started_on DESC NULLS LAST, source.name, source.duration",
+        "source.name, source.duration",
+    ),
+    # A single row: nothing to sort by
+    "mv_total_experience": ("vw_total_experience", "", "", ""),
+}
+
+# Tables behind the source views
+TABLES = ("companies", "experiences")
+
+# Columns the sort key joins read
+SORT_KEY_COLUMNS = (
+    ("companies", "id"),
+    ("companies", "name"),
+    ("experiences", "company_id"),
+    ("experiences", "position"),
+    ("experiences", "start_date"),
+)
+
+
+def materialized_view(materialized: str, source: str, join: str, order_by: str) -> str:
+    order = f"ORDER BY {order_by}" if order_by else ""
+    return f"""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS {materialized} AS
+            SELECT source.*,
+                   row_number() OVER ({order}) AS view_order,
+                   current_date AS refreshed_on
+            FROM {source} AS source
+            {join}
+        WITH DATA
+    """
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    sort_key_columns = ", ".join(
+        f"('{table}', '{column}')" for table, column in SORT_KEY_COLUMNS
+    )
+    for materialized, (source, join, order_by, view_order_by) in VIEWS.items():
+        with_sort_key = materialized_view(materialized, source, join, order_by)
+        without_sort_key = materialized_view(materialized, source, "", view_order_by)
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF to_regclass('public.{source}') IS NULL THEN
+                    RETURN;
+                END IF;
+
+                IF (
+                    SELECT count(*) FROM information_schema.columns
+                    WHERE table_schema = 'public'
+                        AND (table_name, column_name) IN ({sort_key_columns})
+                ) = {len(SORT_KEY_COLUMNS)} THEN
+                    EXECUTE $view${with_sort_key}$view$;
+                ELSE
+                    EXECUTE $view${without_sort_key}$view$;
+                END IF;
+
+                CREATE UNIQUE INDEX IF NOT EXISTS ux_{materialized}_view_order
+                    ON {materialized} (view_order);
+            END
+            $$
+            """
+        )
+
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS experience_view_changes (
+            id bigserial PRIMARY KEY,
+            changed_at timestamptz NOT NULL DEFAULT now()
+        )
+        """
+    )
+
+    refresh_statements = "\n".join(
+        f"            REFRESH MATERIALIZED VIEW CONCURRENTLY {materialized};"
+        for materialized in VIEWS
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION refresh_experience_views(
+            only_if_stale boolean DEFAULT false
+        ) RETURNS boolean AS $$
+        DECLARE
+            changes bigint[];
+        BEGIN
+            IF NOT only_if_stale THEN
+                PERFORM pg_advisory_xact_lock(hashtext('refresh_experience_views'));
+            ELSIF NOT pg_try_advisory_xact_lock(
+                hashtext('refresh_experience_views')
+            ) THEN
+                -- Another worker is refreshing right now
+                RETURN false;
+            END IF;
+
+            -- Changes committed later stay logged for the next refresh
+            SELECT array_agg(id) INTO changes FROM experience_view_changes;
+            IF only_if_stale AND changes IS NULL
+                    AND (SELECT max(refreshed_on) FROM mv_total_experience)
+                        >= current_date THEN
+                RETURN false;
+            END IF;
+
+{refresh_statements}
+
+            DELETE FROM experience_view_changes WHERE id = ANY (changes);
+            PERFORM pg_notify(
+                '{CHANNEL}',
+                json_build_object('table', 'experiences', 'operation', 'REFRESH')::text
+            );
+
+            RETURN true;
+        END;
+        $$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION log_experience_view_change()
+        RETURNS trigger AS $$
+        BEGIN
+            -- Inserts never wait on each other: writers are not serialized
+            INSERT INTO experience_view_changes DEFAULT VALUES;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public
+        """
+    )
+
+    for table in TABLES:
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF to_regclass('public.{table}') IS NOT NULL THEN
+                    DROP TRIGGER IF EXISTS {table}_log_experience_view_change
+                        ON {table};
+                    CREATE TRIGGER {table}_log_experience_view_change
+                        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                        FOR EACH STATEMENT
+                        EXECUTE FUNCTION log_experience_view_change();
+                END IF;
+            END
+            $$
+            """
+        )
+
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.schedule(
+                    '{CRON_JOB}',
+                    '* * * * *',
+                    'SELECT refresh_experience_views(true)'
+                );
+            END IF;
+        END
+        $$
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        f"""
+        DO $$
+        BEGIN
+            IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+                PERFORM cron.unschedule(jobid) FROM cron.job
+                    WHERE jobname = '{CRON_JOB}';
+            END IF;
+        END
+        $$
+        """
+    )
+
+    for table in TABLES:
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF to_regclass('public.{table}') IS NOT NULL THEN
+                    DROP TRIGGER IF EXISTS {table}_log_experience_view_change
+                        ON {table};
+                END IF;
+            END
+            $$
+            """
+        )
+
+    op.execute("DROP FUNCTION IF EXISTS log_experience_view_change()")
+    op.execute("DROP FUNCTION IF EXISTS refresh_experience_views(boolean)")
+    op.execute("DROP TABLE IF EXISTS experience_view_changes")
+
+    for materialized in VIEWS:
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {materialized}")
@@ -17,6 +17,13 @@ class Certification(Base):
     credential_url = Column(String(200), nullable=True, comment="URL da certificação")
     logo = Column(String(200), nullable=True, comment="Logo da certificação")
     active = Column(Boolean, default=False, comment="Flag para indicar se está ativa")
+    display_order = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Posição de exibição da certificação",
+    )
     created_at = Column(
         DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
     )
@@ -40,3 +47,44 @@ class Certification(Base):
         Converte o objeto Project em um dicionário.
         """
         return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
+
+
+class CertificationRecord:
+    """Read-only projection of ``Certification`` holding the response columns.
+
+    Built straight from Core rows by the lean read path, without ORM hydration;
+    ``updated_at`` falls back to ``created_at``. Unknown keyword arguments (e.g.
+    ``id`` in older cache entries) are ignored.
+    """
+
+    __slots__ = (
+        "name",
+        "institution",
+        "credential_url",
+        "logo",
+        "active",
+        "updated_at",
+    )
+
+    def __init__(
+        self,
+        name=None,
+        institution=None,
+        credential_url=None,
+        logo=None,
+        active=None,
+        updated_at=None,
+        **_,
+    ):
+        self.name = name
+        self.institution = institution
+        self.credential_url = credential_url
+        self.logo = logo
+        self.active = active
+        self.updated_at = updated_at
+
+    # Same payload as the ORM model
+    to_response = Certification.to_response
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
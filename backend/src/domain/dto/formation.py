@@ -17,6 +17,13 @@ class Formation(Base):
     description = Column(String(500), nullable=False, comment="Descrição da formação")
     logo = Column(String(200), nullable=True, comment="Logo da formação")
     active = Column(Boolean, default=False, comment="Flag para indicar se está ativa")
+    display_order = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Posição de exibição da formação",
+    )
 
     def to_response(self):
         """
@@ -37,3 +44,45 @@ class Formation(Base):
         """
         return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
 
+
+class FormationRecord:
+    """Read-only projection of ``Formation`` holding the response columns.
+
+    Built straight from Core rows by the lean read path, without ORM hydration.
+    Unknown keyword arguments (e.g. ``id`` in older cache entries) are ignored.
+    """
+
+    __slots__ = (
+        "institution",
+        "type",
+        "course",
+        "period",
+        "description",
+        "logo",
+        "active",
+    )
+
+    def __init__(
+        self,
+        institution=None,
+        type=None,
+        course=None,
+        period=None,
+        description=None,
+        logo=None,
+        active=None,
+        **_,
+    ):
+        self.institution = institution
+        self.type = type
+        self.course = course
+        self.period = period
+        self.description = description
+        self.logo = logo
+        self.active = active
+
+    # Same payload as the ORM model
+    to_response = Formation.to_response
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
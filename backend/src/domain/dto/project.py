@@ -21,6 +21,13 @@ class Project(Base):
     url = Column(String(200), nullable=False, comment="URL do projeto")
     tags = Column(JSON, nullable=False, comment="Tags do projeto")
     active = Column(Boolean, default=False, comment="Ativo ou não do projeto")
+    display_order = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Posição de exibição do projeto",
+    )
     created_at = Column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -48,3 +55,37 @@ class Project(Base):
         Converte o objeto Project em um dicionário.
         """
         return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
+
+
+class ProjectRecord:
+    """Read-only projection of ``Project`` holding the response columns.
+
+    Built straight from Core rows by the lean read path, without ORM hydration;
+    ``updated_at`` falls back to ``created_at``. Unknown keyword arguments (e.g.
+    ``id`` in older cache entries) are ignored.
+    """
+
+    __slots__ = ("title", "description", "url", "tags", "active", "updated_at")
+
+    def __init__(
+        self,
+        title=None,
+        description=None,
+        url=None,
+        tags=None,
+        active=None,
+        updated_at=None,
+        **_,
+    ):
+        self.title = title
+        self.description = description
+        self.url = url
+        self.tags = tags
+        self.active = active
+        self.updated_at = updated_at
+
+    # Same payload as the ORM model
+    to_response = Project.to_response
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
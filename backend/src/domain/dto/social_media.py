@@ -22,6 +22,13 @@ class SocialMedia(Base):
         default=False,
         comment="Flag para indicar se a rede social está ativa ou não",
     )
+    display_order = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="Posição de exibição da rede social",
+    )
     created_at = Column(
         DateTime(timezone=True),
         default=lambda: datetime.now(timezone.utc),
@@ -49,3 +56,34 @@ class SocialMedia(Base):
         """
         return {c.key: getattr(self, c.key) for c in inspect(self).mapper.column_attrs}
 
+
+class SocialMediaRecord:
+    """Read-only projection of ``SocialMedia`` holding the response columns.
+
+    Built straight from Core rows by the lean read path, without ORM hydration;
+    ``updated_at`` falls back to ``created_at``. Unknown keyword arguments (e.g.
+    ``id`` in older cache entries) are ignored.
+    """
+
+    __slots__ = ("label", "url", "type", "active", "updated_at")
+
+    def __init__(
+        self,
+        label=None,
+        url=None,
+        type=None,
+        active=None,
+        updated_at=None,
+        **_,
+    ):
+        self.label = label
+        self.url = url
+        self.type = type
+        self.active = active
+        self.updated_at = updated_at
+
+    # Same payload as the ORM model
+    to_response = SocialMedia.to_response
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
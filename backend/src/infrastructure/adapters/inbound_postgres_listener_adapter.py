@@ -0,0 +1,165 @@
+"""Postgres LISTEN/NOTIFY listener for portfolio data changes."""
+
+import json
+import os
+import select
+import threading
+from typing import Callable, Optional, Set, Tuple
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Pseudo table name meaning "something changed, the table is unknown"
+UNKNOWN_TABLE = "*"
+
+
+def parse_notification(payload: str) -> Tuple[str, Optional[int]]:
+    """Table name and change number of a ``notify_portfolio_change()`` payload.
+
+    The change number is ``None`` for payloads that do not carry one.
+    """
+    try:
+        notification = json.loads(payload)
+        table = notification["table"]
+    except (ValueError, TypeError, KeyError):
+        return UNKNOWN_TABLE, None
+
+    change = notification.get("seq")
+    return table, change if isinstance(change, int) else None
+
+
+class PostgresChangeListener:
+    """Consumes ``NOTIFY portfolio_changes`` events emitted by the table triggers.
+
+    Notifications received in the same poll are coalesced, so a burst of writes
+    results in one ``on_change(tables, changes)`` call with the set of changed
+    tables and the ids of the changes behind them. Every worker receives the
+    same ids, which lets them agree on who reloads what; the set is empty when
+    some change has no id. The connection is re-established automatically when
+    it drops; everything is reported as changed only if the change sequence
+    moved while the listener was away.
+    """
+
+    CHANNEL = "portfolio_changes"
+    CHANGE_SEQUENCE = "portfolio_change_seq"
+    POSTGRES_LISTEN_POLL_TIMEOUT = float(os.getenv("POSTGRES_LISTEN_POLL_TIMEOUT", "5"))
+    POSTGRES_LISTEN_RECONNECT_DELAY = float(
+        os.getenv("POSTGRES_LISTEN_RECONNECT_DELAY", "5")
+    )
+
+    def __init__(
+        self,
+        dsn: str,
+        on_change: Callable[[Set[str], Set[str]], None],
+        connect=None,
+    ) -> None:
+        self.dsn = dsn
+        self.on_change = on_change
+        self._connect = connect or psycopg2.connect
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._listened = False
+        # Latest change number this listener knows about
+        self._last_change: Optional[int] = None
+
+    def start(self) -> threading.Thread:
+        """Listen in a daemon thread of the current worker."""
+        self._thread = threading.Thread(
+            target=self.run_forever, name="postgres-change-listener", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.POSTGRES_LISTEN_POLL_TIMEOUT + 1)
+
+    def run_forever(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+            except psycopg2.Error as e:
+                logger.warning(
+                    f"⚠️  Listener do Postgres desconectado: {str(e)}. "
+                    f"Reconectando em {self.POSTGRES_LISTEN_RECONNECT_DELAY}s..."
+                )
+                self._stop_event.wait(self.POSTGRES_LISTEN_RECONNECT_DELAY)
+
+    def _listen(self) -> None:
+        connection = self._connect(self.dsn)
+        try:
+            connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.CHANNEL};")
+            logger.info(f"👂 Escutando alterações no canal '{self.CHANNEL}'")
+
+            last_change = self._read_last_change(connection)
+            if self._missed_changes(last_change):
+                logger.warning(
+                    "⚠️  Alterações podem ter sido perdidas enquanto o listener "
+                    "estava desconectado, invalidando todo o cache"
+                )
+                # Workers reconnecting at the same point share the reload
+                changes = set() if last_change is None else {f"r{last_change}"}
+                self._dispatch({UNKNOWN_TABLE}, changes)
+
+            while not self._stop_event.is_set():
+                readable, _, _ = select.select(
+                    [connection], [], [], self.POSTGRES_LISTEN_POLL_TIMEOUT
+                )
+                if readable:
+                    self._dispatch(*self._drain(connection))
+        finally:
+            connection.close()
+
+    def _read_last_change(self, connection) -> Optional[int]:
+        """Current value of the change sequence; ``None`` if it can't be read."""
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT last_value FROM {self.CHANGE_SEQUENCE};")
+                return cursor.fetchone()[0]
+        except psycopg2.Error as e:
+            logger.warning(f"Falha ao ler a sequência de alterações: {str(e)}")
+            return None
+
+    def _missed_changes(self, last_change: Optional[int]) -> bool:
+        """Whether changes were made since this listener last heard from Postgres.
+
+        Nothing is missed on the first connection: the worker was just booted.
+        """
+        listened, known = self._listened, self._last_change
+        self._listened, self._last_change = True, last_change
+        if not listened:
+            return False
+
+        return last_change is None or known is None or last_change > known
+
+    def _drain(self, connection) -> Tuple[Set[str], Set[str]]:
+        connection.poll()
+        tables, changes, complete = set(), set(), True
+        while connection.notifies:
+            notification = connection.notifies.pop(0)
+            table, change = parse_notification(notification.payload)
+            tables.add(table)
+            if change is None:
+                complete = False
+                continue
+
+            changes.add(str(change))
+            if self._last_change is not None:
+                self._last_change = max(self._last_change, change)
+        return tables, changes if complete else set()
+
+    def _dispatch(self, tables: Set[str], changes: Set[str]) -> None:
+        if not tables:
+            return
+
+        try:
+            self.on_change(tables, changes)
+        except Exception as e:
+            logger.error(f"Erro ao processar alterações {sorted(tables)}: {str(e)}")
@@ -0,0 +1,119 @@
+"""Asyncio PostgreSQL adapter (SQLAlchemy asyncio on top of asyncpg)."""
+
+from typing import Optional, Type
+
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from src.domain.dto.certification import Certification
+from src.domain.dto.company_duration import CompanyDuration
+from src.domain.dto.experience import Experience
+from src.domain.dto.formation import Formation
+from src.domain.dto.project import Project
+from src.domain.dto.social_media import SocialMedia
+from src.infrastructure.adapters.outbound_postgres_adapter import (
+    LEAN_RECORDS,
+    PostgresAdapter,
+    read_statement,
+)
+from src.infrastructure.ports.async_repository_interface import (
+    AsyncRepositoryInterface,
+)
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncPostgresAdapter(AsyncRepositoryInterface):
+    """Non-blocking counterpart of ``PostgresAdapter``, sharing its settings.
+
+    Connections are opened on first use, and concurrent queries are bounded by
+    the pool size instead of the number of server threads.
+    """
+
+    POSTGRES_POOL_SIZE = PostgresAdapter.POSTGRES_POOL_SIZE
+    POSTGRES_MAX_OVERFLOW = PostgresAdapter.POSTGRES_MAX_OVERFLOW
+
+    def __init__(self, engine: AsyncEngine = None) -> None:
+        self.connection_string = self.build_connection_string()
+        self.engine = engine or create_async_engine(
+            self.connection_string,
+            pool_size=self.POSTGRES_POOL_SIZE,
+            max_overflow=self.POSTGRES_MAX_OVERFLOW,
+            pool_timeout=PostgresAdapter.POSTGRES_POOL_TIMEOUT,
+            pool_recycle=1800,
+            pool_pre_ping=True,
+            connect_args={
+                "timeout": PostgresAdapter.POSTGRES_CONNECT_TIMEOUT,
+                "server_settings": {
+                    "statement_timeout": str(PostgresAdapter.POSTGRES_STATEMENT_TIMEOUT)
+                },
+            },
+        )
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+
+    def build_connection_string(self) -> str:
+        return (
+            f"postgresql+asyncpg://{PostgresAdapter.POSTGRES_USER}:"
+            f"{PostgresAdapter.POSTGRES_PASSWORD}@{PostgresAdapter.POSTGRES_HOST}:"
+            f"{PostgresAdapter.POSTGRES_PORT}/{PostgresAdapter.POSTGRES_DB}"
+        )
+
+    async def close(self) -> None:
+        await self.engine.dispose()
+
+    async def get_all(self, model_class: Type, **criteria) -> list:
+        record_class = LEAN_RECORDS.get(model_class)
+        if PostgresAdapter.POSTGRES_LEAN_READS and record_class is not None:
+            async with self.engine.connect() as connection:
+                rows = await connection.execute(
+                    read_statement(model_class, True, **criteria)
+                )
+                return [record_class(*row) for row in rows]
+
+        async with self.session_factory() as session:
+            result = await session.scalars(
+                read_statement(model_class, False, **criteria)
+            )
+            return list(result.all())
+
+    async def get_all_projects(self, active: Optional[bool] = None) -> list[Project]:
+        return await self.get_all(Project, active=active)
+
+    async def get_all_certifications(
+        self, active: Optional[bool] = None
+    ) -> list[Certification]:
+        return await self.get_all(Certification, active=active)
+
+    async def get_all_formations(
+        self, active: Optional[bool] = None
+    ) -> list[Formation]:
+        return await self.get_all(Formation, active=active)
+
+    async def get_all_social_media(
+        self, active: Optional[bool] = None
+    ) -> list[SocialMedia]:
+        return await self.get_all(SocialMedia, active=active)
+
+    async def get_all_experiences(self) -> list[Experience]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                PostgresAdapter.experience_query("EXPERIENCES")
+            )
+
+            return [PostgresAdapter.to_experience(row) for row in result]
+
+    async def get_company_duration(self) -> list[CompanyDuration]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                PostgresAdapter.experience_query("COMPANIES_DURATION")
+            )
+
+            return [PostgresAdapter.to_company_duration(row) for row in result]
+
+    async def get_total_experience(self) -> dict:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                PostgresAdapter.experience_query("TOTAL_EXPERIENCE")
+            )
+
+            return PostgresAdapter.to_total_experience(result.fetchone())
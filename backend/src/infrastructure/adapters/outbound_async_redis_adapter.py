@@ -0,0 +1,227 @@
+"""Asyncio Redis adapter (``redis.asyncio``) for caching portfolio data."""
+
+import time
+import uuid
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from redis import asyncio as redis_asyncio
+from redis.asyncio.retry import Retry
+from redis.exceptions import RedisError
+
+from src.infrastructure.adapters.outbound_redis_adapter import (
+    RELEASE_LOCK_SCRIPT,
+    RedisAdapter,
+)
+from src.infrastructure.ports.async_cache_provider_interface import (
+    AsyncCacheProvider,
+)
+from src.infrastructure.utils.cache_codec import (
+    CacheEntry,
+    CacheFormatError,
+    get_cache_codec,
+)
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncRedisAdapter(AsyncCacheProvider):
+    """Non-blocking counterpart of ``RedisAdapter``.
+
+    Entries use the same keys, storage layout, envelope and DTO serialization as
+    ``RedisAdapter``, so the WSGI and ASGI stacks share one cache. Stale entries
+    are served while the single caller holding the refill lock reloads them;
+    there is no waiting on hard misses, the caller just reads the repository.
+    The pool size, timeouts and retry policy are the ones of ``RedisAdapter``,
+    and so is the key namespace; misses are not read from other namespaces.
+    """
+
+    REDIS_TTL = RedisAdapter.REDIS_TTL
+    REDIS_SOFT_TTL = RedisAdapter.REDIS_SOFT_TTL
+    REDIS_LOCK_TTL_MS = RedisAdapter.REDIS_LOCK_TTL_MS
+    LOCK_PREFIX = RedisAdapter.LOCK_PREFIX
+    REDIS_STORAGE_LAYOUT = RedisAdapter.REDIS_STORAGE_LAYOUT
+    BLOB_LAYOUT = RedisAdapter.BLOB_LAYOUT
+    HASH_LAYOUT = RedisAdapter.HASH_LAYOUT
+    ITEMS_SUFFIX = RedisAdapter.ITEMS_SUFFIX
+    INDEX_SUFFIX = RedisAdapter.INDEX_SUFFIX
+    META_FIELD = RedisAdapter.META_FIELD
+    LIST_KIND = RedisAdapter.LIST_KIND
+    OBJECT_KIND = RedisAdapter.OBJECT_KIND
+
+    DTO_CLASSES = RedisAdapter.DTO_CLASSES
+    SERIALIZERS = RedisAdapter.SERIALIZERS
+
+    _deserialize = RedisAdapter._deserialize
+    _serialize = RedisAdapter._serialize
+    _physical = RedisAdapter._physical
+    _item_keys = RedisAdapter._item_keys
+    _storage_keys = RedisAdapter._storage_keys
+    _queue_read = RedisAdapter._queue_read
+    _queue_write = RedisAdapter._queue_write
+    _assemble = RedisAdapter._assemble
+
+    def __init__(self, client: redis_asyncio.Redis = None) -> None:
+        if client is None:
+            pool = redis_asyncio.BlockingConnectionPool(
+                max_connections=RedisAdapter.REDIS_MAX_CONNECTIONS,
+                timeout=RedisAdapter.REDIS_POOL_TIMEOUT,
+                **RedisAdapter.connection_kwargs(Retry),
+            )
+            # The client owns the pool: ``close`` disconnects it too
+            client = redis_asyncio.Redis.from_pool(pool)
+
+        self.redis = client
+        self.codec = get_cache_codec(RedisAdapter.REDIS_CACHE_CODEC)
+        self.namespace = RedisAdapter.current_namespace()
+        self.key_prefix = self.namespace + ":"
+        self._release_lock_script = self.redis.register_script(RELEASE_LOCK_SCRIPT)
+        # key -> (lock token, monotonic start) for the refills owned by this process
+        self._refills: Dict[str, tuple] = {}
+        self._stats: Counter = Counter()
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            name: self._stats[name]
+            for name in (
+                "hits",
+                "stale_hits",
+                "misses",
+                "refills",
+                "coalesced",
+                "incompatible",
+            )
+        }
+
+    async def _acquire_refill_lock(self, key: str) -> bool:
+        token = uuid.uuid4().hex
+        acquired = await self.redis.set(
+            self.LOCK_PREFIX + self._physical(key),
+            token,
+            nx=True,
+            px=self.REDIS_LOCK_TTL_MS,
+        )
+        if acquired:
+            self._refills[key] = (token, time.monotonic())
+            self._stats["refills"] += 1
+        return bool(acquired)
+
+    async def _release_refill_lock(self, key: str) -> None:
+        refill = self._refills.pop(key, None)
+        if refill is None:
+            return
+
+        try:
+            await self._release_lock_script(
+                keys=[self.LOCK_PREFIX + self._physical(key)], args=[refill[0]]
+            )
+        except RedisError as e:
+            logger.warning(f"Falha ao liberar lock de recarga '{key}': {str(e)}")
+
+    def _count(self, name: str) -> None:
+        self._stats[name] += 1
+
+    def _decode(self, key: str, raw: Any) -> Optional[CacheEntry]:
+        """Same as ``RedisAdapter._decode``: other codecs/schemas are misses."""
+        if not raw:
+            return None
+
+        try:
+            return self.codec.decode(raw)
+        except CacheFormatError as e:
+            self._count("incompatible")
+            logger.info(f"Valor de cache incompatível em '{key}': {str(e)}")
+            return None
+
+    async def _read_entries(self, keys: List[str]) -> Dict[str, Any]:
+        """Decoded envelopes of ``keys`` in a single round trip."""
+        if self.REDIS_STORAGE_LAYOUT == self.BLOB_LAYOUT:
+            raws = await self.redis.mget([self._physical(key) for key in keys])
+            return {key: self._decode(key, raw) for key, raw in zip(keys, raws)}
+
+        async with self.redis.pipeline(transaction=True) as pipeline:
+            for key in keys:
+                self._queue_read(pipeline, key)
+            replies = await pipeline.execute()
+        return {
+            key: self._assemble(key, replies[2 * i], replies[2 * i + 1])
+            for i, key in enumerate(keys)
+        }
+
+    async def _resolve(self, key: str, entry: Optional[CacheEntry]) -> Any:
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        data, soft_expires_at, _ = entry
+        if time.time() < soft_expires_at:
+            self._stats["hits"] += 1
+            return data
+
+        self._stats["stale_hits"] += 1
+        if await self._acquire_refill_lock(key):
+            # This caller reloads it; set_many publishes and releases the lock
+            return None
+
+        self._stats["coalesced"] += 1
+        return data
+
+    def _envelope(self, key: str, data: Any) -> bytes:
+        refill = self._refills.get(key)
+        return self.codec.encode(
+            data,
+            soft_expires_at=time.time() + self.REDIS_SOFT_TTL,
+            delta=0.0 if refill is None else time.monotonic() - refill[1],
+        )
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Read several keys with a single round trip (``MGET`` or a pipeline)."""
+        if not keys:
+            return {}
+
+        try:
+            entries = await self._read_entries(keys)
+            return {
+                key: self._deserialize(key, await self._resolve(key, entry))
+                for key, entry in entries.items()
+            }
+        except RedisError as e:
+            logger.error(f"Erro ao obter chaves do Redis: {str(e)}", exc_info=True)
+            raise
+
+    async def set_many(self, items: Dict[str, Any]) -> None:
+        """Write several keys, with their TTL, in a single pipelined round trip."""
+        if not items:
+            return
+
+        try:
+            transaction = self.REDIS_STORAGE_LAYOUT == self.HASH_LAYOUT
+            async with self.redis.pipeline(transaction=transaction) as pipeline:
+                for key, value in items.items():
+                    self._queue_write(pipeline, key, self._serialize(key, value))
+                await pipeline.execute()
+        except RedisError as e:
+            logger.error(f"Redis setting Keys -> {list(items)} Error: {e}")
+            raise
+        finally:
+            for key in items:
+                await self._release_refill_lock(key)
+
+    async def abort_refill(self, keys: List[str]) -> None:
+        """Release the refill locks this process holds on ``keys``, if any."""
+        for key in keys:
+            await self._release_refill_lock(key)
+
+    async def delete_many(self, keys: List[str]) -> None:
+        if not keys:
+            return
+
+        try:
+            await self.redis.delete(*self._storage_keys(keys))
+        except RedisError as e:
+            logger.error(f"Redis deleting Keys -> {keys} Error: {e}")
+            raise
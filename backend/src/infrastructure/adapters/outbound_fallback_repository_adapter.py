@@ -0,0 +1,247 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from src.domain.dto.certification import Certification
+from src.domain.dto.company_duration import CompanyDuration
+from src.domain.dto.experience import Experience
+from src.domain.dto.formation import Formation
+from src.domain.dto.project import Project
+from src.domain.dto.social_media import SocialMedia
+from src.infrastructure.ports.cache_provider_interface import CacheProvider
+from src.infrastructure.ports.repository_interface import RepositoryInterface
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RepositoryUnavailableError(Exception):
+    """Raised when no source of a fallback chain could answer."""
+
+
+class FallbackSource(NamedTuple):
+    """One link of the chain: ``deadline`` in seconds, ``None`` to wait forever."""
+
+    name: str
+    repository: RepositoryInterface
+    deadline: Optional[float] = None
+    circuit_breaker: Optional[CircuitBreaker] = None
+
+
+class CacheRepositoryAdapter(RepositoryInterface):
+    """Read-only repository view of a cache provider.
+
+    A cache miss raises ``LookupError`` so the chain moves on. The cache only
+    holds active rows, which is all an ``active=True`` read may return;
+    ``active=False`` reads find nothing there.
+
+    Entries are read with ``peek``: the service has just missed this cache and
+    may hold the key's refill lock, so a regular read would wait for itself.
+    Stale entries are served too, which is the point when the database is down.
+    """
+
+    # Getter name -> cache key
+    GETTER_KEYS = {
+        getter_name: key
+        for key, (getter_name, _) in CacheProvider.KEY_ACCESSORS.items()
+    }
+
+    def __init__(self, cache_provider: CacheProvider) -> None:
+        self.cache_provider = cache_provider
+
+    def _read(self, getter_name: str, active: Optional[bool] = None) -> Any:
+        data = self.cache_provider.peek(self.GETTER_KEYS[getter_name])
+        if data is None:
+            raise LookupError(f"'{getter_name}' ausente do cache")
+        if active is None:
+            return data
+
+        return [item for item in data if getattr(item, "active", True) == active]
+
+    def get_all_projects(self, active: Optional[bool] = None) -> list[Project]:
+        return self._read("get_all_projects", active)
+
+    def get_all_formations(self, active: Optional[bool] = None) -> list[Formation]:
+        return self._read("get_all_formations", active)
+
+    def get_all_certifications(
+        self, active: Optional[bool] = None
+    ) -> list[Certification]:
+        return self._read("get_all_certifications", active)
+
+    def get_all_experiences(self) -> list[Experience]:
+        return self._read("get_all_experiences")
+
+    def get_all_social_media(self, active: Optional[bool] = None) -> list[SocialMedia]:
+        return self._read("get_all_social_media", active)
+
+    def get_company_duration(self) -> list[CompanyDuration]:
+        return self._read("get_company_duration")
+
+    def get_total_experience(self) -> dict:
+        return self._read("get_total_experience")
+
+
+class FallbackRepositoryAdapter(RepositoryInterface):
+    """Repository that asks its sources in order until one answers in time.
+
+    Each source runs on its own thread pool and gets at most its own
+    ``deadline``; a timeout, an error, an open circuit or a ``None`` answer
+    moves on to the next source. A read that outlives its deadline keeps
+    running in its pool, so a hung database never delays the other sources.
+    Reads are never queued: once ``FALLBACK_MAX_WORKERS`` reads of a source
+    are in flight, that source is skipped at once. When every source fails,
+    ``RepositoryUnavailableError`` is raised.
+
+    The first source is the source of truth. The chain remembers which source
+    last answered each method: ``report`` flags it as degraded while a
+    fallback source serves any of them.
+    """
+
+    FALLBACK_MAX_WORKERS = int(os.getenv("FALLBACK_MAX_WORKERS", "8"))
+
+    # Source name -> its thread pool and the slots of its in-flight reads
+    _executors: Dict[str, Tuple[ThreadPoolExecutor, threading.Semaphore]] = {}
+    _executor_lock = threading.Lock()
+
+    def __init__(self, sources: List[FallbackSource]) -> None:
+        if not sources:
+            raise ValueError("A fallback chain needs at least one source")
+        self.sources = list(sources)
+        # Method -> name of the source that answered its last read
+        self._served_by: Dict[str, str] = {}
+        # Source that answered the last read of each thread
+        self._local = threading.local()
+
+    @classmethod
+    def _get_executor(
+        cls, source_name: str
+    ) -> Tuple[ThreadPoolExecutor, threading.Semaphore]:
+        """Thread pool of a source, created lazily after the worker fork."""
+        executor = cls._executors.get(source_name)
+        if executor is None:
+            with cls._executor_lock:
+                executor = cls._executors.get(source_name)
+                if executor is None:
+                    executor = cls._executors[source_name] = (
+                        ThreadPoolExecutor(
+                            max_workers=cls.FALLBACK_MAX_WORKERS,
+                            thread_name_prefix=f"repository-fallback-{source_name}",
+                        ),
+                        threading.Semaphore(cls.FALLBACK_MAX_WORKERS),
+                    )
+
+        return executor
+
+    @staticmethod
+    def _call_source(source: FallbackSource, method_name: str, kwargs: dict) -> Any:
+        method = getattr(source.repository, method_name)
+        if source.circuit_breaker is None:
+            return method(**kwargs)
+
+        return source.circuit_breaker.call(method, **kwargs)
+
+    @property
+    def primary(self) -> FallbackSource:
+        return self.sources[0]
+
+    def served_from_primary(self) -> bool:
+        return getattr(self._local, "source", self.primary.name) == self.primary.name
+
+    def report(self) -> Dict[str, Any]:
+        """Circuit of each source and the methods a fallback source served last."""
+        fallback = {
+            method: name
+            for method, name in self._served_by.items()
+            if name != self.primary.name
+        }
+        return {
+            "sources": {
+                source.name: (
+                    source.circuit_breaker.report()
+                    if source.circuit_breaker is not None
+                    else None
+                )
+                for source in self.sources
+            },
+            "served_by_fallback": fallback,
+            "degraded": bool(fallback),
+        }
+
+    def _call_with_deadline(
+        self, source: FallbackSource, method_name: str, kwargs: dict
+    ) -> Any:
+        executor, slots = self._get_executor(source.name)
+        if not slots.acquire(blocking=False):
+            raise RuntimeError(
+                f"{self.FALLBACK_MAX_WORKERS} leituras anteriores ainda em andamento"
+            )
+
+        try:
+            future = executor.submit(self._call_source, source, method_name, kwargs)
+        except Exception:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+
+        try:
+            return future.result(timeout=source.deadline)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def _read(self, method_name: str, **kwargs) -> Any:
+        self._local.source = None
+        errors = []
+        for source in self.sources:
+            try:
+                if source.deadline is None:
+                    data = self._call_source(source, method_name, kwargs)
+                else:
+                    data = self._call_with_deadline(source, method_name, kwargs)
+            except FutureTimeoutError:
+                reason = f"sem resposta em {source.deadline}s"
+            except Exception as e:
+                reason = str(e)
+            else:
+                if data is not None:
+                    self._local.source = source.name
+                    self._served_by[method_name] = source.name
+                    return data
+                reason = "resposta vazia"
+
+            errors.append(f"{source.name}: {reason}")
+            logger.warning(
+                f"⚠️  Fonte '{source.name}' falhou em '{method_name}' ({reason}), "
+                f"tentando a próxima"
+            )
+
+        raise RepositoryUnavailableError(
+            f"Nenhuma fonte respondeu '{method_name}': {'; '.join(errors)}"
+        )
+
+    def get_all_projects(self, active: Optional[bool] = None) -> list[Project]:
+        return self._read("get_all_projects", active=active)
+
+    def get_all_formations(self, active: Optional[bool] = None) -> list[Formation]:
+        return self._read("get_all_formations", active=active)
+
+    def get_all_certifications(
+        self, active: Optional[bool] = None
+    ) -> list[Certification]:
+        return self._read("get_all_certifications", active=active)
+
+    def get_all_experiences(self) -> list[Experience]:
+        return self._read("get_all_experiences")
+
+    def get_all_social_media(self, active: Optional[bool] = None) -> list[SocialMedia]:
+        return self._read("get_all_social_media", active=active)
+
+    def get_company_duration(self) -> list[CompanyDuration]:
+        return self._read("get_company_duration")
+
+    def get_total_experience(self) -> dict:
+        return self._read("get_total_experience")
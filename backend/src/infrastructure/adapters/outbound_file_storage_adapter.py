@@ -1,145 +1,398 @@
 import json
+import os
+import threading
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
 
-from dateutil.relativedelta import relativedelta
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - watchdog is an optional speed-up
+    FileSystemEventHandler = object
+    Observer = None
 
-from src.domain.dto.education import Certification, Education, Formation
+from src.domain.dto.certification import CertificationRecord
+from src.domain.dto.company_duration import CompanyDuration
 from src.domain.dto.experience import Experience
-from src.domain.dto.project import Project
-from src.domain.dto.social_media import SocialMedia
+from src.domain.dto.formation import FormationRecord
+from src.domain.dto.project import ProjectRecord
+from src.domain.dto.social_media import SocialMediaRecord
 from src.infrastructure.ports.repository_interface import RepositoryInterface
+from src.infrastructure.utils.logger import get_logger
+from src.infrastructure.utils.portfolio_snapshot import PortfolioSnapshot
+from src.infrastructure.utils.ttl_lru_cache import TTLLRUCache
+
+logger = get_logger(__name__)
+
+
+def _month_ordinal(value: str) -> int:
+    """``"YYYY-MM"`` -> months since year 0, without ``strptime``."""
+    return int(value[:4]) * 12 + int(value[5:7]) - 1
+
+
+@lru_cache(maxsize=1024)
+def _format_duration(months: int) -> str:
+    anos, meses = divmod(months, 12)
+
+    if anos == 0:
+        return f"{meses} {'mês' if meses == 1 else 'meses'}"
+    elif meses == 0:
+        return f"{anos} {'ano' if anos == 1 else 'anos'}"
+    else:
+        return (
+            f"{anos} {'ano' if anos == 1 else 'anos'} e "
+            f"{meses} {'mês' if meses == 1 else 'meses'}"
+        )
+
+
+class _ExperienceAggregate(NamedTuple):
+    experiences: list[Experience]
+    company_duration: list[CompanyDuration]
+    total_duration: str
+
+
+class _MappedSnapshot(NamedTuple):
+    snapshot: PortfolioSnapshot
+    # (getter, record index) -> record recently decoded from this snapshot
+    records: TTLLRUCache
+
+
+class _FolderEventHandler(FileSystemEventHandler):
+    """Reports every path touched in the watched folder to ``callback``."""
+
+    def __init__(self, callback: Callable[[Optional[str]], None]) -> None:
+        super().__init__()
+        self.callback = callback
+
+    def on_any_event(self, event) -> None:
+        self.callback(event.src_path)
+        self.callback(getattr(event, "dest_path", None))
 
 
 class FileStorageAdapter(RepositoryInterface):
-    def __init__(self, folder_path: str) -> None:
-        self.folder_path = folder_path
+    """Repository reading a local snapshot of the portfolio from JSON files.
 
-    def get_all_projects(self) -> list[Project]:
-        with open(self.folder_path + "/projects.json", "r", encoding="utf-8") as file:
-            json_content = json.load(file)
+    ``folder_path`` holds ``projects.json``, ``education.json`` (``formations`` and
+    ``certifications``), ``experiences.json`` (one entry per position, with
+    ``startDate``/``endDate``/``currentJob``) and ``social_media.json``. Entries
+    without an ``active`` flag are considered active.
 
-            projects = [Project(**project) for project in json_content]
+    When ``folder_path`` also holds a binary snapshot (``SNAPSHOT_FILE_NAME``,
+    written by ``flask db export-snapshot``) every dataset is served from it
+    instead: the file is memory-mapped, so gunicorn workers share its pages, and
+    records are decoded from it on each read. Only the most recently decoded
+    records are kept, in a small bounded cache (``SNAPSHOT_RECORD_CACHE_*``). A
+    replaced snapshot is mapped again on the next read.
 
-        return projects
+    Parsed JSON files and the results derived from them are cached per file
+    version (``(path, mtime, size)``), so a repeated read costs one ``stat`` and
+    an edited file is picked up on the next call. With ``FILE_STORAGE_WATCH``
+    and the optional ``watchdog`` package, file events invalidate the cache and
+    reads skip the ``stat`` too.
+    """
 
-    def get_all_educations(self)-> Education:
-        with open(self.folder_path + "/education.json", "r", encoding="utf-8") as file:
-            json_content = json.load(file)
+    FILE_STORAGE_WATCH = os.getenv("FILE_STORAGE_WATCH", "false").lower() == "true"
 
-            certifications = [
-                Certification(**certification)
-                for certification in json_content["certifications"]
-            ]
-            formations = [
-                Formation(**formation) for formation in json_content["formations"]
-            ]
+    SNAPSHOT_FILE_NAME = "portfolio.snapshot"
+    SNAPSHOT_RECORD_CACHE_ENTRIES = int(
+        os.getenv("SNAPSHOT_RECORD_CACHE_ENTRIES", "256")
+    )
+    SNAPSHOT_RECORD_CACHE_BYTES = int(
+        os.getenv("SNAPSHOT_RECORD_CACHE_BYTES", str(1024 * 1024))
+    )
 
-            education = Education(certifications=certifications, formations=formations)
+    # Getter -> (snapshot dataset, record class; None for a plain dict)
+    SNAPSHOT_DATASETS = {
+        "get_all_projects": ("projects", ProjectRecord),
+        "get_all_formations": ("formations", FormationRecord),
+        "get_all_certifications": ("certifications", CertificationRecord),
+        "get_all_experiences": ("experiences", Experience),
+        "get_all_social_media": ("social_media", SocialMediaRecord),
+        "get_company_duration": ("companies_duration", CompanyDuration),
+        "get_total_experience": ("total_experience", None),
+    }
 
-        return education
+    def __init__(self, folder_path: str, watch: Optional[bool] = None) -> None:
+        self.folder_path = folder_path
+        # File name -> (version, {key: parsed or derived value})
+        self._parsed: Dict[str, Tuple[tuple, Dict[Any, Any]]] = {}
+        self._parsed_lock = threading.RLock()
+        self.snapshot_path = os.path.join(folder_path, self.SNAPSHOT_FILE_NAME)
+        self._snapshot: Optional[_MappedSnapshot] = None
+        self._snapshot_signature: Optional[tuple] = None
+        self._snapshot_lock = threading.Lock()
+        # Whether the snapshot was looked up since the watcher last saw it change
+        self._snapshot_checked = False
+        self._observer = None
+        if self.FILE_STORAGE_WATCH if watch is None else watch:
+            self._observer = self._watch()
 
-    def get_all_experiences(self) -> list[Experience]:
-        with open(
-            self.folder_path + "/experiences.json", "r", encoding="utf-8"
-        ) as file:
-            json_content = json.load(file)
-
-            # Agrupar experiências por empresa
-            company_experiences = {}
-            for experience in json_content:
-                company = experience["company"]
-                if company not in company_experiences:
-                    company_experiences[company] = {
-                        "start_dates": [],
-                        "end_dates": [],
-                        "current_job": False,
-                    }
-
-                company_experiences[company]["start_dates"].append(
-                    datetime.strptime(experience["startDate"], "%Y-%m")
-                )
+    def _open_snapshot(self) -> Optional[_MappedSnapshot]:
+        """Mapped snapshot, (re)opened when the file changed; None without one."""
+        if self._observer is not None and self._snapshot_checked:
+            return self._snapshot
 
-                if experience.get("currentJob", False):
-                    company_experiences[company]["current_job"] = True
-                elif "endDate" in experience:
-                    company_experiences[company]["end_dates"].append(
-                        datetime.strptime(experience["endDate"], "%Y-%m")
-                    )
-
-            # Calcular duração total por empresa
-            for experience in json_content:
-                company = experience["company"]
-                company_data = company_experiences[company]
-
-                earliest_start = min(company_data["start_dates"])
-                if company_data["current_job"]:
-                    latest_end = None
-                else:
-                    latest_end = max(company_data["end_dates"])
-
-                experience["duration"] = self._calculate_duration(
-                    earliest_start.strftime("%Y-%m"),
-                    latest_end.strftime("%Y-%m") if latest_end else None,
-                )
+        try:
+            stat = os.stat(self.snapshot_path)
+        except FileNotFoundError:
+            self._snapshot_checked = True
+            return None
 
-                experience["period"] = self._parse_period(
-                    experience["startDate"],
-                    (
-                        experience["endDate"]
-                        if not experience.get("currentJob", False)
-                        else None
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        with self._snapshot_lock:
+            self._snapshot_checked = True
+            if signature != self._snapshot_signature:
+                snapshot = PortfolioSnapshot(self.snapshot_path)
+                # The previous mapping is not closed: readers still decoding it
+                # keep it alive, and it is unmapped once the last one drops it
+                self._snapshot = _MappedSnapshot(
+                    snapshot,
+                    TTLLRUCache(
+                        max_entries=self.SNAPSHOT_RECORD_CACHE_ENTRIES,
+                        max_bytes=self.SNAPSHOT_RECORD_CACHE_BYTES,
+                        default_ttl=float("inf"),
                     ),
                 )
+                self._snapshot_signature = signature
+                logger.info(
+                    f"🗂️  Snapshot {self.snapshot_path} mapeado "
+                    f"(versão {snapshot.version}, sha256 {snapshot.checksum[:12]})"
+                )
 
-            experiences = [Experience(**experience) for experience in json_content]
+            return self._snapshot
 
-        return experiences
+    def _from_snapshot(self, getter_name: str, active: Optional[bool] = None) -> Any:
+        """Records of ``getter_name`` from the snapshot; None without one.
 
-    def get_all_social_media(self) -> list[SocialMedia]:
-        """Get social links"""
-        with open(
-            self.folder_path + "/social_media.json", "r", encoding="utf-8"
-        ) as file:
-            json_content = json.load(file)
+        Each record is decoded from the mapping through its offset, unless it is
+        still in the bounded cache of recently decoded records; callers get a
+        new list (or dict) on every call.
+        """
+        mapped = self._open_snapshot()
+        if mapped is None:
+            return None
 
-        return [SocialMedia(**social_link) for social_link in json_content]
+        dataset, record_class = self.SNAPSHOT_DATASETS[getter_name]
+        data = mapped.snapshot.read(dataset)
+        if record_class is None:
+            return data
 
-    def get_total_duration(self) -> str:
-        """Calcula a duração total em anos desde a primeira experiência até hoje"""
-        with open(
-            self.folder_path + "/experiences.json", "r", encoding="utf-8"
-        ) as file:
-            json_content = json.load(file)
-
-            first_experience_date = min(
-                datetime.strptime(experience["startDate"], "%Y-%m")
-                for experience in json_content
+        records = []
+        for index in range(len(data)):
+            record = mapped.records.get((getter_name, index))
+            if record is None:
+                record = record_class(**data[index])
+                mapped.records.set((getter_name, index), record)
+            if active is None or record.active == active:
+                records.append(record)
+
+        return records
+
+    def _on_file_event(self, path: Optional[str]) -> None:
+        """Watcher callback: forget what was parsed from ``path``."""
+        if not path:
+            return
+
+        file_name = os.path.basename(path)
+        if file_name == self.SNAPSHOT_FILE_NAME:
+            self._snapshot_checked = False
+
+        with self._parsed_lock:
+            self._parsed.pop(file_name, None)
+
+    def _watch(self):
+        if Observer is None:
+            logger.warning(
+                "⚠️  FILE_STORAGE_WATCH requer o pacote 'watchdog'; "
+                "seguindo com verificação por stat"
             )
+            return None
+
+        observer = Observer()
+        observer.daemon = True
+        observer.schedule(_FolderEventHandler(self._on_file_event), self.folder_path)
+        observer.start()
+        logger.info(f"👀 Observando alterações em {self.folder_path}")
+        return observer
+
+    def close(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    def _cached(self, file_name: str, key: Any, compute: Callable[[], Any]) -> Any:
+        """``compute()`` once per version of ``file_name``.
+
+        A version is identified by ``(path, mtime, size)``, so each call costs a
+        ``stat``; with a watcher running, not even that.
+        """
+        path = os.path.join(self.folder_path, file_name)
+        with self._parsed_lock:
+            entry = self._parsed.get(file_name)
+            if entry is None or self._observer is None:
+                stat = os.stat(path)
+                signature = (path, stat.st_mtime_ns, stat.st_size)
+                if entry is None or entry[0] != signature:
+                    entry = (signature, {})
+                    self._parsed[file_name] = entry
 
-            years_diff = relativedelta(datetime.now(), first_experience_date).years
-            return f"{years_diff} {'ano' if years_diff == 1 else 'anos'}"
-
-    def _calculate_duration(self, start_date: str, end_date: str = None) -> str:
-        start = datetime.strptime(start_date, "%Y-%m")
-        end = datetime.strptime(end_date, "%Y-%m") if end_date else datetime.now()
-
-        diff = relativedelta(end, start)
-        anos = diff.years
-        meses = diff.months
-
-        if anos == 0:
-            return f"{meses} {'mês' if meses == 1 else 'meses'}"
-        elif meses == 0:
-            return f"{anos} {'ano' if anos == 1 else 'anos'}"
-        else:
-            return (
-                f"{anos} {'ano' if anos == 1 else 'anos'} e "
-                f"{meses} {'mês' if meses == 1 else 'meses'}"
+            values = entry[1]
+            if key not in values:
+                values[key] = compute()
+
+            return values[key]
+
+    def _load(self, file_name: str) -> Any:
+        def parse() -> Any:
+            with open(
+                os.path.join(self.folder_path, file_name), "r", encoding="utf-8"
+            ) as file:
+                return json.load(file)
+
+        return self._cached(file_name, "json", parse)
+
+    def _records(
+        self,
+        record_class,
+        file_name: str,
+        section: Optional[str],
+        active: Optional[bool],
+    ) -> list:
+        def build() -> list:
+            items = self._load(file_name)
+            if section is not None:
+                items = items[section]
+            records = [record_class(**{"active": True, **item}) for item in items]
+            if active is None:
+                return records
+
+            return [record for record in records if record.active == active]
+
+        return list(self._cached(file_name, (record_class, active), build))
+
+    @staticmethod
+    def _current_month() -> int:
+        """Durations are counted in months, so derived results are kept per month."""
+        today = datetime.now()
+        return today.year * 12 + today.month - 1
+
+    def get_all_projects(self, active: Optional[bool] = None) -> list[ProjectRecord]:
+        snapshot_data = self._from_snapshot("get_all_projects", active)
+        if snapshot_data is not None:
+            return snapshot_data
+
+        return self._records(ProjectRecord, "projects.json", None, active)
+
+    def get_all_formations(
+        self, active: Optional[bool] = None
+    ) -> list[FormationRecord]:
+        snapshot_data = self._from_snapshot("get_all_formations", active)
+        if snapshot_data is not None:
+            return snapshot_data
+
+        return self._records(FormationRecord, "education.json", "formations", active)
+
+    def get_all_certifications(
+        self, active: Optional[bool] = None
+    ) -> list[CertificationRecord]:
+        snapshot_data = self._from_snapshot("get_all_certifications", active)
+        if snapshot_data is not None:
+            return snapshot_data
+
+        return self._records(
+            CertificationRecord, "education.json", "certifications", active
+        )
+
+    def get_all_social_media(
+        self, active: Optional[bool] = None
+    ) -> list[SocialMediaRecord]:
+        """Get social links"""
+        snapshot_data = self._from_snapshot("get_all_social_media", active)
+        if snapshot_data is not None:
+            return snapshot_data
+
+        return self._records(SocialMediaRecord, "social_media.json", None, active)
+
+    def _aggregate_experiences(self) -> _ExperienceAggregate:
+        """Experiences and durations of the current month, once per file version."""
+        current_month = self._current_month()
+
+        return self._cached(
+            "experiences.json",
+            ("aggregate", current_month),
+            lambda: self._aggregate(self._load("experiences.json"), current_month),
+        )
+
+    @staticmethod
+    def _aggregate(entries: list, current_month: int) -> _ExperienceAggregate:
+        """Build every experience result in one pass over ``entries``.
+
+        Each date is parsed once into a month ordinal. A company spans from its
+        first start to its last end, or to ``current_month`` while any of its
+        positions is current or has no end date.
+        """
+        # Empresa -> [primeiro início, último fim (None se em andamento)]
+        spans: Dict[str, list] = {}
+        first_start = current_month
+        for entry in entries:
+            start = _month_ordinal(entry["startDate"])
+            end_date = None if entry.get("currentJob", False) else entry.get("endDate")
+            end = _month_ordinal(end_date) if end_date else None
+            first_start = min(first_start, start)
+
+            span = spans.get(entry["company"])
+            if span is None:
+                spans[entry["company"]] = [start, end]
+                continue
+            if start < span[0]:
+                span[0] = start
+            if span[1] is not None:
+                span[1] = None if end is None else max(span[1], end)
+
+        durations = {
+            company: _format_duration(
+                (current_month if end is None else end) - start
             )
+            for company, (start, end) in spans.items()
+        }
+
+        experiences = [
+            Experience(**{**entry, "duration": durations[entry["company"]]})
+            for entry in entries
+        ]
+
+        years = (current_month - first_start) // 12
+        return _ExperienceAggregate(
+            experiences=experiences,
+            company_duration=[
+                CompanyDuration(name=company, duration=duration)
+                for company, duration in durations.items()
+            ],
+            total_duration=f"{years} {'ano' if years == 1 else 'anos'}",
+        )
 
-    def _parse_period(self, start_date: str, end_date: str = None) -> str:
-        if end_date:
-            return f"{start_date} - {end_date}"
-        else:
-            return f"{start_date} - Atualmente"
+    def get_all_experiences(self) -> list[Experience]:
+        snapshot_data = self._from_snapshot("get_all_experiences")
+        if snapshot_data is not None:
+            return snapshot_data
+
+        return list(self._aggregate_experiences().experiences)
+
+    def get_company_duration(self) -> list[CompanyDuration]:
+        snapshot_data = self._from_snapshot("get_company_duration")
+        if snapshot_data is not None:
+            return snapshot_data
+
+        return list(self._aggregate_experiences().company_duration)
 
+    def get_total_experience(self) -> dict:
+        snapshot_data = self._from_snapshot("get_total_experience")
+        if snapshot_data is not None:
+            return snapshot_data
+
+        return {"total_duration": self.get_total_duration()}
+
+    def get_total_duration(self) -> str:
+        """Calcula a duração total em anos desde a primeira experiência até hoje"""
+        return self._aggregate_experiences().total_duration
@@ -0,0 +1,178 @@
+"""In-process (L1) cache adapter sitting in front of a shared CacheProvider."""
+
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from src.domain.dto.certification import Certification
+from src.domain.dto.company_duration import CompanyDuration
+from src.domain.dto.experience import Experience
+from src.domain.dto.formation import Formation
+from src.domain.dto.project import Project
+from src.domain.dto.social_media import SocialMedia
+from src.infrastructure.ports.cache_provider_interface import CacheProvider
+from src.infrastructure.utils.ttl_lru_cache import TTLLRUCache
+
+
+class InMemoryCacheAdapter(CacheProvider):
+    """Per-worker L1 cache holding ready-to-use DTOs.
+
+    Hits are served from worker memory with no network round trip, JSON decoding
+    or DTO rebuilding. Misses are delegated to the optional L2 provider (Redis)
+    and its result is kept in L1. Writes go to both tiers.
+    """
+
+    L1_CACHE_TTL = float(os.getenv("L1_CACHE_TTL", "60"))
+    L1_CACHE_MAX_ENTRIES = int(os.getenv("L1_CACHE_MAX_ENTRIES", "128"))
+    L1_CACHE_MAX_BYTES = int(os.getenv("L1_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+    def __init__(
+        self,
+        l2_cache_provider: Optional[CacheProvider] = None,
+        cache: Optional[TTLLRUCache] = None,
+    ) -> None:
+        self.l2_cache_provider = l2_cache_provider
+        self.cache = cache or TTLLRUCache(
+            max_entries=self.L1_CACHE_MAX_ENTRIES,
+            max_bytes=self.L1_CACHE_MAX_BYTES,
+            default_ttl=self.L1_CACHE_TTL,
+        )
+
+    def _get(self, key: str, getter_name: str) -> Optional[Any]:
+        data = self.cache.get(key)
+        if data is not None or self.l2_cache_provider is None:
+            return data
+
+        data = getattr(self.l2_cache_provider, getter_name)()
+        if data is not None:
+            self.cache.set(key, data)
+
+        return data
+
+    def _set(self, key: str, data: Any, setter_name: str) -> None:
+        self.cache.set(key, data)
+
+        if self.l2_cache_provider is not None:
+            getattr(self.l2_cache_provider, setter_name)(data)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Serve what L1 holds and fetch the rest from L2 in one bulk call."""
+        results = {key: self.cache.get(key) for key in keys}
+        missing = [key for key, data in results.items() if data is None]
+        if not missing or self.l2_cache_provider is None:
+            return results
+
+        for key, data in self.l2_cache_provider.get_many(missing).items():
+            if data is not None:
+                self.cache.set(key, data)
+            results[key] = data
+
+        return results
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        for key, data in items.items():
+            self.cache.set(key, data)
+
+        if self.l2_cache_provider is not None:
+            self.l2_cache_provider.set_many(items)
+
+    def delete_many(self, keys: List[str]) -> None:
+        for key in keys:
+            self.cache.delete(key)
+
+        if self.l2_cache_provider is not None:
+            self.l2_cache_provider.delete_many(keys)
+
+    def peek(self, key: str) -> Optional[Any]:
+        """L1 copy of ``key``, else L2's stored value without taking a refill lock.
+
+        A stale L2 value is not kept in L1.
+        """
+        data = self.cache.get(key)
+        if data is not None or self.l2_cache_provider is None:
+            return data
+
+        return self.l2_cache_provider.peek(key)
+
+    def abort_refill(self, keys: List[str]) -> None:
+        if self.l2_cache_provider is not None:
+            self.l2_cache_provider.abort_refill(keys)
+
+    def drop_local(self, keys: List[str]) -> None:
+        for key in keys:
+            self.cache.delete(key)
+
+    def get_items(self, key: str, ids: List[str]) -> Optional[Any]:
+        """Filter the L1 copy when there is one, otherwise ask L2 for the subset."""
+        if self.cache.get(key) is not None or self.l2_cache_provider is None:
+            return super().get_items(key, ids)
+
+        return self.l2_cache_provider.get_items(key, ids)
+
+    def set_item(self, key: str, item: Any) -> None:
+        self.cache.delete(key)
+
+        if self.l2_cache_provider is not None:
+            self.l2_cache_provider.set_item(key, item)
+
+    def delete_item(self, key: str, item_id: str) -> None:
+        self.cache.delete(key)
+
+        if self.l2_cache_provider is not None:
+            self.l2_cache_provider.delete_item(key, item_id)
+
+    def register_refresher(self, key: str, refresh: Callable[[], None]) -> None:
+        if self.l2_cache_provider is not None:
+            self.l2_cache_provider.register_refresher(key, refresh)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and memory usage of the L1 tier, plus the L2 counters."""
+        return {
+            "l1": self.cache.stats(),
+            "l2": self.l2_cache_provider.stats() if self.l2_cache_provider else {},
+        }
+
+    def get_all_projects(self) -> Optional[List[Project]]:
+        return self._get(self.PROJECTS_KEY, "get_all_projects")
+
+    def get_all_formations(self) -> Optional[List[Formation]]:
+        return self._get(self.FORMATIONS_KEY, "get_all_formations")
+
+    def get_all_certifications(self) -> Optional[List[Certification]]:
+        return self._get(self.CERTIFICATIONS_KEY, "get_all_certifications")
+
+    def get_all_experiences(self) -> Optional[List[Experience]]:
+        return self._get(self.EXPERIENCES_KEY, "get_all_experiences")
+
+    def get_all_social_media(self) -> Optional[List[SocialMedia]]:
+        return self._get(self.SOCIAL_MEDIA_KEY, "get_all_social_media")
+
+    def get_company_duration(self) -> Optional[List[CompanyDuration]]:
+        return self._get(self.COMPANY_DURATION_KEY, "get_company_duration")
+
+    def get_total_experience(self) -> Optional[Dict[str, Any]]:
+        return self._get(self.TOTAL_EXPERIENCE_KEY, "get_total_experience")
+
+    def set_projects(self, list_projects: List[Project]) -> None:
+        self._set(self.PROJECTS_KEY, list_projects, "set_projects")
+
+    def set_formations(self, list_formations: List[Formation]) -> None:
+        self._set(self.FORMATIONS_KEY, list_formations, "set_formations")
+
+    def set_certifications(self, list_certifications: List[Certification]) -> None:
+        self._set(self.CERTIFICATIONS_KEY, list_certifications, "set_certifications")
+
+    def set_experiences(self, list_experiences: List[Experience]) -> None:
+        self._set(self.EXPERIENCES_KEY, list_experiences, "set_experiences")
+
+    def set_social_media(self, list_social_media: List[SocialMedia]) -> None:
+        self._set(self.SOCIAL_MEDIA_KEY, list_social_media, "set_social_media")
+
+    def set_company_duration(
+        self, list_company_duration: List[CompanyDuration]
+    ) -> None:
+        self._set(
+            self.COMPANY_DURATION_KEY, list_company_duration, "set_company_duration"
+        )
+
+    def set_total_experience(self, total_experience: Dict[str, Any]) -> None:
+        self._set(self.TOTAL_EXPERIENCE_KEY, total_experience, "set_total_experience")
@@ -1,24 +1,60 @@
 import os
-import time
 
 from contextlib import contextmanager
-from typing import Type
+from functools import lru_cache
+from typing import Optional, Type
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import Select, TextClause, create_engine, func, select, text
 from sqlalchemy.orm import scoped_session, sessionmaker
-from sqlalchemy.exc import SQLAlchemyError
 
-from src.domain.dto.certification import Certification
+from src.domain.dto.certification import Certification, CertificationRecord
 from src.domain.dto.company_duration import CompanyDuration
 from src.domain.dto.experience import Experience
-from src.domain.dto.formation import Formation
-from src.domain.dto.project import Project
-from src.domain.dto.social_media import SocialMedia
+from src.domain.dto.formation import Formation, FormationRecord
+from src.domain.dto.project import Project, ProjectRecord
+from src.domain.dto.social_media import SocialMedia, SocialMediaRecord
 from src.infrastructure.ports.repository_interface import RepositoryInterface
 from src.infrastructure.utils.logger import get_logger 
 
 logger = get_logger(__name__)
 
+# ORM model -> slotted record built by the lean read path
+LEAN_RECORDS = {
+    Project: ProjectRecord,
+    Formation: FormationRecord,
+    Certification: CertificationRecord,
+    SocialMedia: SocialMediaRecord,
+}
+
+
+@lru_cache(maxsize=None)
+def lean_select(model_class: Type) -> Select:
+    """Core SELECT of the record's columns, in the order of its ``__slots__``."""
+    table = model_class.__table__
+    columns = [
+        func.coalesce(table.c.updated_at, table.c.created_at).label("updated_at")
+        if name == "updated_at"
+        else table.c[name]
+        for name in LEAN_RECORDS[model_class].__slots__
+    ]
+    return select(*columns)
+
+
+def read_statement(model_class: Type, lean: bool, **criteria) -> Select:
+    """SELECT of the ``model_class`` rows matching ``criteria``, in display order.
+
+    ``criteria`` are column equalities; ``None`` values are ignored. ``active``
+    filtering runs in the database, matching the partial ``WHERE active`` indexes.
+    """
+    table = model_class.__table__
+    statement = lean_select(model_class) if lean else select(model_class)
+
+    conditions = [
+        table.c[name] == value for name, value in criteria.items() if value is not None
+    ]
+
+    return statement.where(*conditions).order_by(table.c.display_order, table.c.id)
+
 
 class PostgresAdapter(RepositoryInterface):
     POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
@@ -26,6 +62,16 @@ class PostgresAdapter(RepositoryInterface):
     POSTGRES_USER = os.getenv("POSTGRES_USER", "backend")
     POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "backend")
     POSTGRES_DB = os.getenv("POSTGRES_DB", "portfolio")
+    POSTGRES_POOL_SIZE = int(os.getenv("POSTGRES_POOL_SIZE", "5"))
+    POSTGRES_MAX_OVERFLOW = int(os.getenv("POSTGRES_MAX_OVERFLOW", "10"))
+    # Seconds to open a connection / wait for a pooled one; query limit in ms
+    POSTGRES_CONNECT_TIMEOUT = int(os.getenv("POSTGRES_CONNECT_TIMEOUT", "3"))
+    POSTGRES_POOL_TIMEOUT = float(os.getenv("POSTGRES_POOL_TIMEOUT", "5"))
+    POSTGRES_STATEMENT_TIMEOUT = int(os.getenv("POSTGRES_STATEMENT_TIMEOUT", "5000"))
+    POSTGRES_LEAN_READS = os.getenv("POSTGRES_LEAN_READS", "true").lower() == "true"
+    POSTGRES_MATERIALIZED_VIEWS = (
+        os.getenv("POSTGRES_MATERIALIZED_VIEWS", "true").lower() == "true"
+    )
     
 
     def __init__(self, conn=None) -> None:
@@ -36,39 +82,31 @@ class PostgresAdapter(RepositoryInterface):
     def build_connection_string(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
     
-    def build_engine(self, retry_interval: int = 5):
-        attempt = 0
-        logger.info(f"Conectando ao banco de dados: {self._obfuscated_connection_string()}")
-
-        while True:
-            attempt += 1
-            try:
-                engine = create_engine(self.connection_string,
-                                    echo=False,
-                                    pool_size=5,          
-                                    max_overflow=10,      
-                                    pool_timeout=30,      
-                                    pool_recycle=1800,    
-                                    pool_pre_ping=True)
-                
-                with engine.connect() as connection:
-                    connection.execute(text("SELECT 1"))
-                
-                logger.info(f"✅ Conexão com o banco de dados estabelecida com sucesso! [Tentativa: {attempt}] [PID: {os.getpid()}]")
-                return engine
-                
-            except SQLAlchemyError as e:
-                logger.error(
-                    f"\n{'='*80}\n"
-                    f"❌ Falha na tentativa de conexão #{attempt} [PID: {os.getpid()}]\n"
-                    f"{'-'*80}\n"
-                    f"Erro: {str(e)}\n"
-                    f"String de conexão: {self._obfuscated_connection_string()}\n"
-                    f"Tentando novamente em {retry_interval} segundos...\n"
-                    f"{'='*80}\n"
-                )
-                time.sleep(retry_interval)
-    
+    def build_engine(self):
+        """Engine with bounded timeouts; it only connects on first use.
+
+        Nothing is attempted at startup, so a worker boots even when PostgreSQL
+        is down; failures surface on the calls, within the configured timeouts.
+        """
+        logger.info(
+            f"Banco de dados configurado (conexão sob demanda): "
+            f"{self._obfuscated_connection_string()} [PID: {os.getpid()}]"
+        )
+
+        return create_engine(
+            self.connection_string,
+            echo=False,
+            pool_size=self.POSTGRES_POOL_SIZE,
+            max_overflow=self.POSTGRES_MAX_OVERFLOW,
+            pool_timeout=self.POSTGRES_POOL_TIMEOUT,
+            pool_recycle=1800,
+            pool_pre_ping=True,
+            connect_args={
+                "connect_timeout": self.POSTGRES_CONNECT_TIMEOUT,
+                "options": f"-c statement_timeout={self.POSTGRES_STATEMENT_TIMEOUT}",
+            },
+        )
+
     def _obfuscated_connection_string(self) -> str:
         """Retorna a string de conexão com a senha ofuscada para logs."""
         if not hasattr(self, '_connection_string'):
@@ -95,61 +133,99 @@ class PostgresAdapter(RepositoryInterface):
         finally:
             session.close()
 
-    def get_all(self, model_class: Type) -> list:
-        with self.get_session() as session:
-            return session.query(model_class).all()
-
-    def get_all_projects(self) -> list[Project]:
-        return self.get_all(Project)
+    def get_all(self, model_class: Type, **criteria) -> list:
+        """Rows of ``model_class`` matching ``criteria`` (see ``read_statement``).
 
-    def get_all_certifications(self) -> list[Certification]:
-        return self.get_all(Certification)
+        In lean mode (``POSTGRES_LEAN_READS``) only the response columns are
+        selected through Core and mapped to slotted records; otherwise full ORM
+        objects are hydrated.
+        """
+        record_class = LEAN_RECORDS.get(model_class)
+        if self.POSTGRES_LEAN_READS and record_class is not None:
+            with self.engine.connect() as connection:
+                rows = connection.execute(read_statement(model_class, True, **criteria))
+                return [record_class(*row) for row in rows]
 
-    def get_all_formations(self) -> list[Formation]:
-        return self.get_all(Formation)
+        with self.get_session() as session:
+            return list(
+                session.scalars(read_statement(model_class, False, **criteria)).all()
+            )
+
+    def get_all_projects(self, active: Optional[bool] = None) -> list[Project]:
+        return self.get_all(Project, active=active)
+
+    def get_all_certifications(
+        self, active: Optional[bool] = None
+    ) -> list[Certification]:
+        return self.get_all(Certification, active=active)
+
+    def get_all_formations(self, active: Optional[bool] = None) -> list[Formation]:
+        return self.get_all(Formation, active=active)
+
+    @classmethod
+    def experience_query(cls, view: str) -> TextClause:
+        """SELECT of an experience view (``EXPERIENCES``, ``COMPANIES_DURATION``...).
+
+        Reads the materialized copy ``MV_<view>`` (migration 0003), in the order
+        of the source view, unless ``POSTGRES_MATERIALIZED_VIEWS`` is disabled.
+        """
+        if cls.POSTGRES_MATERIALIZED_VIEWS:
+            return text(f"SELECT * FROM MV_{view} ORDER BY view_order")
+
+        return text(f"SELECT * FROM VW_{view}")
+
+    @staticmethod
+    def to_experience(row) -> Experience:
+        return Experience(
+            position=row.position,
+            company=row.company,
+            location=row.location,
+            website=row.website,
+            logo=row.logo,
+            description=row.description,
+            skills=row.skills,
+            duration=row.duration,
+        )
+
+    @staticmethod
+    def to_company_duration(row) -> CompanyDuration:
+        return CompanyDuration(name=row.name, duration=row.duration)
+
+    @staticmethod
+    def to_total_experience(row) -> dict:
+        return {"total_duration": row[0]} if row else {"total_duration": None}
 
     def get_all_experiences(self) -> list[Experience]:
         with self.get_session() as session:
-            result = session.execute(text("SELECT * FROM VW_EXPERIENCES"))
-            
-            experiences = []
-            
-            for row in result:
-                experience = Experience(
-                    position=row.position,
-                    company=row.company,
-                    location=row.location,
-                    website=row.website,
-                    logo=row.logo,
-                    description=row.description,
-                    skills=row.skills,
-                    duration=row.duration,
-                )
-                experiences.append(experience)
-            
-            return experiences
+            result = session.execute(self.experience_query("EXPERIENCES"))
+
+            return [self.to_experience(row) for row in result]
 
     def get_company_duration(self) -> list[CompanyDuration]:
         with self.get_session() as session:
-            result = session.execute(text("SELECT * FROM VW_COMPANIES_DURATION"))
-
-            companies_durations = []
+            result = session.execute(self.experience_query("COMPANIES_DURATION"))
 
-            for row in result:
-                experience = CompanyDuration(
-                    name=row.name,
-                    duration=row.duration
-                )
-                companies_durations.append(experience)
+            return [self.to_company_duration(row) for row in result]
 
-            return companies_durations
-
-    def get_all_social_media(self) -> list[SocialMedia]:
-        return self.get_all(SocialMedia)
+    def get_all_social_media(self, active: Optional[bool] = None) -> list[SocialMedia]:
+        return self.get_all(SocialMedia, active=active)
 
     def get_total_experience(self) -> dict:
         with self.get_session() as session:
-            result = session.execute(text("SELECT * FROM VW_TOTAL_EXPERIENCE"))
-            row = result.fetchone()
-
-            return {"total_duration": row[0]} if row else {"total_duration": None} 
+            result = session.execute(self.experience_query("TOTAL_EXPERIENCE"))
+
+            return self.to_total_experience(result.fetchone())
+
+    def refresh_experience_views(self, only_if_stale: bool = False) -> bool:
+        """Refresh the materialized experience views; True if they were refreshed.
+
+        With ``only_if_stale`` nothing is done when no table change is pending,
+        they were already refreshed today, or another worker is refreshing them.
+        """
+        with self.engine.begin() as connection:
+            return bool(
+                connection.execute(
+                    text("SELECT refresh_experience_views(:only_if_stale)"),
+                    {"only_if_stale": only_if_stale},
+                ).scalar()
+            )
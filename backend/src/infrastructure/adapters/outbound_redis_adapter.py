@@ -1,154 +1,1135 @@
 """Redis Adapter for caching portfolio data."""
 
-import json
+import math
 import os
-from typing import Optional, List, Dict, Any
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Tuple
 import redis
+from redis.backoff import EqualJitterBackoff
 from redis.exceptions import RedisError
+from redis.retry import Retry
 
-from src.domain.dto.certification import Certification
+from src.domain.dto.certification import Certification, CertificationRecord
 from src.domain.dto.company_duration import CompanyDuration
 from src.domain.dto.experience import Experience
-from src.domain.dto.formation import Formation
-from src.domain.dto.project import Project
-from src.domain.dto.social_media import SocialMedia
+from src.domain.dto.formation import Formation, FormationRecord
+from src.domain.dto.project import Project, ProjectRecord
+from src.domain.dto.social_media import SocialMedia, SocialMediaRecord
 from src.infrastructure.ports.cache_provider_interface import CacheProvider
+from src.infrastructure.utils.app_version import get_application_version
+from src.infrastructure.utils.cache_codec import (
+    CACHE_SCHEMA_VERSION,
+    CacheEntry,
+    CacheFormatError,
+    get_cache_codec,
+)
 from src.infrastructure.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Compare-and-delete, so a worker never releases a lock it no longer owns
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Compare-and-set keeping the TTL: marks a reload this worker owns as finished
+FINISH_INVALIDATION_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("set", KEYS[1], ARGV[2], "KEEPTTL")
+end
+return 0
+"""
+
+# Hash layout: add or replace one item, appending new ids to the ordered index.
+# Datasets that are not cached are left alone, to be written whole.
+SET_ITEM_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return 0
+end
+if redis.call("hset", KEYS[1], ARGV[1], ARGV[2]) == 1 then
+    redis.call("rpush", KEYS[2], ARGV[1])
+    local ttl = redis.call("ttl", KEYS[1])
+    if ttl > 0 then
+        redis.call("expire", KEYS[2], ttl)
+    end
+end
+return 1
+"""
+
+DELETE_ITEM_SCRIPT = """
+if redis.call("hdel", KEYS[1], ARGV[1]) == 1 then
+    redis.call("lrem", KEYS[2], 1, ARGV[1])
+    return 1
+end
+return 0
+"""
+
+
+def _as_text(value: Any) -> Optional[str]:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+class InstrumentedConnectionPool(redis.BlockingConnectionPool):
+    """Bounded pool recording checkouts, saturation and wait times.
+
+    A checkout waits at most ``timeout`` seconds for a free connection and then
+    raises ``ConnectionError``, so request threads never queue unbounded.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._stats_lock = threading.Lock()
+        self._stats: Counter = Counter()
+        self._peak_in_use = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        super().__init__(*args, **kwargs)
+
+    def reset(self) -> None:
+        super().reset()
+        # ids of the connections handed out, dropped with the pool after a fork
+        self._checked_out = set()
+
+    def get_connection(self, *args, **kwargs):
+        started = time.monotonic()
+        with self._stats_lock:
+            if len(self._checked_out) >= self.max_connections:
+                self._stats["saturated"] += 1
+
+        try:
+            connection = super().get_connection(*args, **kwargs)
+        except redis.ConnectionError:
+            with self._stats_lock:
+                self._stats["checkout_failures"] += 1
+            raise
+
+        waited = time.monotonic() - started
+        with self._stats_lock:
+            self._checked_out.add(id(connection))
+            self._peak_in_use = max(self._peak_in_use, len(self._checked_out))
+            self._stats["checkouts"] += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        return connection
+
+    def release(self, connection) -> None:
+        with self._stats_lock:
+            self._checked_out.discard(id(connection))
+        super().release(connection)
+
+    def stats(self) -> Dict[str, Any]:
+        """Pool size and usage; ``saturated`` counts checkouts that had to wait."""
+        with self._stats_lock:
+            checkouts = self._stats["checkouts"]
+            return {
+                "max_connections": self.max_connections,
+                "in_use": len(self._checked_out),
+                "peak_in_use": self._peak_in_use,
+                "checkouts": checkouts,
+                "saturated": self._stats["saturated"],
+                "checkout_failures": self._stats["checkout_failures"],
+                "wait_ms_avg": (
+                    round(self._wait_total / checkouts * 1000, 3) if checkouts else 0.0
+                ),
+                "wait_ms_max": round(self._wait_max * 1000, 3),
+            }
+
 
 class RedisAdapter(CacheProvider):
+    """Shared cache with stampede protection.
+
+    Values are stored in an envelope with a soft expiry (``REDIS_SOFT_TTL``) on top
+    of the hard Redis TTL (``REDIS_TTL``):
+
+    - fresh entries are served as-is; entries get probabilistically "early
+      expired" ahead of the soft expiry (XFetch), weighted by the refill time;
+    - stale entries keep being served while a single worker, holding the per-key
+      refill lock, refreshes them in the background;
+    - on a hard miss only the lock holder recomputes, the others wait up to
+      ``REDIS_REFILL_WAIT`` seconds (at most ``REDIS_CALL_BUDGET``) for the new
+      value before falling back.
+
+    ``REDIS_STORAGE_LAYOUT`` picks how a dataset is stored:
+
+    - ``blob`` (default): one value per cache key;
+    - ``hash``: one hash field per item under ``<key>:items``, next to a
+      ``__meta__`` field holding the envelope, plus the ordered item ids in the
+      ``<key>:index`` list. ``set_item``/``delete_item`` touch a single field and
+      ``get_items`` reads a subset with one ``HMGET``.
+
+    Keys live in a namespace named after ``CACHE_SCHEMA_VERSION`` and
+    ``APP_VERSION`` (``v1:1.4.0:portfolio:projects``), so a deploy never reads
+    values shaped by another release. Until the new namespace is populated and
+    promoted (see ``CacheNamespaceService``), misses in it are read from the
+    current namespace when that one has the same schema version. Namespaces no
+    worker reported for ``REDIS_NAMESPACE_GRACE`` seconds are then deleted.
+
+    Connections come from a bounded pool sized for the gunicorn request threads
+    plus the background refreshers. Timeouts and jittered retries are chosen so
+    a command, retries included, holds a thread at most ``REDIS_CALL_BUDGET``
+    seconds (see ``worst_case_call_time``).
+    """
+
     REDIS_HOST = os.getenv("REDIS_HOST", "localhost") 
     REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
     REDIS_PASSWORD = os.getenv("REDIS_PASSWORD")
     REDIS_DB = int(os.getenv("REDIS_DB", "0"))
     REDIS_TTL = int(os.getenv("REDIS_TTL", "2592000"))  ## 30 days
-    
-    
-    PROJECTS_KEY = "portfolio:projects"
-    FORMATIONS_KEY = "portfolio:formations"
-    CERTIFICATIONS_KEY = "portfolio:certifications"
-    EXPERIENCES_KEY = "portfolio:experiences"
-    SOCIAL_MEDIA_KEY = "portfolio:social_media"
-    COMPANY_DURATION_KEY = "portfolio:company_duration"
-    TOTAL_EXPERIENCE_KEY = "portfolio:total_experience"
+    REDIS_SOFT_TTL = int(os.getenv("REDIS_SOFT_TTL", "3600"))  ## 1 hour
+    REDIS_XFETCH_BETA = float(os.getenv("REDIS_XFETCH_BETA", "1.0"))
+    REDIS_LOCK_TTL_MS = int(os.getenv("REDIS_LOCK_TTL_MS", "10000"))
+    REDIS_REFILL_WAIT = float(os.getenv("REDIS_REFILL_WAIT", "1.0"))
+    REDIS_REFILL_POLL_INTERVAL = 0.05
+    REDIS_CACHE_CODEC = os.getenv("REDIS_CACHE_CODEC", "binary")
+    REDIS_STORAGE_LAYOUT = os.getenv("REDIS_STORAGE_LAYOUT", "blob")
+    APP_VERSION = get_application_version()
+    # Seconds between two reads of the namespace registry by a worker
+    REDIS_NAMESPACE_CHECK_INTERVAL = float(
+        os.getenv("REDIS_NAMESPACE_CHECK_INTERVAL", "5")
+    )
+    REDIS_NAMESPACE_GRACE = int(os.getenv("REDIS_NAMESPACE_GRACE", "3600"))
+    REDIS_NAMESPACE_LOCK_TTL_MS = int(
+        os.getenv("REDIS_NAMESPACE_LOCK_TTL_MS", "120000")
+    )
+    # Longest a worker may hold the reload of a dataset after a table change, and
+    # how long a finished reload is remembered for the workers notified late
+    REDIS_INVALIDATION_LOCK_TTL_MS = int(
+        os.getenv("REDIS_INVALIDATION_LOCK_TTL_MS", "30000")
+    )
+
+    # Must match gunicorn's --threads: one connection per request thread
+    GUNICORN_THREADS = int(os.getenv("GUNICORN_THREADS", "4"))
+    REDIS_REFRESH_WORKERS = 2
+    REDIS_MAX_CONNECTIONS = int(
+        os.getenv(
+            "REDIS_MAX_CONNECTIONS", str(GUNICORN_THREADS + REDIS_REFRESH_WORKERS)
+        )
+    )
+    # Seconds to open a connection / answer a command / get a pooled connection
+    REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "0.05"))
+    REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.25"))
+    REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "0.1"))
+    REDIS_RETRIES = int(os.getenv("REDIS_RETRIES", "1"))
+    REDIS_RETRY_BACKOFF_BASE = float(os.getenv("REDIS_RETRY_BACKOFF_BASE", "0.01"))
+    REDIS_RETRY_BACKOFF_CAP = float(os.getenv("REDIS_RETRY_BACKOFF_CAP", "0.05"))
+    REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+    # Longest a single command may hold a request thread, retries included
+    REDIS_CALL_BUDGET = float(os.getenv("REDIS_CALL_BUDGET", "1.0"))
+
+    LOCK_PREFIX = "lock:"
+    # Value of an invalidation lock once its reload finished
+    INVALIDATION_DONE = "done"
+
+    # Namespace -> status; namespace -> last time a worker used it; the current
+    # (populated) namespace. These keys are global, outside every namespace.
+    NAMESPACES_KEY = "portfolio:namespaces"
+    NAMESPACES_SEEN_KEY = "portfolio:namespaces:seen"
+    CURRENT_NAMESPACE_KEY = "portfolio:namespaces:current"
+    NAMESPACE_WARMING = "warming"
+    NAMESPACE_READY = "ready"
+
+    BLOB_LAYOUT = "blob"
+    HASH_LAYOUT = "hash"
+    ITEMS_SUFFIX = ":items"
+    INDEX_SUFFIX = ":index"
+    META_FIELD = b"__meta__"
+    # Envelope data of the hash layout: how to reassemble the items
+    LIST_KIND = "list"
+    OBJECT_KIND = "object"
+
+    # Cache key -> DTO rebuilt from each cached item (None: stored as-is). Lean
+    # records are cheaper to rebuild than ORM objects and expose the same API.
+    DTO_CLASSES = {
+        CacheProvider.PROJECTS_KEY: ProjectRecord,
+        CacheProvider.FORMATIONS_KEY: FormationRecord,
+        CacheProvider.CERTIFICATIONS_KEY: CertificationRecord,
+        CacheProvider.EXPERIENCES_KEY: Experience,
+        CacheProvider.SOCIAL_MEDIA_KEY: SocialMediaRecord,
+        CacheProvider.COMPANY_DURATION_KEY: CompanyDuration,
+        CacheProvider.TOTAL_EXPERIENCE_KEY: None,
+    }
+    # Cache key -> DTO method producing the cached representation of each item
+    SERIALIZERS = {
+        CacheProvider.PROJECTS_KEY: "to_dict",
+        CacheProvider.FORMATIONS_KEY: "to_dict",
+        CacheProvider.CERTIFICATIONS_KEY: "to_dict",
+        CacheProvider.EXPERIENCES_KEY: "model_dump",
+        CacheProvider.SOCIAL_MEDIA_KEY: "to_dict",
+        CacheProvider.COMPANY_DURATION_KEY: "to_response",
+        CacheProvider.TOTAL_EXPERIENCE_KEY: None,
+    }
 
     def __init__(self) -> None:
-        redis_kwargs = {
-            "host": self.REDIS_HOST,
-            "port": self.REDIS_PORT,
-            "db": self.REDIS_DB,
-            "decode_responses": True,
-        }
-        if self.REDIS_PASSWORD:
-            redis_kwargs["password"] = self.REDIS_PASSWORD
+        if self.REDIS_STORAGE_LAYOUT not in (self.BLOB_LAYOUT, self.HASH_LAYOUT):
+            raise ValueError(
+                f"Unknown REDIS_STORAGE_LAYOUT '{self.REDIS_STORAGE_LAYOUT}' "
+                f"(expected '{self.BLOB_LAYOUT}' or '{self.HASH_LAYOUT}')"
+            )
+
+        self.pool = InstrumentedConnectionPool(
+            max_connections=self.REDIS_MAX_CONNECTIONS,
+            timeout=self.REDIS_POOL_TIMEOUT,
+            **self.connection_kwargs(),
+        )
+        self.redis = redis.Redis(connection_pool=self.pool)
+        self.codec = get_cache_codec(self.REDIS_CACHE_CODEC)
+        self.namespace = self.current_namespace()
+        self.key_prefix = self.namespace + ":"
+        # Prefix of the namespace read on misses while ours is not ready
+        self._fallback_prefix: Optional[str] = None
+        self._namespace_checked_at: Optional[float] = None
+        self._namespace_token: Optional[str] = None
+        # dataset -> (token, locks claimed), for the reloads this worker runs
+        self._invalidation_tokens: Dict[str, Tuple[str, List[str]]] = {}
+        self._release_lock_script = self.redis.register_script(RELEASE_LOCK_SCRIPT)
+        self._finish_invalidation_script = self.redis.register_script(
+            FINISH_INVALIDATION_SCRIPT
+        )
+        self._set_item_script = self.redis.register_script(SET_ITEM_SCRIPT)
+        self._delete_item_script = self.redis.register_script(DELETE_ITEM_SCRIPT)
 
-        self.redis = redis.Redis(**redis_kwargs)
+        # key -> lock token, for the refills owned by this process
+        self._refill_tokens: Dict[str, str] = {}
+        # key -> monotonic start of the refill, used as the XFetch delta
+        self._refill_started: Dict[str, float] = {}
+        self._refreshers: Dict[str, Callable[[], None]] = {}
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._state_lock = threading.Lock()
+        self._stats: Counter = Counter()
 
         try:
+            # Retried with backoff like any other command
             self.redis.ping()
         except RedisError as e:
             logger.error(f"Erro de conexão com o Redis: {str(e)}", exc_info=True)
             raise
 
-    def get_cache_data_by_key(self, key: str):
+        self._check_namespace(force=True)
+
+    @classmethod
+    def current_namespace(cls) -> str:
+        """Namespace of this release: schema version plus application version."""
+        return f"v{CACHE_SCHEMA_VERSION}:{cls.APP_VERSION}"
+
+    @classmethod
+    def worst_case_call_time(cls, retries: int) -> float:
+        """Upper bound, in seconds, of a command retried ``retries`` times.
+
+        Each attempt may reconnect, and redis-py retries the connect itself with
+        the same policy. Health-check pings are left out.
+        """
+        backoff = retries * cls.REDIS_RETRY_BACKOFF_CAP
+        connect = (retries + 1) * cls.REDIS_CONNECT_TIMEOUT + backoff
+        attempt = connect + cls.REDIS_SOCKET_TIMEOUT
+        return cls.REDIS_POOL_TIMEOUT + (retries + 1) * attempt + backoff
+
+    @classmethod
+    def refill_wait(cls) -> float:
+        """``REDIS_REFILL_WAIT``, clamped so a waiter fits the call budget too.
+
+        Waiting for another worker's refill holds the request thread like a slow
+        command does, so it is bounded by ``REDIS_CALL_BUDGET`` as well.
+        """
+        return min(cls.REDIS_REFILL_WAIT, cls.REDIS_CALL_BUDGET)
+
+    @classmethod
+    def _retries_within_budget(cls) -> int:
+        """``REDIS_RETRIES``, lowered until the worst case fits the call budget."""
+        retries = cls.REDIS_RETRIES
+        while retries > 0 and cls.worst_case_call_time(retries) > cls.REDIS_CALL_BUDGET:
+            retries -= 1
+
+        if retries < cls.REDIS_RETRIES:
+            logger.warning(
+                f"⚠️  REDIS_RETRIES reduzido de {cls.REDIS_RETRIES} para {retries} "
+                f"para caber em REDIS_CALL_BUDGET={cls.REDIS_CALL_BUDGET}s"
+            )
+        if cls.worst_case_call_time(retries) > cls.REDIS_CALL_BUDGET:
+            logger.warning(
+                f"⚠️  Timeouts do Redis excedem REDIS_CALL_BUDGET="
+                f"{cls.REDIS_CALL_BUDGET}s mesmo sem retries"
+            )
+        return retries
+
+    @classmethod
+    def connection_kwargs(cls, retry_class: type = Retry) -> Dict[str, Any]:
+        """Connection settings shared by the sync and asyncio pools."""
+        kwargs = {
+            "host": cls.REDIS_HOST,
+            "port": cls.REDIS_PORT,
+            "db": cls.REDIS_DB,
+            # Values are bytes produced by the cache codec
+            "decode_responses": False,
+            "socket_connect_timeout": cls.REDIS_CONNECT_TIMEOUT,
+            "socket_timeout": cls.REDIS_SOCKET_TIMEOUT,
+            "health_check_interval": cls.REDIS_HEALTH_CHECK_INTERVAL,
+            "retry": retry_class(
+                EqualJitterBackoff(
+                    cap=cls.REDIS_RETRY_BACKOFF_CAP, base=cls.REDIS_RETRY_BACKOFF_BASE
+                ),
+                cls._retries_within_budget(),
+            ),
+        }
+        if cls.REDIS_PASSWORD:
+            kwargs["password"] = cls.REDIS_PASSWORD
+
+        return kwargs
+
+    def register_refresher(self, key: str, refresh: Callable[[], None]) -> None:
+        self._refreshers[key] = refresh
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters of hits, stale serves, refills and coalesced refills."""
+        with self._state_lock:
+            counters = {
+                name: self._stats[name]
+                for name in (
+                    "hits",
+                    "stale_hits",
+                    "misses",
+                    "refills",
+                    "coalesced",
+                    "early_refreshes",
+                    "background_refreshes",
+                    "refill_wait_timeouts",
+                    "incompatible",
+                    "namespace_fallbacks",
+                )
+            }
+
+        return {**counters, "pool": self.pool.stats()}
+
+    def _count(self, name: str) -> None:
+        with self._state_lock:
+            self._stats[name] += 1
+
+    def _acquire_refill_lock(self, key: str) -> bool:
+        token = uuid.uuid4().hex
+        acquired = self.redis.set(
+            self.LOCK_PREFIX + self._physical(key),
+            token,
+            nx=True,
+            px=self.REDIS_LOCK_TTL_MS,
+        )
+        if not acquired:
+            return False
+
+        with self._state_lock:
+            self._refill_tokens[key] = token
+            self._refill_started[key] = time.monotonic()
+            self._stats["refills"] += 1
+        return True
+
+    def _release_refill_lock(self, key: str) -> Optional[float]:
+        """Release the refill lock if owned; returns the refill duration."""
+        with self._state_lock:
+            token = self._refill_tokens.pop(key, None)
+            started = self._refill_started.pop(key, None)
+
+        if token is not None:
+            try:
+                self._release_lock_script(
+                    keys=[self.LOCK_PREFIX + self._physical(key)], args=[token]
+                )
+            except RedisError as e:
+                logger.warning(f"Falha ao liberar lock de recarga '{key}': {str(e)}")
+
+        return None if started is None else time.monotonic() - started
+
+    def _wait_for_refills(self, keys: List[str]) -> Dict[str, Optional[Any]]:
+        """Wait for the lock holders to publish ``keys``; ``None`` on timeout.
+
+        All the keys share one deadline and are polled with a single read per
+        interval, so a batch waits no longer than a single key.
+        """
+        results: Dict[str, Optional[Any]] = dict.fromkeys(keys)
+        pending = list(keys)
+        deadline = time.monotonic() + self.refill_wait()
+        while pending and time.monotonic() < deadline:
+            time.sleep(self.REDIS_REFILL_POLL_INTERVAL)
+            for key, entry in self._read_entries(pending).items():
+                if entry is not None:
+                    self._count("coalesced")
+                    results[key] = entry.data
+                    pending.remove(key)
+
+        for _ in pending:
+            self._count("refill_wait_timeouts")
+        return results
+
+    def _refresh_in_background(self, key: str) -> bool:
+        refresh = self._refreshers.get(key)
+        if refresh is None:
+            return False
+
+        if self._refresh_executor is None:
+            with self._state_lock:
+                if self._refresh_executor is None:
+                    self._refresh_executor = ThreadPoolExecutor(
+                        max_workers=self.REDIS_REFRESH_WORKERS,
+                        thread_name_prefix="redis-refresh",
+                    )
+
+        def run() -> None:
+            try:
+                refresh()
+            except Exception as e:
+                logger.warning(f"Falha na recarga em segundo plano de '{key}': {e}")
+            finally:
+                self._release_refill_lock(key)
+
+        self._count("background_refreshes")
+        self._refresh_executor.submit(run)
+        return True
+
+    def _decode(self, key: str, raw: Optional[bytes]) -> Optional[CacheEntry]:
+        """Decoded envelope of ``key``; None when absent or written differently.
+
+        Values from another codec or schema version (e.g. right after a deploy)
+        are counted as ``incompatible`` and handled as misses.
+        """
+        if not raw:
+            return None
+
+        try:
+            return self.codec.decode(raw)
+        except CacheFormatError as e:
+            self._count("incompatible")
+            logger.info(f"Valor de cache incompatível em '{key}': {str(e)}")
+            return None
+
+    def _should_refresh(self, soft_expires_at: float, delta: float) -> bool:
+        """XFetch: refresh ahead of the soft expiry with a growing probability."""
+        now = time.time()
+        if now >= soft_expires_at:
+            return True
+
+        early_by = -delta * self.REDIS_XFETCH_BETA * math.log(1.0 - random.random())
+        if now + early_by >= soft_expires_at:
+            self._count("early_refreshes")
+            return True
+        return False
+
+    def _physical(self, key: str, prefix: Optional[str] = None) -> str:
+        """Redis key of ``key`` in our namespace (or the one of ``prefix``)."""
+        return (self.key_prefix if prefix is None else prefix) + key
+
+    def _item_keys(self, key: str, prefix: Optional[str] = None) -> List[str]:
+        """Hash and index keys holding dataset ``key`` in the hash layout."""
+        physical = self._physical(key, prefix)
+        return [physical + self.ITEMS_SUFFIX, physical + self.INDEX_SUFFIX]
+
+    def _storage_keys(self, keys: List[str]) -> List[str]:
+        if self.REDIS_STORAGE_LAYOUT == self.BLOB_LAYOUT:
+            return [self._physical(key) for key in keys]
+        return [stored for key in keys for stored in self._item_keys(key)]
+
+    def _queue_read(self, pipeline, key: str, prefix: Optional[str] = None) -> None:
+        """Queue the hash layout reads of ``key``: its fields, then its index."""
+        items_key, index_key = self._item_keys(key, prefix)
+        pipeline.hgetall(items_key)
+        pipeline.lrange(index_key, 0, -1)
+
+    def _assemble(
+        self, key: str, fields: Dict[bytes, bytes], ids: List[bytes]
+    ) -> Optional[CacheEntry]:
+        """Envelope of ``key`` rebuilt from its hash fields, in index order.
+
+        A missing or unreadable item makes the whole dataset a miss.
+        """
+        meta = self._decode(key, fields.get(self.META_FIELD))
+        if meta is None:
+            return None
+
+        try:
+            values = [self.codec.decode(fields[item_id]).data for item_id in ids]
+        except (KeyError, CacheFormatError) as e:
+            self._count("incompatible")
+            logger.info(f"Item de cache ausente ou incompatível em '{key}': {e!r}")
+            return None
+
+        if meta.data == self.OBJECT_KIND:
+            data = {item_id.decode("utf-8"): v for item_id, v in zip(ids, values)}
+        else:
+            data = values
+        return CacheEntry(data, meta.soft_expires_at, meta.delta)
+
+    def _queue_write(self, pipeline, key: str, data: Any) -> None:
+        """Queue the commands replacing dataset ``key`` with (serialized) ``data``."""
+        if self.REDIS_STORAGE_LAYOUT == self.BLOB_LAYOUT:
+            pipeline.set(
+                self._physical(key), self._envelope(key, data), ex=self.REDIS_TTL
+            )
+            return
+
+        kind = self.OBJECT_KIND if isinstance(data, dict) else self.LIST_KIND
+        ids = CacheProvider.item_ids(key, data)
+        values = data.values() if isinstance(data, dict) else data
+        fields = {self.META_FIELD: self._envelope(key, kind)}
+        for item_id, value in zip(ids, values):
+            fields[item_id] = self.codec.encode(value, soft_expires_at=0.0, delta=0.0)
+
+        items_key, index_key = self._item_keys(key)
+        pipeline.delete(items_key, index_key)
+        pipeline.hset(items_key, mapping=fields)
+        pipeline.expire(items_key, self.REDIS_TTL)
+        if ids:
+            pipeline.rpush(index_key, *ids)
+            pipeline.expire(index_key, self.REDIS_TTL)
+
+    def _pipeline(self):
+        # The hash layout spans several commands per dataset: keep them atomic
+        return self.redis.pipeline(
+            transaction=self.REDIS_STORAGE_LAYOUT == self.HASH_LAYOUT
+        )
+
+    def _fetch(
+        self, keys: List[str], prefix: Optional[str] = None
+    ) -> Dict[str, Optional[CacheEntry]]:
+        """Decoded envelopes of ``keys`` in a single round trip."""
+        if self.REDIS_STORAGE_LAYOUT == self.BLOB_LAYOUT:
+            if len(keys) == 1:
+                raws = [self.redis.get(self._physical(keys[0], prefix))]
+            else:
+                raws = self.redis.mget([self._physical(key, prefix) for key in keys])
+            return {key: self._decode(key, raw) for key, raw in zip(keys, raws)}
+
+        pipeline = self._pipeline()
+        for key in keys:
+            self._queue_read(pipeline, key, prefix)
+        replies = pipeline.execute()
+        return {
+            key: self._assemble(key, replies[2 * i], replies[2 * i + 1])
+            for i, key in enumerate(keys)
+        }
+
+    def _read_entries(self, keys: List[str]) -> Dict[str, Optional[CacheEntry]]:
+        """Envelopes of ``keys``; misses come from the fallback namespace, if any."""
+        self._check_namespace()
+        entries = self._fetch(keys)
+        missing = [key for key, entry in entries.items() if entry is None]
+        fallback_prefix = self._fallback_prefix
+        if missing and fallback_prefix is not None:
+            for key, entry in self._fetch(missing, fallback_prefix).items():
+                if entry is not None:
+                    self._count("namespace_fallbacks")
+                    entries[key] = entry
+
+        return entries
+
+    def _read_entry(self, key: str) -> Optional[CacheEntry]:
+        return self._read_entries([key])[key]
+
+    def _check_namespace(self, force: bool = False) -> None:
+        """Report this namespace as in use and pick the fallback namespace.
+
+        Runs at most every ``REDIS_NAMESPACE_CHECK_INTERVAL`` seconds. Another
+        namespace is only read from when it is current, ours is not ready yet
+        and both share the schema version.
+        """
+        now = time.monotonic()
+        checked_at = self._namespace_checked_at
+        if not force and checked_at is not None:
+            if now - checked_at < self.REDIS_NAMESPACE_CHECK_INTERVAL:
+                return
+        self._namespace_checked_at = now
+
         try:
-            data = self.redis.get(key)
-            if not data:
-                return None
-            return json.loads(data)
+            pipeline = self.redis.pipeline(transaction=False)
+            pipeline.zadd(self.NAMESPACES_SEEN_KEY, {self.namespace: time.time()})
+            pipeline.hget(self.NAMESPACES_KEY, self.namespace)
+            pipeline.get(self.CURRENT_NAMESPACE_KEY)
+            _, status, current = pipeline.execute()
         except RedisError as e:
-            logger.error(f"Erro ao obter chave do Redis: {str(e)}", exc_info=True)
-            raise
+            logger.warning(f"Falha ao consultar namespaces do cache: {str(e)}")
+            return
 
-    def get_all_projects(self) -> [] or List[Project]:
-        projects_data = self.get_cache_data_by_key(self.PROJECTS_KEY)
+        status, current = _as_text(status), _as_text(current)
+        same_schema = f"v{CACHE_SCHEMA_VERSION}:"
+        if (
+            status == self.NAMESPACE_READY
+            or current is None
+            or current == self.namespace
+            or not current.startswith(same_schema)
+        ):
+            self._fallback_prefix = None
+        else:
+            self._fallback_prefix = current + ":"
 
-        return None if projects_data is None else [Project(**project) for project in projects_data]
+    def namespace_status(self) -> Dict[str, Any]:
+        """Our namespace, its status, the current one and the known namespaces."""
+        pipeline = self.redis.pipeline(transaction=False)
+        pipeline.hgetall(self.NAMESPACES_KEY)
+        pipeline.get(self.CURRENT_NAMESPACE_KEY)
+        pipeline.zrange(self.NAMESPACES_SEEN_KEY, 0, -1, withscores=True)
+        statuses, current, seen = pipeline.execute()
+        statuses = {_as_text(ns): _as_text(status) for ns, status in statuses.items()}
 
-    def get_all_formations(self) -> List[Formation]:
-        formations_data = self.get_cache_data_by_key(self.FORMATIONS_KEY)
+        return {
+            "namespace": self.namespace,
+            "status": statuses.get(self.namespace),
+            "current": _as_text(current),
+            "fallback": (
+                self._fallback_prefix[:-1] if self._fallback_prefix else None
+            ),
+            "namespaces": {
+                _as_text(ns): {"status": statuses.get(_as_text(ns)), "seen": score}
+                for ns, score in seen
+            },
+        }
 
-        return None if formations_data is None else [Formation(**project) for project in formations_data]
+    def acquire_namespace_lock(self) -> bool:
+        """Lock held by the single worker populating our namespace."""
+        token = uuid.uuid4().hex
+        acquired = self.redis.set(
+            self.LOCK_PREFIX + self.NAMESPACES_KEY + ":" + self.namespace,
+            token,
+            nx=True,
+            px=self.REDIS_NAMESPACE_LOCK_TTL_MS,
+        )
+        if acquired:
+            self._namespace_token = token
+            self.redis.hset(
+                self.NAMESPACES_KEY, mapping={self.namespace: self.NAMESPACE_WARMING}
+            )
+        return bool(acquired)
 
-    def get_all_certifications(self) -> List[Certification]:
-        certifications_data = self.get_cache_data_by_key(self.CERTIFICATIONS_KEY)
+    def release_namespace_lock(self) -> None:
+        token, self._namespace_token = self._namespace_token, None
+        if token is None:
+            return
 
-        return None if certifications_data is None else [Certification(**project) for project in certifications_data]
-    
-    def get_all_experiences(self) -> List[Experience]:
-        experiences_data = self.get_cache_data_by_key(self.EXPERIENCES_KEY)
+        try:
+            self._release_lock_script(
+                keys=[self.LOCK_PREFIX + self.NAMESPACES_KEY + ":" + self.namespace],
+                args=[token],
+            )
+        except RedisError as e:
+            logger.warning(f"Falha ao liberar lock do namespace: {str(e)}")
 
-        return None if experiences_data is None else [Experience(**project) for project in experiences_data]
-    
-    def get_all_social_media(self) -> List[SocialMedia]:
-        social_media_data = self.get_cache_data_by_key(self.SOCIAL_MEDIA_KEY)
+    def _invalidation_lock(self, dataset: str, change: str) -> str:
+        return self.LOCK_PREFIX + self._physical(f"invalidation:{dataset}:{change}")
 
-        return None if social_media_data is None else [SocialMedia(**project) for project in social_media_data]
-    
-    def get_company_duration(self) -> List[CompanyDuration]:
-        company_duration_data = self.get_cache_data_by_key(self.COMPANY_DURATION_KEY)
+    def acquire_invalidation_locks(
+        self, datasets: List[str], changes: List[str]
+    ) -> List[str]:
+        """Datasets this worker was elected to reload for ``changes``.
 
-        return None if company_duration_data is None else [CompanyDuration(**project) for project in company_duration_data]
-    
-    def get_total_experience(self) -> Dict[str, Any]:
-        total_experience_data = self.get_cache_data_by_key(self.TOTAL_EXPERIENCE_KEY)
+        Each (dataset, change) pair is claimed separately, so workers coalescing
+        the notifications differently still agree on who reloads. A worker
+        claiming any change of a dataset reloads it, which also covers the
+        changes claimed by others.
+        """
+        elected = []
+        for dataset in datasets:
+            token = uuid.uuid4().hex
+            locks = [self._invalidation_lock(dataset, change) for change in changes]
+            pipeline = self.redis.pipeline(transaction=False)
+            for lock in locks:
+                pipeline.set(
+                    lock, token, nx=True, px=self.REDIS_INVALIDATION_LOCK_TTL_MS
+                )
+            claimed = [lock for lock, ok in zip(locks, pipeline.execute()) if ok]
+            if claimed:
+                self._invalidation_tokens[dataset] = (token, claimed)
+                elected.append(dataset)
 
-        return None if total_experience_data is None else total_experience_data
+        return elected
 
-    def set_projects(self, list_projects: List[Project]):
+    def release_invalidation_locks(
+        self, datasets: List[str], reloaded: bool = True
+    ) -> None:
+        """Mark the claims on ``datasets`` as reloaded, or drop them on failure.
+
+        Reloaded claims stay until their TTL, so a worker notified of the same
+        change afterwards does not reload again. Dropped ones let it retry.
+        """
+        for dataset in datasets:
+            token, locks = self._invalidation_tokens.pop(dataset, (None, []))
+            for lock in locks:
+                try:
+                    if reloaded:
+                        self._finish_invalidation_script(
+                            keys=[lock], args=[token, self.INVALIDATION_DONE]
+                        )
+                    else:
+                        self._release_lock_script(keys=[lock], args=[token])
+                except RedisError as e:
+                    logger.warning(
+                        f"Falha ao liberar lock de invalidação de {dataset}: {str(e)}"
+                    )
+
+    def wait_for_invalidations(
+        self,
+        datasets: List[str],
+        changes: List[str],
+        timeout: Optional[float] = None,
+    ) -> bool:
+        """Wait for the reloads other workers claimed; False on timeout."""
+        if timeout is None:
+            timeout = self.REDIS_INVALIDATION_LOCK_TTL_MS / 1000
+        deadline = time.monotonic() + timeout
+        locks = [
+            self._invalidation_lock(dataset, change)
+            for dataset in datasets
+            for change in changes
+        ]
+        while locks:
+            locks = [
+                lock
+                for lock, value in zip(locks, self.redis.mget(locks))
+                if value is not None and _as_text(value) != self.INVALIDATION_DONE
+            ]
+            if not locks:
+                break
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.REDIS_REFILL_POLL_INTERVAL)
+
+        return True
+
+    def promote_namespace(self) -> None:
+        """Mark our (populated) namespace as ready and switch readers to it."""
+        pipeline = self.redis.pipeline(transaction=True)
+        pipeline.hset(
+            self.NAMESPACES_KEY, mapping={self.namespace: self.NAMESPACE_READY}
+        )
+        pipeline.set(self.CURRENT_NAMESPACE_KEY, self.namespace)
+        pipeline.zadd(self.NAMESPACES_SEEN_KEY, {self.namespace: time.time()})
+        pipeline.execute()
+        self._fallback_prefix = None
+        logger.info(f"🔀 Namespace de cache '{self.namespace}' promovido")
+
+    def collect_namespaces(self, grace: Optional[float] = None) -> List[str]:
+        """Delete the namespaces no worker used for ``grace`` seconds.
+
+        Ours and the current namespace are always kept. Returns the deleted ones.
+        """
+        grace = self.REDIS_NAMESPACE_GRACE if grace is None else grace
+        keep = {self.namespace, _as_text(self.redis.get(self.CURRENT_NAMESPACE_KEY))}
+        stale = [
+            namespace
+            for namespace in map(
+                _as_text,
+                self.redis.zrangebyscore(
+                    self.NAMESPACES_SEEN_KEY, "-inf", time.time() - grace
+                ),
+            )
+            if namespace not in keep
+        ]
+
+        for namespace in stale:
+            batch = []
+            for key in self.redis.scan_iter(match=f"{namespace}:*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    self.redis.unlink(*batch)
+                    batch = []
+            if batch:
+                self.redis.unlink(*batch)
+
+            pipeline = self.redis.pipeline(transaction=True)
+            pipeline.hdel(self.NAMESPACES_KEY, namespace)
+            pipeline.zrem(self.NAMESPACES_SEEN_KEY, namespace)
+            pipeline.execute()
+            logger.info(f"🧹 Namespace de cache '{namespace}' removido")
+
+        return stale
+
+    def _write(self, items: Dict[str, Any]) -> None:
+        """Replace the (serialized) datasets in ``items`` in a single round trip."""
+        pipeline = self._pipeline()
+        for key, data in items.items():
+            self._queue_write(pipeline, key, data)
+        pipeline.execute()
+
+    def _resolve_many(
+        self, entries: Dict[str, Optional[CacheEntry]]
+    ) -> Dict[str, Optional[Any]]:
+        """Apply miss/soft-expiry handling to the envelopes read for each key.
+
+        Misses another worker is refilling are awaited together.
+        """
+        results: Dict[str, Optional[Any]] = {}
+        waiting = []
+        for key, entry in entries.items():
+            if entry is not None:
+                results[key] = self._resolve(key, entry)
+                continue
+
+            self._count("misses")
+            results[key] = None
+            # The lock holder recomputes; set_* publishes and releases the lock
+            if not self._acquire_refill_lock(key):
+                waiting.append(key)
+
+        if waiting:
+            results.update(self._wait_for_refills(waiting))
+        return results
+
+    def _resolve(self, key: str, entry: Optional[CacheEntry]) -> Optional[Any]:
+        """Apply miss/soft-expiry handling to the envelope read for ``key``."""
+        if entry is None:
+            return self._resolve_many({key: entry})[key]
+
+        data, soft_expires_at, delta = entry
+        if not self._should_refresh(soft_expires_at, delta):
+            self._count("hits")
+            return data
+
+        self._count("stale_hits")
+        if not self._acquire_refill_lock(key):
+            # Someone else is already refreshing it
+            self._count("coalesced")
+            return data
+
+        if self._refresh_in_background(key):
+            return data
+
+        # No refresher registered: the caller refills synchronously
+        return None
+
+    def _envelope(self, key: str, data: Any) -> bytes:
+        with self._state_lock:
+            started = self._refill_started.get(key)
+
+        return self.codec.encode(
+            data,
+            soft_expires_at=time.time() + self.REDIS_SOFT_TTL,
+            delta=0.0 if started is None else time.monotonic() - started,
+        )
+
+    def _deserialize(self, key: str, data: Optional[Any]) -> Optional[Any]:
+        """Rebuild the DTOs of ``key`` from their cached representation."""
+        dto_class = self.DTO_CLASSES[key]
+        if data is None or dto_class is None:
+            return data
+        return [dto_class(**item) for item in data]
+
+    def _serialize(self, key: str, value: Any) -> Any:
+        """Turn the DTOs of ``key`` into their cached representation."""
+        method = self.SERIALIZERS[key]
+        if method is None:
+            return value
+        return [getattr(item, method)() for item in value]
+
+    def get_cache_data_by_key(self, key: str):
         try:
-            data = [project.to_dict() for project in list_projects]
-            self.redis.set(self.PROJECTS_KEY, json.dumps(data, default=str), ex=self.REDIS_TTL)
+            return self._resolve(key, self._read_entry(key))
         except RedisError as e:
-            logger.error(f"Redis setting Key -> {self.PROJECTS_KEY} Error: {e}")
+            logger.error(f"Erro ao obter chave do Redis: {str(e)}", exc_info=True)
             raise
 
-    def set_formations(self, list_formations: List[Formation]):
+    def peek(self, key: str) -> Optional[Any]:
+        """Stored value of ``key``, stale or not: no refill lock, no waiting."""
         try:
-            data = [formation.to_dict() for formation in list_formations]
-            self.redis.set(self.FORMATIONS_KEY, json.dumps(data, default=str), ex=self.REDIS_TTL)
+            entry = self._read_entry(key)
         except RedisError as e:
-            logger.error(f"Redis setting Key -> {self.FORMATIONS_KEY} Error: {e}")
+            logger.error(f"Erro ao obter chave do Redis: {str(e)}", exc_info=True)
             raise
 
-    def set_certifications(self, list_certifications: List[Certification]):
+        return None if entry is None else self._deserialize(key, entry[0])
+
+    def abort_refill(self, keys: List[str]) -> None:
+        """Release the refill locks this process holds on ``keys``, if any."""
+        for key in keys:
+            self._release_refill_lock(key)
+
+    def set_cache_data_by_key(self, key: str, data: Any) -> None:
+        """Publish ``data`` with a fresh soft expiry and release the refill lock."""
         try:
-            data = [certification.to_dict() for certification in list_certifications]
-            self.redis.set(self.CERTIFICATIONS_KEY, json.dumps(data, default=str), ex=self.REDIS_TTL)
+            self._write({key: data})
         except RedisError as e:
-            logger.error(f"Redis setting Key -> {self.CERTIFICATIONS_KEY} Error: {e}")
+            logger.error(f"Redis setting Key -> {key} Error: {e}")
             raise
+        finally:
+            self._release_refill_lock(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Read several keys with a single round trip (``MGET`` or a pipeline)."""
+        if not keys:
+            return {}
 
-    def set_experiences(self, list_experiences: List[Experience]):
         try:
-            data = [experience.model_dump() for experience in list_experiences]
-            self.redis.set(self.EXPERIENCES_KEY, json.dumps(data, default=str), ex=self.REDIS_TTL)
+            resolved = self._resolve_many(self._read_entries(keys))
+            return {key: self._deserialize(key, data) for key, data in resolved.items()}
         except RedisError as e:
-            logger.error(f"Redis setting Key -> {self.EXPERIENCES_KEY} Error: {e}")
+            logger.error(f"Erro ao obter chaves do Redis: {str(e)}", exc_info=True)
             raise
 
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Write several keys, with their TTL, in a single pipelined round trip."""
+        if not items:
+            return
 
-    def set_social_media(self, list_social_media: List[SocialMedia]):
         try:
-            data = [social_media.to_dict() for social_media in list_social_media]
-            self.redis.set(self.SOCIAL_MEDIA_KEY, json.dumps(data, default=str), ex=self.REDIS_TTL)
+            self._write(
+                {key: self._serialize(key, value) for key, value in items.items()}
+            )
         except RedisError as e:
-            logger.error(f"Redis setting Key -> {self.SOCIAL_MEDIA_KEY} Error: {e}")
+            logger.error(f"Redis setting Keys -> {list(items)} Error: {e}")
             raise
+        finally:
+            for key in items:
+                self._release_refill_lock(key)
+
+    def delete_many(self, keys: List[str]) -> None:
+        if not keys:
+            return
 
-    def set_company_duration(self, list_company_duration: List[CompanyDuration]):
         try:
-            data = [company_duration.to_response() for company_duration in list_company_duration]
-            self.redis.set(self.COMPANY_DURATION_KEY, json.dumps(data, default=str), ex=self.REDIS_TTL)
+            self.redis.delete(*self._storage_keys(keys))
         except RedisError as e:
-            logger.error(f"Redis setting Key -> {self.COMPANY_DURATION_KEY} Error: {e}")
+            logger.error(f"Redis deleting Keys -> {keys} Error: {e}")
             raise
 
-    def set_total_experience(self, total_experience: Dict[str, Any]):
+    def get_items(self, key: str, ids: List[str]) -> Optional[Any]:
+        """Subset of dataset ``key``; a single ``HMGET`` in the hash layout.
+
+        Misses are read from the fallback namespace, like whole datasets. Soft
+        expiry is not checked and no refill lock is taken: stale datasets are
+        refreshed by the whole-dataset reads.
+        """
+        if self.REDIS_STORAGE_LAYOUT == self.BLOB_LAYOUT:
+            return self.select_items(key, self.peek(key), ids)
+
+        try:
+            self._check_namespace()
+            meta, raws = self._fetch_items(key, ids)
+            fallback_prefix = self._fallback_prefix
+            if meta is None and fallback_prefix is not None:
+                meta, raws = self._fetch_items(key, ids, fallback_prefix)
+                if meta is not None:
+                    self._count("namespace_fallbacks")
+        except RedisError as e:
+            logger.error(f"Erro ao obter itens de '{key}': {str(e)}", exc_info=True)
+            raise
+
+        if meta is None:
+            return None
+
+        found = {}
+        for item_id, raw in zip(ids, raws):
+            entry = self._decode(key, raw)
+            if entry is not None:
+                found[item_id] = entry.data
+
+        if meta.data == self.OBJECT_KIND:
+            return found
+        return self._deserialize(key, list(found.values()))
+
+    def _fetch_items(
+        self, key: str, ids: List[str], prefix: Optional[str] = None
+    ) -> Tuple[Optional[CacheEntry], List[Optional[bytes]]]:
+        """Envelope of dataset ``key`` and the raw items ``ids``, in one ``HMGET``."""
+        raws = self.redis.hmget(self._item_keys(key, prefix)[0], self.META_FIELD, *ids)
+        return self._decode(key, raws[0]), raws[1:]
+
+    def set_item(self, key: str, item: Any) -> None:
+        """Write one item (O(1)); cached datasets missing it get it appended."""
+        if self.REDIS_STORAGE_LAYOUT == self.BLOB_LAYOUT:
+            return super().set_item(key, item)
+
+        if isinstance(item, dict):
+            values = item
+        else:
+            value = self._serialize(key, [item])[0]
+            values = {self.item_ids(key, [value])[0]: value}
+
+        try:
+            for item_id, value in values.items():
+                self._set_item_script(
+                    keys=self._item_keys(key),
+                    args=[item_id, self.codec.encode(value, 0.0, 0.0)],
+                )
+        except RedisError as e:
+            logger.error(f"Redis setting item of '{key}' Error: {e}")
+            raise
+
+    def delete_item(self, key: str, item_id: str) -> None:
+        if self.REDIS_STORAGE_LAYOUT == self.BLOB_LAYOUT:
+            return super().delete_item(key, item_id)
+
         try:
-            self.redis.set(self.TOTAL_EXPERIENCE_KEY, json.dumps(total_experience, default=str), ex=self.REDIS_TTL)
+            self._delete_item_script(keys=self._item_keys(key), args=[item_id])
         except RedisError as e:
-            logger.error(f"Redis setting Key -> {self.TOTAL_EXPERIENCE_KEY} Error: {e}")
+            logger.error(f"Redis deleting item '{item_id}' of '{key}' Error: {e}")
             raise
+
+    def get_all_projects(self) -> Optional[List[Project]]:
+        return self._deserialize(
+            self.PROJECTS_KEY, self.get_cache_data_by_key(self.PROJECTS_KEY)
+        )
+
+    def get_all_formations(self) -> Optional[List[Formation]]:
+        return self._deserialize(
+            self.FORMATIONS_KEY, self.get_cache_data_by_key(self.FORMATIONS_KEY)
+        )
+
+    def get_all_certifications(self) -> Optional[List[Certification]]:
+        return self._deserialize(
+            self.CERTIFICATIONS_KEY, self.get_cache_data_by_key(self.CERTIFICATIONS_KEY)
+        )
+
+    def get_all_experiences(self) -> Optional[List[Experience]]:
+        return self._deserialize(
+            self.EXPERIENCES_KEY, self.get_cache_data_by_key(self.EXPERIENCES_KEY)
+        )
+
+    def get_all_social_media(self) -> Optional[List[SocialMedia]]:
+        return self._deserialize(
+            self.SOCIAL_MEDIA_KEY, self.get_cache_data_by_key(self.SOCIAL_MEDIA_KEY)
+        )
+
+    def get_company_duration(self) -> Optional[List[CompanyDuration]]:
+        return self._deserialize(
+            self.COMPANY_DURATION_KEY,
+            self.get_cache_data_by_key(self.COMPANY_DURATION_KEY),
+        )
+
+    def get_total_experience(self) -> Optional[Dict[str, Any]]:
+        return self.get_cache_data_by_key(self.TOTAL_EXPERIENCE_KEY)
+
+    def set_projects(self, list_projects: List[Project]):
+        self.set_cache_data_by_key(
+            self.PROJECTS_KEY, self._serialize(self.PROJECTS_KEY, list_projects)
+        )
+
+    def set_formations(self, list_formations: List[Formation]):
+        self.set_cache_data_by_key(
+            self.FORMATIONS_KEY, self._serialize(self.FORMATIONS_KEY, list_formations)
+        )
+
+    def set_certifications(self, list_certifications: List[Certification]):
+        self.set_cache_data_by_key(
+            self.CERTIFICATIONS_KEY,
+            self._serialize(self.CERTIFICATIONS_KEY, list_certifications),
+        )
+
+    def set_experiences(self, list_experiences: List[Experience]):
+        self.set_cache_data_by_key(
+            self.EXPERIENCES_KEY,
+            self._serialize(self.EXPERIENCES_KEY, list_experiences),
+        )
+
+    def set_social_media(self, list_social_media: List[SocialMedia]):
+        self.set_cache_data_by_key(
+            self.SOCIAL_MEDIA_KEY,
+            self._serialize(self.SOCIAL_MEDIA_KEY, list_social_media),
+        )
+
+    def set_company_duration(self, list_company_duration: List[CompanyDuration]):
+        self.set_cache_data_by_key(
+            self.COMPANY_DURATION_KEY,
+            self._serialize(self.COMPANY_DURATION_KEY, list_company_duration),
+        )
+
+    def set_total_experience(self, total_experience: Dict[str, Any]):
+        self.set_cache_data_by_key(self.TOTAL_EXPERIENCE_KEY, total_experience)
@@ -0,0 +1,53 @@
+"""Flask CLI commands to operate the caches (``flask cache ...``)."""
+
+import json
+from typing import Optional
+
+import click
+from flask.cli import AppGroup
+
+from src.infrastructure.dependencie_injection import ApplicationDependencies
+
+
+def get_cache_warmup_service():
+    return ApplicationDependencies().cache_warmup_service
+
+
+def get_cache_namespace_service():
+    return ApplicationDependencies().cache_namespace_service
+
+
+cache_cli = AppGroup("cache", help="Manage the portfolio caches.")
+
+
+@cache_cli.command("warm")
+@click.option(
+    "--force",
+    is_flag=True,
+    help="Reload every dataset from the database, even if already cached.",
+)
+def warm_command(force: bool) -> None:
+    """Load every dataset into the caches."""
+    report = get_cache_warmup_service().warm(force=force)
+    click.echo(json.dumps(report))
+
+    if report["status"] == "failed":
+        raise SystemExit(1)
+
+
+@cache_cli.command("gc-namespaces")
+@click.option(
+    "--grace",
+    type=float,
+    default=None,
+    help="Seconds a namespace must be unused before it is deleted.",
+)
+def gc_namespaces_command(grace: Optional[float]) -> None:
+    """Delete the Redis namespaces of releases no longer running."""
+    namespace_service = get_cache_namespace_service()
+    if namespace_service is None:
+        click.echo(json.dumps({"status": "skipped", "collected": []}))
+        return
+
+    collected = namespace_service.cache.collect_namespaces(grace)
+    click.echo(json.dumps({"status": "collected", "collected": collected}))
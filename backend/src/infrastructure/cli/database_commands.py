@@ -0,0 +1,63 @@
+"""Flask CLI commands to operate the database (``flask db ...``)."""
+
+import json
+import os
+
+import click
+from flask.cli import AppGroup
+
+from src.infrastructure.dependencie_injection import ApplicationDependencies
+from src.infrastructure.utils.portfolio_snapshot import write_snapshot
+
+
+def default_snapshot_path() -> str:
+    # Imported here: the CLI is registered at boot, the adapter is not needed then
+    from src.infrastructure.adapters.outbound_file_storage_adapter import (
+        FileStorageAdapter,
+    )
+
+    return os.path.join(
+        ApplicationDependencies.SNAPSHOT_DIR, FileStorageAdapter.SNAPSHOT_FILE_NAME
+    )
+
+
+def get_data_repository():
+    return ApplicationDependencies().data_repository
+
+
+db_cli = AppGroup("db", help="Manage the portfolio database.")
+
+
+@db_cli.command("refresh-views")
+@click.option(
+    "--if-stale",
+    is_flag=True,
+    help="Only refresh if a change is pending or they were not refreshed today.",
+)
+def refresh_views_command(if_stale: bool) -> None:
+    """Refresh the materialized experience views."""
+    refreshed = get_data_repository().refresh_experience_views(if_stale)
+    click.echo(json.dumps({"refreshed": refreshed}))
+
+
+@db_cli.command("export-snapshot")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    default=default_snapshot_path,
+    show_default="SNAPSHOT_DIR/portfolio.snapshot",
+    help="Snapshot file to write.",
+)
+def export_snapshot_command(output: str) -> None:
+    """Dump every dataset served by the API into a binary snapshot."""
+    from src.infrastructure.services.portfolio_data_service import (
+        PortfolioDataService,
+    )
+
+    repository = get_data_repository()
+    datasets = {}
+    for dataset, (_, getter_name, _) in PortfolioDataService.CACHE_BINDINGS.items():
+        criteria = PortfolioDataService.REPOSITORY_CRITERIA.get(getter_name, {})
+        datasets[dataset] = getattr(repository, getter_name)(**criteria)
+
+    click.echo(json.dumps(write_snapshot(output, datasets)))
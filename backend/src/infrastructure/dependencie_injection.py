@@ -1,43 +1,356 @@
 import os
-from src.infrastructure.adapters.outbound_postgres_adapter import PostgresAdapter
-from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from src.infrastructure.utils.constants import ASSETS_DIR
 from src.infrastructure.utils.logger import get_logger
 
+# Adapters and services are imported by the builders that use them, so importing
+# this module (every route and CLI command does) loads none of them
+if TYPE_CHECKING:
+    from src.infrastructure.adapters.inbound_postgres_listener_adapter import (
+        PostgresChangeListener,
+    )
+    from src.infrastructure.ports.cache_provider_interface import CacheProvider
+    from src.infrastructure.ports.repository_interface import RepositoryInterface
+    from src.infrastructure.services.cache_invalidation_service import (
+        CacheInvalidationService,
+    )
+    from src.infrastructure.services.cache_namespace_service import (
+        CacheNamespaceService,
+    )
+    from src.infrastructure.services.portfolio_data_service import (
+        PortfolioDataService,
+    )
+
 logger = get_logger(__name__)
 
 class ApplicationDependencies:
+    CACHE_ENABLED = os.getenv("CACHE_ENABLED", "false").lower() == "true"
+    L1_CACHE_ENABLED = os.getenv("L1_CACHE_ENABLED", "false").lower() == "true"
+    CACHE_INVALIDATION_LISTENER = (
+        os.getenv("CACHE_INVALIDATION_LISTENER", "false").lower() == "true"
+    )
+    REPOSITORY_FALLBACK_ENABLED = (
+        os.getenv("REPOSITORY_FALLBACK_ENABLED", "false").lower() == "true"
+    )
+    FALLBACK_POSTGRES_DEADLINE = float(os.getenv("FALLBACK_POSTGRES_DEADLINE", "2"))
+    FALLBACK_CACHE_DEADLINE = float(os.getenv("FALLBACK_CACHE_DEADLINE", "0.5"))
+    FALLBACK_SNAPSHOT_DEADLINE = float(os.getenv("FALLBACK_SNAPSHOT_DEADLINE", "1"))
+    SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", ASSETS_DIR)
+    # Zero-database mode: every read is served by the snapshot in SNAPSHOT_DIR
+    SNAPSHOT_MODE = os.getenv("SNAPSHOT_MODE", "false").lower() == "true"
+
     _instance = None
+    # Held while the dependencies are built: other threads wait for the result
+    _build_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
-            logger.info("🚀 Inicializando dependências da aplicação")
-            cls._instance = super().__new__(cls)
+            with cls._build_lock:
+                if cls._instance is None:
+                    cls._instance = cls._build()
 
-            try:
-                # Inicializa o repositório de dados (PostgresAdapter)
-                logger.info("📦 Configurando repositório de dados (PostgreSQL)")
-                cls._instance.data_repository = PostgresAdapter()
-                logger.info("✅ Repositório de dados configurado com sucesso")
+        return cls._instance
 
-                # Inicializa o serviço de portfólio
-                logger.info("⚙️  Inicializando serviço de portfólio")
-                cls._instance.portfolio_data_service = PortfolioDataService(
-                    cls._instance.data_repository
-                )
-                logger.info("✅ Serviço de portfólio inicializado com sucesso")
+    @classmethod
+    def initialized(cls) -> bool:
+        """Whether the dependencies are built; never waits for a build."""
+        return cls._instance is not None
+
+    @classmethod
+    def _build(cls) -> "ApplicationDependencies":
+        from src.infrastructure.services.cache_warmup_service import (
+            CacheWarmupService,
+        )
+        from src.infrastructure.services.experience_view_refresh_service import (
+            ExperienceViewRefreshService,
+        )
+        from src.infrastructure.services.portfolio_data_service import (
+            PortfolioDataService,
+        )
 
-                # Log final de sucesso com informações do ambiente
-                env = os.getenv("FLASK_ENV", "development")
-                logger.info(
-                    f"🎉 Todas as dependências carregadas com sucesso "
-                    f"(Ambiente: {env}) [PID: {os.getpid()}]"
+        logger.info("🚀 Inicializando dependências da aplicação")
+        instance = super().__new__(cls)
+
+        try:
+            # Inicializa o repositório de dados (PostgresAdapter ou snapshot)
+            instance.data_repository = cls._build_data_repository()
+            logger.info("✅ Repositório de dados configurado com sucesso")
+
+            # Inicializa o cache (L1 em memória + Redis), quando habilitado
+            shared_cache = cls._build_shared_cache_provider()
+            instance.cache_provider = cls._build_cache_provider(shared_cache)
+
+            # Inicializa o serviço de portfólio
+            logger.info("⚙️  Inicializando serviço de portfólio")
+            instance.portfolio_data_service = PortfolioDataService(
+                cls._build_service_repository(
+                    instance.data_repository, shared_cache
+                ),
+                instance.cache_provider,
+            )
+            logger.info("✅ Serviço de portfólio inicializado com sucesso")
+
+            # Aquecimento do cache antes de o worker receber tráfego
+            instance.cache_namespace_service = cls._build_cache_namespace_service(
+                shared_cache, instance.portfolio_data_service
+            )
+            instance.cache_warmup_service = CacheWarmupService(
+                instance.portfolio_data_service,
+                namespace_service=instance.cache_namespace_service,
+            )
+
+            # Invalidação de cache dirigida por eventos (LISTEN/NOTIFY)
+            instance.cache_invalidation_service = (
+                cls._build_cache_invalidation_service(
+                    shared_cache, instance.portfolio_data_service
                 )
+            )
+            instance.change_listener = cls._start_change_listener(
+                instance
+            )
+
+            # Atualização das views materializadas de experiência
+            instance.experience_view_refresh_service = (
+                ExperienceViewRefreshService(instance.data_repository)
+            )
+            if not cls.SNAPSHOT_MODE and cls._materialized_views_enabled():
+                if instance.experience_view_refresh_service.start() is not None:
+                    # Mudanças em companies/experiences disparam a atualização
+                    instance.cache_invalidation_service.add_callback(
+                        instance.experience_view_refresh_service.request_refresh
+                    )
+
+            # Log final de sucesso com informações do ambiente
+            env = os.getenv("FLASK_ENV", "development")
+            logger.info(
+                f"🎉 Todas as dependências carregadas com sucesso "
+                f"(Ambiente: {env}) [PID: {os.getpid()}]"
+            )
+
+        except Exception as e:
+            logger.error(
+                f"❌ Falha crítica na inicialização das dependências: {str(e)}",
+                exc_info=True
+            )
+            raise
+
+        return instance
+
+    @staticmethod
+    def _materialized_views_enabled() -> bool:
+        from src.infrastructure.adapters.outbound_postgres_adapter import (
+            PostgresAdapter,
+        )
+
+        return PostgresAdapter.POSTGRES_MATERIALIZED_VIEWS
+
+    @classmethod
+    def _build_data_repository(cls) -> "RepositoryInterface":
+        if cls.SNAPSHOT_MODE:
+            from src.infrastructure.adapters.outbound_file_storage_adapter import (
+                FileStorageAdapter,
+            )
+
+            logger.info(
+                f"📦 Configurando repositório de dados "
+                f"(snapshot em {cls.SNAPSHOT_DIR}, sem banco)"
+            )
+            return FileStorageAdapter(cls.SNAPSHOT_DIR)
+
+        from src.infrastructure.adapters.outbound_postgres_adapter import (
+            PostgresAdapter,
+        )
+
+        logger.info("📦 Configurando repositório de dados (PostgreSQL)")
+        return PostgresAdapter()
+
+    @classmethod
+    def _build_cache_provider(
+        cls, shared_cache: Optional["CacheProvider"]
+    ) -> Optional["CacheProvider"]:
+        """Build the cache chain used in cache-aside mode: L1 (memory) -> L2 (Redis)."""
+        if not cls.L1_CACHE_ENABLED:
+            return shared_cache
+
+        from src.infrastructure.adapters.outbound_memory_cache_adapter import (
+            InMemoryCacheAdapter,
+        )
+
+        logger.info("⚡ Configurando cache L1 em memória do worker")
+        return InMemoryCacheAdapter(shared_cache)
+
+    @classmethod
+    def _build_shared_cache_provider(cls) -> Optional["CacheProvider"]:
+        """Build the shared (L2) cache provider, if enabled."""
+        if not cls.CACHE_ENABLED:
+            logger.info("ℹ️  Cache desabilitado (CACHE_ENABLED=false)")
+            return None
+
+        from src.infrastructure.adapters.outbound_redis_adapter import RedisAdapter
 
-            except Exception as e:
-                logger.error(
-                    f"❌ Falha crítica na inicialização das dependências: {str(e)}",
-                    exc_info=True
+        try:
+            logger.info("🧠 Configurando cache (Redis)")
+            cache_provider = RedisAdapter()
+            logger.info("✅ Cache configurado com sucesso")
+            return cache_provider
+        except Exception as e:
+            logger.warning(
+                f"⚠️  Cache indisponível, seguindo apenas com o repositório: "
+                f"{str(e)}"
+            )
+            return None
+
+    @classmethod
+    def _build_cache_namespace_service(
+        cls,
+        shared_cache: Optional["CacheProvider"],
+        portfolio_data_service: "PortfolioDataService",
+    ) -> Optional["CacheNamespaceService"]:
+        """Cutover of the Redis namespace on deploys, when Redis is the L2."""
+        if shared_cache is None:
+            return None
+
+        from src.infrastructure.adapters.outbound_redis_adapter import RedisAdapter
+        from src.infrastructure.services.cache_namespace_service import (
+            CacheNamespaceService,
+        )
+
+        if not isinstance(shared_cache, RedisAdapter):
+            return None
+
+        return CacheNamespaceService(shared_cache, portfolio_data_service)
+
+    @classmethod
+    def _build_cache_invalidation_service(
+        cls,
+        shared_cache: Optional["CacheProvider"],
+        portfolio_data_service: "PortfolioDataService",
+    ) -> "CacheInvalidationService":
+        """Invalidation reloading each dataset once per change when Redis is L2."""
+        from src.infrastructure.services.cache_invalidation_service import (
+            CacheInvalidationService,
+        )
+
+        if shared_cache is not None:
+            from src.infrastructure.adapters.outbound_redis_adapter import (
+                RedisAdapter,
+            )
+
+            if isinstance(shared_cache, RedisAdapter):
+                return CacheInvalidationService(portfolio_data_service, shared_cache)
+
+        return CacheInvalidationService(portfolio_data_service)
+
+    @classmethod
+    def _build_service_repository(
+        cls,
+        data_repository: "RepositoryInterface",
+        shared_cache: Optional["CacheProvider"],
+    ) -> "RepositoryInterface":
+        """Repository read by the service: Postgres -> Redis -> snapshot, if enabled.
+
+        ``data_repository`` stays the plain Postgres adapter for the listener,
+        the view refresh and the CLI.
+        """
+        if not cls.REPOSITORY_FALLBACK_ENABLED or cls.SNAPSHOT_MODE:
+            return data_repository
+
+        from src.infrastructure.adapters.outbound_fallback_repository_adapter import (
+            CacheRepositoryAdapter,
+            FallbackRepositoryAdapter,
+            FallbackSource,
+        )
+        from src.infrastructure.adapters.outbound_file_storage_adapter import (
+            FileStorageAdapter,
+        )
+        from src.infrastructure.utils.circuit_breaker import CircuitBreaker
+
+        logger.info(
+            f"🪜 Configurando repositório com fallback "
+            f"(PostgreSQL -> Redis -> snapshot em {cls.SNAPSHOT_DIR})"
+        )
+        sources = [
+            FallbackSource(
+                "postgres",
+                data_repository,
+                cls.FALLBACK_POSTGRES_DEADLINE,
+                CircuitBreaker("postgres"),
+            )
+        ]
+        if shared_cache is not None:
+            sources.append(
+                FallbackSource(
+                    "redis",
+                    CacheRepositoryAdapter(shared_cache),
+                    cls.FALLBACK_CACHE_DEADLINE,
                 )
-                raise
+            )
+        sources.append(
+            FallbackSource(
+                "snapshot",
+                FileStorageAdapter(cls.SNAPSHOT_DIR),
+                cls.FALLBACK_SNAPSHOT_DEADLINE,
+            )
+        )
+        return FallbackRepositoryAdapter(sources)
+
+    @classmethod
+    def _start_change_listener(
+        cls, dependencies
+    ) -> Optional["PostgresChangeListener"]:
+        """Listen for table changes in this worker, if enabled."""
+        if not cls.CACHE_INVALIDATION_LISTENER or cls.SNAPSHOT_MODE:
+            return None
+
+        from src.infrastructure.adapters.inbound_postgres_listener_adapter import (
+            PostgresChangeListener,
+        )
+
+        logger.info("👂 Iniciando listener de alterações do PostgreSQL")
+        listener = PostgresChangeListener(
+            dependencies.data_repository.connection_string,
+            dependencies.cache_invalidation_service.handle_changes,
+        )
+        listener.start()
+        return listener
+
+
+class AsyncApplicationDependencies:
+    """Dependencies of the asyncio data path, used by the ASGI entry point.
+
+    Nothing connects here: the async engine and Redis client open their
+    connections on first use, inside the server's event loop. The asyncio
+    stack (``sqlalchemy.ext.asyncio``, ``redis.asyncio``) is only imported
+    here, so WSGI workers never load it.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            from src.infrastructure.adapters.outbound_async_postgres_adapter import (
+                AsyncPostgresAdapter,
+            )
+            from src.infrastructure.adapters.outbound_async_redis_adapter import (
+                AsyncRedisAdapter,
+            )
+            from src.infrastructure.services.async_portfolio_data_service import (
+                AsyncPortfolioDataService,
+            )
+
+            logger.info("🚀 Inicializando dependências assíncronas da aplicação")
+            cls._instance = super().__new__(cls)
+
+            cls._instance.data_repository = AsyncPostgresAdapter()
+            cls._instance.cache_provider = (
+                AsyncRedisAdapter() if ApplicationDependencies.CACHE_ENABLED else None
+            )
+            cls._instance.portfolio_data_service = AsyncPortfolioDataService(
+                cls._instance.data_repository,
+                cls._instance.cache_provider,
+            )
+            logger.info("✅ Dependências assíncronas configuradas")
 
         return cls._instance
@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List
+
+from src.infrastructure.ports.cache_provider_interface import CacheProvider
+
+
+class AsyncCacheProvider(ABC):
+    """Asyncio variant of ``CacheProvider``.
+
+    Only the bulk operations are exposed: the async data path always reads and
+    writes datasets in batches. Keys and values are those of ``CacheProvider``.
+    """
+
+    PROJECTS_KEY = CacheProvider.PROJECTS_KEY
+    FORMATIONS_KEY = CacheProvider.FORMATIONS_KEY
+    CERTIFICATIONS_KEY = CacheProvider.CERTIFICATIONS_KEY
+    EXPERIENCES_KEY = CacheProvider.EXPERIENCES_KEY
+    SOCIAL_MEDIA_KEY = CacheProvider.SOCIAL_MEDIA_KEY
+    COMPANY_DURATION_KEY = CacheProvider.COMPANY_DURATION_KEY
+    TOTAL_EXPERIENCE_KEY = CacheProvider.TOTAL_EXPERIENCE_KEY
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several keys at once; missing keys map to ``None``."""
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: Dict[str, Any]) -> None:
+        """Set several keys at once."""
+        pass
+
+    @abstractmethod
+    async def delete_many(self, keys: List[str]) -> None:
+        """Drop several keys at once."""
+        pass
+
+    async def abort_refill(self, keys: List[str]) -> None:
+        """Give up reloading ``keys`` after a miss; see ``CacheProvider``."""
+
+    async def close(self) -> None:
+        """Release the connections held by the provider."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Provider counters, when supported."""
+        return {}
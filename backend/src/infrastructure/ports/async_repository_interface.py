@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.dto.certification import Certification
+from src.domain.dto.company_duration import CompanyDuration
+from src.domain.dto.experience import Experience
+from src.domain.dto.formation import Formation
+from src.domain.dto.project import Project
+from src.domain.dto.social_media import SocialMedia
+
+
+class AsyncRepositoryInterface(ABC):
+    """Asyncio variant of ``RepositoryInterface``, with the same method names."""
+
+    @abstractmethod
+    async def get_all_projects(self, active: Optional[bool] = None) -> list[Project]:
+        """Get all projects from the repository.
+
+        When ``active`` is given, only rows with that flag are returned.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all_formations(
+        self, active: Optional[bool] = None
+    ) -> list[Formation]:
+        """Get all educations from the repository.
+
+        When ``active`` is given, only rows with that flag are returned.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all_certifications(
+        self, active: Optional[bool] = None
+    ) -> list[Certification]:
+        """Get all certifications from the repository.
+
+        When ``active`` is given, only rows with that flag are returned.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all_experiences(self) -> list[Experience]:
+        """Get all experiences from the repository."""
+        pass
+
+    @abstractmethod
+    async def get_all_social_media(
+        self, active: Optional[bool] = None
+    ) -> list[SocialMedia]:
+        """Get all social media from the repository.
+
+        When ``active`` is given, only rows with that flag are returned.
+        """
+        pass
+
+    @abstractmethod
+    async def get_company_duration(self) -> list[CompanyDuration]:
+        """Get all company duration from the repository."""
+        pass
+
+    @abstractmethod
+    async def get_total_experience(self) -> dict:
+        """Get all total experience."""
+        pass
+
+    async def close(self) -> None:
+        """Release the connections held by the repository."""
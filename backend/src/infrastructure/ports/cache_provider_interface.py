@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Callable, Dict, List, Optional
 
 from src.domain.dto.certification import Certification
 from src.domain.dto.company_duration import CompanyDuration
@@ -10,6 +10,57 @@ from src.domain.dto.social_media import SocialMedia
 
 
 class CacheProvider(ABC):
+    PROJECTS_KEY = "portfolio:projects"
+    FORMATIONS_KEY = "portfolio:formations"
+    CERTIFICATIONS_KEY = "portfolio:certifications"
+    EXPERIENCES_KEY = "portfolio:experiences"
+    SOCIAL_MEDIA_KEY = "portfolio:social_media"
+    COMPANY_DURATION_KEY = "portfolio:company_duration"
+    TOTAL_EXPERIENCE_KEY = "portfolio:total_experience"
+
+    # Cache key -> (getter, setter) used by the default bulk operations
+    KEY_ACCESSORS = {
+        PROJECTS_KEY: ("get_all_projects", "set_projects"),
+        FORMATIONS_KEY: ("get_all_formations", "set_formations"),
+        CERTIFICATIONS_KEY: ("get_all_certifications", "set_certifications"),
+        EXPERIENCES_KEY: ("get_all_experiences", "set_experiences"),
+        SOCIAL_MEDIA_KEY: ("get_all_social_media", "set_social_media"),
+        COMPANY_DURATION_KEY: ("get_company_duration", "set_company_duration"),
+        TOTAL_EXPERIENCE_KEY: ("get_total_experience", "set_total_experience"),
+    }
+    # Cache key -> fields identifying an item of the dataset. The items carry no
+    # database id, so natural keys are used; the entries of the total experience
+    # dict are identified by their own keys.
+    ITEM_ID_FIELDS = {
+        PROJECTS_KEY: ("url",),
+        FORMATIONS_KEY: ("institution", "course"),
+        CERTIFICATIONS_KEY: ("institution", "name"),
+        EXPERIENCES_KEY: ("company", "position", "duration"),
+        SOCIAL_MEDIA_KEY: ("url",),
+        COMPANY_DURATION_KEY: ("name",),
+        TOTAL_EXPERIENCE_KEY: (),
+    }
+
+    @classmethod
+    def item_ids(cls, key: str, items: Any) -> List[str]:
+        """Ids of ``items`` (DTOs or their cached dicts) of dataset ``key``.
+
+        Repeated natural keys get a ``#2``, ``#3``... suffix, in list order.
+        """
+        if isinstance(items, dict):
+            return [str(name) for name in items]
+
+        ids, seen = [], {}
+        for item in items:
+            item_id = "|".join(
+                str(item.get(field) if isinstance(item, dict) else getattr(item, field))
+                for field in cls.ITEM_ID_FIELDS[key]
+            )
+            seen[item_id] = seen.get(item_id, 0) + 1
+            ids.append(item_id if seen[item_id] == 1 else f"{item_id}#{seen[item_id]}")
+
+        return ids
+
     @abstractmethod
     def get_all_projects(self) -> list[Project]:
         """Get all projects from the repository."""
@@ -79,3 +130,88 @@ class CacheProvider(ABC):
     def set_total_experience(self, total_experience: dict) -> None:
         """Set cache."""
         pass
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several keys at once; missing keys map to ``None``.
+
+        The default implementation calls the single-key getters; providers backed
+        by a network store should override it to use a single round trip.
+        """
+        return {key: getattr(self, self.KEY_ACCESSORS[key][0])() for key in keys}
+
+    def set_many(self, items: Dict[str, Any]) -> None:
+        """Set several keys at once, each value being what its ``set_*`` expects."""
+        for key, value in items.items():
+            getattr(self, self.KEY_ACCESSORS[key][1])(value)
+
+    def delete_many(self, keys: List[str]) -> None:
+        """Drop several keys at once so the next read reloads them.
+
+        Providers that cannot delete ignore it; their entries expire by TTL.
+        """
+
+    def abort_refill(self, keys: List[str]) -> None:
+        """Give up reloading ``keys`` after a miss, e.g. the repository failed.
+
+        Releases the refill locks this caller took on those misses so the other
+        workers stop waiting for it. Providers without refill locks ignore it.
+        """
+
+    def drop_local(self, keys: List[str]) -> None:
+        """Forget this process's copy of ``keys``, keeping the shared tiers.
+
+        Used when another worker reloaded the shared cache. Providers without a
+        per-process tier ignore it.
+        """
+
+    def peek(self, key: str) -> Optional[Any]:
+        """Stored value of ``key``, even if stale, without triggering a refill.
+
+        Unlike the getters it never takes a refill lock nor waits for another
+        worker's refill. The default implementation calls the getter.
+        """
+        return getattr(self, self.KEY_ACCESSORS[key][0])()
+
+    def get_items(self, key: str, ids: List[str]) -> Optional[Any]:
+        """Items of ``key`` with the given ids, in that order; absent ids are skipped.
+
+        Returns ``None`` when the dataset is not cached, and a dict for the total
+        experience. The default implementation reads the whole dataset.
+        """
+        return self.select_items(key, getattr(self, self.KEY_ACCESSORS[key][0])(), ids)
+
+    @classmethod
+    def select_items(cls, key: str, data: Optional[Any], ids: List[str]) -> Any:
+        """Items of dataset ``key`` (``data``) with the given ids, in that order."""
+        if data is None:
+            return None
+
+        if isinstance(data, dict):
+            return {item_id: data[item_id] for item_id in ids if item_id in data}
+        by_id = dict(zip(cls.item_ids(key, data), data))
+        return [by_id[item_id] for item_id in ids if item_id in by_id]
+
+    def set_item(self, key: str, item: Any) -> None:
+        """Add or replace one item of ``key``; by default the dataset is dropped.
+
+        For the total experience, ``item`` is a dict of entries. The services do
+        not use the item writes: change notifications name tables, not rows, so
+        invalidation reloads whole datasets. A caller writing items must also
+        invalidate the response snapshots built from ``key``.
+        """
+        self.delete_many([key])
+
+    def delete_item(self, key: str, item_id: str) -> None:
+        """Remove one item of ``key``; by default the dataset is dropped."""
+        self.delete_many([key])
+
+    def register_refresher(self, key: str, refresh: Callable[[], None]) -> None:
+        """Register how to recompute ``key`` so stale entries refresh in background.
+
+        ``refresh`` must load the data and write it back through the matching
+        ``set_*`` method. Providers without background refresh ignore it.
+        """
+
+    def stats(self) -> Dict[str, Any]:
+        """Provider counters (hits, misses, refills...), when supported."""
+        return {}
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from src.domain.dto.certification import Certification
 from src.domain.dto.company_duration import CompanyDuration
@@ -9,19 +10,39 @@ from src.domain.dto.social_media import SocialMedia
 
 
 class RepositoryInterface(ABC):
+    def served_from_primary(self) -> bool:
+        """Whether the last read of the calling thread came from the source of truth.
+
+        Fallback chains answer ``False`` when a secondary source (cache,
+        snapshot) served it: that data may be stale and must not be cached as
+        fresh. A plain repository is always its own source of truth.
+        """
+        return True
+
     @abstractmethod
-    def get_all_projects(self) -> list[Project]:
-        """Get all projects from the repository."""
+    def get_all_projects(self, active: Optional[bool] = None) -> list[Project]:
+        """Get all projects from the repository.
+
+        When ``active`` is given, only rows with that flag are returned.
+        """
         pass
 
     @abstractmethod
-    def get_all_formations(self) -> list[Formation]:
-        """Get all educations from the repository."""
+    def get_all_formations(self, active: Optional[bool] = None) -> list[Formation]:
+        """Get all educations from the repository.
+
+        When ``active`` is given, only rows with that flag are returned.
+        """
         pass
 
     @abstractmethod
-    def get_all_certifications(self) -> list[Certification]:
-        """Get all certifications from the repository."""
+    def get_all_certifications(
+        self, active: Optional[bool] = None
+    ) -> list[Certification]:
+        """Get all certifications from the repository.
+
+        When ``active`` is given, only rows with that flag are returned.
+        """
         pass
 
     @abstractmethod
@@ -30,8 +51,11 @@ class RepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_social_media(self) -> list[SocialMedia]:
-        """Get all social media from the repository."""
+    def get_all_social_media(self, active: Optional[bool] = None) -> list[SocialMedia]:
+        """Get all social media from the repository.
+
+        When ``active`` is given, only rows with that flag are returned.
+        """
         pass
 
     @abstractmethod
@@ -0,0 +1,244 @@
+"""Async (ASGI) serving of the read-only data routes.
+
+The data endpoints are answered natively on the event loop: datasets come from
+``AsyncPortfolioDataService`` and are rendered by the same functions, snapshot
+store and after-request hooks as the Flask views, so payloads and headers are
+identical. Every other request (docs, health checks...) is handed to the Flask
+app through a WSGI bridge.
+"""
+
+import asyncio
+import io
+import sys
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import unquote
+
+from flask import Flask, request
+from werkzeug.datastructures import MultiDict
+
+from src.infrastructure.routes.education.view import (
+    EDUCATION_DATASETS,
+    render_education_response,
+)
+from src.infrastructure.routes.experiences.view import (
+    EXPERIENCES_VARIANTS,
+    experiences_snapshot_key,
+)
+from src.infrastructure.routes.portfolio.view import (
+    parse_sections,
+    portfolio_datasets,
+    render_portfolio_response,
+)
+from src.infrastructure.routes.projects.view import render_projects_response
+from src.infrastructure.routes.social_media.view import render_social_media_response
+from src.infrastructure.services.async_portfolio_data_service import (
+    AsyncPortfolioDataService,
+)
+from src.infrastructure.services.response_snapshot_store import (
+    get_response_snapshot_store,
+)
+from src.infrastructure.utils.constants import (
+    HTTP_BAD_REQUEST,
+    HTTP_INTERNAL_SERVER_ERROR,
+)
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+API_PREFIX = "/api/v1"
+
+
+class AsyncRoute(NamedTuple):
+    """What a request needs: its snapshot, the datasets and how to render them."""
+
+    snapshot_key: str
+    datasets: Tuple[str, ...]
+    render: Callable[[Dict[str, Any]], Any]
+
+
+def resolve_experiences(args: MultiDict) -> AsyncRoute:
+    snapshot_key = experiences_snapshot_key(args)
+    datasets, render, _ = EXPERIENCES_VARIANTS[snapshot_key]
+
+    return AsyncRoute(snapshot_key, datasets, render)
+
+
+def resolve_portfolio(args: MultiDict) -> AsyncRoute:
+    sections = parse_sections(args.get("include", ""))
+
+    return AsyncRoute(
+        f"portfolio:{','.join(sections)}",
+        tuple(portfolio_datasets(sections)),
+        lambda data: render_portfolio_response(sections, data),
+    )
+
+
+# Path -> resolver of the route for the request's query params
+ASYNC_ROUTES: Dict[str, Callable[[MultiDict], AsyncRoute]] = {
+    f"{API_PREFIX}/projects": lambda args: AsyncRoute(
+        "projects", ("projects",), render_projects_response
+    ),
+    f"{API_PREFIX}/education": lambda args: AsyncRoute(
+        "education", EDUCATION_DATASETS, render_education_response
+    ),
+    f"{API_PREFIX}/social-media-links": lambda args: AsyncRoute(
+        "social_media", ("social_media",), render_social_media_response
+    ),
+    f"{API_PREFIX}/experiences": resolve_experiences,
+    f"{API_PREFIX}/portfolio": resolve_portfolio,
+}
+
+
+def build_environ(scope: Dict[str, Any]) -> Dict[str, Any]:
+    """Minimal WSGI environ for a body-less ASGI HTTP request."""
+    server_name, server_port = scope.get("server") or ("localhost", 80)
+    environ = {
+        "REQUEST_METHOD": scope["method"],
+        "SCRIPT_NAME": scope.get("root_path", ""),
+        "PATH_INFO": unquote(scope["path"]),
+        "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+        "SERVER_NAME": server_name,
+        "SERVER_PORT": str(server_port),
+        "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scope.get("scheme", "http"),
+        "wsgi.input": io.BytesIO(b""),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": False,
+        "wsgi.multiprocess": True,
+        "wsgi.run_once": False,
+    }
+    if scope.get("client"):
+        environ["REMOTE_ADDR"] = scope["client"][0]
+
+    for name, value in scope.get("headers", []):
+        name = name.decode("latin-1").upper().replace("-", "_")
+        value = value.decode("latin-1")
+        if name not in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            name = f"HTTP_{name}"
+        if name in environ:
+            value = f"{environ[name]},{value}"
+        environ[name] = value
+
+    return environ
+
+
+class AsyncPortfolioApp:
+    """ASGI application serving ``ASYNC_ROUTES`` natively and the rest via Flask."""
+
+    def __init__(
+        self,
+        flask_app: Flask,
+        portfolio_data_service: AsyncPortfolioDataService,
+        fallback: Optional[Callable] = None,
+    ) -> None:
+        self.flask_app = flask_app
+        self.portfolio_data_service = portfolio_data_service
+        self.fallback = fallback
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        resolver = None
+        if scope["type"] == "http" and scope["method"] == "GET":
+            resolver = ASYNC_ROUTES.get(scope["path"].rstrip("/"))
+
+        if resolver is None:
+            if self.fallback is None:
+                await self._send(send, 404, [], b"")
+                return
+            await self.fallback(scope, receive, send)
+            return
+
+        await self._serve(scope, resolver, send)
+
+    async def _serve(self, scope, resolver, send) -> None:
+        environ = build_environ(scope)
+        route = snapshot = data = None
+
+        with self.flask_app.request_context(environ):
+            try:
+                route = resolver(request.args)
+                snapshot = get_response_snapshot_store().get(route.snapshot_key)
+            except ValueError as error:
+                response = self._finalize(
+                    self._error_response(str(error), HTTP_BAD_REQUEST)
+                )
+
+        if route is None:
+            await self._send(send, *response)
+            return
+
+        try:
+            if snapshot is None:
+                # No thread is held while waiting on I/O; rendering, encoding and
+                # compressing the body are CPU-bound and run in a worker thread
+                data = await self.portfolio_data_service.load_datasets(route.datasets)
+                response = await asyncio.get_running_loop().run_in_executor(
+                    None, self._build, environ, route, data
+                )
+            else:
+                with self.flask_app.request_context(environ):
+                    response = self._finalize(snapshot.to_response())
+        except Exception as error:
+            logger.error(f"Error getting {scope['path']}: {str(error)}")
+            with self.flask_app.request_context(environ):
+                response = self._finalize(
+                    self._error_response(
+                        "An internal server error occurred",
+                        HTTP_INTERNAL_SERVER_ERROR,
+                    )
+                )
+
+        await self._send(send, *response)
+
+    def _build(
+        self, environ: Dict[str, Any], route: AsyncRoute, data: Dict[str, Any]
+    ) -> Tuple[int, list, bytes]:
+        with self.flask_app.request_context(environ):
+            snapshot = get_response_snapshot_store().get_or_build(
+                route.snapshot_key, lambda: route.render(data)
+            )
+            return self._finalize(snapshot.to_response())
+
+    def _error_response(self, message: str, status: int):
+        return self.flask_app.response_class(
+            self.flask_app.json.dumps({"error_message": message}),
+            status=status,
+            mimetype="application/json",
+        )
+
+    def _finalize(self, response) -> Tuple[int, list, bytes]:
+        """Status, ASGI headers and body; must run inside the request's context."""
+        # Same after-request hooks (CORS, validators) as the WSGI stack
+        response = self.flask_app.process_response(response)
+        # Let werkzeug drop the body of 304s and fix the headers, as over WSGI
+        app_iter, status, headers = response.get_wsgi_response(request.environ)
+
+        return (
+            int(status.split(" ", 1)[0]),
+            [
+                (name.lower().encode("latin-1"), value.encode("latin-1"))
+                for name, value in headers
+            ],
+            b"".join(app_iter),
+        )
+
+    @staticmethod
+    async def _send(send, status: int, headers: list, body: bytes) -> None:
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self.portfolio_data_service.close()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -6,6 +6,9 @@ from flask_restx import Namespace, Resource
 from src.infrastructure.utils.constants import HTTP_INTERNAL_SERVER_ERROR
 from src.infrastructure.utils.logger import get_logger
 from src.infrastructure.dependencie_injection import ApplicationDependencies
+from src.infrastructure.services.response_snapshot_store import (
+    get_response_snapshot_store,
+)
 
 logger = get_logger(__name__)
 
@@ -16,27 +19,41 @@ education_blueprint = Blueprint("education_bp", __name__)
 education_ns = Namespace("Education", description="My formations and certifications")
 
 
+EDUCATION_DATASETS = ("formations", "certifications")
+
+
+def render_education_response(data: dict) -> dict:
+    formations = data["formations"]
+    certifications = data["certifications"]
+
+    return {
+        "formations": [
+            formation.to_response() for formation in formations if formation.active
+        ],
+        "certifications": [
+            certification.to_response()
+            for certification in certifications
+            if certification.active
+        ],
+    }
+
+
+def build_education_response() -> dict:
+    return render_education_response(
+        get_portfolio_data_service().load_datasets(EDUCATION_DATASETS)
+    )
+
+
 @education_ns.route("/education")
 class Education(Resource):
     def get(self):
         """Get all education and formations from the injected adapter."""
         try:
-            portfolio_data_service = get_portfolio_data_service()
-            formations = portfolio_data_service.formations()
-            certifications = portfolio_data_service.certifications()
-
-            response = {
-                "formations": [
-                    formation.to_response() for formation in formations if formation.active
-                ],
-                "certifications": [
-                    certification.to_response()
-                    for certification in certifications
-                    if certification.active
-                ],
-            }
-
-            return jsonify(response)
+            snapshot = get_response_snapshot_store().get_or_build(
+                "education", build_education_response
+            )
+
+            return snapshot.to_response()
         except Exception as error:
             logger.error(f"Error getting education: {str(error)}")
             return (
@@ -4,6 +4,9 @@ from flask import jsonify, request
 from flask_restx import Namespace, Resource
 
 from src.infrastructure.dependencie_injection import ApplicationDependencies
+from src.infrastructure.services.response_snapshot_store import (
+    get_response_snapshot_store,
+)
 
 def get_portfolio_data_service():
     return ApplicationDependencies().portfolio_data_service
@@ -14,39 +17,80 @@ logger = get_logger(__name__)
 
 experiences_ns = Namespace("Experiences", description="Companies experiences")
 
+
+def render_total_experience_response(data: dict) -> dict:
+    return data["total_experience"]
+
+
+def render_companies_duration_response(data: dict) -> list:
+    return [
+        company_duration.to_response()
+        for company_duration in data["companies_duration"]
+    ]
+
+
+def render_experiences_response(data: dict) -> list:
+    return [experience.to_response() for experience in data["experiences"]]
+
+
+def build_total_experience_response() -> dict:
+    return render_total_experience_response(
+        {"total_experience": get_portfolio_data_service().total_experience()}
+    )
+
+
+def build_companies_duration_response() -> list:
+    return render_companies_duration_response(
+        {"companies_duration": get_portfolio_data_service().companies_duration()}
+    )
+
+
+def build_experiences_response() -> list:
+    return render_experiences_response(
+        {"experiences": get_portfolio_data_service().experiences()}
+    )
+
+
+# Snapshot key -> (datasets, renderer, builder) of each /experiences variant
+EXPERIENCES_VARIANTS = {
+    "experiences:total_duration": (
+        ("total_experience",),
+        render_total_experience_response,
+        build_total_experience_response,
+    ),
+    "experiences:company_duration": (
+        ("companies_duration",),
+        render_companies_duration_response,
+        build_companies_duration_response,
+    ),
+    "experiences": (
+        ("experiences",),
+        render_experiences_response,
+        build_experiences_response,
+    ),
+}
+
+
+def experiences_snapshot_key(args) -> str:
+    """Snapshot key of the variant selected by the query params."""
+    if args.get("total_duration", "false").lower() == "true":
+        return "experiences:total_duration"
+    if args.get("company_duration", "false").lower() == "true":
+        return "experiences:company_duration"
+    return "experiences"
+
+
 @experiences_ns.route("/experiences")
 class Experiences(Resource):
     def get(self):
         """Get all experiences from the injected adapter"""
         try:
-            portfolio_data_service = get_portfolio_data_service()
-            total_duration_param = (
-                request.args.get("total_duration", "false").lower() == "true"
+            snapshot_key = experiences_snapshot_key(request.args)
+            snapshot = get_response_snapshot_store().get_or_build(
+                snapshot_key, EXPERIENCES_VARIANTS[snapshot_key][2]
             )
 
-            if total_duration_param:
-                response = portfolio_data_service.total_experience()
-                return jsonify(response)
-
-            company_duration_param = (
-                    request.args.get("company_duration", "false").lower() == "true"
-            )
-
-            if company_duration_param:
-                company_durations = portfolio_data_service.companies_duration()
-                response = [
-                    company_duration.to_response()
-                    for company_duration in company_durations
-                ]
-                return jsonify(response)
-
-            experiences = portfolio_data_service.experiences()
-
-            response = [
-                experience.to_response() for experience in experiences
-            ]
-
-            return jsonify(response)
+            return snapshot.to_response()
         except Exception as error:
             logger.error(f"Error getting experiences: {str(error)}")
             return (
@@ -3,6 +3,53 @@
 from flask import Blueprint, jsonify
 from flask_restx import Namespace, Resource
 
+from src.infrastructure.dependencie_injection import ApplicationDependencies
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker
+from src.infrastructure.utils.constants import HTTP_OK, HTTP_SERVICE_UNAVAILABLE
+
+
+# Reported while the dependencies are still being built (fast boot)
+INITIALIZING = "initializing"
+
+
+def dependencies_initialized() -> bool:
+    return ApplicationDependencies.initialized()
+
+
+def get_cache_provider():
+    return ApplicationDependencies().cache_provider
+
+
+def get_cache_warmup_service():
+    return ApplicationDependencies().cache_warmup_service
+
+
+def get_fallback_repository():
+    """Fallback chain read by the service, or None when there is none."""
+    from src.infrastructure.adapters.outbound_fallback_repository_adapter import (
+        FallbackRepositoryAdapter,
+    )
+
+    repository = ApplicationDependencies().portfolio_data_service.data_repository
+    return repository if isinstance(repository, FallbackRepositoryAdapter) else None
+
+
+def get_circuit_breaker():
+    """Breaker of the database: the one of the chain's primary source, if any.
+
+    The service breaker wraps the whole chain, which keeps answering from its
+    fallback sources while the database is down.
+    """
+    fallback_repository = get_fallback_repository()
+    if (
+        fallback_repository is not None
+        and fallback_repository.primary.circuit_breaker is not None
+    ):
+        return fallback_repository.primary.circuit_breaker
+
+    return ApplicationDependencies().portfolio_data_service.circuit_breaker
+
+
 health_check_blueprint = Blueprint("health_check", __name__)
 health_check_ns = Namespace("Health Check", description="Application Health Check")
 
@@ -10,5 +57,62 @@ health_check_ns = Namespace("Health Check", description="Application Health Chec
 @health_check_ns.route("/ping")
 class HealthCheck(Resource):
     def get(self):
-        """Ping the server."""
-        return jsonify({"message": "pong"})
+        """Ping the server; also reports the database circuit breaker state."""
+        if not dependencies_initialized():
+            return jsonify({"message": "pong", "database": INITIALIZING})
+
+        try:
+            database = get_circuit_breaker().state
+        except Exception:
+            # Liveness must not depend on the dependencies being initialized
+            database = "unknown"
+
+        return jsonify({"message": "pong", "database": database})
+
+
+@health_check_ns.route("/cache-stats")
+class CacheStats(Resource):
+    def get(self):
+        """Cache counters: hits, stale serves, refills and coalesced refills."""
+        if not dependencies_initialized():
+            return jsonify({})
+
+        cache_provider = get_cache_provider()
+
+        return jsonify(cache_provider.stats() if cache_provider is not None else {})
+
+
+@health_check_ns.route("/ready")
+class Readiness(Resource):
+    @health_check_ns.response(200, "Ready to serve traffic")
+    @health_check_ns.response(
+        503, "Cache warm-up still running, or database down and nothing to serve"
+    )
+    def get(self):
+        """Readiness of this worker; unlike /ping it waits for the cache warm-up.
+
+        While the database circuit is not closed, or a fallback source (Redis,
+        snapshot) served the last read of a dataset, the worker is ``degraded``:
+        it keeps serving from the cache or the fallback chain, or is unready if
+        there is neither.
+        """
+        if not dependencies_initialized():
+            return {"ready": False, "status": INITIALIZING}, HTTP_SERVICE_UNAVAILABLE
+
+        report = dict(get_cache_warmup_service().report())
+        report["database"] = get_circuit_breaker().report()
+        report["degraded"] = report["database"]["state"] != CircuitBreaker.CLOSED
+        fallback_repository = get_fallback_repository()
+        if fallback_repository is not None:
+            report["fallback"] = fallback_repository.report()
+            report["degraded"] = (
+                report["degraded"] or report["fallback"]["degraded"]
+            )
+        if (
+            report["degraded"]
+            and get_cache_provider() is None
+            and fallback_repository is None
+        ):
+            report["ready"] = False
+
+        return report, HTTP_OK if report["ready"] else HTTP_SERVICE_UNAVAILABLE
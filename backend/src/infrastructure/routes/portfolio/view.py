@@ -0,0 +1,132 @@
+"""Portfolio Routes"""
+
+from flask import jsonify, request
+from flask_restx import Namespace, Resource
+
+from src.infrastructure.dependencie_injection import ApplicationDependencies
+from src.infrastructure.services.response_snapshot_store import (
+    get_response_snapshot_store,
+)
+from src.infrastructure.utils.constants import (
+    HTTP_BAD_REQUEST,
+    HTTP_INTERNAL_SERVER_ERROR,
+)
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def get_portfolio_data_service():
+    return ApplicationDependencies().portfolio_data_service
+
+
+portfolio_ns = Namespace(
+    name="Portfolio",
+    description="Every portfolio section in a single response",
+)
+
+# Section name -> datasets of PortfolioDataService needed to render it
+SECTION_DATASETS = {
+    "projects": ("projects",),
+    "education": ("formations", "certifications"),
+    "experiences": ("experiences",),
+    "companies_duration": ("companies_duration",),
+    "total_experience": ("total_experience",),
+    "social_media": ("social_media",),
+}
+
+
+def parse_sections(include: str) -> list[str]:
+    """Parse the ``include`` query param; an empty value selects every section."""
+    sections = [section.strip() for section in include.split(",") if section.strip()]
+    if not sections:
+        return list(SECTION_DATASETS)
+
+    unknown = [section for section in sections if section not in SECTION_DATASETS]
+    if unknown:
+        raise ValueError(f"Unknown sections: {', '.join(unknown)}")
+
+    return [section for section in SECTION_DATASETS if section in sections]
+
+
+def portfolio_datasets(sections: list[str]) -> list[str]:
+    return [name for section in sections for name in SECTION_DATASETS[section]]
+
+
+def render_portfolio_response(sections: list[str], data: dict) -> dict:
+    response = {}
+    if "projects" in sections:
+        response["projects"] = [
+            project.to_response() for project in data["projects"] if project.active
+        ]
+    if "education" in sections:
+        response["education"] = {
+            "formations": [
+                formation.to_response()
+                for formation in data["formations"]
+                if formation.active
+            ],
+            "certifications": [
+                certification.to_response()
+                for certification in data["certifications"]
+                if certification.active
+            ],
+        }
+    if "experiences" in sections:
+        response["experiences"] = [
+            experience.to_response() for experience in data["experiences"]
+        ]
+    if "companies_duration" in sections:
+        response["companies_duration"] = [
+            company_duration.to_response()
+            for company_duration in data["companies_duration"]
+        ]
+    if "total_experience" in sections:
+        response["total_experience"] = data["total_experience"]
+    if "social_media" in sections:
+        response["social_media"] = [
+            sm.to_response() for sm in data["social_media"] if sm.active
+        ]
+
+    return response
+
+
+def build_portfolio_response(sections: list[str]) -> dict:
+    data = get_portfolio_data_service().load_datasets(portfolio_datasets(sections))
+
+    return render_portfolio_response(sections, data)
+
+
+@portfolio_ns.route("/portfolio")
+class Portfolio(Resource):
+    @portfolio_ns.doc(
+        params={
+            "include": (
+                "Comma-separated sections to return "
+                f"({', '.join(SECTION_DATASETS)}). Defaults to all of them."
+            )
+        }
+    )
+    @portfolio_ns.response(200, "Success")
+    @portfolio_ns.response(400, "Unknown section")
+    @portfolio_ns.response(500, "Internal Server Error")
+    def get(self):
+        """Get every portfolio section, loading the datasets concurrently."""
+        try:
+            sections = parse_sections(request.args.get("include", ""))
+        except ValueError as error:
+            return {"error_message": str(error)}, HTTP_BAD_REQUEST
+
+        try:
+            snapshot = get_response_snapshot_store().get_or_build(
+                f"portfolio:{','.join(sections)}",
+                lambda: build_portfolio_response(sections),
+            )
+
+            return snapshot.to_response()
+        except Exception as error:
+            logger.error(f"Error getting portfolio: {str(error)}")
+            return (
+                jsonify({"error_message": "An internal server error occurred"}),
+                HTTP_INTERNAL_SERVER_ERROR,
+            )
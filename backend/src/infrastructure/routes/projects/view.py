@@ -4,6 +4,11 @@ from flask import Blueprint, jsonify
 from flask_restx import Namespace, Resource
 
 from src.infrastructure.dependencie_injection import ApplicationDependencies
+from src.infrastructure.services.response_snapshot_store import (
+    SnapshotPayload,
+    get_response_snapshot_store,
+    latest_update,
+)
 
 def get_portfolio_data_service():
     return ApplicationDependencies().portfolio_data_service
@@ -18,17 +23,31 @@ projects_ns = Namespace(
     description="My OpenSource Projects",
 )
 
+def render_projects_response(data: dict) -> SnapshotPayload:
+    projects = data["projects"]
+
+    return SnapshotPayload(
+        data=[project.to_response() for project in projects if project.active],
+        last_modified=latest_update(projects),
+    )
+
+
+def build_projects_response() -> SnapshotPayload:
+    portfolio_data_service = get_portfolio_data_service()
+
+    return render_projects_response({"projects": portfolio_data_service.projects()})
+
+
 @projects_ns.route("/projects")
 class Projects(Resource):
     def get(self):
         """Get all projects from the projects.json file."""
         try:
-            portfolio_data_service = get_portfolio_data_service()
-            projects = portfolio_data_service.projects()
-
-            response = [project.to_response() for project in projects if project.active]
+            snapshot = get_response_snapshot_store().get_or_build(
+                "projects", build_projects_response
+            )
 
-            return jsonify(response)
+            return snapshot.to_response()
         except Exception as error:
             logger.error(f"Error getting projects: {str(error)}")
             return (
@@ -4,6 +4,11 @@ from flask import Blueprint, jsonify
 from flask_restx import Namespace, Resource
 
 from src.infrastructure.dependencie_injection import ApplicationDependencies
+from src.infrastructure.services.response_snapshot_store import (
+    SnapshotPayload,
+    get_response_snapshot_store,
+    latest_update,
+)
 
 def get_portfolio_data_service():
     return ApplicationDependencies().portfolio_data_service
@@ -19,6 +24,23 @@ social_media_ns = Namespace(
     path="/social-media",
 )
 
+def render_social_media_response(data: dict) -> SnapshotPayload:
+    social_media_list = data["social_media"]
+
+    return SnapshotPayload(
+        data=[sm.to_response() for sm in social_media_list if sm.active],
+        last_modified=latest_update(social_media_list),
+    )
+
+
+def build_social_media_response() -> SnapshotPayload:
+    portfolio_data_service = get_portfolio_data_service()
+
+    return render_social_media_response(
+        {"social_media": portfolio_data_service.social_media()}
+    )
+
+
 @social_media_ns.route("/social-media-links")
 class SocialMediaLinks(Resource):
     @social_media_ns.response(200, "Success")
@@ -26,12 +48,11 @@ class SocialMediaLinks(Resource):
     def get(self):
         """Get all social media from the social_media.json file."""
         try:
-            portfolio_data_service = get_portfolio_data_service()
-            social_media_list = portfolio_data_service.social_media()
-
-            response = [sm.to_response() for sm in social_media_list if sm.active]
+            snapshot = get_response_snapshot_store().get_or_build(
+                "social_media", build_social_media_response
+            )
 
-            return jsonify(response)
+            return snapshot.to_response()
         except Exception as error:
             logger.error(f"Error getting social media: {str(error)}")
             return (
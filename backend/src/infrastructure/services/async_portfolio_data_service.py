@@ -0,0 +1,140 @@
+import asyncio
+from typing import Any, Awaitable, Dict, Iterable, Optional
+
+from src.domain.dto.certification import Certification
+from src.domain.dto.company_duration import CompanyDuration
+from src.domain.dto.experience import Experience
+from src.domain.dto.formation import Formation
+from src.domain.dto.project import Project
+from src.domain.dto.social_media import SocialMedia
+from src.infrastructure.ports.async_cache_provider_interface import (
+    AsyncCacheProvider,
+)
+from src.infrastructure.ports.async_repository_interface import (
+    AsyncRepositoryInterface,
+)
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncPortfolioDataService:
+    """Asyncio counterpart of ``PortfolioDataService``.
+
+    Datasets missing from the cache are read from the repository concurrently on
+    the event loop, so a request waiting on I/O does not hold a thread.
+    """
+
+    CACHE_BINDINGS = PortfolioDataService.CACHE_BINDINGS
+    DATASETS = PortfolioDataService.DATASETS
+    REPOSITORY_CRITERIA = PortfolioDataService.REPOSITORY_CRITERIA
+
+    def __init__(
+        self,
+        data_repository: AsyncRepositoryInterface,
+        cache_provider: Optional[AsyncCacheProvider] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.data_repository = data_repository
+        self.cache_provider = cache_provider
+        self.circuit_breaker = circuit_breaker or CircuitBreaker("repository")
+
+    async def close(self) -> None:
+        await self.data_repository.close()
+        if self.cache_provider is not None:
+            await self.cache_provider.close()
+
+    async def load_datasets(self, datasets: Iterable[str]) -> Dict[str, Any]:
+        """Load several datasets at once; same contract as the sync service."""
+        datasets = list(dict.fromkeys(datasets))
+        unknown = set(datasets) - set(self.DATASETS)
+        if unknown:
+            raise ValueError(f"Unknown datasets: {', '.join(sorted(unknown))}")
+
+        results = await self._get_many_from_cache(datasets)
+        missing = [name for name in datasets if results.get(name) is None]
+        try:
+            loaded = dict(
+                zip(
+                    missing,
+                    await asyncio.gather(
+                        *(
+                            self._read_repository(self.CACHE_BINDINGS[name][1])
+                            for name in missing
+                        )
+                    ),
+                )
+            )
+        except Exception:
+            await self._abort_refill([self.CACHE_BINDINGS[name][0] for name in missing])
+            raise
+
+        if self.cache_provider is not None and loaded:
+            try:
+                await self.cache_provider.set_many(
+                    {
+                        self.CACHE_BINDINGS[name][0]: data
+                        for name, data in loaded.items()
+                    }
+                )
+            except Exception as e:
+                logger.warning(f"Falha ao popular o cache em lote: {str(e)}")
+
+        results.update(loaded)
+        return {name: results[name] for name in datasets}
+
+    def _read_repository(self, getter_name: str) -> Awaitable[Any]:
+        return self.circuit_breaker.call_async(
+            getattr(self.data_repository, getter_name),
+            **self.REPOSITORY_CRITERIA.get(getter_name, {}),
+        )
+
+    async def _abort_refill(self, keys: list[str]) -> None:
+        if self.cache_provider is None or not keys:
+            return
+
+        try:
+            await self.cache_provider.abort_refill(keys)
+        except Exception as e:
+            logger.warning(f"Falha ao liberar a recarga de {', '.join(keys)}: {str(e)}")
+
+    async def _get_many_from_cache(self, datasets: list[str]) -> Dict[str, Any]:
+        if self.cache_provider is None or not datasets:
+            return {}
+
+        keys = {self.CACHE_BINDINGS[name][0]: name for name in datasets}
+        try:
+            cached = await self.cache_provider.get_many(list(keys))
+        except Exception as e:
+            logger.warning(
+                f"Falha ao ler o cache em lote, usando o repositório: {str(e)}"
+            )
+            return {}
+
+        return {name: cached.get(key) for key, name in keys.items()}
+
+    async def _load(self, dataset: str) -> Any:
+        return (await self.load_datasets([dataset]))[dataset]
+
+    async def projects(self) -> list[Project]:
+        return await self._load("projects")
+
+    async def experiences(self) -> list[Experience]:
+        return await self._load("experiences")
+
+    async def companies_duration(self) -> list[CompanyDuration]:
+        return await self._load("companies_duration")
+
+    async def formations(self) -> list[Formation]:
+        return await self._load("formations")
+
+    async def certifications(self) -> list[Certification]:
+        return await self._load("certifications")
+
+    async def social_media(self) -> list[SocialMedia]:
+        return await self._load("social_media")
+
+    async def total_experience(self) -> dict:
+        return await self._load("total_experience")
@@ -0,0 +1,113 @@
+"""Keeps the caches in sync with table changes reported by the database."""
+
+import uuid
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional
+
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+from src.infrastructure.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.infrastructure.adapters.outbound_redis_adapter import RedisAdapter
+
+logger = get_logger(__name__)
+
+
+class CacheInvalidationService:
+    """Maps changed tables to the datasets derived from them and refreshes those.
+
+    Besides the data cache, callbacks registered with ``add_callback`` (e.g. the
+    response snapshot store) are told which datasets changed.
+
+    Every worker listens to the changes. With a ``shared_cache``, a single worker
+    per dataset and change is elected to reload it into the shared cache; the
+    others, including those notified after the reload, wait for it and only drop
+    their own copy (L1 and callbacks).
+    """
+
+    # Table -> datasets of PortfolioDataService computed from it
+    TABLE_DATASETS = {
+        "projects": ("projects",),
+        "formations": ("formations",),
+        "certifications": ("certifications",),
+        "social_media": ("social_media",),
+        "companies": ("experiences", "companies_duration", "total_experience"),
+        "experiences": ("experiences", "companies_duration", "total_experience"),
+    }
+
+    def __init__(
+        self,
+        portfolio_data_service: PortfolioDataService,
+        shared_cache: Optional["RedisAdapter"] = None,
+    ) -> None:
+        self.portfolio_data_service = portfolio_data_service
+        self.shared_cache = shared_cache
+        self._callbacks: List[Callable[[List[str]], None]] = []
+
+    def add_callback(self, callback: Callable[[List[str]], None]) -> None:
+        self._callbacks.append(callback)
+
+    def datasets_for_tables(self, tables: Iterable[str]) -> List[str]:
+        """Datasets affected by ``tables``; an unknown table affects all of them."""
+        datasets = []
+        for table in tables:
+            if table not in self.TABLE_DATASETS:
+                return list(PortfolioDataService.DATASETS)
+            datasets.extend(self.TABLE_DATASETS[table])
+
+        return list(dict.fromkeys(datasets))
+
+    def handle_changes(
+        self, tables: Iterable[str], changes: Iterable[str] = ()
+    ) -> List[str]:
+        """Refresh everything derived from ``tables`` and notify the callbacks.
+
+        ``changes`` identify the changes behind ``tables`` the same way in every
+        worker; without them this worker reloads the datasets itself.
+        """
+        datasets = self.datasets_for_tables(tables)
+        if not datasets:
+            return datasets
+
+        self._reload(datasets, sorted(changes) or [uuid.uuid4().hex])
+
+        for callback in self._callbacks:
+            try:
+                callback(datasets)
+            except Exception as e:
+                logger.warning(f"Falha ao notificar invalidação de cache: {str(e)}")
+
+        return datasets
+
+    def _reload(self, datasets: List[str], changes: List[str]) -> None:
+        if self.shared_cache is None:
+            self.portfolio_data_service.refresh_datasets(datasets)
+            return
+
+        try:
+            elected = self.shared_cache.acquire_invalidation_locks(datasets, changes)
+        except Exception as e:
+            # Without the election every worker reloads, as without Redis
+            logger.warning(f"Falha ao eleger o worker da recarga: {str(e)}")
+            self.portfolio_data_service.refresh_datasets(datasets)
+            return
+
+        if elected:
+            reloaded = False
+            try:
+                reloaded = self.portfolio_data_service.refresh_datasets(elected)
+            finally:
+                self.shared_cache.release_invalidation_locks(elected, reloaded)
+
+        others = [name for name in datasets if name not in elected]
+        if not others:
+            return
+
+        try:
+            if not self.shared_cache.wait_for_invalidations(others, changes):
+                logger.warning(
+                    f"Recarga de {', '.join(others)} por outro worker excedeu o "
+                    f"tempo limite"
+                )
+        except Exception as e:
+            logger.warning(f"Falha ao aguardar a recarga de outro worker: {str(e)}")
+        self.portfolio_data_service.drop_local_datasets(others)
@@ -0,0 +1,73 @@
+"""Populates the Redis namespace of a new release before readers switch to it."""
+
+from typing import Any, Dict, List, Optional
+
+from src.infrastructure.adapters.outbound_redis_adapter import RedisAdapter
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CacheNamespaceService:
+    """Cuts the shared cache over to the namespace of this release.
+
+    A single worker (holding the namespace lock) reloads every dataset into the
+    new namespace, promotes it and collects the namespaces no release uses any
+    more. Meanwhile the other workers read misses from the current namespace.
+    """
+
+    READY = "ready"
+    POPULATED = "populated"
+    PENDING = "pending"
+    FAILED = "failed"
+
+    def __init__(
+        self, cache: RedisAdapter, portfolio_data_service: PortfolioDataService
+    ) -> None:
+        self.cache = cache
+        self.portfolio_data_service = portfolio_data_service
+        self.status: Optional[str] = None
+        self.collected: List[str] = []
+
+    def prepare(self) -> Dict[str, Any]:
+        """Populate and promote our namespace, unless ready or being populated."""
+        try:
+            status = self.cache.namespace_status()["status"]
+            if status == RedisAdapter.NAMESPACE_READY:
+                return self._finish(self.READY)
+            if not self.cache.acquire_namespace_lock():
+                return self._finish(self.PENDING)
+        except Exception as e:
+            logger.warning(f"⚠️  Falha ao consultar o namespace de cache: {str(e)}")
+            return self._finish(self.FAILED)
+
+        try:
+            logger.info(f"🧱 Populando o namespace de cache '{self.cache.namespace}'")
+            if not self.portfolio_data_service.refresh_datasets(
+                PortfolioDataService.DATASETS
+            ):
+                return self._finish(self.FAILED)
+
+            self.cache.promote_namespace()
+            collected = self.cache.collect_namespaces()
+        except Exception as e:
+            logger.warning(f"⚠️  Falha ao promover o namespace de cache: {str(e)}")
+            return self._finish(self.FAILED)
+        finally:
+            self.cache.release_namespace_lock()
+
+        return self._finish(self.POPULATED, collected)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "namespace": self.cache.namespace,
+            "status": self.status,
+            "collected": self.collected,
+        }
+
+    def _finish(
+        self, status: str, collected: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        self.status, self.collected = status, collected or []
+        return self.report()
@@ -0,0 +1,118 @@
+"""Loads every dataset into the caches before a worker starts serving."""
+
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+from src.infrastructure.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.infrastructure.services.cache_namespace_service import (
+        CacheNamespaceService,
+    )
+
+logger = get_logger(__name__)
+
+
+class CacheWarmupService:
+    """Tracks the warm-up of one worker and reports its readiness.
+
+    The worker is ready once its warm-up finished, whatever the outcome: a failed
+    warm-up only means the first requests read from the repository.
+    """
+
+    CACHE_WARMUP_ENABLED = os.getenv("CACHE_WARMUP_ENABLED", "true").lower() == "true"
+    CACHE_WARMUP_TIMEOUT = float(os.getenv("CACHE_WARMUP_TIMEOUT", "10"))
+
+    PENDING = "pending"
+    WARMING = "warming"
+    WARM = "warm"
+    FAILED = "failed"
+    SKIPPED = "skipped"
+
+    def __init__(
+        self,
+        portfolio_data_service: PortfolioDataService,
+        enabled: Optional[bool] = None,
+        namespace_service: Optional["CacheNamespaceService"] = None,
+    ) -> None:
+        self.portfolio_data_service = portfolio_data_service
+        self.namespace_service = namespace_service
+        self.enabled = self.CACHE_WARMUP_ENABLED if enabled is None else enabled
+        self.status = self.PENDING
+        self.duration: Optional[float] = None
+        self.error: Optional[str] = None
+        self._done = threading.Event()
+
+    @property
+    def ready(self) -> bool:
+        return self._done.is_set()
+
+    def start(self) -> Optional[threading.Thread]:
+        """Warm the caches in a background thread, unless disabled."""
+        if not self.enabled:
+            self._finish(self.SKIPPED)
+            return None
+
+        thread = threading.Thread(target=self.warm, name="cache-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the warm-up finished or ``timeout`` seconds elapsed."""
+        if timeout is None:
+            timeout = self.CACHE_WARMUP_TIMEOUT
+
+        return self._done.wait(timeout)
+
+    def warm(self, force: bool = False) -> Dict[str, Any]:
+        """Load every dataset into the caches and return the warm-up report.
+
+        Datasets already cached in the shared tier are only copied into the
+        worker's memory; ``force`` reloads all of them from the repository.
+        With a namespace service, the Redis namespace of this release is
+        populated first (by a single worker).
+        """
+        if self.portfolio_data_service.cache_provider is None:
+            return self._finish(self.SKIPPED)
+
+        self.status = self.WARMING
+        started_at = time.perf_counter()
+        try:
+            if self.namespace_service is not None:
+                self.namespace_service.prepare()
+            if force:
+                # A failed reload keeps the entries already cached
+                if not self.portfolio_data_service.refresh_datasets(
+                    PortfolioDataService.DATASETS
+                ):
+                    raise RuntimeError("datasets could not be reloaded")
+            else:
+                self.portfolio_data_service.load_datasets(PortfolioDataService.DATASETS)
+        except Exception as e:
+            logger.warning(f"⚠️  Falha ao aquecer o cache: {str(e)}")
+            return self._finish(self.FAILED, time.perf_counter() - started_at, str(e))
+
+        duration = time.perf_counter() - started_at
+        logger.info(f"🔥 Cache aquecido em {duration:.3f}s")
+        return self._finish(self.WARM, duration)
+
+    def report(self) -> Dict[str, Any]:
+        report = {
+            "ready": self.ready,
+            "status": self.status,
+            "duration_seconds": self.duration,
+            "error": self.error,
+        }
+        if self.namespace_service is not None:
+            report["namespace"] = self.namespace_service.report()
+        return report
+
+    def _finish(
+        self, status: str, duration: Optional[float] = None, error: Optional[str] = None
+    ) -> Dict[str, Any]:
+        self.status, self.duration, self.error = status, duration, error
+        self._done.set()
+        return self.report()
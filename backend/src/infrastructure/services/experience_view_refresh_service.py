@@ -0,0 +1,90 @@
+"""Refresh of the materialized experience views from the API workers."""
+
+import os
+import threading
+from typing import Iterable, Optional
+
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ExperienceViewRefreshService:
+    """Keeps the materialized experience views current when no ``pg_cron`` job does.
+
+    Every worker asks the database every ``MATERIALIZED_VIEW_REFRESH_INTERVAL``
+    seconds, and as soon as ``request_refresh`` reports a change of the
+    experience datasets, to refresh the views if a change is pending or they
+    were not refreshed today; the database lets a single worker through. A
+    value of ``0`` disables the schedule.
+    """
+
+    # Datasets read from the materialized views
+    DATASETS = ("experiences", "companies_duration", "total_experience")
+
+    MATERIALIZED_VIEW_REFRESH_INTERVAL = float(
+        os.getenv("MATERIALIZED_VIEW_REFRESH_INTERVAL", "3600")
+    )
+
+    def __init__(self, data_repository, interval: Optional[float] = None) -> None:
+        self.data_repository = data_repository
+        self.interval = (
+            self.MATERIALIZED_VIEW_REFRESH_INTERVAL if interval is None else interval
+        )
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def in_cli_process() -> bool:
+        """Whether this process runs a ``flask`` command (``db``, ``cache``...)."""
+        # Set by the flask command line for every command it runs
+        return os.getenv("FLASK_RUN_FROM_CLI") == "true"
+
+    def start(self) -> Optional[threading.Thread]:
+        """Check periodically in a daemon thread, unless disabled.
+
+        Only server processes check: ``flask`` commands (including
+        ``flask db refresh-views``) never start the schedule.
+        """
+        if self.interval <= 0 or self.in_cli_process():
+            return None
+
+        self._thread = threading.Thread(
+            target=self.run_forever, name="experience-view-refresh", daemon=True
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    def request_refresh(self, datasets: Optional[Iterable[str]] = None) -> None:
+        """Check at once if ``datasets`` (default: all) include an experience one.
+
+        Registered as a cache invalidation callback: the change notifications
+        of ``companies`` and ``experiences`` wake the check.
+        """
+        if datasets is None or set(datasets) & set(self.DATASETS):
+            self._wake_event.set()
+
+    def run_forever(self) -> None:
+        while not self._stop_event.is_set():
+            self._wake_event.clear()
+            self.refresh(only_if_stale=True)
+            self._wake_event.wait(self.interval)
+
+    def refresh(self, only_if_stale: bool = False) -> bool:
+        """Refresh the views; returns whether this call refreshed them."""
+        try:
+            refreshed = self.data_repository.refresh_experience_views(only_if_stale)
+        except Exception as e:
+            logger.warning(f"Falha ao atualizar as views de experiência: {str(e)}")
+            return False
+
+        if refreshed:
+            logger.info("♻️  Views materializadas de experiência atualizadas")
+        return refreshed
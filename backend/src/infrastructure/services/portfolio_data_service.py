@@ -1,58 +1,361 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, Optional, Tuple
+
 from src.domain.dto.certification import Certification
 from src.domain.dto.company_duration import CompanyDuration
 from src.domain.dto.experience import Experience
 from src.domain.dto.formation import Formation
 from src.domain.dto.project import Project
 from src.domain.dto.social_media import SocialMedia
+from src.infrastructure.ports.cache_provider_interface import CacheProvider
 from src.infrastructure.ports.repository_interface import RepositoryInterface
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker
 from src.infrastructure.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+
 class PortfolioDataService:
     """Portfolio Data Service"""
 
-    def __init__(self, data_repository: RepositoryInterface):
+    PORTFOLIO_MAX_WORKERS = int(os.getenv("PORTFOLIO_MAX_WORKERS", "7"))
+
+    # Dataset -> (cache key, getter shared by cache and repository, cache setter)
+    CACHE_BINDINGS = {
+        "projects": (CacheProvider.PROJECTS_KEY, "get_all_projects", "set_projects"),
+        "experiences": (
+            CacheProvider.EXPERIENCES_KEY,
+            "get_all_experiences",
+            "set_experiences",
+        ),
+        "companies_duration": (
+            CacheProvider.COMPANY_DURATION_KEY,
+            "get_company_duration",
+            "set_company_duration",
+        ),
+        "total_experience": (
+            CacheProvider.TOTAL_EXPERIENCE_KEY,
+            "get_total_experience",
+            "set_total_experience",
+        ),
+        "formations": (
+            CacheProvider.FORMATIONS_KEY,
+            "get_all_formations",
+            "set_formations",
+        ),
+        "certifications": (
+            CacheProvider.CERTIFICATIONS_KEY,
+            "get_all_certifications",
+            "set_certifications",
+        ),
+        "social_media": (
+            CacheProvider.SOCIAL_MEDIA_KEY,
+            "get_all_social_media",
+            "set_social_media",
+        ),
+    }
+    DATASETS = tuple(CACHE_BINDINGS)
+    GETTER_KEYS = {getter: key for key, getter, _ in CACHE_BINDINGS.values()}
+
+    # Repository getter -> filter criteria, applied by the database. Only active
+    # rows are ever served, so inactive ones are neither read nor cached.
+    REPOSITORY_CRITERIA = {
+        "get_all_projects": {"active": True},
+        "get_all_formations": {"active": True},
+        "get_all_certifications": {"active": True},
+        "get_all_social_media": {"active": True},
+    }
+
+    _executor: Optional[ThreadPoolExecutor] = None
+    _executor_lock = threading.Lock()
+
+    def __init__(
+        self,
+        data_repository: RepositoryInterface,
+        cache_provider: Optional[CacheProvider] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ):
         self.data_repository = data_repository
+        self.cache_provider = cache_provider
+        # While the repository is down, reads fail fast and only the cache serves
+        self.circuit_breaker = circuit_breaker or CircuitBreaker("repository")
+
+        if self.cache_provider is not None:
+            for key, getter_name, setter_name in self.CACHE_BINDINGS.values():
+                self.cache_provider.register_refresher(
+                    key, partial(self._refresh, getter_name, setter_name)
+                )
+
+    def _refresh(self, getter_name: str, setter_name: str) -> None:
+        """Reload a dataset from the repository and write it back to the cache."""
+        repository_data, cacheable = self._read_cacheable(getter_name)
+        if cacheable:
+            getattr(self.cache_provider, setter_name)(repository_data)
+
+    def _read_repository(self, getter_name: str) -> Any:
+        """Call a repository getter with its ``REPOSITORY_CRITERIA``.
+
+        Calls go through the circuit breaker: ``CircuitOpenError`` is raised at
+        once while the repository is considered down.
+        """
+        return self.circuit_breaker.call(
+            getattr(self.data_repository, getter_name),
+            **self.REPOSITORY_CRITERIA.get(getter_name, {}),
+        )
+
+    def _read_cacheable(self, getter_name: str) -> Tuple[Any, bool]:
+        """Repository read and whether it may be written back to the cache.
+
+        Only data from the source of truth is: what a fallback source (the
+        shared cache itself, the snapshot) served would be cached as fresh.
+        """
+        repository_data = self._read_repository(getter_name)
+        return repository_data, self.data_repository.served_from_primary()
+
+    def _read_through(self, getter_name: str, setter_name: str) -> Any:
+        """Cache-aside read: serve from the cache, fall back to the repository.
+
+        ``getter_name`` is shared by ``CacheProvider`` and ``RepositoryInterface``;
+        ``setter_name`` is the ``CacheProvider`` method used to populate the cache.
+        """
+        if self.cache_provider is None:
+            return self._read_repository(getter_name)
+
+        try:
+            cached_data = getattr(self.cache_provider, getter_name)()
+            if cached_data is not None:
+                return cached_data
+        except Exception as e:
+            logger.warning(
+                f"Falha ao ler '{getter_name}' do cache, "
+                f"usando o repositório: {str(e)}"
+            )
+
+        try:
+            repository_data, cacheable = self._read_cacheable(getter_name)
+        except Exception:
+            self._abort_refill([self.GETTER_KEYS[getter_name]])
+            raise
+
+        if not cacheable:
+            self._abort_refill([self.GETTER_KEYS[getter_name]])
+            return repository_data
+
+        try:
+            getattr(self.cache_provider, setter_name)(repository_data)
+        except Exception as e:
+            logger.warning(f"Falha ao popular o cache via '{setter_name}': {str(e)}")
+
+        return repository_data
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """Thread pool shared by the service, created lazily after the worker fork."""
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(
+                        max_workers=cls.PORTFOLIO_MAX_WORKERS,
+                        thread_name_prefix="portfolio-data",
+                    )
+
+        return cls._executor
+
+    def load_datasets(self, datasets: Iterable[str]) -> Dict[str, Any]:
+        """Load several datasets at once.
+
+        Each name must be one of ``DATASETS``. Cached datasets are fetched with a
+        single ``get_many`` round trip; the misses are read from the repository
+        concurrently (latency bounded by the slowest read instead of the sum) and
+        written back with a single ``set_many``. Repository failures propagate.
+        """
+        datasets = list(dict.fromkeys(datasets))
+        unknown = set(datasets) - set(self.DATASETS)
+        if unknown:
+            raise ValueError(f"Unknown datasets: {', '.join(sorted(unknown))}")
+
+        results = self._get_many_from_cache(datasets)
+        missing = [name for name in datasets if results.get(name) is None]
+        try:
+            loaded, cacheable = self._load_from_repository(missing)
+        except Exception:
+            self._abort_refill([self.CACHE_BINDINGS[name][0] for name in missing])
+            raise
+
+        self._abort_refill(
+            [self.CACHE_BINDINGS[name][0] for name in loaded if name not in cacheable]
+        )
+        if self.cache_provider is not None and cacheable:
+            try:
+                self.cache_provider.set_many(
+                    {self.CACHE_BINDINGS[name][0]: loaded[name] for name in cacheable}
+                )
+            except Exception as e:
+                logger.warning(f"Falha ao popular o cache em lote: {str(e)}")
+
+        results.update(loaded)
+        return {name: results[name] for name in datasets}
+
+    def refresh_datasets(self, datasets: Iterable[str]) -> bool:
+        """Reload the given datasets from the repository into the cache.
+
+        Used when the underlying data changed. If the repository cannot be read
+        (open circuit, database down, or only a fallback source answered) the
+        cached entries are kept: degraded mode serves them. If new data was read
+        but could not be cached, the entries are dropped instead, so stale data
+        is never served next to it. Returns whether the datasets were reloaded.
+        """
+        datasets = list(dict.fromkeys(datasets))
+        if self.cache_provider is None or not datasets:
+            return False
+
+        try:
+            loaded, cacheable = self._load_from_repository(datasets)
+        except Exception as e:
+            logger.warning(
+                f"Falha ao recarregar {', '.join(datasets)} do repositório, "
+                f"mantendo o cache atual: {str(e)}"
+            )
+            return False
+
+        if len(cacheable) < len(loaded):
+            logger.warning(
+                f"Recarga de {', '.join(datasets)} servida por uma fonte de "
+                f"fallback, mantendo o cache atual"
+            )
+            return False
+
+        try:
+            self.cache_provider.set_many(
+                {self.CACHE_BINDINGS[name][0]: data for name, data in loaded.items()}
+            )
+        except Exception as e:
+            logger.warning(
+                f"Falha ao atualizar o cache de {', '.join(datasets)}, "
+                f"removendo as entradas: {str(e)}"
+            )
+            try:
+                self.cache_provider.delete_many(
+                    [self.CACHE_BINDINGS[name][0] for name in datasets]
+                )
+            except Exception as delete_error:
+                logger.warning(
+                    f"Falha ao remover as entradas do cache: {str(delete_error)}"
+                )
+            return False
+
+        logger.info(f"♻️  Cache atualizado para {', '.join(datasets)}")
+        return True
+
+    def drop_local_datasets(self, datasets: Iterable[str]) -> None:
+        """Drop this worker's copy of datasets another worker reloaded."""
+        if self.cache_provider is None:
+            return
+
+        keys = [self.CACHE_BINDINGS[name][0] for name in dict.fromkeys(datasets)]
+        try:
+            self.cache_provider.drop_local(keys)
+        except Exception as e:
+            logger.warning(f"Falha ao descartar a cópia local do cache: {str(e)}")
+
+    def _abort_refill(self, keys: list[str]) -> None:
+        """Let the other workers stop waiting for keys this read failed to load."""
+        if self.cache_provider is None or not keys:
+            return
+
+        try:
+            self.cache_provider.abort_refill(keys)
+        except Exception as e:
+            logger.warning(f"Falha ao liberar a recarga de {', '.join(keys)}: {str(e)}")
+
+    def _get_many_from_cache(self, datasets: list[str]) -> Dict[str, Any]:
+        if self.cache_provider is None or not datasets:
+            return {}
+
+        keys = {self.CACHE_BINDINGS[name][0]: name for name in datasets}
+        try:
+            cached = self.cache_provider.get_many(list(keys))
+        except Exception as e:
+            logger.warning(
+                f"Falha ao ler o cache em lote, usando o repositório: {str(e)}"
+            )
+            return {}
+
+        return {name: cached.get(key) for key, name in keys.items()}
+
+    def _load_from_repository(
+        self, datasets: list[str]
+    ) -> Tuple[Dict[str, Any], list[str]]:
+        """Read ``datasets`` from the repository, plus the ones that may be cached."""
+        getters = {name: self.CACHE_BINDINGS[name][1] for name in datasets}
+        if len(getters) <= 1:
+            reads = {
+                name: self._read_cacheable(getter) for name, getter in getters.items()
+            }
+        else:
+            executor = self._get_executor()
+            futures = {
+                name: executor.submit(self._read_cacheable, getter)
+                for name, getter in getters.items()
+            }
+            reads = {name: future.result() for name, future in futures.items()}
+
+        loaded = {name: data for name, (data, _) in reads.items()}
+        return loaded, [name for name, (_, cacheable) in reads.items() if cacheable]
 
     def projects(self) -> list[Project]:
         """Get projects data from the repository."""
-        repository_projects = self.data_repository.get_all_projects()
-        
+        repository_projects = self._read_through("get_all_projects", "set_projects")
+
         return repository_projects
 
 
     def experiences(self) -> list[Experience]:
         """Get experiences data from the repository."""
-        repository_experiences = self.data_repository.get_all_experiences()
+        repository_experiences = self._read_through(
+            "get_all_experiences", "set_experiences"
+        )
 
         return repository_experiences
 
     def companies_duration(self) -> list[CompanyDuration]:
-        repository_companies_duration = self.data_repository.get_company_duration()
+        repository_companies_duration = self._read_through(
+            "get_company_duration", "set_company_duration"
+        )
 
         return repository_companies_duration
 
     def formations(self) -> list[Formation]:
         """Get educations data from the repository."""
-        repository_formations = self.data_repository.get_all_formations()
+        repository_formations = self._read_through(
+            "get_all_formations", "set_formations"
+        )
 
         return repository_formations
 
     def certifications(self) -> list[Certification]:
         """Get certifications data from the repository."""
-        repository_certifications = self.data_repository.get_all_certifications()
+        repository_certifications = self._read_through(
+            "get_all_certifications", "set_certifications"
+        )
 
         return repository_certifications
 
     def social_media(self) -> list[SocialMedia]:
         """Get social media data from the repository."""
-        repository_social_media = self.data_repository.get_all_social_media()
+        repository_social_media = self._read_through(
+            "get_all_social_media", "set_social_media"
+        )
 
         return repository_social_media
 
     def total_experience(self) -> dict:
         """Get total experience from the repository."""
-        repository_total_experience = self.data_repository.get_total_experience()
+        repository_total_experience = self._read_through(
+            "get_total_experience", "set_total_experience"
+        )
 
         return repository_total_experience
@@ -0,0 +1,206 @@
+"""Store of pre-rendered (already encoded) JSON response bodies."""
+
+import hashlib
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from flask import Response, current_app, request
+
+from src.infrastructure.utils.compression import (
+    available_encodings,
+    compress_variants,
+)
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class SnapshotPayload:
+    """Builder result carrying the payload and, when known, its last change."""
+
+    data: Any
+    last_modified: Optional[datetime] = None
+
+
+@dataclass(frozen=True)
+class ResponseSnapshot:
+    """A finished JSON body for one endpoint/query-param variant.
+
+    ``encoded_bodies`` holds the same body pre-compressed per content coding, so
+    serving a compressed response costs no compression work.
+    """
+
+    body: bytes
+    built_at: float
+    etag: str
+    last_modified: Optional[datetime] = None
+    encoded_bodies: Dict[str, bytes] = field(default_factory=dict)
+
+    def to_response(self) -> Response:
+        """Build the response, answering 304 when the client's validators match."""
+        encoding = None
+        if self.encoded_bodies:
+            encoding = request.accept_encodings.best_match(
+                [e for e in available_encodings() if e in self.encoded_bodies]
+            )
+
+        if encoding is None:
+            response = Response(self.body, status=200, mimetype="application/json")
+            response.set_etag(self.etag)
+        else:
+            response = Response(
+                self.encoded_bodies[encoding], status=200, mimetype="application/json"
+            )
+            response.content_encoding = encoding
+            # Each representation needs its own strong validator.
+            response.set_etag(f"{self.etag}-{encoding}")
+
+        if self.encoded_bodies:
+            response.vary.add("Accept-Encoding")
+        response.last_modified = self.last_modified
+        response.cache_control.no_cache = True
+
+        return response.make_conditional(request)
+
+
+class ResponseSnapshotStore:
+    """Keeps one encoded body per snapshot key and rebuilds it only when needed.
+
+    A snapshot is rebuilt when it is invalidated (data changed) or, as a safety
+    net for changes made by other workers, after ``RESPONSE_SNAPSHOT_TTL``
+    seconds. A TTL of ``0`` disables time-based expiry.
+    """
+
+    RESPONSE_SNAPSHOT_TTL = float(os.getenv("RESPONSE_SNAPSHOT_TTL", "60"))
+    RESPONSE_COMPRESSION_MIN_SIZE = int(
+        os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "512")
+    )
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        self.ttl = self.RESPONSE_SNAPSHOT_TTL if ttl is None else ttl
+        self._snapshots: Dict[str, ResponseSnapshot] = {}
+        # One build at a time per key; _lock guards the dicts and the generation
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        # Bumped by every invalidation, so builds started before it are dropped
+        self._generation = 0
+
+    def get(self, key: str) -> Optional[ResponseSnapshot]:
+        """Return the snapshot for ``key`` if it exists and has not expired."""
+        snapshot = self._snapshots.get(key)
+        if snapshot is None or self._is_expired(snapshot):
+            return None
+
+        return snapshot
+
+    def get_or_build(self, key: str, builder: Callable[[], Any]) -> ResponseSnapshot:
+        """Return the snapshot for ``key``, building it from ``builder()`` if needed.
+
+        ``builder`` returns the JSON-serializable payload, optionally wrapped in a
+        ``SnapshotPayload`` to provide ``Last-Modified``. Failures propagate to the
+        caller and nothing is stored. Concurrent callers of one key share a single
+        build; other keys are built in parallel. The body is compressed after the
+        build lock is released, and served uncompressed until then.
+        """
+        snapshot = self.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        with self._build_lock(key):
+            snapshot = self.get(key)
+            if snapshot is not None:
+                return snapshot
+
+            generation = self._generation
+            payload = builder()
+            if not isinstance(payload, SnapshotPayload):
+                payload = SnapshotPayload(payload)
+
+            body = current_app.json.response(payload.data).get_data()
+            snapshot = ResponseSnapshot(
+                body=body,
+                built_at=time.monotonic(),
+                etag=hashlib.sha256(body).hexdigest()[:32],
+                last_modified=payload.last_modified,
+            )
+            self._store(key, snapshot, generation)
+            logger.debug(f"Snapshot '{key}' reconstruído ({len(snapshot.body)} bytes)")
+
+        encoded_bodies = compress_variants(body, self.RESPONSE_COMPRESSION_MIN_SIZE)
+        if not encoded_bodies:
+            return snapshot
+
+        compressed = replace(snapshot, encoded_bodies=encoded_bodies)
+        with self._lock:
+            if self._snapshots.get(key) is snapshot:
+                self._snapshots[key] = compressed
+
+        return compressed
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop the given snapshots, or every snapshot when no key is given."""
+        with self._lock:
+            self._generation += 1
+            if not keys:
+                self._snapshots.clear()
+                return
+
+            for key in keys:
+                self._snapshots.pop(key, None)
+
+    def _build_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._build_locks.setdefault(key, threading.Lock())
+
+    def _store(self, key: str, snapshot: ResponseSnapshot, generation: int) -> None:
+        """Keep ``snapshot`` unless an invalidation happened during its build."""
+        with self._lock:
+            if self._generation == generation:
+                self._snapshots[key] = snapshot
+
+    def _is_expired(self, snapshot: ResponseSnapshot) -> bool:
+        return self.ttl > 0 and time.monotonic() - snapshot.built_at >= self.ttl
+
+
+def latest_update(*collections: Iterable[Any]) -> Optional[datetime]:
+    """Most recent ``updated_at``/``created_at`` across the given items, if any.
+
+    Inactive rows are filtered out by the repository, so deactivating an item
+    does not move this date; the ETag still changes with the body. Timestamps
+    read back from the cache as strings are parsed.
+    """
+    latest = None
+    for collection in collections:
+        for item in collection:
+            timestamp = getattr(item, "updated_at", None) or getattr(
+                item, "created_at", None
+            )
+            if isinstance(timestamp, str):
+                try:
+                    timestamp = datetime.fromisoformat(timestamp)
+                except ValueError:
+                    continue
+            if not isinstance(timestamp, datetime):
+                continue
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            if latest is None or timestamp > latest:
+                latest = timestamp
+
+    return latest
+
+
+def get_response_snapshot_store() -> ResponseSnapshotStore:
+    """Return the snapshot store bound to the current Flask application."""
+    store = current_app.extensions.get("response_snapshot_store")
+    if store is None:
+        store = current_app.extensions["response_snapshot_store"] = (
+            ResponseSnapshotStore()
+        )
+
+    return store
@@ -0,0 +1,36 @@
+"""Version of the running build, read from build-time metadata.
+
+Nothing is spawned: the version comes from ``APP_VERSION``, else from the
+``VERSION`` file written by the image build (``poetry version -s > VERSION``),
+else from ``pyproject.toml`` (local runs).
+"""
+
+import os
+import re
+from functools import lru_cache
+
+from src.infrastructure.utils.constants import ROOT_DIR
+
+VERSION_FILE = os.path.join(ROOT_DIR, "VERSION")
+PYPROJECT_FILE = os.path.join(ROOT_DIR, "pyproject.toml")
+DEFAULT_VERSION = "dev"
+
+_PYPROJECT_VERSION = re.compile(r'^version\s*=\s*"([^"]+)"', re.MULTILINE)
+
+
+def _read(path: str) -> str:
+    try:
+        with open(path, encoding="utf-8") as file:
+            return file.read()
+    except OSError:
+        return ""
+
+
+@lru_cache(maxsize=1)
+def get_application_version() -> str:
+    version = os.getenv("APP_VERSION", "").strip() or _read(VERSION_FILE).strip()
+    if version:
+        return version
+
+    match = _PYPROJECT_VERSION.search(_read(PYPROJECT_FILE))
+    return match.group(1) if match else DEFAULT_VERSION
@@ -0,0 +1,192 @@
+"""Codecs turning cache envelopes (value + soft expiry) into Redis values.
+
+``REDIS_CACHE_CODEC`` picks the codec shared by the Redis adapters:
+
+- ``binary`` (default): a fixed binary header carrying a magic number, the
+  body format and ``CACHE_SCHEMA_VERSION``, the soft expiry and the refill
+  time, followed by the value in MessagePack (JSON when ``msgpack`` is not
+  installed). Lists of records are stored as a table (field names once, then
+  one array of values per row) instead of repeating every key.
+- ``json``: the JSON envelope used before, kept for rollbacks.
+
+Both decode to the same values (datetimes as ISO 8601 strings), so the DTOs are
+rebuilt the same way whichever codec wrote them.
+
+Values written by another codec, format or schema version raise
+``CacheFormatError``; the adapters count them as misses and overwrite them. A
+worker without ``msgpack`` reads MessagePack bodies that way too.
+"""
+
+import math
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Dict, NamedTuple, Optional
+
+from src.infrastructure.utils import json_codec
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack is an optional speed-up
+    msgpack = None
+
+# Bump whenever the cached representation of a DTO changes
+CACHE_SCHEMA_VERSION = 1
+
+
+class CacheFormatError(ValueError):
+    """Raised for cached bytes this codec (or schema version) cannot read."""
+
+
+class CacheEntry(NamedTuple):
+    data: Any
+    soft_expires_at: float
+    delta: float
+
+
+class CacheCodec(ABC):
+    name: str
+
+    @abstractmethod
+    def encode(self, data: Any, soft_expires_at: float, delta: float) -> bytes:
+        """Serialize ``data`` with its soft expiry and refill time."""
+
+    @abstractmethod
+    def decode(self, raw: bytes) -> CacheEntry:
+        """Read back an ``encode`` result; ``CacheFormatError`` if it can't."""
+
+
+class JSONCacheCodec(CacheCodec):
+    """``{"data", "soft_expires_at", "delta"}`` as JSON text.
+
+    Values written before envelopes existed are treated as fresh.
+    """
+
+    name = "json"
+
+    def encode(self, data: Any, soft_expires_at: float, delta: float) -> bytes:
+        return json_codec.dumps(
+            {"data": data, "soft_expires_at": soft_expires_at, "delta": delta}
+        )
+
+    def decode(self, raw: bytes) -> CacheEntry:
+        try:
+            payload = json_codec.loads(raw)
+        except ValueError as e:
+            raise CacheFormatError(f"Valor de cache não é JSON: {str(e)}") from e
+
+        if isinstance(payload, dict) and "soft_expires_at" in payload:
+            return CacheEntry(
+                payload["data"], payload["soft_expires_at"], payload["delta"]
+            )
+        return CacheEntry(payload, math.inf, 0.0)
+
+
+class BinaryCacheCodec(CacheCodec):
+    """Schema-versioned binary header followed by a MessagePack or JSON body.
+
+    Header (little endian): magic ``PFC``, body format (u8), schema version
+    (u16), soft expiry (f64), refill time (f64) and body kind (u8). A ``TABLE``
+    body is ``[fields, rows]``; a ``VALUE`` body is the value itself. Both body
+    formats keep datetimes as ISO 8601 strings.
+    """
+
+    name = "binary"
+
+    MAGIC = b"PFC"
+    HEADER = struct.Struct("<3sBHddB")
+
+    FORMAT_JSON = 1
+    FORMAT_MSGPACK = 2
+
+    VALUE = 0
+    TABLE = 1
+
+    def __init__(
+        self,
+        schema_version: int = CACHE_SCHEMA_VERSION,
+        body_format: Optional[int] = None,
+    ) -> None:
+        if body_format is None:
+            body_format = self.FORMAT_MSGPACK if msgpack else self.FORMAT_JSON
+        if body_format == self.FORMAT_MSGPACK and msgpack is None:
+            raise ValueError("msgpack não está instalado")
+
+        self.schema_version = schema_version
+        self.body_format = body_format
+
+    @staticmethod
+    def _is_table(data: Any) -> bool:
+        return (
+            isinstance(data, list)
+            and bool(data)
+            and all(isinstance(item, dict) for item in data)
+        )
+
+    def _dumps(self, body: Any) -> bytes:
+        if self.body_format == self.FORMAT_MSGPACK:
+            return msgpack.packb(body, default=json_codec.default, datetime=False)
+        return json_codec.dumps(body)
+
+    def _loads(self, body_format: int, body: memoryview) -> Any:
+        if body_format == self.FORMAT_MSGPACK and msgpack is not None:
+            return msgpack.unpackb(body, strict_map_key=False)
+        if body_format == self.FORMAT_JSON:
+            return json_codec.loads(body)
+        raise CacheFormatError("Valor de cache em outro formato")
+
+    def encode(self, data: Any, soft_expires_at: float, delta: float) -> bytes:
+        if not self._is_table(data):
+            kind, body = self.VALUE, self._dumps(data)
+        else:
+            fields = list(dict.fromkeys(key for item in data for key in item))
+            rows = [[item.get(field) for field in fields] for item in data]
+            kind, body = self.TABLE, self._dumps([fields, rows])
+
+        header = self.HEADER.pack(
+            self.MAGIC,
+            self.body_format,
+            self.schema_version,
+            soft_expires_at,
+            delta,
+            kind,
+        )
+        return header + body
+
+    def decode(self, raw: bytes) -> CacheEntry:
+        if isinstance(raw, str) or len(raw) < self.HEADER.size:
+            raise CacheFormatError("Valor de cache sem cabeçalho binário")
+
+        magic, body_format, schema_version, soft_expires_at, delta, kind = (
+            self.HEADER.unpack_from(raw)
+        )
+        if magic != self.MAGIC:
+            raise CacheFormatError("Valor de cache em outro formato")
+        if schema_version != self.schema_version:
+            raise CacheFormatError(
+                f"Valor de cache no schema {schema_version} "
+                f"(atual: {self.schema_version})"
+            )
+
+        body = self._loads(body_format, memoryview(raw)[self.HEADER.size :])
+        if kind == self.VALUE:
+            return CacheEntry(body, soft_expires_at, delta)
+
+        fields, rows = body
+        return CacheEntry(
+            [dict(zip(fields, row)) for row in rows], soft_expires_at, delta
+        )
+
+
+CACHE_CODECS: Dict[str, type] = {
+    JSONCacheCodec.name: JSONCacheCodec,
+    BinaryCacheCodec.name: BinaryCacheCodec,
+}
+
+
+def get_cache_codec(name: str) -> CacheCodec:
+    try:
+        return CACHE_CODECS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown cache codec '{name}' (expected one of: {', '.join(CACHE_CODECS)})"
+        ) from None
@@ -0,0 +1,149 @@
+"""Circuit breaker that fails fast while a dependency is down."""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Thread-safe closed -> open -> half-open breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls
+    fail immediately with ``CircuitOpenError``. Once ``reset_timeout`` seconds
+    have passed, a single trial call is let through (half-open): its success
+    closes the circuit, its failure opens it again.
+    """
+
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(
+        os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "3")
+    )
+    CIRCUIT_BREAKER_RESET_TIMEOUT = float(
+        os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", "30")
+    )
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: Optional[int] = None,
+        reset_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = (
+            self.CIRCUIT_BREAKER_FAILURE_THRESHOLD
+            if failure_threshold is None
+            else failure_threshold
+        )
+        self.reset_timeout = (
+            self.CIRCUIT_BREAKER_RESET_TIMEOUT
+            if reset_timeout is None
+            else reset_timeout
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.last_error: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        self._before_call()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as error:
+            self._record_failure(error)
+            raise
+
+        self._record_success()
+        return result
+
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """Same as ``call`` for a coroutine function."""
+        self._before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as error:
+            self._record_failure(error)
+            raise
+
+        self._record_success()
+        return result
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            state = self._current_state()
+            retry_in = None
+            if state == self.OPEN:
+                retry_in = round(
+                    max(0.0, self._opened_at + self.reset_timeout - self._clock()), 3
+                )
+
+            return {
+                "state": state,
+                "consecutive_failures": self._failures,
+                "retry_in": retry_in,
+                "last_error": self.last_error,
+            }
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and self._clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def _before_call(self) -> None:
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return
+            if state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+
+        raise CircuitOpenError(f"Circuito '{self.name}' aberto")
+
+    def _record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"✅ Circuito '{self.name}' fechado novamente")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+            self.last_error = None
+
+    def _record_failure(self, error: Exception) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            self.last_error = str(error)
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                logger.warning(
+                    f"⚠️  Circuito '{self.name}' aberto após {self._failures} "
+                    f"falha(s): {str(error)}. Nova tentativa em "
+                    f"{self.reset_timeout}s"
+                )
@@ -0,0 +1,37 @@
+"""Pre-compression of response bodies (gzip and, when available, brotli)."""
+
+import gzip
+from typing import Dict
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is an optional speed-up
+    brotli = None
+
+GZIP = "gzip"
+BROTLI = "br"
+
+
+def available_encodings() -> list[str]:
+    """Supported content codings, in server preference order."""
+    return [BROTLI, GZIP] if brotli is not None else [GZIP]
+
+
+def compress_variants(body: bytes, min_size: int) -> Dict[str, bytes]:
+    """Compress ``body`` once into every available content coding.
+
+    Bodies smaller than ``min_size`` are not worth the header overhead and get no
+    variants. A variant that does not shrink the body is dropped as well.
+    """
+    if len(body) < min_size:
+        return {}
+
+    variants = {GZIP: gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[BROTLI] = brotli.compress(body, mode=brotli.MODE_TEXT, quality=11)
+
+    return {
+        encoding: compressed
+        for encoding, compressed in variants.items()
+        if len(compressed) < len(body)
+    }
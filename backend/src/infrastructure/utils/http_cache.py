@@ -0,0 +1,28 @@
+"""HTTP caching helpers shared by every API namespace."""
+
+from flask import Flask, Response, request
+
+from src.infrastructure.utils.constants import HTTP_OK
+
+
+def add_conditional_validators(response: Response) -> Response:
+    """Add a content-hash ETag to GET responses that do not carry one yet.
+
+    Snapshot-backed routes set their precomputed ETag (and answer 304 before
+    touching the repository), so this only hashes the remaining small bodies.
+    """
+    if (
+        request.method != "GET"
+        or response.status_code != HTTP_OK
+        or response.direct_passthrough
+        or "ETag" in response.headers
+    ):
+        return response
+
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def register_conditional_get(app: Flask) -> None:
+    """Enable ETag / If-None-Match handling for every route of ``app``."""
+    app.after_request(add_conditional_validators)
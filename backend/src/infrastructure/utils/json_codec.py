@@ -0,0 +1,109 @@
+"""JSON encoding shared by the HTTP responses and the cache payloads.
+
+``orjson`` is used when installed; otherwise the stdlib ``json`` module. Both
+write compact UTF-8 and encode datetimes, dates and times as ISO 8601 strings,
+so ``datetime.fromisoformat`` reads them back.
+"""
+
+import dataclasses
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any, Union
+from uuid import UUID
+
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def default(value: Any) -> Any:
+    """Encode the types the backends (and msgpack) don't all handle natively."""
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any, sort_keys: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(value, default=default, option=option)
+
+    return json.dumps(
+        value,
+        default=default,
+        sort_keys=sort_keys,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+
+    return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by ``dumps``/``loads``.
+
+    Keys stay sorted as with the default provider. Calls passing stdlib options
+    (``indent`` for debug responses, ``cls``...) are left to the default
+    provider.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        kwargs.pop("separators", None)
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+
+        return dumps(obj, sort_keys=self.sort_keys).decode("utf-8")
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            dumps(obj, sort_keys=self.sort_keys) + b"\n", mimetype=self.mimetype
+        )
+
+
+def output_json(data: Any, code: int, headers=None):
+    """flask-restx representation using the application's JSON provider."""
+    response = current_app.json.response(data)
+    response.status_code = code
+    response.headers.extend(headers or {})
+    return response
+
+
+def register_json_provider(app, api=None) -> None:
+    """Encode the responses of ``app`` (and of the restx ``api``) with orjson."""
+    app.json_provider_class = FastJSONProvider
+    app.json = FastJSONProvider(app)
+    if api is not None:
+        api.representations["application/json"] = output_json
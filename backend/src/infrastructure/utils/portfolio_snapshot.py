@@ -0,0 +1,290 @@
+"""Compact, versioned and checksummed binary snapshot of the portfolio datasets.
+
+Layout (little endian)::
+
+    header   magic ``PFSNAP``, format version (u16), dataset count (u16),
+             creation time (f64, unix seconds), payload length (u64),
+             SHA-256 of the payload (32 bytes)
+    payload  per dataset: name length (u16) + name, meta length (u32) + meta
+             (JSON: ``kind``, ``fields``, ``datetime_fields``), record count
+             (u32), ``count + 1`` record offsets (u32, relative to the first
+             record) and the records, each a compact JSON array of the values
+             in ``fields`` order.
+
+Readers memory-map the file: the pages are shared by every process mapping it
+and a record is only decoded when it is accessed.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+MAGIC = b"PFSNAP"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<6sHHdQ32s")
+NAME_LENGTH = struct.Struct("<H")
+META_LENGTH = struct.Struct("<I")
+COUNT = struct.Struct("<I")
+OFFSET = struct.Struct("<I")
+
+LIST_KIND = "list"
+OBJECT_KIND = "object"
+
+
+class SnapshotError(ValueError):
+    """Raised for a file that is not a valid snapshot of a supported version."""
+
+
+def _as_dict(item: Any) -> Dict[str, Any]:
+    """Plain mapping of a DTO, ORM model or dict."""
+    if isinstance(item, dict):
+        return item
+    if hasattr(item, "to_dict"):
+        return item.to_dict()
+    if hasattr(item, "model_dump"):
+        return item.model_dump()
+
+    raise TypeError(f"Cannot snapshot {type(item).__name__}")
+
+
+def _encode_dataset(data: Any) -> bytes:
+    if isinstance(data, dict):
+        kind, rows = OBJECT_KIND, [data]
+    else:
+        kind, rows = LIST_KIND, [_as_dict(item) for item in data]
+
+    # Union of the keys, in order of first appearance
+    fields = list(dict.fromkeys(key for row in rows for key in row))
+    datetime_fields = [
+        field
+        for field in fields
+        if any(isinstance(row.get(field), datetime) for row in rows)
+    ]
+
+    records = []
+    for row in rows:
+        values = [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in (row.get(field) for field in fields)
+        ]
+        records.append(
+            json.dumps(
+                values, separators=(",", ":"), ensure_ascii=False, default=str
+            ).encode("utf-8")
+        )
+
+    meta = json.dumps(
+        {"kind": kind, "fields": fields, "datetime_fields": datetime_fields},
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    offsets = [0]
+    for record in records:
+        offsets.append(offsets[-1] + len(record))
+
+    return b"".join(
+        [
+            META_LENGTH.pack(len(meta)),
+            meta,
+            COUNT.pack(len(records)),
+            struct.pack(f"<{len(offsets)}I", *offsets),
+            *records,
+        ]
+    )
+
+
+def write_snapshot(
+    path: str, datasets: Dict[str, Any], created_at: Optional[float] = None
+) -> Dict[str, Any]:
+    """Write ``datasets`` (name -> list of items or dict) to ``path`` atomically.
+
+    The file is written next to ``path`` and renamed over it, so processes that
+    mapped the previous snapshot keep reading it undisturbed.
+    """
+    parts = []
+    for name, data in datasets.items():
+        encoded_name = name.encode("utf-8")
+        parts += [NAME_LENGTH.pack(len(encoded_name)), encoded_name]
+        parts.append(_encode_dataset(data))
+    payload = b"".join(parts)
+
+    checksum = hashlib.sha256(payload).digest()
+    created_at = time.time() if created_at is None else created_at
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(datasets), created_at, len(payload), checksum
+    )
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".snapshot-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(header)
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+    return {
+        "path": path,
+        "version": FORMAT_VERSION,
+        "bytes": HEADER.size + len(payload),
+        "sha256": checksum.hex(),
+        "datasets": {
+            name: 1 if isinstance(data, dict) else len(data)
+            for name, data in datasets.items()
+        },
+    }
+
+
+class SnapshotDataset(Sequence):
+    """Records of one dataset, decoded from the mapped file on access."""
+
+    def __init__(
+        self, buffer, meta: Dict[str, Any], count: int, offsets_at: int
+    ) -> None:
+        self._buffer = buffer
+        self.fields: List[str] = meta["fields"]
+        self._datetime_fields = set(meta["datetime_fields"])
+        self._count = count
+        self._offsets_at = offsets_at
+        self._records_at = offsets_at + (count + 1) * OFFSET.size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("snapshot record index out of range")
+
+        start, end = struct.unpack_from(
+            "<2I", self._buffer, self._offsets_at + index * OFFSET.size
+        )
+        values = json.loads(
+            self._buffer[self._records_at + start : self._records_at + end]
+        )
+        record = dict(zip(self.fields, values))
+        for field in self._datetime_fields:
+            if record[field] is not None:
+                record[field] = datetime.fromisoformat(record[field])
+
+        return record
+
+    @property
+    def end(self) -> int:
+        """Position right after the last record."""
+        return self._records_at + struct.unpack_from(
+            "<I", self._buffer, self._offsets_at + self._count * OFFSET.size
+        )[0]
+
+
+class PortfolioSnapshot:
+    """Read-only, memory-mapped view of a snapshot file.
+
+    Opening it only parses the header and the dataset directory; ``verify``
+    also checks the payload checksum, which reads the file once.
+    """
+
+    def __init__(self, path: str, verify: bool = True) -> None:
+        self.path = path
+        with open(path, "rb") as file:
+            try:
+                self._buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise SnapshotError(f"Snapshot vazio: {path}") from e
+
+        try:
+            self._read_header(verify)
+            self._datasets = self._read_directory()
+        except BaseException:
+            self._buffer.close()
+            raise
+
+    def _read_header(self, verify: bool) -> None:
+        if len(self._buffer) < HEADER.size:
+            raise SnapshotError(f"Snapshot truncado: {self.path}")
+
+        magic, version, dataset_count, created_at, length, checksum = (
+            HEADER.unpack_from(self._buffer)
+        )
+        if magic != MAGIC:
+            raise SnapshotError(f"Arquivo não é um snapshot: {self.path}")
+        if version != FORMAT_VERSION:
+            raise SnapshotError(
+                f"Versão de snapshot {version} não suportada "
+                f"(esperada {FORMAT_VERSION})"
+            )
+        if len(self._buffer) != HEADER.size + length:
+            raise SnapshotError(f"Snapshot truncado: {self.path}")
+        if verify:
+            payload = memoryview(self._buffer)[HEADER.size :]
+            try:
+                digest = hashlib.sha256(payload).digest()
+            finally:
+                payload.release()
+            if digest != checksum:
+                raise SnapshotError(f"Checksum inválido: {self.path}")
+
+        self.version = version
+        self.created_at = created_at
+        self.checksum = checksum.hex()
+        self._dataset_count = dataset_count
+
+    def _read_directory(self) -> Dict[str, tuple]:
+        datasets = {}
+        position = HEADER.size
+        for _ in range(self._dataset_count):
+            (name_length,) = NAME_LENGTH.unpack_from(self._buffer, position)
+            position += NAME_LENGTH.size
+            name = self._buffer[position : position + name_length].decode("utf-8")
+            position += name_length
+
+            (meta_length,) = META_LENGTH.unpack_from(self._buffer, position)
+            position += META_LENGTH.size
+            meta = json.loads(self._buffer[position : position + meta_length])
+            position += meta_length
+
+            (count,) = COUNT.unpack_from(self._buffer, position)
+            position += COUNT.size
+            dataset = SnapshotDataset(self._buffer, meta, count, position)
+            datasets[name] = (meta["kind"], dataset)
+            position = dataset.end
+
+        return datasets
+
+    @property
+    def datasets(self) -> List[str]:
+        return list(self._datasets)
+
+    def read(self, name: str) -> Any:
+        """Lazy sequence of the records of ``name``, or the dict it holds."""
+        if name not in self._datasets:
+            raise KeyError(f"Dataset '{name}' ausente do snapshot {self.path}")
+
+        kind, dataset = self._datasets[name]
+        return dataset[0] if kind == OBJECT_KIND else dataset
+
+    def close(self) -> None:
+        self._datasets = {}
+        self._buffer.close()
+
+    def __enter__(self) -> "PortfolioSnapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
@@ -0,0 +1,35 @@
+"""Datadog tracing limited to the integrations the API uses.
+
+An alternative to ``ddtrace-run``, which imports ``ddtrace`` and patches every
+supported library before the application is imported. Here ``ddtrace`` is
+only imported when ``TRACING_ENABLED=true``, and only the libraries below are
+patched (the ones not yet imported are patched when they are).
+"""
+
+import os
+from typing import Optional
+
+from src.infrastructure.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+TRACED_INTEGRATIONS = ("flask", "sqlalchemy", "psycopg", "redis")
+
+
+def setup_tracing(enabled: Optional[bool] = None) -> bool:
+    """Patch the traced integrations; returns whether tracing is on."""
+    if not (TRACING_ENABLED if enabled is None else enabled):
+        return False
+
+    try:
+        import ddtrace
+    except ImportError:
+        logger.warning(
+            "⚠️  TRACING_ENABLED=true, mas o pacote ddtrace não está instalado"
+        )
+        return False
+
+    ddtrace.patch(raise_errors=False, **{name: True for name in TRACED_INTEGRATIONS})
+    logger.info(f"🔭 Tracing habilitado ({', '.join(TRACED_INTEGRATIONS)})")
+    return True
@@ -0,0 +1,143 @@
+"""Bounded in-process cache with per-entry TTL and LRU eviction."""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+_MAX_SIZE_DEPTH = 4
+
+
+def estimate_size(value: Any, _depth: int = 0) -> int:
+    """Estimate the memory footprint of ``value`` in bytes.
+
+    Walks containers and plain or slotted objects (DTOs, ORM rows, lean records)
+    a few levels deep.
+    Private attributes such as SQLAlchemy's ``_sa_instance_state`` are skipped.
+    """
+    size = sys.getsizeof(value)
+    if _depth >= _MAX_SIZE_DEPTH:
+        return size
+
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+
+    if isinstance(value, dict):
+        return size + sum(
+            estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1)
+            for k, v in value.items()
+        )
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, _depth + 1) for item in value)
+
+    attributes = getattr(value, "__dict__", None)
+    if attributes is None and hasattr(type(value), "__slots__"):
+        attributes = {
+            name: getattr(value, name, None) for name in type(value).__slots__
+        }
+    if attributes:
+        return size + sum(
+            estimate_size(v, _depth + 1)
+            for k, v in attributes.items()
+            if not k.startswith("_")
+        )
+
+    return size
+
+
+class TTLLRUCache:
+    """Thread-safe LRU cache bounded by entry count and estimated bytes.
+
+    ``get`` returns ``None`` for missing or expired keys, so ``None`` itself is
+    never cached.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, default_ttl: float) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        # key -> (value, expires_at, size)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at, size = entry
+            if expires_at <= time.monotonic():
+                self._remove(key, size)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> bool:
+        """Store ``value``; returns ``False`` when it alone exceeds the memory cap."""
+        if value is None:
+            return False
+
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return False
+
+        expires_at = time.monotonic() + (self.default_ttl if ttl is None else ttl)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous[2]
+
+            self._entries[key] = (value, expires_at, size)
+            self._current_bytes += size
+
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self._current_bytes > self.max_bytes
+            ):
+                _, (_, _, evicted_size) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+                self.evictions += 1
+
+        return True
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._remove(key, entry[2])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "bytes": self._current_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove(self, key: Hashable, size: int) -> None:
+        del self._entries[key]
+        self._current_bytes -= size
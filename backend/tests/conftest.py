@@ -26,6 +26,7 @@ from src.domain.dto.social_media import SocialMedia
 from src.infrastructure.routes.education.view import education_ns
 from src.infrastructure.routes.experiences.view import experiences_ns
 from src.infrastructure.routes.health_check.view import health_check_ns
+from src.infrastructure.routes.portfolio.view import portfolio_ns
 from src.infrastructure.routes.projects.view import projects_ns
 from src.infrastructure.routes.social_media.view import social_media_ns
 from src.infrastructure.services.portfolio_data_service import PortfolioDataService
@@ -62,6 +63,7 @@ def app():
     api.add_namespace(education_ns, path="/api/v1")
     api.add_namespace(social_media_ns, path="/api/v1")
     api.add_namespace(health_check_ns, path="/api/v1")
+    api.add_namespace(portfolio_ns, path="/api/v1")
     return app
 
 
@@ -78,6 +80,13 @@ def mock_repository():
     return mock_repo
 
 
+@pytest.fixture
+def mock_cache_provider():
+    """Create a mock cache provider."""
+    mock_cache = MagicMock()
+    return mock_cache
+
+
 @pytest.fixture
 def mock_portfolio_service():
     """Create a mock portfolio service."""
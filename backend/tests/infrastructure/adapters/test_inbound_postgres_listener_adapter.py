@@ -0,0 +1,176 @@
+"""Tests for the Postgres LISTEN/NOTIFY change listener."""
+
+import json
+import os
+from collections import namedtuple
+from unittest.mock import MagicMock
+
+import psycopg2
+import pytest
+
+from src.infrastructure.adapters.inbound_postgres_listener_adapter import (
+    UNKNOWN_TABLE,
+    PostgresChangeListener,
+    parse_notification,
+)
+
+Notify = namedtuple("Notify", "pid channel payload")
+
+
+class FakeConnection:
+    """Connection whose notifications become readable through a pipe."""
+
+    def __init__(self, payloads, last_change=0):
+        self._read_fd, self._write_fd = os.pipe()
+        self._pending = list(payloads)
+        self.last_change = last_change
+        self.notifies = []
+        self.executed = []
+        self.closed = False
+        os.write(self._write_fd, b"x")
+
+    def fileno(self):
+        return self._read_fd
+
+    def set_isolation_level(self, level):
+        self.isolation_level = level
+
+    def cursor(self):
+        cursor = MagicMock()
+        cursor.__enter__.return_value.execute.side_effect = self.executed.append
+        cursor.__enter__.return_value.fetchone.return_value = (self.last_change,)
+        return cursor
+
+    def poll(self):
+        os.read(self._read_fd, 1)
+        self.notifies.extend(
+            Notify(1, PostgresChangeListener.CHANNEL, payload)
+            for payload in self._pending
+        )
+        self._pending = []
+
+    def close(self):
+        self.closed = True
+        os.close(self._read_fd)
+        os.close(self._write_fd)
+
+
+def payload(table, operation="UPDATE", seq=1):
+    return json.dumps({"table": table, "operation": operation, "seq": seq})
+
+
+def test_parse_notification_reads_the_table_and_change():
+    """Test that the trigger payload is parsed and bad payloads are tolerated."""
+    assert parse_notification(payload("projects", seq=7)) == ("projects", 7)
+    assert parse_notification('{"table": "projects"}') == ("projects", None)
+    assert parse_notification("not json") == (UNKNOWN_TABLE, None)
+
+
+def test_notifications_in_one_poll_are_coalesced():
+    """Test that a burst of notifications triggers a single callback."""
+    connection = FakeConnection(
+        [
+            payload("projects", seq=1),
+            payload("projects", "INSERT", seq=2),
+            payload("companies", seq=3),
+        ]
+    )
+    changes = []
+
+    def on_change(tables, ids):
+        changes.append((tables, ids))
+        listener._stop_event.set()
+
+    listener = PostgresChangeListener("dsn", on_change, connect=lambda dsn: connection)
+    listener.run_forever()
+
+    assert changes == [({"projects", "companies"}, {"1", "2", "3"})]
+    assert connection.executed == [
+        "LISTEN portfolio_changes;",
+        "SELECT last_value FROM portfolio_change_seq;",
+    ]
+    assert connection.closed
+
+
+def test_changes_without_an_id_are_reported_without_ids():
+    """Test that a batch with an id-less notification carries no change ids."""
+    connection = FakeConnection([payload("projects"), '{"table": "formations"}'])
+    on_change = MagicMock(side_effect=lambda *_: listener._stop_event.set())
+
+    listener = PostgresChangeListener("dsn", on_change, connect=lambda dsn: connection)
+    listener.run_forever()
+
+    on_change.assert_called_once_with({"projects", "formations"}, set())
+
+
+def test_reconnect_invalidates_everything_only_if_changes_were_missed():
+    """Test that a reconnect reloads all datasets only when the sequence moved."""
+    last_changes = iter([5, 5, 9])
+    on_change = MagicMock()
+
+    def connect(dsn):
+        last_change = next(last_changes, None)
+        if last_change is None:
+            listener._stop_event.set()
+            raise psycopg2.OperationalError("stop")
+        connection = FakeConnection([], last_change=last_change)
+        connection.poll = MagicMock(side_effect=psycopg2.OperationalError("down"))
+        return connection
+
+    listener = PostgresChangeListener("dsn", on_change, connect=connect)
+    listener.POSTGRES_LISTEN_RECONNECT_DELAY = 0
+    listener.run_forever()
+
+    on_change.assert_called_once_with({UNKNOWN_TABLE}, {"r9"})
+
+
+def test_listener_reconnects_after_connection_errors(monkeypatch):
+    """Test that a failed connection is retried after the reconnect delay."""
+    monkeypatch.setattr(PostgresChangeListener, "POSTGRES_LISTEN_RECONNECT_DELAY", 0)
+    attempts = []
+
+    def connect(dsn):
+        attempts.append(dsn)
+        if len(attempts) < 3:
+            raise psycopg2.OperationalError("connection refused")
+        listener._stop_event.set()
+        return FakeConnection([])
+
+    listener = PostgresChangeListener("dsn", MagicMock(), connect=connect)
+    listener.run_forever()
+
+    assert len(attempts) == 3
+
+
+@pytest.mark.skipif(
+    not os.getenv("POSTGRES_TEST_DSN"),
+    reason="POSTGRES_TEST_DSN not set; needs a local Postgres",
+)
+def test_notify_reaches_the_listener():
+    """Test the listener against a real Postgres using NOTIFY."""
+    dsn = os.environ["POSTGRES_TEST_DSN"]
+    changes = []
+
+    def on_change(tables, ids):
+        changes.append(tables)
+        if "projects" in tables:
+            listener._stop_event.set()
+
+    listener = PostgresChangeListener(dsn, on_change)
+    thread = listener.start()
+
+    notifier = psycopg2.connect(dsn)
+    notifier.autocommit = True
+    with notifier.cursor() as cursor:
+        for _ in range(50):
+            if changes:
+                break
+            thread.join(0.1)
+        cursor.execute(
+            "SELECT pg_notify(%s, %s)",
+            (PostgresChangeListener.CHANNEL, payload("projects")),
+        )
+    notifier.close()
+
+    thread.join(PostgresChangeListener.POSTGRES_LISTEN_POLL_TIMEOUT + 1)
+    assert {"projects"} in changes
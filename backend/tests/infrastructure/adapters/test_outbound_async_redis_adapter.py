@@ -0,0 +1,172 @@
+"""Tests for the asyncio Redis cache adapter."""
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.adapters.outbound_async_redis_adapter import (
+    AsyncRedisAdapter,
+)
+
+
+class FakeAsyncRedis:
+    """Minimal in-memory stand-in for the ``redis.asyncio`` client."""
+
+    def __init__(self):
+        self.data = {}
+        self.mget_calls = 0
+
+    async def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(key) for key in keys]
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def expire(self, key, seconds):
+        return key in self.data
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def hset(self, key, mapping):
+        fields = self.data.setdefault(key, {})
+        fields.update(
+            {
+                field.encode("utf-8") if isinstance(field, str) else field: value
+                for field, value in mapping.items()
+            }
+        )
+
+    async def lrange(self, key, start, end):
+        return list(self.data.get(key, []))
+
+    async def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(value.encode("utf-8") for value in values)
+
+    def pipeline(self, transaction=True):
+        return FakeAsyncPipeline(self)
+
+    def register_script(self, script):
+        async def release(keys, args):
+            if self.data.get(keys[0]) == args[0]:
+                del self.data[keys[0]]
+                return 1
+            return 0
+
+        return release
+
+
+class FakeAsyncPipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self):
+        return [
+            await getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeAsyncRedis()
+
+
+@pytest.fixture
+def redis_adapter(fake_redis):
+    return AsyncRedisAdapter(client=fake_redis)
+
+
+def test_set_many_then_get_many_round_trips_dtos(redis_adapter, sample_projects):
+    """Test that DTOs are stored in the shared envelope format and rebuilt."""
+    key = AsyncRedisAdapter.PROJECTS_KEY
+
+    async def scenario():
+        await redis_adapter.set_many({key: sample_projects})
+        return await redis_adapter.get_many([key])
+
+    result = asyncio.run(scenario())
+
+    assert [p.to_response() for p in result[key]] == [
+        p.to_response() for p in sample_projects
+    ]
+
+
+def test_hash_layout_round_trips_dtos(redis_adapter, fake_redis, sample_projects):
+    """Test that the hash layout is written and read back in item order."""
+    key = AsyncRedisAdapter.PROJECTS_KEY
+
+    async def scenario():
+        await redis_adapter.set_many({key: sample_projects})
+        return await redis_adapter.get_many([key])
+
+    with patch.object(
+        AsyncRedisAdapter, "REDIS_STORAGE_LAYOUT", AsyncRedisAdapter.HASH_LAYOUT
+    ):
+        result = asyncio.run(scenario())
+
+    stored_key = f"{redis_adapter.namespace}:{key}"
+    assert stored_key not in fake_redis.data
+    assert len(fake_redis.data[stored_key + AsyncRedisAdapter.INDEX_SUFFIX]) == len(
+        sample_projects
+    )
+    assert [p.title for p in result[key]] == [p.title for p in sample_projects]
+
+
+def test_stale_entry_is_refilled_by_a_single_caller(redis_adapter, fake_redis):
+    """Test that only the lock holder gets a miss for a soft-expired entry."""
+    key = AsyncRedisAdapter.TOTAL_EXPERIENCE_KEY
+    fake_redis.data[f"{redis_adapter.namespace}:{key}"] = redis_adapter.codec.encode(
+        {"total_duration": 1}, soft_expires_at=time.time() - 1, delta=0.0
+    )
+
+    async def scenario():
+        first = await redis_adapter.get_many([key])
+        second = await redis_adapter.get_many([key])
+        await redis_adapter.set_many({key: {"total_duration": 2}})
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert first[key] is None
+    assert second[key] == {"total_duration": 1}
+    assert (
+        f"{AsyncRedisAdapter.LOCK_PREFIX}{redis_adapter.namespace}:{key}"
+        not in fake_redis.data
+    )
+    assert redis_adapter.stats()["coalesced"] == 1
+
+
+def test_delete_many_drops_the_keys(redis_adapter, fake_redis):
+    """Test that deleted keys are reported as misses afterwards."""
+    key = AsyncRedisAdapter.SOCIAL_MEDIA_KEY
+
+    async def scenario():
+        await redis_adapter.set_many({key: []})
+        await redis_adapter.delete_many([key])
+        return await redis_adapter.get_many([key])
+
+    assert asyncio.run(scenario()) == {key: None}
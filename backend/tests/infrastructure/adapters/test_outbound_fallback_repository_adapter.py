@@ -0,0 +1,137 @@
+"""Tests for the fallback repository chain."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure.adapters.outbound_fallback_repository_adapter import (
+    CacheRepositoryAdapter,
+    FallbackRepositoryAdapter,
+    FallbackSource,
+    RepositoryUnavailableError,
+)
+from src.infrastructure.ports.cache_provider_interface import CacheProvider
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker
+
+
+def test_first_source_that_answers_wins():
+    """Test that later sources are not asked once one answers."""
+    primary, secondary = MagicMock(), MagicMock()
+    primary.get_all_projects.side_effect = Exception("connection refused")
+    secondary.get_all_projects.return_value = ["project"]
+    tertiary = MagicMock()
+    chain = FallbackRepositoryAdapter(
+        [
+            FallbackSource("postgres", primary, 1),
+            FallbackSource("redis", secondary, 1),
+            FallbackSource("snapshot", tertiary, 1),
+        ]
+    )
+
+    assert chain.get_all_projects(active=True) == ["project"]
+    primary.get_all_projects.assert_called_once_with(active=True)
+    tertiary.get_all_projects.assert_not_called()
+
+
+def test_chain_tells_whether_the_primary_source_answered():
+    """Test that a fallback answer is reported until the primary answers again."""
+    primary, secondary = MagicMock(), MagicMock()
+    primary.get_all_projects.side_effect = [Exception("down"), ["fresh"]]
+    secondary.get_all_projects.return_value = ["stale"]
+    chain = FallbackRepositoryAdapter(
+        [FallbackSource("postgres", primary), FallbackSource("redis", secondary)]
+    )
+
+    assert chain.get_all_projects() == ["stale"]
+    assert not chain.served_from_primary()
+    assert chain.report()["served_by_fallback"] == {"get_all_projects": "redis"}
+
+    assert chain.get_all_projects() == ["fresh"]
+    assert chain.served_from_primary()
+    assert chain.report()["degraded"] is False
+
+
+def test_slow_source_is_abandoned_at_its_deadline():
+    """Test that a source exceeding its deadline is skipped."""
+    release = threading.Event()
+    slow, fallback = MagicMock(), MagicMock()
+    slow.get_total_experience.side_effect = lambda: release.wait(5)
+    fallback.get_total_experience.return_value = {"total_duration": "5 anos"}
+    chain = FallbackRepositoryAdapter(
+        [FallbackSource("postgres", slow, 0.05), FallbackSource("snapshot", fallback)]
+    )
+
+    try:
+        assert chain.get_total_experience() == {"total_duration": "5 anos"}
+    finally:
+        release.set()
+
+
+def test_stuck_source_is_skipped_without_delaying_the_others():
+    """Test that reads piling up on a hung source neither queue nor block others."""
+    release = threading.Event()
+    hung, snapshot = MagicMock(), MagicMock()
+    hung.get_all_projects.side_effect = lambda active=None: release.wait(5)
+    snapshot.get_all_projects.return_value = ["project"]
+    chain = FallbackRepositoryAdapter(
+        [
+            FallbackSource("postgres", hung, 0.05),
+            FallbackSource("snapshot", snapshot, 1),
+        ]
+    )
+
+    with patch.object(
+        FallbackRepositoryAdapter, "FALLBACK_MAX_WORKERS", 1
+    ), patch.object(FallbackRepositoryAdapter, "_executors", {}):
+        try:
+            assert chain.get_all_projects() == ["project"]
+            started_at = time.monotonic()
+            assert chain.get_all_projects() == ["project"]
+            elapsed = time.monotonic() - started_at
+        finally:
+            release.set()
+
+    # The second read skipped the busy source instead of waiting its deadline
+    assert elapsed < 0.05
+    assert hung.get_all_projects.call_count == 1
+
+
+def test_all_sources_failing_raises():
+    """Test that the chain fails with every source's reason."""
+    empty = MagicMock()
+    empty.get_all_experiences.return_value = None
+    breaker = CircuitBreaker("postgres", failure_threshold=1)
+    with pytest.raises(Exception):
+        breaker.call(MagicMock(side_effect=Exception("down")))
+    chain = FallbackRepositoryAdapter(
+        [
+            FallbackSource("postgres", MagicMock(), 1, breaker),
+            FallbackSource("snapshot", empty),
+        ]
+    )
+
+    with pytest.raises(RepositoryUnavailableError) as error:
+        chain.get_all_experiences()
+
+    assert "postgres: Circuito 'postgres' aberto" in str(error.value)
+    assert "snapshot: resposta vazia" in str(error.value)
+
+
+def test_cache_source_treats_miss_as_failure(sample_projects):
+    """Test that a cache miss raises and hits honour the active filter."""
+    cache = MagicMock()
+    cache.peek.side_effect = {
+        CacheProvider.FORMATIONS_KEY: None,
+        CacheProvider.PROJECTS_KEY: sample_projects,
+    }.get
+    source = CacheRepositoryAdapter(cache)
+
+    with pytest.raises(LookupError):
+        source.get_all_formations(active=True)
+    assert source.get_all_projects(active=True) == [
+        p for p in sample_projects if p.active
+    ]
+
+    cache.get_all_projects.assert_not_called()
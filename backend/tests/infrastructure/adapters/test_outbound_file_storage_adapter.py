@@ -0,0 +1,213 @@
+"""Tests for the JSON snapshot repository."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.adapters.outbound_file_storage_adapter import (
+    FileStorageAdapter,
+)
+from src.infrastructure.utils.portfolio_snapshot import write_snapshot
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path):
+    files = {
+        "projects.json": [
+            {"title": "Portfolio", "description": "Site", "url": "https://a.dev"},
+            {"title": "Old", "description": "Legacy", "active": False},
+        ],
+        "education.json": {
+            "formations": [{"institution": "USP", "course": "Computação"}],
+            "certifications": [
+                {"name": "AWS", "institution": "Amazon", "active": False}
+            ],
+        },
+        "experiences.json": [
+            {
+                "position": "Data Engineer",
+                "company": "Acme",
+                "location": "Remoto",
+                "description": "Pipelines",
+                "skills": "Python",
+                "startDate": "2020-01",
+                "endDate": "2021-01",
+            },
+            {
+                "position": "Senior Data Engineer",
+                "company": "Acme",
+                "location": "Remoto",
+                "description": "Plataforma",
+                "skills": "Spark",
+                "startDate": "2021-01",
+                "endDate": "2022-07",
+            },
+        ],
+        "social_media.json": [{"label": "GitHub", "url": "https://github.com"}],
+    }
+    for name, content in files.items():
+        (tmp_path / name).write_text(json.dumps(content), encoding="utf-8")
+
+    return tmp_path
+
+
+def test_active_filter_defaults_missing_flag_to_active(snapshot_dir):
+    """Test that entries without 'active' are active and the filter applies."""
+    adapter = FileStorageAdapter(str(snapshot_dir))
+
+    assert [p.title for p in adapter.get_all_projects()] == ["Portfolio", "Old"]
+    assert [p.title for p in adapter.get_all_projects(active=True)] == ["Portfolio"]
+    assert adapter.get_all_formations(active=True)[0].course == "Computação"
+    assert adapter.get_all_certifications(active=True) == []
+    assert adapter.get_all_social_media()[0].to_response()["label"] == "GitHub"
+
+
+def test_experiences_share_the_company_duration(snapshot_dir):
+    """Test that positions carry the whole tenure at their company."""
+    adapter = FileStorageAdapter(str(snapshot_dir))
+
+    experiences = adapter.get_all_experiences()
+    company_duration = adapter.get_company_duration()
+
+    assert {e.duration for e in experiences} == {"2 anos e 6 meses"}
+    assert [c.to_response() for c in company_duration] == [
+        {"name": "Acme", "duration": "2 anos e 6 meses"}
+    ]
+    assert adapter.get_total_experience() == {
+        "total_duration": adapter.get_total_duration()
+    }
+
+
+def test_binary_snapshot_takes_precedence(snapshot_dir):
+    """Test that a snapshot file is served instead of the JSON files."""
+    adapter = FileStorageAdapter(str(snapshot_dir))
+    write_snapshot(
+        adapter.snapshot_path,
+        {
+            "projects": [
+                {"title": "Snapshot", "active": True},
+                {"title": "Hidden", "active": False},
+            ],
+            "companies_duration": [{"name": "Acme", "duration": "1 ano"}],
+            "total_experience": {"total_duration": "9 anos"},
+        },
+    )
+
+    assert [p.title for p in adapter.get_all_projects(active=True)] == ["Snapshot"]
+    assert adapter.get_company_duration()[0].duration == "1 ano"
+    assert adapter.get_total_experience() == {"total_duration": "9 anos"}
+
+    write_snapshot(adapter.snapshot_path, {"total_experience": {"total_duration": "1"}})
+
+    assert adapter.get_total_experience() == {"total_duration": "1"}
+
+
+def test_snapshot_records_are_decoded_on_access_with_a_bounded_cache(snapshot_dir):
+    """Test that only a bounded number of decoded records is kept per worker."""
+    adapter = FileStorageAdapter(str(snapshot_dir))
+    titles = ["First", "Second", "Third"]
+    write_snapshot(
+        adapter.snapshot_path, {"projects": [{"title": title} for title in titles]}
+    )
+
+    with patch.object(FileStorageAdapter, "SNAPSHOT_RECORD_CACHE_ENTRIES", 1):
+        first = adapter.get_all_projects()
+        first.clear()
+        assert [p.title for p in adapter.get_all_projects()] == titles
+        assert adapter._snapshot.records.stats()["entries"] == 1
+
+    write_snapshot(adapter.snapshot_path, {"projects": [{"title": "Fourth"}]})
+
+    assert [p.title for p in adapter.get_all_projects()] == ["Fourth"]
+
+
+def test_parsed_files_are_reused_until_they_change(snapshot_dir):
+    """Test that a file is parsed once per (path, mtime, size) version."""
+    adapter = FileStorageAdapter(str(snapshot_dir))
+
+    with patch(
+        "src.infrastructure.adapters.outbound_file_storage_adapter.json.load",
+        wraps=json.load,
+    ) as json_load:
+        adapter.get_all_experiences()
+        adapter.get_company_duration()
+        adapter.get_total_duration()
+        assert json_load.call_count == 1
+
+        experiences = json.loads((snapshot_dir / "experiences.json").read_text())
+        experiences[0]["startDate"] = "2019-01"
+        (snapshot_dir / "experiences.json").write_text(json.dumps(experiences))
+
+        assert adapter.get_company_duration()[0].duration == "3 anos e 6 meses"
+        assert json_load.call_count == 2
+
+
+def test_watcher_events_replace_the_stat_check(snapshot_dir):
+    """Test that a watched folder is not stat'ed and events invalidate it."""
+    with patch(
+        "src.infrastructure.adapters.outbound_file_storage_adapter.Observer"
+    ) as observer_class:
+        adapter = FileStorageAdapter(str(snapshot_dir), watch=True)
+    observer_class.return_value.start.assert_called_once()
+    projects_path = snapshot_dir / "projects.json"
+    adapter.get_all_projects()
+
+    projects_path.write_text(json.dumps([{"title": "Novo"}]))
+    with patch(
+        "src.infrastructure.adapters.outbound_file_storage_adapter.os.stat"
+    ) as stat:
+        assert len(adapter.get_all_projects()) == 2
+    stat.assert_not_called()
+
+    adapter._on_file_event(str(projects_path))
+
+    assert [p.title for p in adapter.get_all_projects()] == ["Novo"]
+    adapter.close()
+    observer_class.return_value.stop.assert_called_once()
+
+
+def test_aggregation_spans_each_company_once():
+    """Test durations of current and past companies against a fixed month."""
+    entries = [
+        {
+            "position": "Tech Lead",
+            "company": "Acme",
+            "location": "Remoto",
+            "description": "Plataforma",
+            "skills": "Python",
+            "startDate": "2021-02",
+            "currentJob": True,
+        },
+        {
+            "position": "Data Engineer",
+            "company": "Acme",
+            "location": "Remoto",
+            "description": "Pipelines",
+            "skills": "SQL",
+            "startDate": "2020-01",
+            "endDate": "2021-02",
+        },
+        {
+            "position": "Analista",
+            "company": "Globex",
+            "location": "São Paulo",
+            "description": "BI",
+            "skills": "Excel",
+            "startDate": "2019-01",
+            "endDate": "2019-02",
+        },
+    ]
+
+    aggregate = FileStorageAdapter._aggregate(entries, current_month=2025 * 12 + 2)
+
+    assert [e.duration for e in aggregate.experiences] == [
+        "5 anos e 2 meses",
+        "5 anos e 2 meses",
+        "1 mês",
+    ]
+    assert [c.to_response() for c in aggregate.company_duration] == [
+        {"name": "Acme", "duration": "5 anos e 2 meses"},
+        {"name": "Globex", "duration": "1 mês"},
+    ]
+    assert aggregate.total_duration == "6 anos"
@@ -0,0 +1,120 @@
+"""Tests for the in-process L1 cache adapter."""
+
+from unittest.mock import MagicMock
+
+from src.infrastructure.adapters.outbound_memory_cache_adapter import (
+    InMemoryCacheAdapter,
+)
+
+
+def test_l1_hit_does_not_reach_l2(sample_projects):
+    """Test that a warm L1 entry is served without calling the L2 provider."""
+    l2_cache = MagicMock()
+    adapter = InMemoryCacheAdapter(l2_cache)
+    adapter.set_projects(sample_projects)
+
+    result = adapter.get_all_projects()
+
+    assert result is sample_projects
+    l2_cache.get_all_projects.assert_not_called()
+    l2_cache.set_projects.assert_called_once_with(sample_projects)
+
+
+def test_l1_miss_is_filled_from_l2(sample_experiences):
+    """Test that an L1 miss is read from L2 once and then kept in memory."""
+    l2_cache = MagicMock()
+    l2_cache.get_all_experiences.return_value = sample_experiences
+    adapter = InMemoryCacheAdapter(l2_cache)
+
+    assert adapter.get_all_experiences() == sample_experiences
+    assert adapter.get_all_experiences() == sample_experiences
+
+    l2_cache.get_all_experiences.assert_called_once()
+    assert adapter.stats()["l1"]["hits"] == 1
+
+
+def test_miss_on_both_tiers_returns_none():
+    """Test that a miss on L1 and L2 is reported as None."""
+    l2_cache = MagicMock()
+    l2_cache.get_total_experience.return_value = None
+    adapter = InMemoryCacheAdapter(l2_cache)
+
+    assert adapter.get_total_experience() is None
+    assert adapter.stats()["l1"]["entries"] == 0
+
+
+def test_peek_never_calls_the_l2_getters(sample_projects, sample_experiences):
+    """Test that peek reads L1, then L2's peek, without a refilling getter."""
+    l2_cache = MagicMock()
+    l2_cache.peek.return_value = sample_experiences
+    adapter = InMemoryCacheAdapter(l2_cache)
+    adapter.set_projects(sample_projects)
+
+    assert adapter.peek(adapter.PROJECTS_KEY) is sample_projects
+    assert adapter.peek(adapter.EXPERIENCES_KEY) is sample_experiences
+    assert InMemoryCacheAdapter().peek(adapter.EXPERIENCES_KEY) is None
+
+    l2_cache.peek.assert_called_once_with(adapter.EXPERIENCES_KEY)
+    l2_cache.get_all_experiences.assert_not_called()
+    assert adapter.cache.get(adapter.EXPERIENCES_KEY) is None
+
+
+def test_get_many_only_asks_l2_for_l1_misses(sample_projects, sample_social_media):
+    """Test that bulk reads forward just the L1 misses to L2 in one call."""
+    l2_cache = MagicMock()
+    l2_cache.get_many.return_value = {
+        InMemoryCacheAdapter.SOCIAL_MEDIA_KEY: sample_social_media
+    }
+    adapter = InMemoryCacheAdapter(l2_cache)
+    adapter.set_projects(sample_projects)
+
+    result = adapter.get_many(
+        [InMemoryCacheAdapter.PROJECTS_KEY, InMemoryCacheAdapter.SOCIAL_MEDIA_KEY]
+    )
+
+    l2_cache.get_many.assert_called_once_with([InMemoryCacheAdapter.SOCIAL_MEDIA_KEY])
+    assert result[InMemoryCacheAdapter.PROJECTS_KEY] is sample_projects
+    assert adapter.get_all_social_media() is sample_social_media
+
+
+def test_delete_many_clears_both_tiers(sample_projects):
+    """Test that deleted keys are dropped from L1 and forwarded to L2."""
+    l2_cache = MagicMock()
+    l2_cache.get_all_projects.return_value = None
+    adapter = InMemoryCacheAdapter(l2_cache)
+    adapter.set_projects(sample_projects)
+
+    adapter.delete_many([InMemoryCacheAdapter.PROJECTS_KEY])
+
+    assert adapter.get_all_projects() is None
+    l2_cache.delete_many.assert_called_once_with([InMemoryCacheAdapter.PROJECTS_KEY])
+
+
+def test_drop_local_keeps_the_l2_entry(sample_projects):
+    """Test that dropping the local copy rereads L2 without deleting from it."""
+    l2_cache = MagicMock()
+    l2_cache.get_all_projects.return_value = sample_projects
+    adapter = InMemoryCacheAdapter(l2_cache)
+    adapter.set_projects(sample_projects)
+
+    adapter.drop_local([InMemoryCacheAdapter.PROJECTS_KEY])
+
+    assert adapter.get_all_projects() == sample_projects
+    l2_cache.get_all_projects.assert_called_once()
+    l2_cache.delete_many.assert_not_called()
+
+
+def test_item_writes_drop_the_l1_copy(sample_projects):
+    """Test that single-item writes go to L2 and the next read reloads."""
+    l2_cache = MagicMock()
+    adapter = InMemoryCacheAdapter(l2_cache)
+    adapter.set_projects(sample_projects)
+
+    adapter.set_item(InMemoryCacheAdapter.PROJECTS_KEY, sample_projects[0])
+
+    l2_cache.set_item.assert_called_once_with(
+        InMemoryCacheAdapter.PROJECTS_KEY, sample_projects[0]
+    )
+    assert adapter.get_items(InMemoryCacheAdapter.PROJECTS_KEY, ["x"]) is (
+        l2_cache.get_items.return_value
+    )
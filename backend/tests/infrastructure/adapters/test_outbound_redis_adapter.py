@@ -0,0 +1,649 @@
+"""Tests for the Redis cache adapter."""
+
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import redis
+
+from src.infrastructure.adapters.outbound_redis_adapter import (
+    InstrumentedConnectionPool,
+    RedisAdapter,
+)
+from src.infrastructure.utils.cache_codec import (
+    BinaryCacheCodec,
+    JSONCacheCodec,
+    get_cache_codec,
+)
+
+
+def as_bytes(value):
+    return value.encode("utf-8") if isinstance(value, str) else value
+
+
+def stored(key):
+    """Redis key of ``key`` in the namespace of this release."""
+    return f"{RedisAdapter.current_namespace()}:{key}"
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client used by the adapter."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.lock = threading.Lock()
+        self.mget_calls = 0
+        self.pipelines_executed = 0
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None, px=None, nx=False):
+        with self.lock:
+            if nx and key in self.data:
+                return None
+            self.data[key] = value
+            self.ttls[key] = ex
+            return True
+
+    def mget(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(key) for key in keys]
+
+    def delete(self, *keys):
+        with self.lock:
+            return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+
+    def exists(self, *keys):
+        return sum(key in self.data for key in keys)
+
+    def unlink(self, *keys):
+        return self.delete(*keys)
+
+    def scan_iter(self, match, count=None):
+        prefix = match.rstrip("*")
+        return [key for key in list(self.data) if key.startswith(prefix)]
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(as_bytes(field))
+
+    def hdel(self, key, *fields):
+        stored_fields = self.data.get(key, {})
+        return sum(stored_fields.pop(as_bytes(f), None) is not None for f in fields)
+
+    def zadd(self, key, mapping):
+        with self.lock:
+            self.data.setdefault(key, {}).update(
+                {as_bytes(member): score for member, score in mapping.items()}
+            )
+
+    def zrange(self, key, start, end, withscores=False):
+        members = sorted(self.data.get(key, {}).items(), key=lambda item: item[1])
+        return members if withscores else [member for member, _ in members]
+
+    def zrangebyscore(self, key, low, high):
+        return [
+            member
+            for member, score in self.zrange(key, 0, -1, withscores=True)
+            if score <= high
+        ]
+
+    def zrem(self, key, *members):
+        return self.hdel(key, *members)
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def hmget(self, key, *fields):
+        fields_stored = self.data.get(key, {})
+        return [fields_stored.get(as_bytes(field)) for field in fields]
+
+    def hset(self, key, mapping):
+        with self.lock:
+            fields = self.data.setdefault(key, {})
+            fields.update({as_bytes(field): value for field, value in mapping.items()})
+
+    def lrange(self, key, start, end):
+        return list(self.data.get(key, []))
+
+    def rpush(self, key, *values):
+        with self.lock:
+            self.data.setdefault(key, []).extend(as_bytes(value) for value in values)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        def set_item(keys, args):
+            items_key, index_key = keys
+            if items_key not in self.data:
+                return 0
+            field = as_bytes(args[0])
+            if field not in self.data[items_key]:
+                self.rpush(index_key, field)
+            self.data[items_key][field] = args[1]
+            return 1
+
+        def delete_item(keys, args):
+            field = as_bytes(args[0])
+            if self.data.get(keys[0], {}).pop(field, None) is None:
+                return 0
+            self.data[keys[1]].remove(field)
+            return 1
+
+        def finish(keys, args):
+            with self.lock:
+                if self.data.get(keys[0]) == args[0]:
+                    self.data[keys[0]] = args[1]
+                    return 1
+                return 0
+
+        if "hdel" in script:
+            return delete_item
+        if "hset" in script:
+            return set_item
+        if "KEEPTTL" in script:
+            return finish
+
+        def release(keys, args):
+            with self.lock:
+                if self.data.get(keys[0]) == args[0]:
+                    del self.data[keys[0]]
+                    return 1
+                return 0
+
+        return release
+
+
+class FakeConnection(redis.Connection):
+    """Connection that never touches the network, for pool tests."""
+
+    def connect(self):
+        pass
+
+    def can_read(self):
+        return False
+
+    def disconnect(self):
+        pass
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def execute(self):
+        self.client.pipelines_executed += 1
+        return [
+            getattr(self.client, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
+
+
+@pytest.fixture
+def redis_adapter(fake_redis):
+    with patch(
+        "src.infrastructure.adapters.outbound_redis_adapter.redis.Redis",
+        return_value=fake_redis,
+    ):
+        yield RedisAdapter()
+
+
+@pytest.fixture
+def hash_adapter(fake_redis):
+    with patch.object(RedisAdapter, "REDIS_STORAGE_LAYOUT", RedisAdapter.HASH_LAYOUT):
+        with patch(
+            "src.infrastructure.adapters.outbound_redis_adapter.redis.Redis",
+            return_value=fake_redis,
+        ):
+            yield RedisAdapter()
+
+
+def store_envelope(fake_redis, key, data, soft_expires_at, delta=0.0):
+    fake_redis.data[stored(key)] = get_cache_codec(
+        RedisAdapter.REDIS_CACHE_CODEC
+    ).encode(
+        data, soft_expires_at, delta
+    )
+
+
+def test_fresh_entry_is_a_hit(redis_adapter, fake_redis):
+    """Test that an entry before its soft expiry is served as a hit."""
+    key = RedisAdapter.TOTAL_EXPERIENCE_KEY
+    store_envelope(fake_redis, key, {"total": 1}, time.time() + 3600)
+
+    assert redis_adapter.get_total_experience() == {"total": 1}
+    assert redis_adapter.stats()["hits"] == 1
+
+
+def test_set_writes_envelope_and_round_trips(redis_adapter, sample_experiences):
+    """Test that values written through set_* are read back as DTOs."""
+    redis_adapter.set_experiences(sample_experiences)
+
+    assert redis_adapter.get_all_experiences() == sample_experiences
+
+
+def test_legacy_values_without_envelope_are_served(redis_adapter, fake_redis):
+    """Test that the JSON codec still reads values written before envelopes."""
+    redis_adapter.codec = JSONCacheCodec()
+    key = stored(RedisAdapter.TOTAL_EXPERIENCE_KEY)
+    fake_redis.data[key] = json.dumps({"total": 2})
+
+    assert redis_adapter.get_total_experience() == {"total": 2}
+
+
+def test_values_from_another_schema_are_misses(redis_adapter, fake_redis):
+    """Test that a schema change after a deploy refills instead of failing."""
+    key = RedisAdapter.TOTAL_EXPERIENCE_KEY
+    redis_adapter.codec = BinaryCacheCodec(schema_version=2)
+    fake_redis.data[stored(key)] = BinaryCacheCodec(schema_version=1).encode(
+        {"total": 1}, time.time() + 3600, 0.0
+    )
+
+    assert redis_adapter.get_total_experience() is None  # lock holder refills
+    redis_adapter.set_total_experience({"total": 2})
+
+    assert redis_adapter.get_total_experience() == {"total": 2}
+    assert redis_adapter.stats()["incompatible"] == 1
+    assert redis_adapter.stats()["misses"] == 1
+
+
+def test_hard_miss_lets_only_one_worker_refill(redis_adapter, fake_redis):
+    """Test that concurrent misses coalesce on the lock holder's refill."""
+    with patch.object(RedisAdapter, "REDIS_REFILL_WAIT", 2.0):
+        assert redis_adapter.get_total_experience() is None  # lock holder
+
+        waiter_result = {}
+        waiter = threading.Thread(
+            target=lambda: waiter_result.update(
+                value=redis_adapter.get_total_experience()
+            )
+        )
+        waiter.start()
+        time.sleep(0.1)
+        redis_adapter.set_total_experience({"total": 3})
+        waiter.join(timeout=5)
+
+    assert waiter_result["value"] == {"total": 3}
+    stats = redis_adapter.stats()
+    assert stats["refills"] == 1
+    assert stats["coalesced"] == 1
+    assert "lock:" + stored(RedisAdapter.TOTAL_EXPERIENCE_KEY) not in fake_redis.data
+
+
+def test_hard_miss_waiter_gives_up_after_the_wait_budget(redis_adapter):
+    """Test that waiters fall back to the repository when the refill is slow."""
+    with patch.object(RedisAdapter, "REDIS_REFILL_WAIT", 0.1):
+        assert redis_adapter.get_total_experience() is None
+        assert redis_adapter.get_total_experience() is None
+
+    assert redis_adapter.stats()["refill_wait_timeouts"] == 1
+
+
+def test_aborted_refill_releases_the_lock(redis_adapter, fake_redis):
+    """Test that a failed refill frees the waiters at once, not after the TTL."""
+    assert redis_adapter.get_total_experience() is None  # lock holder
+    redis_adapter.abort_refill([RedisAdapter.TOTAL_EXPERIENCE_KEY])
+
+    assert "lock:" + stored(RedisAdapter.TOTAL_EXPERIENCE_KEY) not in fake_redis.data
+    assert redis_adapter.get_total_experience() is None  # next caller refills
+    assert redis_adapter.stats()["refills"] == 2
+
+
+def test_stale_entry_is_served_while_refreshing_in_background(
+    redis_adapter, fake_redis
+):
+    """Test soft expiry: stale data is returned and one background refresh runs."""
+    key = RedisAdapter.TOTAL_EXPERIENCE_KEY
+    store_envelope(fake_redis, key, {"total": "old"}, time.time() - 1)
+    refreshed = threading.Event()
+
+    def refresh():
+        redis_adapter.set_total_experience({"total": "new"})
+        refreshed.set()
+
+    redis_adapter.register_refresher(key, refresh)
+
+    assert redis_adapter.get_total_experience() == {"total": "old"}
+    assert refreshed.wait(timeout=5)
+    assert redis_adapter.get_total_experience() == {"total": "new"}
+    assert redis_adapter.stats()["background_refreshes"] == 1
+    assert "lock:" + stored(key) not in fake_redis.data
+
+
+def test_stale_entry_with_refresh_in_progress_is_coalesced(redis_adapter, fake_redis):
+    """Test that stale readers do not start a second refresh."""
+    key = RedisAdapter.TOTAL_EXPERIENCE_KEY
+    store_envelope(fake_redis, key, {"total": "old"}, time.time() - 1)
+    fake_redis.data["lock:" + stored(key)] = "another-worker"
+    refresh = MagicMock()
+    redis_adapter.register_refresher(key, refresh)
+
+    assert redis_adapter.get_total_experience() == {"total": "old"}
+    refresh.assert_not_called()
+    assert redis_adapter.stats()["coalesced"] == 1
+
+
+def test_entries_can_expire_early(redis_adapter, fake_redis):
+    """Test XFetch: a slow-to-compute entry close to expiry refreshes early."""
+    key = RedisAdapter.TOTAL_EXPERIENCE_KEY
+    store_envelope(fake_redis, key, {"total": 1}, time.time() + 1, delta=60)
+
+    with patch(
+        "src.infrastructure.adapters.outbound_redis_adapter.random.random",
+        return_value=0.5,
+    ):
+        assert redis_adapter.get_total_experience() is None
+
+    assert redis_adapter.stats()["early_refreshes"] == 1
+
+
+def test_get_many_and_set_many_use_single_round_trips(
+    redis_adapter, fake_redis, sample_formations, sample_certifications
+):
+    """Test that bulk reads use MGET and bulk writes a pipeline with TTL."""
+    items = {
+        RedisAdapter.FORMATIONS_KEY: sample_formations,
+        RedisAdapter.CERTIFICATIONS_KEY: sample_certifications,
+    }
+
+    pipelines_before = fake_redis.pipelines_executed
+    redis_adapter.set_many(items)
+    result = redis_adapter.get_many(list(items))
+
+    assert fake_redis.pipelines_executed - pipelines_before == 1
+    assert fake_redis.mget_calls == 1
+    assert all(ttl == RedisAdapter.REDIS_TTL for ttl in fake_redis.ttls.values())
+    assert [f.to_response() for f in result[RedisAdapter.FORMATIONS_KEY]] == [
+        f.to_response() for f in sample_formations
+    ]
+    assert len(result[RedisAdapter.CERTIFICATIONS_KEY]) == len(sample_certifications)
+
+
+def test_get_many_waits_for_concurrent_refills_together(
+    redis_adapter, fake_redis, sample_formations
+):
+    """Test that misses refilled elsewhere share one deadline and one MGET per poll."""
+    keys = [RedisAdapter.FORMATIONS_KEY, RedisAdapter.CERTIFICATIONS_KEY]
+    for key in keys:  # another worker holds both refill locks
+        fake_redis.set("lock:" + stored(key), b"other", nx=True)
+    publisher = threading.Timer(0.1, redis_adapter.set_formations, [sample_formations])
+
+    with patch.object(RedisAdapter, "REDIS_REFILL_WAIT", 0.3):
+        publisher.start()
+        started = time.monotonic()
+        result = redis_adapter.get_many(keys)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert len(result[RedisAdapter.FORMATIONS_KEY]) == len(sample_formations)
+    assert result[RedisAdapter.CERTIFICATIONS_KEY] is None
+    assert fake_redis.mget_calls <= 0.3 / RedisAdapter.REDIS_REFILL_POLL_INTERVAL + 2
+    stats = redis_adapter.stats()
+    assert stats["coalesced"] == 1
+    assert stats["refill_wait_timeouts"] == 1
+
+
+def test_get_many_reports_misses_as_none(redis_adapter):
+    """Test that keys absent from Redis map to None."""
+    result = redis_adapter.get_many([RedisAdapter.PROJECTS_KEY])
+
+    assert result == {RedisAdapter.PROJECTS_KEY: None}
+
+
+def test_delete_many_drops_the_keys(redis_adapter, sample_formations):
+    """Test that deleted keys are reported as misses afterwards."""
+    redis_adapter.set_formations(sample_formations)
+
+    redis_adapter.delete_many([RedisAdapter.FORMATIONS_KEY])
+
+    assert redis_adapter.get_all_formations() is None
+
+
+def test_pool_reports_saturation_and_bounds_the_wait():
+    """Test that a full pool times out after its wait budget and is reported."""
+    pool = InstrumentedConnectionPool(
+        max_connections=1, timeout=0.05, connection_class=FakeConnection
+    )
+    connection = pool.get_connection()
+
+    started = time.monotonic()
+    with pytest.raises(redis.ConnectionError):
+        pool.get_connection()
+    assert time.monotonic() - started < 0.5
+
+    pool.release(connection)
+    stats = pool.stats()
+    assert stats["in_use"] == 0
+    assert stats["peak_in_use"] == 1
+    assert (stats["checkouts"], stats["saturated"], stats["checkout_failures"]) == (
+        1,
+        1,
+        1,
+    )
+
+
+def test_refill_wait_is_clamped_to_the_call_budget():
+    """Test that waiting for another worker's refill fits the call budget."""
+    with patch.object(RedisAdapter, "REDIS_REFILL_WAIT", 2.0), patch.object(
+        RedisAdapter, "REDIS_CALL_BUDGET", 0.2
+    ):
+        assert RedisAdapter.refill_wait() == 0.2
+
+    with patch.object(RedisAdapter, "REDIS_REFILL_WAIT", 0.1):
+        assert RedisAdapter.refill_wait() == 0.1
+
+
+def test_retries_are_lowered_to_fit_the_call_budget():
+    """Test that the retry count never lets a command outlive the budget."""
+    with patch.multiple(
+        RedisAdapter,
+        REDIS_CALL_BUDGET=1.0,
+        REDIS_RETRIES=5,
+        REDIS_POOL_TIMEOUT=0.1,
+        REDIS_CONNECT_TIMEOUT=0.1,
+        REDIS_SOCKET_TIMEOUT=0.15,
+        REDIS_RETRY_BACKOFF_CAP=0.05,
+    ):
+        retry = RedisAdapter.connection_kwargs()["retry"]
+
+        assert retry._retries == 1
+        assert RedisAdapter.worst_case_call_time(1) <= 1.0 < (
+            RedisAdapter.worst_case_call_time(2)
+        )
+
+
+def test_hash_layout_keeps_one_field_per_item_in_order(
+    hash_adapter, fake_redis, sample_projects
+):
+    """Test that the hash layout round trips datasets in their original order."""
+    items_key = stored(RedisAdapter.PROJECTS_KEY) + RedisAdapter.ITEMS_SUFFIX
+    index_key = stored(RedisAdapter.PROJECTS_KEY) + RedisAdapter.INDEX_SUFFIX
+    total = {"total_duration": "5 anos", "years": 5}
+
+    hash_adapter.set_many({RedisAdapter.PROJECTS_KEY: sample_projects[::-1]})
+    hash_adapter.set_total_experience(total)
+
+    assert len(fake_redis.data[items_key]) == len(sample_projects) + 1
+    assert fake_redis.ttls[items_key] == fake_redis.ttls[index_key]
+    assert [p.title for p in hash_adapter.get_all_projects()] == [
+        p.title for p in sample_projects[::-1]
+    ]
+    assert hash_adapter.get_many([RedisAdapter.TOTAL_EXPERIENCE_KEY]) == {
+        RedisAdapter.TOTAL_EXPERIENCE_KEY: total
+    }
+
+
+def test_hash_layout_updates_and_reads_single_items(
+    hash_adapter, fake_redis, sample_projects
+):
+    """Test that item writes touch one field and subsets are read by id."""
+    items_key = stored(RedisAdapter.PROJECTS_KEY) + RedisAdapter.ITEMS_SUFFIX
+    hash_adapter.set_projects(sample_projects[:2])
+    untouched = fake_redis.data[items_key][b"https://example.com/1"]
+    sample_projects[0].title = "Renamed"
+
+    hash_adapter.set_item(RedisAdapter.PROJECTS_KEY, sample_projects[0])
+    hash_adapter.set_item(RedisAdapter.PROJECTS_KEY, sample_projects[2])
+    assert fake_redis.data[items_key][b"https://example.com/1"] is untouched
+    hash_adapter.delete_item(RedisAdapter.PROJECTS_KEY, "https://example.com/1")
+
+    assert b"https://example.com/1" not in fake_redis.data[items_key]
+    assert [p.title for p in hash_adapter.get_all_projects()] == [
+        "Renamed",
+        "Project 2",
+    ]
+    subset = hash_adapter.get_items(
+        RedisAdapter.PROJECTS_KEY, ["https://example.com/2", "https://example.com/9"]
+    )
+    assert [p.title for p in subset] == ["Project 2"]
+
+
+def test_hash_layout_item_writes_skip_uncached_datasets(hash_adapter, sample_projects):
+    """Test that an item write does not create a partial dataset."""
+    hash_adapter.set_item(RedisAdapter.PROJECTS_KEY, sample_projects[0])
+
+    assert hash_adapter.get_items(RedisAdapter.PROJECTS_KEY, ["x"]) is None
+    assert hash_adapter.get_all_projects() is None
+
+
+def test_item_ids_use_natural_keys_and_number_repeats(sample_projects):
+    """Test that repeated natural keys still get distinct ids."""
+    sample_projects[1].url = sample_projects[0].url
+
+    assert RedisAdapter.item_ids(RedisAdapter.PROJECTS_KEY, sample_projects[:3]) == [
+        "https://example.com/0",
+        "https://example.com/0#2",
+        "https://example.com/2",
+    ]
+
+
+def test_new_namespace_reads_misses_from_the_current_one(fake_redis):
+    """Test that a release being rolled out reads the previous release's keys."""
+    with patch.object(RedisAdapter, "APP_VERSION", "1.0.0"):
+        with patch(
+            "src.infrastructure.adapters.outbound_redis_adapter.redis.Redis",
+            return_value=fake_redis,
+        ):
+            previous = RedisAdapter()
+    previous.set_total_experience({"total": 1})
+    previous.promote_namespace()
+
+    with patch.object(RedisAdapter, "APP_VERSION", "1.1.0"):
+        with patch(
+            "src.infrastructure.adapters.outbound_redis_adapter.redis.Redis",
+            return_value=fake_redis,
+        ):
+            adapter = RedisAdapter()
+
+    assert adapter.get_total_experience() == {"total": 1}
+    assert adapter.stats()["namespace_fallbacks"] == 1
+
+    adapter.set_total_experience({"total": 2})
+    adapter.promote_namespace()
+    assert adapter.collect_namespaces(grace=-1) == [previous.namespace]
+    assert not any(key.startswith(previous.namespace) for key in fake_redis.data)
+    assert adapter.get_total_experience() == {"total": 2}
+
+
+def test_item_reads_fall_back_to_the_current_namespace(fake_redis, sample_projects):
+    """Test that get_items reads the previous release's keys, in both layouts."""
+    for layout in (RedisAdapter.BLOB_LAYOUT, RedisAdapter.HASH_LAYOUT):
+        fake_redis.data.clear()
+        with patch.object(RedisAdapter, "REDIS_STORAGE_LAYOUT", layout), patch(
+            "src.infrastructure.adapters.outbound_redis_adapter.redis.Redis",
+            return_value=fake_redis,
+        ):
+            with patch.object(RedisAdapter, "APP_VERSION", "1.0.0"):
+                previous = RedisAdapter()
+            previous.set_projects(sample_projects)
+            previous.promote_namespace()
+            with patch.object(RedisAdapter, "APP_VERSION", "1.1.0"):
+                adapter = RedisAdapter()
+
+            subset = adapter.get_items(
+                RedisAdapter.PROJECTS_KEY, ["https://example.com/2"]
+            )
+
+        assert [p.title for p in subset] == ["Project 2"]
+        assert adapter.stats()["namespace_fallbacks"] == 1
+        assert not any(key.startswith("lock:") for key in fake_redis.data)
+
+
+def test_peek_serves_stale_entries_without_waiting_for_the_refill(
+    redis_adapter, fake_redis
+):
+    """Test that peek ignores refill locks, even one held by the same caller."""
+    key = RedisAdapter.TOTAL_EXPERIENCE_KEY
+    store_envelope(fake_redis, key, {"total": 1}, time.time() - 1)
+    assert redis_adapter.get_total_experience() is None  # this caller refills
+
+    started = time.monotonic()
+    assert redis_adapter.peek(key) == {"total": 1}
+    assert redis_adapter.peek(RedisAdapter.PROJECTS_KEY) is None
+    assert time.monotonic() - started < RedisAdapter.REDIS_REFILL_WAIT
+
+
+def test_invalidation_reload_is_elected_once_per_dataset(redis_adapter, fake_redis):
+    """Test that only one worker is elected to reload a changed dataset."""
+    with patch(
+        "src.infrastructure.adapters.outbound_redis_adapter.redis.Redis",
+        return_value=fake_redis,
+    ):
+        other_worker = RedisAdapter()
+
+    assert redis_adapter.acquire_invalidation_locks(["projects"], ["1"]) == [
+        "projects"
+    ]
+    assert other_worker.acquire_invalidation_locks(
+        ["projects", "formations"], ["1"]
+    ) == ["formations"]
+    assert not other_worker.wait_for_invalidations(["projects"], ["1"], timeout=0)
+
+    redis_adapter.release_invalidation_locks(["projects"])
+
+    assert other_worker.wait_for_invalidations(["projects"], ["1"], timeout=0)
+
+
+def test_finished_reload_is_remembered_for_late_workers(redis_adapter, fake_redis):
+    """Test that a change reloaded once is not reloaded by a late worker."""
+    with patch(
+        "src.infrastructure.adapters.outbound_redis_adapter.redis.Redis",
+        return_value=fake_redis,
+    ):
+        late_worker = RedisAdapter()
+
+    redis_adapter.acquire_invalidation_locks(["projects", "formations"], ["1"])
+    redis_adapter.release_invalidation_locks(["projects"])
+    redis_adapter.release_invalidation_locks(["formations"], reloaded=False)
+
+    assert late_worker.acquire_invalidation_locks(
+        ["projects", "formations"], ["1"]
+    ) == ["formations"]
+    assert late_worker.acquire_invalidation_locks(["projects"], ["1", "2"]) == [
+        "projects"
+    ]
+    assert late_worker.wait_for_invalidations(["projects"], ["1"], timeout=0)
@@ -0,0 +1,57 @@
+"""Tests for the ``flask cache`` CLI commands."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.cli.cache_commands import cache_cli
+
+
+def test_cache_warm_prints_the_report(app):
+    """Test that ``flask cache warm --force`` runs a forced warm-up."""
+    app.cli.add_command(cache_cli)
+    warmup_service = MagicMock()
+    warmup_service.warm.return_value = {"ready": True, "status": "warm"}
+
+    with patch(
+        "src.infrastructure.cli.cache_commands.get_cache_warmup_service",
+        return_value=warmup_service,
+    ):
+        result = app.test_cli_runner().invoke(args=["cache", "warm", "--force"])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output)["status"] == "warm"
+    warmup_service.warm.assert_called_once_with(force=True)
+
+
+def test_cache_warm_fails_when_the_warm_up_fails(app):
+    """Test that a failed warm-up exits with a non-zero status."""
+    app.cli.add_command(cache_cli)
+    warmup_service = MagicMock()
+    warmup_service.warm.return_value = {"ready": True, "status": "failed"}
+
+    with patch(
+        "src.infrastructure.cli.cache_commands.get_cache_warmup_service",
+        return_value=warmup_service,
+    ):
+        result = app.test_cli_runner().invoke(args=["cache", "warm"])
+
+    assert result.exit_code == 1
+
+
+def test_cache_gc_namespaces_prints_the_deleted_namespaces(app):
+    """Test that ``flask cache gc-namespaces`` collects with the given grace."""
+    app.cli.add_command(cache_cli)
+    namespace_service = MagicMock()
+    namespace_service.cache.collect_namespaces.return_value = ["v2:1.0.0"]
+
+    with patch(
+        "src.infrastructure.cli.cache_commands.get_cache_namespace_service",
+        return_value=namespace_service,
+    ):
+        result = app.test_cli_runner().invoke(
+            args=["cache", "gc-namespaces", "--grace", "0"]
+        )
+
+    assert result.exit_code == 0
+    assert json.loads(result.output)["collected"] == ["v2:1.0.0"]
+    namespace_service.cache.collect_namespaces.assert_called_once_with(0.0)
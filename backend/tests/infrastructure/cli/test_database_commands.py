@@ -0,0 +1,56 @@
+"""Tests for the ``flask db`` CLI commands."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.cli.database_commands import db_cli
+from src.infrastructure.utils.portfolio_snapshot import PortfolioSnapshot
+
+
+def test_refresh_views_reports_whether_the_views_were_refreshed(app):
+    """Test that ``flask db refresh-views --if-stale`` delegates to the database."""
+    app.cli.add_command(db_cli)
+    repository = MagicMock()
+    repository.refresh_experience_views.return_value = False
+
+    with patch(
+        "src.infrastructure.cli.database_commands.get_data_repository",
+        return_value=repository,
+    ):
+        result = app.test_cli_runner().invoke(
+            args=["db", "refresh-views", "--if-stale"]
+        )
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {"refreshed": False}
+    repository.refresh_experience_views.assert_called_once_with(True)
+
+
+def test_export_snapshot_dumps_every_served_dataset(app, tmp_path, sample_projects):
+    """Test that ``flask db export-snapshot`` writes the active datasets."""
+    app.cli.add_command(db_cli)
+    repository = MagicMock()
+    repository.get_all_projects.return_value = sample_projects
+    repository.get_all_formations.return_value = []
+    repository.get_all_certifications.return_value = []
+    repository.get_all_experiences.return_value = []
+    repository.get_all_social_media.return_value = []
+    repository.get_company_duration.return_value = []
+    repository.get_total_experience.return_value = {"total_duration": "5 anos"}
+    output = tmp_path / "portfolio.snapshot"
+
+    with patch(
+        "src.infrastructure.cli.database_commands.get_data_repository",
+        return_value=repository,
+    ):
+        result = app.test_cli_runner().invoke(
+            args=["db", "export-snapshot", "--output", str(output)]
+        )
+
+    assert result.exit_code == 0, result.output
+    report = json.loads(result.output)
+    assert report["datasets"]["projects"] == len(sample_projects)
+    assert report["bytes"] == output.stat().st_size
+    repository.get_all_projects.assert_called_once_with(active=True)
+    with PortfolioSnapshot(str(output)) as snapshot:
+        assert snapshot.read("total_experience") == {"total_duration": "5 anos"}
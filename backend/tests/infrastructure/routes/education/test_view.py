@@ -14,8 +14,10 @@ def test_get_education_returns_active_formations_and_certifications(
         "src.infrastructure.routes.education.view.get_portfolio_data_service",
         return_value=mock_portfolio_service,
     ):
-        mock_portfolio_service.formations.return_value = sample_formations
-        mock_portfolio_service.certifications.return_value = sample_certifications
+        mock_portfolio_service.load_datasets.return_value = {
+            "formations": sample_formations,
+            "certifications": sample_certifications,
+        }
         
         response = client.get("/api/v1/education")
         
@@ -38,7 +40,7 @@ def test_get_education_error_handling(client, mock_portfolio_service):
         "src.infrastructure.routes.education.view.get_portfolio_data_service",
         return_value=mock_portfolio_service,
     ):
-        mock_portfolio_service.formations.side_effect = Exception("Test error")
+        mock_portfolio_service.load_datasets.side_effect = Exception("Test error")
         
         response = client.get("/api/v1/education")
 
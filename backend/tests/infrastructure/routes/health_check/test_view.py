@@ -1,6 +1,42 @@
 """Tests for the health check routes."""
 
 import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker
+
+
+@pytest.fixture(autouse=True)
+def dependencies_initialized():
+    """The health check routes see the dependencies as built."""
+    with patch(
+        "src.infrastructure.routes.health_check.view.dependencies_initialized",
+        return_value=True,
+    ) as initialized:
+        yield initialized
+
+
+@pytest.fixture(autouse=True)
+def circuit_breaker():
+    """Closed breaker returned by the health check routes."""
+    breaker = CircuitBreaker("repository", failure_threshold=1, reset_timeout=60)
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_circuit_breaker",
+        return_value=breaker,
+    ):
+        yield breaker
+
+
+@pytest.fixture(autouse=True)
+def fallback_repository():
+    """No fallback chain unless a test sets one."""
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_fallback_repository",
+        return_value=None,
+    ) as get_fallback_repository:
+        yield get_fallback_repository
 
 
 def test_ping_returns_pong(client):
@@ -11,3 +47,163 @@ def test_ping_returns_pong(client):
     data = json.loads(response.data)
     assert "message" in data
     assert data["message"] == "pong"
+    assert data["database"] == "closed"
+
+
+def test_cache_stats_returns_provider_counters(client):
+    """Test that cache-stats exposes the cache provider counters."""
+    cache_provider = MagicMock()
+    cache_provider.stats.return_value = {"hits": 3, "coalesced": 2}
+
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_cache_provider",
+        return_value=cache_provider,
+    ):
+        response = client.get("/api/v1/cache-stats")
+
+    assert response.status_code == 200
+    assert json.loads(response.data) == {"hits": 3, "coalesced": 2}
+
+
+def test_cache_stats_without_cache_is_empty(client):
+    """Test that cache-stats answers an empty object when caching is disabled."""
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_cache_provider",
+        return_value=None,
+    ):
+        response = client.get("/api/v1/cache-stats")
+
+    assert json.loads(response.data) == {}
+
+
+def test_ready_is_unavailable_while_warming(client):
+    """Test that readiness answers 503 until the cache warm-up finished."""
+    warmup_service = MagicMock()
+    warmup_service.report.return_value = {"ready": False, "status": "warming"}
+
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_cache_warmup_service",
+        return_value=warmup_service,
+    ):
+        response = client.get("/api/v1/ready")
+
+    assert response.status_code == 503
+    assert json.loads(response.data)["status"] == "warming"
+
+
+def test_ready_once_warm(client):
+    """Test that readiness answers 200 after the warm-up."""
+    warmup_service = MagicMock()
+    warmup_service.report.return_value = {"ready": True, "status": "warm"}
+
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_cache_warmup_service",
+        return_value=warmup_service,
+    ):
+        response = client.get("/api/v1/ready")
+
+    assert response.status_code == 200
+
+
+def open_circuit(breaker):
+    with pytest.raises(ConnectionError):
+        breaker.call(MagicMock(side_effect=ConnectionError("connection refused")))
+
+
+def test_ready_is_degraded_but_serving_from_the_cache(client, circuit_breaker):
+    """Test that an open database circuit keeps the worker ready with a cache."""
+    open_circuit(circuit_breaker)
+    warmup_service = MagicMock()
+    warmup_service.report.return_value = {"ready": True, "status": "failed"}
+
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_cache_warmup_service",
+        return_value=warmup_service,
+    ), patch(
+        "src.infrastructure.routes.health_check.view.get_cache_provider",
+        return_value=MagicMock(),
+    ):
+        response = client.get("/api/v1/ready")
+        ping = client.get("/api/v1/ping")
+
+    data = json.loads(response.data)
+    assert response.status_code == 200
+    assert data["degraded"] is True
+    assert data["database"]["state"] == "open"
+    assert data["database"]["last_error"] == "connection refused"
+    assert json.loads(ping.data)["database"] == "open"
+
+
+def test_ready_is_unavailable_when_database_is_down_without_cache(
+    client, circuit_breaker
+):
+    """Test that without a cache an open database circuit makes the worker unready."""
+    open_circuit(circuit_breaker)
+    warmup_service = MagicMock()
+    warmup_service.report.return_value = {"ready": True, "status": "skipped"}
+
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_cache_warmup_service",
+        return_value=warmup_service,
+    ), patch(
+        "src.infrastructure.routes.health_check.view.get_cache_provider",
+        return_value=None,
+    ):
+        response = client.get("/api/v1/ready")
+
+    assert response.status_code == 503
+
+
+def test_health_routes_do_not_wait_for_the_dependencies(
+    client, dependencies_initialized
+):
+    """Test that ping/ready answer at once while the dependencies are built."""
+    dependencies_initialized.return_value = False
+
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_cache_warmup_service"
+    ) as get_cache_warmup_service:
+        ping = client.get("/api/v1/ping")
+        ready = client.get("/api/v1/ready")
+
+    assert json.loads(ping.data)["database"] == "initializing"
+    assert ready.status_code == 503
+    assert json.loads(ready.data)["status"] == "initializing"
+    get_cache_warmup_service.assert_not_called()
+
+
+def test_ready_is_degraded_while_a_fallback_source_serves(client, fallback_repository):
+    """Test that data served by Redis or the snapshot marks the worker degraded."""
+    from src.infrastructure.adapters.outbound_fallback_repository_adapter import (
+        FallbackRepositoryAdapter,
+        FallbackSource,
+    )
+
+    postgres, snapshot = MagicMock(), MagicMock()
+    postgres.get_all_projects.side_effect = ConnectionError("connection refused")
+    snapshot.get_all_projects.return_value = ["project"]
+    chain = FallbackRepositoryAdapter(
+        [
+            FallbackSource("postgres", postgres, None, CircuitBreaker("postgres")),
+            FallbackSource("snapshot", snapshot),
+        ]
+    )
+    chain.get_all_projects(active=True)
+    fallback_repository.return_value = chain
+    warmup_service = MagicMock()
+    warmup_service.report.return_value = {"ready": True, "status": "warm"}
+
+    with patch(
+        "src.infrastructure.routes.health_check.view.get_cache_warmup_service",
+        return_value=warmup_service,
+    ), patch(
+        "src.infrastructure.routes.health_check.view.get_cache_provider",
+        return_value=None,
+    ):
+        response = client.get("/api/v1/ready")
+
+    data = json.loads(response.data)
+    assert response.status_code == 200
+    assert data["degraded"] is True
+    assert data["fallback"]["served_by_fallback"] == {"get_all_projects": "snapshot"}
+    assert data["fallback"]["sources"]["postgres"]["consecutive_failures"] == 1
@@ -0,0 +1,82 @@
+"""Tests for the portfolio routes."""
+
+import json
+from unittest.mock import patch
+
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+from src.infrastructure.utils.constants import (
+    HTTP_BAD_REQUEST,
+    HTTP_INTERNAL_SERVER_ERROR,
+)
+
+
+def test_get_portfolio_returns_every_section(
+    client,
+    mock_repository,
+    sample_projects,
+    sample_experiences,
+    sample_formations,
+    sample_certifications,
+    sample_social_media,
+):
+    """Test that the aggregated endpoint renders all sections from one request."""
+    mock_repository.get_all_projects.return_value = sample_projects
+    mock_repository.get_all_experiences.return_value = sample_experiences
+    mock_repository.get_company_duration.return_value = []
+    mock_repository.get_total_experience.return_value = {"total_duration": 5}
+    mock_repository.get_all_formations.return_value = sample_formations
+    mock_repository.get_all_certifications.return_value = sample_certifications
+    mock_repository.get_all_social_media.return_value = sample_social_media
+
+    with patch(
+        "src.infrastructure.routes.portfolio.view.get_portfolio_data_service",
+        return_value=PortfolioDataService(mock_repository),
+    ):
+        response = client.get("/api/v1/portfolio")
+
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert len(data["projects"]) == 4
+    assert len(data["experiences"]) == 4
+    assert data["companies_duration"] == []
+    assert data["total_experience"] == {"total_duration": 5}
+    assert len(data["education"]["formations"]) == 2
+    assert len(data["education"]["certifications"]) == 2
+    assert len(data["social_media"]) == 4
+
+
+def test_get_portfolio_include_selects_sections(
+    client, mock_repository, sample_projects
+):
+    """Test that include= only loads the requested datasets."""
+    mock_repository.get_all_projects.return_value = sample_projects
+
+    with patch(
+        "src.infrastructure.routes.portfolio.view.get_portfolio_data_service",
+        return_value=PortfolioDataService(mock_repository),
+    ):
+        response = client.get("/api/v1/portfolio?include=projects")
+
+    assert response.status_code == 200
+    assert list(json.loads(response.data)) == ["projects"]
+    mock_repository.get_all_experiences.assert_not_called()
+
+
+def test_get_portfolio_rejects_unknown_sections(client):
+    """Test that unknown sections are answered with 400."""
+    response = client.get("/api/v1/portfolio?include=projects,unknown")
+
+    assert response.status_code == HTTP_BAD_REQUEST
+
+
+def test_get_portfolio_error_handling(client, mock_repository):
+    """Test that repository failures are answered with 500."""
+    mock_repository.get_all_projects.side_effect = Exception("Test error")
+
+    with patch(
+        "src.infrastructure.routes.portfolio.view.get_portfolio_data_service",
+        return_value=PortfolioDataService(mock_repository),
+    ):
+        response = client.get("/api/v1/portfolio")
+
+    assert response.status_code == HTTP_INTERNAL_SERVER_ERROR
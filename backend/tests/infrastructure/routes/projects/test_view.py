@@ -1,5 +1,6 @@
 """Tests for the projects routes."""
 
+import gzip
 from unittest.mock import patch
 
 from src.infrastructure.utils.constants import HTTP_INTERNAL_SERVER_ERROR
@@ -31,3 +32,58 @@ def test_get_projects_error_handling(client, mock_portfolio_service):
         response = client.get("/api/v1/projects")
         
         assert response.status_code == HTTP_INTERNAL_SERVER_ERROR
+
+
+def test_get_projects_serves_snapshot_on_repeated_requests(
+    client, mock_portfolio_service, sample_projects
+):
+    """Test that repeated requests reuse the pre-rendered body."""
+    with patch(
+        "src.infrastructure.routes.projects.view.get_portfolio_data_service",
+        return_value=mock_portfolio_service,
+    ):
+        mock_portfolio_service.projects.return_value = sample_projects
+
+        first = client.get("/api/v1/projects")
+        second = client.get("/api/v1/projects")
+
+        assert first.data == second.data
+        mock_portfolio_service.projects.assert_called_once()
+
+
+def test_get_projects_returns_not_modified_without_touching_the_service(
+    client, mock_portfolio_service, sample_projects
+):
+    """Test that a matching ETag is answered with 304 from the snapshot."""
+    with patch(
+        "src.infrastructure.routes.projects.view.get_portfolio_data_service",
+        return_value=mock_portfolio_service,
+    ):
+        mock_portfolio_service.projects.return_value = sample_projects
+        etag = client.get("/api/v1/projects").headers["ETag"]
+        mock_portfolio_service.projects.reset_mock()
+
+        response = client.get("/api/v1/projects", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        mock_portfolio_service.projects.assert_not_called()
+
+
+def test_get_projects_serves_precompressed_gzip_variant(
+    client, mock_portfolio_service, sample_projects
+):
+    """Test that gzip clients get the pre-compressed body with its own ETag."""
+    with patch(
+        "src.infrastructure.routes.projects.view.get_portfolio_data_service",
+        return_value=mock_portfolio_service,
+    ):
+        mock_portfolio_service.projects.return_value = sample_projects * 10
+        plain = client.get("/api/v1/projects")
+
+        response = client.get("/api/v1/projects", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert response.headers["ETag"] != plain.headers["ETag"]
+        assert gzip.decompress(response.data) == plain.data
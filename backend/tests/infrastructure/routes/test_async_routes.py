@@ -0,0 +1,157 @@
+"""Tests for the ASGI serving of the data routes."""
+
+import asyncio
+import json
+import threading
+from unittest.mock import AsyncMock, patch
+
+from flask import Flask
+
+from src.infrastructure.routes.async_routes import AsyncPortfolioApp
+from src.infrastructure.services.response_snapshot_store import ResponseSnapshotStore
+from src.infrastructure.utils.constants import (
+    HTTP_BAD_REQUEST,
+    HTTP_INTERNAL_SERVER_ERROR,
+)
+
+
+def call_asgi(asgi_app, path, query_string=b"", headers=()):
+    """Run one GET request through the ASGI app; returns status, headers, body."""
+    messages = []
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": path,
+        "query_string": query_string,
+        "headers": list(headers),
+        "server": ("testserver", 80),
+        "scheme": "http",
+        "http_version": "1.1",
+        "root_path": "",
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(asgi_app(scope, receive, send))
+    start, body = messages
+
+    return (
+        start["status"],
+        {name.decode(): value.decode() for name, value in start["headers"]},
+        body["body"],
+    )
+
+
+def async_service(**datasets):
+    service = AsyncMock()
+    service.load_datasets.side_effect = lambda names: {
+        name: datasets[name] for name in names
+    }
+    return service
+
+
+def test_payload_matches_the_wsgi_route(client, mock_portfolio_service, sample_projects):
+    """Test that the ASGI route answers the same body and ETag as Flask."""
+    mock_portfolio_service.projects.return_value = sample_projects
+    with patch(
+        "src.infrastructure.routes.projects.view.get_portfolio_data_service",
+        return_value=mock_portfolio_service,
+    ):
+        wsgi_response = client.get("/api/v1/projects")
+
+    asgi_app = AsyncPortfolioApp(Flask(__name__), async_service(projects=sample_projects))
+    status, headers, body = call_asgi(asgi_app, "/api/v1/projects")
+
+    assert status == 200
+    assert body == wsgi_response.data
+    assert headers["etag"] == wsgi_response.headers["ETag"]
+
+
+def test_snapshot_is_reused_and_validators_are_honoured(sample_social_media):
+    """Test that a fresh snapshot skips the data load and answers 304."""
+    service = async_service(social_media=sample_social_media)
+    asgi_app = AsyncPortfolioApp(Flask(__name__), service)
+
+    _, headers, _ = call_asgi(asgi_app, "/api/v1/social-media-links")
+    status, _, body = call_asgi(
+        asgi_app,
+        "/api/v1/social-media-links",
+        headers=[(b"if-none-match", headers["etag"].encode())],
+    )
+
+    assert status == 304
+    assert body == b""
+    service.load_datasets.assert_awaited_once()
+
+
+def test_snapshots_are_built_off_the_event_loop(sample_projects):
+    """Test that rendering and compressing the body do not block the loop."""
+    service = async_service(projects=sample_projects)
+    asgi_app = AsyncPortfolioApp(Flask(__name__), service)
+    build_threads = []
+    get_or_build = ResponseSnapshotStore.get_or_build
+
+    def record_thread(store, key, builder):
+        build_threads.append(threading.current_thread())
+        return get_or_build(store, key, builder)
+
+    with patch.object(ResponseSnapshotStore, "get_or_build", record_thread):
+        status, _, _ = call_asgi(asgi_app, "/api/v1/projects")
+
+    assert status == 200
+    assert build_threads and threading.main_thread() not in build_threads
+
+
+def test_query_params_select_the_variant(sample_experiences):
+    """Test that /experiences?total_duration=true serves the total only."""
+    service = async_service(total_experience={"total_duration": 5})
+    asgi_app = AsyncPortfolioApp(Flask(__name__), service)
+
+    status, _, body = call_asgi(
+        asgi_app, "/api/v1/experiences", query_string=b"total_duration=true"
+    )
+
+    assert status == 200
+    assert json.loads(body) == {"total_duration": 5}
+
+
+def test_unknown_portfolio_section_is_a_bad_request():
+    """Test that include= validation matches the WSGI route."""
+    asgi_app = AsyncPortfolioApp(Flask(__name__), async_service())
+
+    status, _, body = call_asgi(
+        asgi_app, "/api/v1/portfolio", query_string=b"include=nope"
+    )
+
+    assert status == HTTP_BAD_REQUEST
+    assert "nope" in json.loads(body)["error_message"]
+
+
+def test_data_errors_return_internal_server_error():
+    """Test that a failing load answers 500 with the usual error body."""
+    service = AsyncMock()
+    service.load_datasets.side_effect = Exception("DB down")
+    asgi_app = AsyncPortfolioApp(Flask(__name__), service)
+
+    status, _, body = call_asgi(asgi_app, "/api/v1/education")
+
+    assert status == HTTP_INTERNAL_SERVER_ERROR
+    assert json.loads(body) == {"error_message": "An internal server error occurred"}
+
+
+def test_other_paths_go_to_the_fallback():
+    """Test that non-data routes are delegated to the WSGI bridge."""
+    fallback = AsyncMock()
+    asgi_app = AsyncPortfolioApp(Flask(__name__), async_service(), fallback=fallback)
+
+    async def receive():
+        return {"type": "http.request"}
+
+    scope = {"type": "http", "method": "GET", "path": "/api/v1/ping"}
+    asyncio.run(asgi_app(scope, receive, AsyncMock()))
+
+    fallback.assert_awaited_once()
@@ -0,0 +1,92 @@
+"""Tests for the asyncio portfolio data service."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.ports.cache_provider_interface import CacheProvider
+from src.infrastructure.services.async_portfolio_data_service import (
+    AsyncPortfolioDataService,
+)
+
+
+def test_load_datasets_awaits_reads_concurrently():
+    """Test that repository reads overlap on the event loop."""
+    repository = AsyncMock()
+    started = []
+
+    def reader(name):
+        async def read(**criteria):
+            started.append(name)
+            # Both reads must be in flight before either completes
+            while len(started) < 2:
+                await asyncio.sleep(0)
+            return [name]
+
+        return read
+
+    repository.get_all_projects.side_effect = reader("project")
+    repository.get_all_social_media.side_effect = reader("social")
+    service = AsyncPortfolioDataService(repository)
+
+    result = asyncio.run(
+        asyncio.wait_for(service.load_datasets(["projects", "social_media"]), 5)
+    )
+
+    assert result == {"projects": ["project"], "social_media": ["social"]}
+
+
+def test_cached_datasets_skip_the_repository(sample_formations, sample_certifications):
+    """Test that hits come from get_many and misses are written with set_many."""
+    repository = AsyncMock()
+    repository.get_all_certifications.return_value = sample_certifications
+    cache_provider = AsyncMock()
+    cache_provider.get_many.return_value = {
+        CacheProvider.FORMATIONS_KEY: sample_formations,
+        CacheProvider.CERTIFICATIONS_KEY: None,
+    }
+    service = AsyncPortfolioDataService(repository, cache_provider)
+
+    result = asyncio.run(service.load_datasets(["formations", "certifications"]))
+
+    assert result["formations"] == sample_formations
+    repository.get_all_formations.assert_not_awaited()
+    cache_provider.set_many.assert_awaited_once_with(
+        {CacheProvider.CERTIFICATIONS_KEY: sample_certifications}
+    )
+
+
+def test_cache_errors_fall_back_to_the_repository(sample_projects):
+    """Test that a failing cache never breaks the read path."""
+    repository = AsyncMock()
+    repository.get_all_projects.return_value = sample_projects
+    cache_provider = AsyncMock()
+    cache_provider.get_many.side_effect = Exception("Redis down")
+    cache_provider.set_many.side_effect = Exception("Redis down")
+    service = AsyncPortfolioDataService(repository, cache_provider)
+
+    assert asyncio.run(service.projects()) == sample_projects
+
+
+def test_failed_repository_reads_abort_the_refill():
+    """Test that the refill locks taken on the misses are released on failure."""
+    repository = AsyncMock()
+    repository.get_all_projects.side_effect = Exception("Database down")
+    cache_provider = AsyncMock()
+    cache_provider.get_many.return_value = {}
+    service = AsyncPortfolioDataService(repository, cache_provider)
+
+    with pytest.raises(Exception, match="Database down"):
+        asyncio.run(service.projects())
+
+    cache_provider.abort_refill.assert_awaited_once_with([CacheProvider.PROJECTS_KEY])
+    cache_provider.set_many.assert_not_awaited()
+
+
+def test_load_datasets_rejects_unknown_names():
+    """Test that unknown dataset names are rejected."""
+    service = AsyncPortfolioDataService(AsyncMock())
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.load_datasets(["unknown"]))
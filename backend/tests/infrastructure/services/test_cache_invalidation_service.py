@@ -0,0 +1,92 @@
+"""Tests for the event-driven cache invalidation service."""
+
+from unittest.mock import MagicMock
+
+from src.infrastructure.services.cache_invalidation_service import (
+    CacheInvalidationService,
+)
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+
+
+def test_changed_tables_refresh_derived_datasets():
+    """Test that a table change refreshes every dataset computed from it."""
+    portfolio_data_service = MagicMock()
+    service = CacheInvalidationService(portfolio_data_service)
+
+    datasets = service.handle_changes({"companies"})
+
+    assert datasets == ["experiences", "companies_duration", "total_experience"]
+    portfolio_data_service.refresh_datasets.assert_called_once_with(datasets)
+
+
+def test_unknown_table_refreshes_everything():
+    """Test that an unknown table conservatively refreshes all datasets."""
+    service = CacheInvalidationService(MagicMock())
+
+    assert service.datasets_for_tables(["*"]) == list(PortfolioDataService.DATASETS)
+
+
+def test_callbacks_are_notified_even_if_one_fails():
+    """Test that a failing callback does not stop the others."""
+    service = CacheInvalidationService(MagicMock())
+    failing, callback = MagicMock(side_effect=Exception("boom")), MagicMock()
+    service.add_callback(failing)
+    service.add_callback(callback)
+
+    service.handle_changes(["projects"])
+
+    callback.assert_called_once_with(["projects"])
+
+
+def test_only_the_elected_worker_reloads_the_shared_cache():
+    """Test that datasets reloaded by another worker are only dropped locally."""
+    portfolio_data_service, shared_cache = MagicMock(), MagicMock()
+    portfolio_data_service.refresh_datasets.return_value = True
+    shared_cache.acquire_invalidation_locks.return_value = ["projects"]
+    shared_cache.wait_for_invalidations.return_value = True
+    service = CacheInvalidationService(portfolio_data_service, shared_cache)
+    callback = MagicMock()
+    service.add_callback(callback)
+
+    service.handle_changes(["projects", "formations"], {"8", "7"})
+
+    shared_cache.acquire_invalidation_locks.assert_called_once_with(
+        ["projects", "formations"], ["7", "8"]
+    )
+    portfolio_data_service.refresh_datasets.assert_called_once_with(["projects"])
+    shared_cache.release_invalidation_locks.assert_called_once_with(
+        ["projects"], True
+    )
+    shared_cache.wait_for_invalidations.assert_called_once_with(
+        ["formations"], ["7", "8"]
+    )
+    portfolio_data_service.drop_local_datasets.assert_called_once_with(
+        ["formations"]
+    )
+    callback.assert_called_once_with(["projects", "formations"])
+
+
+def test_changes_without_ids_are_reloaded_by_this_worker():
+    """Test that id-less changes are claimed under an id of their own."""
+    shared_cache = MagicMock()
+    service = CacheInvalidationService(MagicMock(), shared_cache)
+
+    service.handle_changes(["*"])
+    service.handle_changes(["*"])
+
+    (_, first), (_, second) = (
+        call.args for call in shared_cache.acquire_invalidation_locks.call_args_list
+    )
+    assert len(first) == 1 and first != second
+
+
+def test_every_worker_reloads_when_the_election_fails():
+    """Test that a Redis error during the election falls back to a local reload."""
+    portfolio_data_service, shared_cache = MagicMock(), MagicMock()
+    shared_cache.acquire_invalidation_locks.side_effect = Exception("down")
+    service = CacheInvalidationService(portfolio_data_service, shared_cache)
+
+    service.handle_changes(["projects"])
+
+    portfolio_data_service.refresh_datasets.assert_called_once_with(["projects"])
+    portfolio_data_service.drop_local_datasets.assert_not_called()
@@ -0,0 +1,71 @@
+"""Tests for the cutover of the Redis cache namespace."""
+
+from unittest.mock import MagicMock
+
+from src.infrastructure.adapters.outbound_redis_adapter import RedisAdapter
+from src.infrastructure.services.cache_namespace_service import (
+    CacheNamespaceService,
+)
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+
+
+def build_cache(status=None, locked=True):
+    cache = MagicMock(namespace="v2:1.1.0")
+    cache.namespace_status.return_value = {"namespace": "v2:1.1.0", "status": status}
+    cache.acquire_namespace_lock.return_value = locked
+    cache.collect_namespaces.return_value = ["v2:1.0.0"]
+    return cache
+
+
+def test_prepare_populates_promotes_and_collects():
+    """Test that the lock holder reloads the datasets, then switches readers."""
+    cache = build_cache()
+    portfolio_data_service = MagicMock()
+    portfolio_data_service.refresh_datasets.return_value = True
+    service = CacheNamespaceService(cache, portfolio_data_service)
+
+    report = service.prepare()
+
+    portfolio_data_service.refresh_datasets.assert_called_once_with(
+        PortfolioDataService.DATASETS
+    )
+    cache.promote_namespace.assert_called_once()
+    cache.release_namespace_lock.assert_called_once()
+    assert report == {
+        "namespace": "v2:1.1.0",
+        "status": CacheNamespaceService.POPULATED,
+        "collected": ["v2:1.0.0"],
+    }
+
+
+def test_prepare_skips_a_ready_namespace():
+    """Test that nothing is reloaded once the namespace was promoted."""
+    cache = build_cache(status=RedisAdapter.NAMESPACE_READY)
+    portfolio_data_service = MagicMock()
+    service = CacheNamespaceService(cache, portfolio_data_service)
+
+    assert service.prepare()["status"] == CacheNamespaceService.READY
+    cache.acquire_namespace_lock.assert_not_called()
+    portfolio_data_service.refresh_datasets.assert_not_called()
+
+
+def test_prepare_leaves_the_population_to_the_lock_holder():
+    """Test that other workers do not reload while one populates the namespace."""
+    cache = build_cache(status=RedisAdapter.NAMESPACE_WARMING, locked=False)
+    portfolio_data_service = MagicMock()
+    service = CacheNamespaceService(cache, portfolio_data_service)
+
+    assert service.prepare()["status"] == CacheNamespaceService.PENDING
+    portfolio_data_service.refresh_datasets.assert_not_called()
+
+
+def test_failed_population_is_not_promoted():
+    """Test that a namespace whose reload failed keeps reading the old one."""
+    cache = build_cache()
+    portfolio_data_service = MagicMock()
+    portfolio_data_service.refresh_datasets.return_value = False
+    service = CacheNamespaceService(cache, portfolio_data_service)
+
+    assert service.prepare()["status"] == CacheNamespaceService.FAILED
+    cache.promote_namespace.assert_not_called()
+    cache.release_namespace_lock.assert_called_once()
@@ -0,0 +1,114 @@
+"""Tests for the startup cache warm-up."""
+
+import threading
+from unittest.mock import MagicMock
+
+from src.infrastructure.services.cache_warmup_service import CacheWarmupService
+from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+
+
+def test_warm_loads_every_dataset():
+    """Test that warming reads every dataset through the caches."""
+    portfolio_data_service = MagicMock()
+    service = CacheWarmupService(portfolio_data_service, enabled=True)
+
+    report = service.warm()
+
+    portfolio_data_service.load_datasets.assert_called_once_with(
+        PortfolioDataService.DATASETS
+    )
+    assert report["status"] == CacheWarmupService.WARM
+    assert report["ready"] is True
+
+
+def test_forced_warm_reloads_from_the_repository():
+    """Test that --force refreshes the datasets instead of reading the cache."""
+    portfolio_data_service = MagicMock()
+    service = CacheWarmupService(portfolio_data_service, enabled=True)
+
+    service.warm(force=True)
+
+    portfolio_data_service.refresh_datasets.assert_called_once_with(
+        PortfolioDataService.DATASETS
+    )
+    portfolio_data_service.load_datasets.assert_not_called()
+
+
+def test_failed_forced_warm_is_reported_as_failed():
+    """Test that --force fails (and evicts nothing) when the reload fails."""
+    repository = MagicMock()
+    repository.get_all_projects.side_effect = Exception("DB down")
+    cache_provider = MagicMock()
+    service = CacheWarmupService(
+        PortfolioDataService(repository, cache_provider), enabled=True
+    )
+
+    report = service.warm(force=True)
+
+    assert report["status"] == CacheWarmupService.FAILED
+    cache_provider.set_many.assert_not_called()
+    cache_provider.delete_many.assert_not_called()
+
+
+def test_warm_without_cache_is_skipped():
+    """Test that there is nothing to warm when caching is disabled."""
+    portfolio_data_service = MagicMock(cache_provider=None)
+    service = CacheWarmupService(portfolio_data_service, enabled=True)
+
+    assert service.warm()["status"] == CacheWarmupService.SKIPPED
+    portfolio_data_service.load_datasets.assert_not_called()
+
+
+def test_failed_warm_still_reports_ready():
+    """Test that a failing warm-up does not keep the worker unready forever."""
+    portfolio_data_service = MagicMock()
+    portfolio_data_service.load_datasets.side_effect = Exception("DB down")
+    service = CacheWarmupService(portfolio_data_service, enabled=True)
+
+    report = service.warm()
+
+    assert report["status"] == CacheWarmupService.FAILED
+    assert report["error"] == "DB down"
+    assert service.ready
+
+
+def test_wait_is_bounded_by_the_timeout():
+    """Test that a slow warm-up stops blocking after the timeout but keeps going."""
+    release = threading.Event()
+    portfolio_data_service = MagicMock()
+    portfolio_data_service.load_datasets.side_effect = lambda datasets: release.wait(5)
+    service = CacheWarmupService(portfolio_data_service, enabled=True)
+
+    thread = service.start()
+
+    assert service.wait(timeout=0.05) is False
+    assert service.report()["status"] == CacheWarmupService.WARMING
+    assert not service.ready
+
+    release.set()
+    thread.join(5)
+    assert service.ready
+
+
+def test_disabled_warm_up_is_ready_immediately():
+    """Test that with CACHE_WARMUP_ENABLED=false the worker is ready at once."""
+    service = CacheWarmupService(MagicMock(), enabled=False)
+
+    assert service.start() is None
+    assert service.wait(timeout=0)
+    assert service.status == CacheWarmupService.SKIPPED
+
+
+def test_warm_prepares_the_cache_namespace_first():
+    """Test that the namespace is prepared and reported with the warm-up."""
+    portfolio_data_service = MagicMock()
+    namespace_service = MagicMock()
+    namespace_service.report.return_value = {"status": "ready"}
+    service = CacheWarmupService(
+        portfolio_data_service, enabled=True, namespace_service=namespace_service
+    )
+
+    report = service.warm()
+
+    namespace_service.prepare.assert_called_once()
+    assert report["namespace"] == {"status": "ready"}
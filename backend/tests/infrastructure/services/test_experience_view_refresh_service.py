@@ -0,0 +1,69 @@
+"""Tests for the scheduled refresh of the materialized experience views."""
+
+import threading
+from unittest.mock import MagicMock
+
+from src.infrastructure.services.experience_view_refresh_service import (
+    ExperienceViewRefreshService,
+)
+
+
+def test_scheduled_checks_only_refresh_stale_views():
+    """Test that the worker loop asks for a refresh only if the views are stale."""
+    repository = MagicMock()
+    checked = threading.Event()
+    repository.refresh_experience_views.side_effect = lambda only_if_stale: (
+        checked.set() or False
+    )
+    service = ExperienceViewRefreshService(repository, interval=60)
+
+    service.start()
+    assert checked.wait(5)
+    service.stop()
+
+    repository.refresh_experience_views.assert_called_once_with(True)
+
+
+def test_zero_interval_disables_the_schedule():
+    """Test that no thread is started when the interval is 0."""
+    repository = MagicMock()
+
+    assert ExperienceViewRefreshService(repository, interval=0).start() is None
+    repository.refresh_experience_views.assert_not_called()
+
+
+def test_flask_commands_do_not_start_the_schedule(monkeypatch):
+    """Test that only server processes check, not flask CLI processes."""
+    monkeypatch.setenv("FLASK_RUN_FROM_CLI", "true")
+    repository = MagicMock()
+
+    assert ExperienceViewRefreshService(repository, interval=60).start() is None
+    repository.refresh_experience_views.assert_not_called()
+
+
+def test_refresh_failures_are_logged_not_raised():
+    """Test that a database error does not kill the worker thread."""
+    repository = MagicMock()
+    repository.refresh_experience_views.side_effect = Exception("DB down")
+
+    assert ExperienceViewRefreshService(repository, interval=0).refresh() is False
+
+
+def test_experience_changes_wake_the_check():
+    """Test that a change of an experience dataset triggers a check at once."""
+    repository = MagicMock()
+    checks = threading.Semaphore(0)
+    repository.refresh_experience_views.side_effect = lambda only_if_stale: (
+        checks.release() or False
+    )
+    service = ExperienceViewRefreshService(repository, interval=60)
+
+    service.start()
+    assert checks.acquire(timeout=5)
+    service.request_refresh(["projects"])
+    assert not checks.acquire(timeout=0.1)
+    service.request_refresh(["companies_duration"])
+    assert checks.acquire(timeout=5)
+    service.stop()
+
+    assert repository.refresh_experience_views.call_count == 2
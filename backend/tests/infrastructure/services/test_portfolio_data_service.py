@@ -1,6 +1,12 @@
 """Tests for the PortfolioDataService."""
 
+import threading
+
+import pytest
+
+from src.infrastructure.ports.cache_provider_interface import CacheProvider
 from src.infrastructure.services.portfolio_data_service import PortfolioDataService
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 
 
 def test_projects_calls_repository(mock_repository, sample_projects):
@@ -56,3 +62,217 @@ def test_social_media_calls_repository(mock_repository, sample_social_media):
     
     mock_repository.get_all_social_media.assert_called_once()
     assert result == sample_social_media
+
+
+def test_projects_served_from_cache_skip_repository(
+    mock_repository, mock_cache_provider, sample_projects
+):
+    """Test that a cache hit does not touch the repository."""
+    mock_cache_provider.get_all_projects.return_value = sample_projects
+    service = PortfolioDataService(mock_repository, mock_cache_provider)
+
+    result = service.projects()
+
+    mock_repository.get_all_projects.assert_not_called()
+    mock_cache_provider.set_projects.assert_not_called()
+    assert result == sample_projects
+
+
+def test_cache_miss_reads_repository_and_populates_cache(
+    mock_repository, mock_cache_provider, sample_experiences
+):
+    """Test that a cache miss falls back to the repository and fills the cache."""
+    mock_cache_provider.get_all_experiences.return_value = None
+    mock_repository.get_all_experiences.return_value = sample_experiences
+    service = PortfolioDataService(mock_repository, mock_cache_provider)
+
+    result = service.experiences()
+
+    mock_repository.get_all_experiences.assert_called_once()
+    mock_cache_provider.set_experiences.assert_called_once_with(sample_experiences)
+    assert result == sample_experiences
+
+
+def test_cache_errors_fall_back_to_repository(
+    mock_repository, mock_cache_provider, sample_formations
+):
+    """Test that cache failures never break the read path."""
+    mock_cache_provider.get_all_formations.side_effect = Exception("Redis down")
+    mock_cache_provider.set_formations.side_effect = Exception("Redis down")
+    mock_repository.get_all_formations.return_value = sample_formations
+    service = PortfolioDataService(mock_repository, mock_cache_provider)
+
+    result = service.formations()
+
+    mock_repository.get_all_formations.assert_called_once()
+    assert result == sample_formations
+
+
+def test_load_datasets_runs_reads_concurrently(mock_repository):
+    """Test that load_datasets overlaps the repository reads."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def read_projects(**criteria):
+        barrier.wait()
+        return ["project"]
+
+    def read_social_media(**criteria):
+        barrier.wait()
+        return ["social"]
+
+    mock_repository.get_all_projects.side_effect = read_projects
+    mock_repository.get_all_social_media.side_effect = read_social_media
+    service = PortfolioDataService(mock_repository)
+
+    result = service.load_datasets(["projects", "social_media"])
+
+    assert result == {"projects": ["project"], "social_media": ["social"]}
+
+
+def test_load_datasets_rejects_unknown_names(mock_repository):
+    """Test that unknown dataset names are rejected."""
+    service = PortfolioDataService(mock_repository)
+
+    with pytest.raises(ValueError):
+        service.load_datasets(["projects", "unknown"])
+
+
+def test_failed_repository_reads_abort_the_refill(
+    mock_repository, mock_cache_provider
+):
+    """Test that the refill locks taken on the misses are released on failure."""
+    mock_cache_provider.get_all_projects.return_value = None
+    mock_cache_provider.get_many.return_value = {}
+    mock_repository.get_all_projects.side_effect = Exception("Database down")
+    service = PortfolioDataService(mock_repository, mock_cache_provider)
+
+    with pytest.raises(Exception, match="Database down"):
+        service.projects()
+    with pytest.raises(Exception, match="Database down"):
+        service.load_datasets(["projects"])
+
+    mock_cache_provider.abort_refill.assert_called_with([CacheProvider.PROJECTS_KEY])
+    assert mock_cache_provider.abort_refill.call_count == 2
+    mock_cache_provider.set_projects.assert_not_called()
+
+
+def test_fallback_answers_are_not_written_back_to_the_cache(
+    mock_repository, mock_cache_provider, sample_projects
+):
+    """Test that data a fallback source served is not cached as fresh."""
+    mock_cache_provider.get_all_projects.return_value = None
+    mock_cache_provider.get_many.return_value = {}
+    mock_repository.get_all_projects.return_value = sample_projects
+    mock_repository.served_from_primary.return_value = False
+    service = PortfolioDataService(mock_repository, mock_cache_provider)
+
+    assert service.projects() == sample_projects
+    assert service.load_datasets(["projects"]) == {"projects": sample_projects}
+    assert service.refresh_datasets(["projects"]) is False
+
+    mock_cache_provider.set_projects.assert_not_called()
+    mock_cache_provider.set_many.assert_not_called()
+    mock_cache_provider.abort_refill.assert_called_with([CacheProvider.PROJECTS_KEY])
+
+
+def test_load_datasets_uses_one_bulk_cache_round_trip(
+    mock_repository, mock_cache_provider, sample_formations, sample_certifications
+):
+    """Test that cached datasets come from get_many and misses go to set_many."""
+    mock_cache_provider.get_many.return_value = {
+        CacheProvider.FORMATIONS_KEY: sample_formations,
+        CacheProvider.CERTIFICATIONS_KEY: None,
+    }
+    mock_repository.get_all_certifications.return_value = sample_certifications
+    service = PortfolioDataService(mock_repository, mock_cache_provider)
+
+    result = service.load_datasets(["formations", "certifications"])
+
+    assert result == {
+        "formations": sample_formations,
+        "certifications": sample_certifications,
+    }
+    mock_cache_provider.get_many.assert_called_once_with(
+        [CacheProvider.FORMATIONS_KEY, CacheProvider.CERTIFICATIONS_KEY]
+    )
+    mock_repository.get_all_formations.assert_not_called()
+    mock_cache_provider.set_many.assert_called_once_with(
+        {CacheProvider.CERTIFICATIONS_KEY: sample_certifications}
+    )
+
+
+def test_refresh_datasets_reloads_the_cache(
+    mock_repository, mock_cache_provider, sample_projects
+):
+    """Test that refreshed datasets are read from the repository and cached."""
+    mock_repository.get_all_projects.return_value = sample_projects
+    service = PortfolioDataService(mock_repository, mock_cache_provider)
+
+    service.refresh_datasets(["projects"])
+
+    mock_cache_provider.set_many.assert_called_once_with(
+        {CacheProvider.PROJECTS_KEY: sample_projects}
+    )
+    mock_cache_provider.delete_many.assert_not_called()
+
+
+def test_refresh_datasets_keeps_entries_when_the_repository_fails(
+    mock_repository, mock_cache_provider
+):
+    """Test that a failed reload keeps the entries degraded mode serves."""
+    mock_repository.get_all_projects.side_effect = CircuitOpenError("open")
+    service = PortfolioDataService(mock_repository, mock_cache_provider)
+
+    assert service.refresh_datasets(["projects"]) is False
+
+    mock_cache_provider.set_many.assert_not_called()
+    mock_cache_provider.delete_many.assert_not_called()
+
+
+def test_refresh_datasets_drops_entries_when_the_new_data_is_not_cached(
+    mock_repository, mock_cache_provider, sample_projects
+):
+    """Test that entries are evicted when fresher data could not be written."""
+    mock_repository.get_all_projects.return_value = sample_projects
+    mock_cache_provider.set_many.side_effect = Exception("Redis down")
+    service = PortfolioDataService(mock_repository, mock_cache_provider)
+
+    assert service.refresh_datasets(["projects"]) is False
+
+    mock_cache_provider.delete_many.assert_called_once_with(
+        [CacheProvider.PROJECTS_KEY]
+    )
+
+
+def test_repository_reads_only_active_rows(mock_repository, sample_projects):
+    """Test that the active filter is delegated to the repository."""
+    mock_repository.get_all_projects.return_value = sample_projects
+    service = PortfolioDataService(mock_repository)
+
+    service.load_datasets(["projects", "experiences"])
+    service.projects()
+
+    mock_repository.get_all_projects.assert_called_with(active=True)
+    mock_repository.get_all_experiences.assert_called_once_with()
+
+
+def test_open_circuit_serves_the_cache_and_fails_fast_on_misses(
+    mock_repository, mock_cache_provider, sample_projects
+):
+    """Test the degraded mode: cached data is served, the repository is skipped."""
+    mock_repository.get_all_formations.side_effect = Exception("DB down")
+    mock_cache_provider.get_all_formations.return_value = None
+    mock_cache_provider.get_all_projects.return_value = sample_projects
+    service = PortfolioDataService(
+        mock_repository,
+        mock_cache_provider,
+        CircuitBreaker("repository", failure_threshold=1, reset_timeout=60),
+    )
+
+    with pytest.raises(Exception, match="DB down"):
+        service.formations()
+    with pytest.raises(CircuitOpenError):
+        service.formations()
+
+    assert service.projects() == sample_projects
+    mock_repository.get_all_formations.assert_called_once()
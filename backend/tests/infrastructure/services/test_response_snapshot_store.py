@@ -0,0 +1,113 @@
+"""Tests for the ResponseSnapshotStore."""
+
+import json
+import threading
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.services.response_snapshot_store import (
+    ResponseSnapshotStore,
+    get_response_snapshot_store,
+    latest_update,
+)
+
+
+def test_snapshot_is_built_once_and_reused(app):
+    """Test that the builder only runs on the first request for a key."""
+    store = ResponseSnapshotStore(ttl=0)
+    builder = MagicMock(return_value=[{"title": "Project"}])
+
+    with app.app_context():
+        first = store.get_or_build("projects", builder)
+        second = store.get_or_build("projects", builder)
+
+    builder.assert_called_once()
+    assert first is second
+    assert json.loads(first.body) == [{"title": "Project"}]
+
+
+def test_invalidate_forces_rebuild(app):
+    """Test that invalidating a key rebuilds its body on the next read."""
+    store = ResponseSnapshotStore(ttl=0)
+    builder = MagicMock(side_effect=[["old"], ["new"]])
+
+    with app.app_context():
+        store.get_or_build("projects", builder)
+        store.invalidate("projects")
+        snapshot = store.get_or_build("projects", builder)
+
+    assert json.loads(snapshot.body) == ["new"]
+
+
+def test_builder_failures_are_not_stored(app):
+    """Test that a failing builder propagates and leaves no snapshot behind."""
+    store = ResponseSnapshotStore(ttl=0)
+
+    with app.app_context():
+        with pytest.raises(Exception):
+            store.get_or_build("projects", MagicMock(side_effect=Exception("boom")))
+
+        snapshot = store.get_or_build("projects", MagicMock(return_value=[]))
+
+    assert json.loads(snapshot.body) == []
+
+
+def test_keys_are_built_in_parallel_and_once_each(app):
+    """Test that a slow build only holds back callers of the same key."""
+    store = ResponseSnapshotStore(ttl=0)
+    release = threading.Event()
+    slow_builder = MagicMock(side_effect=lambda: release.wait(5) and ["slow"])
+    results = []
+
+    def read_slow():
+        with app.app_context():
+            results.append(store.get_or_build("projects", slow_builder))
+
+    readers = [threading.Thread(target=read_slow) for _ in range(2)]
+    for reader in readers:
+        reader.start()
+    with app.app_context():
+        other = store.get_or_build("formations", MagicMock(return_value=["fast"]))
+    release.set()
+    for reader in readers:
+        reader.join(5)
+
+    assert json.loads(other.body) == ["fast"]
+    slow_builder.assert_called_once()
+    assert [json.loads(result.body) for result in results] == [["slow"], ["slow"]]
+
+
+def test_builds_overtaken_by_an_invalidation_are_not_kept(app):
+    """Test that a body built from data read before an invalidation is dropped."""
+    store = ResponseSnapshotStore(ttl=0)
+
+    def builder():
+        store.invalidate("projects")  # data changed while this build was running
+        return ["old"]
+
+    with app.app_context():
+        assert json.loads(store.get_or_build("projects", builder).body) == ["old"]
+        snapshot = store.get_or_build("projects", MagicMock(return_value=["new"]))
+
+    assert json.loads(snapshot.body) == ["new"]
+
+
+def test_store_is_bound_to_the_application(app):
+    """Test that each Flask app gets its own snapshot store."""
+    with app.app_context():
+        assert get_response_snapshot_store() is get_response_snapshot_store()
+
+
+def test_latest_update_picks_most_recent_timestamp():
+    """Test that latest_update prefers updated_at and parses cached strings."""
+    older = MagicMock(
+        updated_at=None, created_at=datetime(2024, 1, 1, tzinfo=timezone.utc)
+    )
+    newer = MagicMock(updated_at="2024-05-01 10:00:00+00:00", created_at=None)
+
+    assert latest_update([older], [newer]) == datetime(
+        2024, 5, 1, 10, tzinfo=timezone.utc
+    )
+    assert latest_update([]) is None
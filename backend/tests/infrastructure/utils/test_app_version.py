@@ -0,0 +1,47 @@
+"""Tests for the build-time application version."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.infrastructure.utils import app_version
+from src.infrastructure.utils.app_version import get_application_version
+
+
+@pytest.fixture(autouse=True)
+def clear_version_cache():
+    get_application_version.cache_clear()
+    yield
+    get_application_version.cache_clear()
+
+
+def test_version_comes_from_the_environment(monkeypatch):
+    """Test that APP_VERSION, set by the image build, wins."""
+    monkeypatch.setenv("APP_VERSION", "2.3.4")
+
+    assert get_application_version() == "2.3.4"
+
+
+def test_version_file_is_read_without_subprocess(monkeypatch, tmp_path):
+    """Test that the VERSION file written at build time is used next."""
+    monkeypatch.delenv("APP_VERSION", raising=False)
+    version_file = tmp_path / "VERSION"
+    version_file.write_text("1.2.0\n", encoding="utf-8")
+
+    with patch.object(app_version, "VERSION_FILE", str(version_file)), patch(
+        "subprocess.run"
+    ) as run:
+        assert get_application_version() == "1.2.0"
+    run.assert_not_called()
+
+
+def test_version_falls_back_to_pyproject(monkeypatch, tmp_path):
+    """Test that local runs read the version declared in pyproject.toml."""
+    monkeypatch.delenv("APP_VERSION", raising=False)
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[tool.poetry]\nversion = "0.9.1"\n', encoding="utf-8")
+
+    with patch.object(
+        app_version, "VERSION_FILE", str(tmp_path / "VERSION")
+    ), patch.object(app_version, "PYPROJECT_FILE", str(pyproject)):
+        assert get_application_version() == "0.9.1"
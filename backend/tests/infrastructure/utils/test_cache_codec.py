@@ -0,0 +1,73 @@
+"""Tests for the cache value codecs."""
+
+import math
+from datetime import datetime, timezone
+
+import pytest
+
+from src.infrastructure.utils.cache_codec import (
+    BinaryCacheCodec,
+    CacheFormatError,
+    JSONCacheCodec,
+    get_cache_codec,
+)
+
+UPDATED_AT = datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc)
+
+
+def test_binary_codec_round_trips_tables_and_values():
+    """Test that record lists and values decode as with the JSON envelope."""
+    codec = BinaryCacheCodec()
+    records = [
+        {"title": "A", "tags": ["python"], "updated_at": UPDATED_AT},
+        {"title": "B", "tags": [], "updated_at": None},
+    ]
+
+    entry = codec.decode(codec.encode(records, soft_expires_at=10.5, delta=0.25))
+
+    assert entry.data == JSONCacheCodec().decode(
+        JSONCacheCodec().encode(records, 0.0, 0.0)
+    ).data
+    assert entry.data[0]["updated_at"] == UPDATED_AT.isoformat()
+    assert (entry.soft_expires_at, entry.delta) == (10.5, 0.25)
+    for value in ({"total_duration": "5 anos"}, [], None):
+        assert codec.decode(codec.encode(value, math.inf, 0.0)).data == value
+
+
+def test_binary_codec_is_smaller_than_the_json_envelope():
+    """Test that field names are not repeated per record."""
+    records = [{"label": f"Rede {i}", "url": f"https://x/{i}"} for i in range(50)]
+
+    binary = BinaryCacheCodec().encode(records, 0.0, 0.0)
+    text = JSONCacheCodec().encode(records, 0.0, 0.0)
+
+    assert len(binary) < len(text) * 0.8
+
+
+def test_foreign_values_raise_format_errors():
+    """Test that other schemas, formats and codecs are rejected."""
+    old = BinaryCacheCodec(schema_version=1).encode({"a": 1}, 0.0, 0.0)
+
+    with pytest.raises(CacheFormatError, match="schema 1"):
+        BinaryCacheCodec(schema_version=2).decode(old)
+    with pytest.raises(CacheFormatError):
+        BinaryCacheCodec().decode(JSONCacheCodec().encode({"a": 1}, 0.0, 0.0))
+    with pytest.raises(CacheFormatError):
+        JSONCacheCodec().decode(old)
+    with pytest.raises(ValueError, match="Unknown cache codec"):
+        get_cache_codec("msgpack")
+
+
+def test_binary_codec_reads_both_body_formats():
+    """Test that MessagePack and JSON bodies decode to the same values."""
+    pytest.importorskip("msgpack")
+    records = [{"title": "A", "updated_at": UPDATED_AT, "tags": ["python"]}]
+    json_body = BinaryCacheCodec(body_format=BinaryCacheCodec.FORMAT_JSON)
+    msgpack_body = BinaryCacheCodec(body_format=BinaryCacheCodec.FORMAT_MSGPACK)
+
+    packed = msgpack_body.encode(records, 0.0, 0.0)
+    text = json_body.encode(records, 0.0, 0.0)
+
+    assert len(packed) < len(text)
+    assert msgpack_body.decode(text).data == json_body.decode(packed).data
+    assert json_body.decode(packed).data[0]["updated_at"] == UPDATED_AT.isoformat()
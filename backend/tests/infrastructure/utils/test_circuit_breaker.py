@@ -0,0 +1,103 @@
+"""Tests for the circuit breaker."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.infrastructure.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def failing():
+    raise ConnectionError("connection refused")
+
+
+def test_opens_after_consecutive_failures_and_fails_fast():
+    """Test that calls are rejected without reaching the dependency once open."""
+    breaker = CircuitBreaker("db", failure_threshold=2, reset_timeout=30)
+    dependency = MagicMock(side_effect=ConnectionError("down"))
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(dependency)
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(dependency)
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert dependency.call_count == 2
+
+
+def test_success_resets_the_failure_count():
+    """Test that only consecutive failures open the circuit."""
+    breaker = CircuitBreaker("db", failure_threshold=2, reset_timeout=30)
+
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+    assert breaker.call(lambda: "ok") == "ok"
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_half_open_trial_closes_or_reopens_the_circuit():
+    """Test that after the reset timeout a single trial call decides the state."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("db", failure_threshold=1, reset_timeout=30, clock=clock)
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+
+    clock.now = 29
+    assert breaker.report()["retry_in"] == 1
+    clock.now = 30
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 60
+    assert breaker.call(lambda: "ok") == "ok"
+    assert breaker.report() == {
+        "state": CircuitBreaker.CLOSED,
+        "consecutive_failures": 0,
+        "retry_in": None,
+        "last_error": None,
+    }
+
+
+def test_half_open_lets_a_single_trial_through():
+    """Test that concurrent calls are rejected while the trial is in flight."""
+    clock = FakeClock()
+    breaker = CircuitBreaker("db", failure_threshold=1, reset_timeout=30, clock=clock)
+    with pytest.raises(ConnectionError):
+        breaker.call(failing)
+    clock.now = 30
+
+    def trial():
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "second")
+        return "trial"
+
+    assert breaker.call(trial) == "trial"
+
+
+def test_call_async_counts_coroutine_failures():
+    """Test that the async variant shares the same state machine."""
+    breaker = CircuitBreaker("db", failure_threshold=1, reset_timeout=30)
+
+    async def read():
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(breaker.call_async(read))
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(breaker.call_async(read))
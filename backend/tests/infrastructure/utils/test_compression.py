@@ -0,0 +1,25 @@
+"""Tests for the response pre-compression helpers."""
+
+import gzip
+
+from src.infrastructure.utils.compression import (
+    GZIP,
+    available_encodings,
+    compress_variants,
+)
+
+
+def test_small_bodies_are_not_compressed():
+    """Test that bodies below the threshold get no variants."""
+    assert compress_variants(b'{"message": "pong"}', min_size=512) == {}
+
+
+def test_variants_are_produced_for_every_available_encoding():
+    """Test that every available coding yields a smaller, decodable body."""
+    body = b'[{"description": "repetitive text"}]' * 100
+
+    variants = compress_variants(body, min_size=512)
+
+    assert set(variants) == set(available_encodings())
+    assert gzip.decompress(variants[GZIP]) == body
+    assert all(len(compressed) < len(body) for compressed in variants.values())
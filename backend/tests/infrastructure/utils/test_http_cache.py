@@ -0,0 +1,24 @@
+"""Tests for the HTTP caching helpers."""
+
+from src.infrastructure.utils.http_cache import register_conditional_get
+
+
+def test_get_responses_receive_an_etag(app, client):
+    """Test that routes without their own validator get a content-hash ETag."""
+    register_conditional_get(app)
+
+    response = client.get("/api/v1/ping")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"]
+
+
+def test_matching_if_none_match_returns_not_modified(app, client):
+    """Test that a matching If-None-Match is answered with 304."""
+    register_conditional_get(app)
+    etag = client.get("/api/v1/ping").headers["ETag"]
+
+    response = client.get("/api/v1/ping", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
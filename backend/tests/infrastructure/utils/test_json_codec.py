@@ -0,0 +1,68 @@
+"""Tests for the shared JSON codec and Flask provider."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from flask_restx import Api, Resource
+
+from src.infrastructure.utils import json_codec
+from src.infrastructure.utils.json_codec import register_json_provider
+
+PAYLOAD = {
+    "updated_at": datetime(2025, 3, 1, 12, 30, tzinfo=timezone.utc),
+    "title": "Formação",
+    "price": Decimal("9.90"),
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request):
+    """Run a test with orjson and with the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+        yield request.param
+        return
+
+    with patch.object(json_codec, "orjson", None):
+        yield request.param
+
+
+def test_datetimes_are_encoded_as_iso_8601(backend):
+    """Test that both backends write the same compact ISO 8601 output."""
+    data = json_codec.loads(json_codec.dumps(PAYLOAD, sort_keys=True))
+
+    assert list(data) == ["price", "title", "updated_at"]
+    assert datetime.fromisoformat(data["updated_at"]) == PAYLOAD["updated_at"]
+    assert data["price"] == "9.90"
+    assert "Formação".encode("utf-8") in json_codec.dumps(PAYLOAD)
+
+
+def test_unknown_types_are_rejected(backend):
+    """Test that objects without an encoding raise instead of using str()."""
+    with pytest.raises(TypeError):
+        json_codec.dumps({"value": object()})
+
+
+def test_provider_encodes_flask_and_restx_responses(backend):
+    """Test that jsonify and restx resources both use the registered provider."""
+    app = Flask(__name__)
+    api = Api(app)
+
+    @api.route("/item")
+    class Item(Resource):
+        def get(self):
+            return {"b": 1, "a": "ç"}, 201
+
+    register_json_provider(app, api)
+    with app.test_request_context():
+        body = app.json.response({"b": 1, "a": "ç"}).get_data()
+
+    response = app.test_client().get("/item")
+
+    assert body == '{"a":"ç","b":1}\n'.encode("utf-8")
+    assert response.status_code == 201
+    assert response.get_data() == body
+    assert response.mimetype == "application/json"
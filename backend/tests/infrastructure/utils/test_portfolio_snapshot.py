@@ -0,0 +1,72 @@
+"""Tests for the binary portfolio snapshot."""
+
+from datetime import datetime
+
+import pytest
+
+from src.domain.dto.project import ProjectRecord
+from src.infrastructure.utils.portfolio_snapshot import (
+    HEADER,
+    PortfolioSnapshot,
+    SnapshotError,
+    write_snapshot,
+)
+
+UPDATED_AT = datetime(2025, 3, 1, 12, 30)
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, sample_projects, sample_experiences):
+    path = str(tmp_path / "portfolio.snapshot")
+    write_snapshot(
+        path,
+        {
+            "projects": [
+                ProjectRecord(title="Lean", active=True, updated_at=UPDATED_AT),
+                *sample_projects,
+            ],
+            "experiences": sample_experiences,
+            "total_experience": {"total_duration": "5 anos"},
+        },
+    )
+    return path
+
+
+def test_round_trip_keeps_values_and_datetimes(snapshot_path, sample_projects):
+    """Test that records, dicts and datetimes come back as written."""
+    with PortfolioSnapshot(snapshot_path) as snapshot:
+        projects = snapshot.read("projects")
+
+        assert snapshot.datasets == ["projects", "experiences", "total_experience"]
+        assert len(projects) == len(sample_projects) + 1
+        assert projects[0]["updated_at"] == UPDATED_AT
+        assert projects[-1]["title"] == sample_projects[-1].title
+        assert projects[1]["tags"] == sample_projects[0].tags
+        assert snapshot.read("total_experience") == {"total_duration": "5 anos"}
+
+
+def test_records_are_decoded_on_access(snapshot_path):
+    """Test that opening only reads the directory, not the records."""
+    with PortfolioSnapshot(snapshot_path) as snapshot:
+        experiences = snapshot.read("experiences")
+
+        assert experiences[1:2] == [experiences[1]]
+        with pytest.raises(IndexError):
+            experiences[len(experiences)]
+        with pytest.raises(KeyError):
+            snapshot.read("formations")
+
+
+def test_corrupted_or_foreign_files_are_rejected(snapshot_path, tmp_path):
+    """Test that the checksum and the magic number are checked."""
+    with open(snapshot_path, "r+b") as file:
+        file.seek(HEADER.size + 3)
+        file.write(b"\xff")
+
+    with pytest.raises(SnapshotError, match="Checksum"):
+        PortfolioSnapshot(snapshot_path)
+
+    foreign = tmp_path / "projects.json"
+    foreign.write_bytes(b"[]" * HEADER.size)
+    with pytest.raises(SnapshotError, match="não é um snapshot"):
+        PortfolioSnapshot(str(foreign))
@@ -0,0 +1,30 @@
+"""Tests for the opt-in tracing setup."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+from src.infrastructure.utils.tracing import TRACED_INTEGRATIONS, setup_tracing
+
+
+def test_disabled_tracing_does_not_import_ddtrace():
+    """Test that nothing is imported or patched unless tracing is enabled."""
+    with patch.dict(sys.modules, {"ddtrace": None}):
+        assert setup_tracing(enabled=False) is False
+
+
+def test_enabled_tracing_patches_only_the_used_integrations():
+    """Test that only the integrations the API uses are patched."""
+    ddtrace = MagicMock()
+
+    with patch.dict(sys.modules, {"ddtrace": ddtrace}):
+        assert setup_tracing(enabled=True) is True
+
+    ddtrace.patch.assert_called_once_with(
+        raise_errors=False, **{name: True for name in TRACED_INTEGRATIONS}
+    )
+
+
+def test_missing_ddtrace_leaves_tracing_off():
+    """Test that a missing ddtrace package only logs a warning."""
+    with patch.dict(sys.modules, {"ddtrace": None}):
+        assert setup_tracing(enabled=True) is False
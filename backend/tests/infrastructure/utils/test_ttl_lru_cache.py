@@ -0,0 +1,73 @@
+"""Tests for the TTL/LRU in-process cache."""
+
+from unittest.mock import patch
+
+from src.infrastructure.utils.ttl_lru_cache import TTLLRUCache, estimate_size
+
+
+def test_get_returns_stored_value_and_counts_hits_and_misses():
+    """Test that hits and misses are counted."""
+    cache = TTLLRUCache(max_entries=10, max_bytes=1024 * 1024, default_ttl=60)
+    cache.set("key", ["value"])
+
+    assert cache.get("key") == ["value"]
+    assert cache.get("missing") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_entries_expire_after_ttl():
+    """Test that an entry is dropped once its TTL elapses."""
+    cache = TTLLRUCache(max_entries=10, max_bytes=1024 * 1024, default_ttl=60)
+
+    with patch("src.infrastructure.utils.ttl_lru_cache.time.monotonic") as clock:
+        clock.return_value = 100.0
+        cache.set("key", "value", ttl=5)
+        clock.return_value = 104.0
+        assert cache.get("key") == "value"
+        clock.return_value = 105.0
+        assert cache.get("key") is None
+
+    assert cache.stats()["expirations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test LRU eviction when the entry limit is reached."""
+    cache = TTLLRUCache(max_entries=2, max_bytes=1024 * 1024, default_ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_memory_cap_is_enforced():
+    """Test that the estimated byte size never exceeds the configured cap."""
+    cache = TTLLRUCache(max_entries=100, max_bytes=4096, default_ttl=60)
+
+    assert cache.set("huge", "x" * 10_000) is False
+    for i in range(20):
+        cache.set(f"key{i}", "x" * 500)
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 4096
+    assert stats["evictions"] > 0
+
+
+def test_estimate_size_counts_slotted_attributes():
+    """Test that objects with ``__slots__`` are measured through their slots."""
+
+    class Slotted:
+        __slots__ = ("payload",)
+
+        def __init__(self, payload):
+            self.payload = payload
+
+    assert estimate_size(Slotted("x" * 10_000)) - estimate_size(Slotted("x")) > 9_000